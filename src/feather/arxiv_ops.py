@@ -1,10 +1,14 @@
 import datetime as dt
+import gzip
 import os
+import re
+import shutil
 import tarfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, List, Optional
 
-import requests
+from . import circuit, downloads, ratelimit, response_cache
+from .utils import provider_base
 
 try:
     import arxiv  # type: ignore
@@ -19,8 +23,24 @@ except Exception:
 from . import __version__
 
 ARXIV_AVAILABLE = arxiv is not None
+# IDs per arXiv API query; the export API serves up to 100 entries per page.
+ID_BATCH_SIZE = 100
 PYMUPDF_AVAILABLE = fitz is not None
 DEFAULT_USER_AGENT = f"Feather/{__version__} (+https://example.invalid)"
+ARXIV_API_BASE = "https://export.arxiv.org/api"
+ARXIV_FILES_BASE = "https://arxiv.org"
+# Source extraction keeps the TeX side of an e-print plus the figures it includes;
+# bundled data, checkpoints and unused images stay in the tarball.
+SOURCE_TEXT_EXTS = {".tex", ".bbl", ".sty", ".cls"}
+FIGURE_EXTS = {".pdf", ".png", ".jpg", ".jpeg", ".eps", ".svg"}
+SOURCE_MAX_MEMBER_BYTES = 20 * 1024 * 1024
+SOURCE_MAX_TOTAL_BYTES = 100 * 1024 * 1024
+# The arxiv package does its own HTTP; its HTTPError (after its retries) counts
+# against the "arxiv" circuit like a transport failure.
+API_FAILURES = circuit.TRANSPORT_ERRORS + tuple(
+    exc for exc in [getattr(arxiv, "HTTPError", None)] if isinstance(exc, type)
+)
+INCLUDEGRAPHICS_RE = re.compile(r"\\includegraphics\*?(?:\[[^\]]*\])?\{([^}]+)\}")
 
 
 def request_headers() -> Dict[str, str]:
@@ -33,6 +53,13 @@ def require_arxiv() -> None:
         raise RuntimeError("Missing dependency: arxiv (pip install arxiv)")
 
 
+def point_api_client() -> None:
+    # The arxiv package builds its query URL from a class attribute.
+    client = getattr(arxiv, "Client", None)
+    if client is not None and hasattr(client, "query_url_format"):
+        client.query_url_format = f"{provider_base('arxiv', ARXIV_API_BASE)}/query?{{}}"
+
+
 def require_pymupdf() -> None:
     if fitz is None:
         raise RuntimeError("Missing dependency: pymupdf (pip install pymupdf)")
@@ -40,8 +67,53 @@ def require_pymupdf() -> None:
 
 def search_by_id(arxiv_id: str) -> Optional[Any]:
     require_arxiv()
-    search = arxiv.Search(query=f"id:{arxiv_id}", max_results=1)
-    return next(search.results(), None)
+    point_api_client()
+    with circuit.guard("arxiv", API_FAILURES):
+        ratelimit.get_limiter().acquire("arxiv")
+        search = arxiv.Search(query=f"id:{arxiv_id}", max_results=1)
+        return next(search.results(), None)
+
+
+def fetch_by_id(arxiv_id: str) -> Optional[Dict[str, Any]]:
+    def fetch() -> Optional[Dict[str, Any]]:
+        result = search_by_id(arxiv_id)
+        return result_to_metadata(result) if result is not None else None
+
+    return response_cache.cached("arxiv", "id", {"id": arxiv_id}, fetch)
+
+
+def base_arxiv_id(arxiv_id: str) -> str:
+    return re.sub(r"v\d+$", "", arxiv_id.strip())
+
+
+def search_by_ids(arxiv_ids: List[str]) -> List[Optional[Any]]:
+    # One id_list query for the whole batch. Results come back in arXiv's order, so
+    # match them to the requested IDs by versioned and unversioned short ID.
+    require_arxiv()
+    by_id: Dict[str, Any] = {}
+    point_api_client()
+    with circuit.guard("arxiv", API_FAILURES):
+        ratelimit.get_limiter().acquire("arxiv")
+        search = arxiv.Search(id_list=list(arxiv_ids), max_results=len(arxiv_ids))
+        for result in search.results():
+            short_id = result.get_short_id()
+            by_id.setdefault(short_id, result)
+            by_id.setdefault(base_arxiv_id(short_id), result)
+    return [by_id.get(aid.strip()) or by_id.get(base_arxiv_id(aid)) for aid in arxiv_ids]
+
+
+def fetch_by_ids(arxiv_ids: List[str], batch_size: int = ID_BATCH_SIZE) -> List[Optional[Dict[str, Any]]]:
+    # Metadata for many IDs in input order (None for IDs arXiv does not know). Cached
+    # per ID under the same key as fetch_by_id, so either path reuses the other's hits.
+    def fetch(params_list: List[Dict[str, str]]) -> List[Optional[Dict[str, Any]]]:
+        ids = [params["id"] for params in params_list]
+        out: List[Optional[Dict[str, Any]]] = []
+        for start in range(0, len(ids), batch_size):
+            results = search_by_ids(ids[start : start + batch_size])
+            out.extend(result_to_metadata(r) if r is not None else None for r in results)
+        return out
+
+    return response_cache.cached_many("arxiv", "id", [{"id": aid} for aid in arxiv_ids], fetch)
 
 
 def result_to_metadata(result: Any) -> Dict[str, Any]:
@@ -73,64 +145,180 @@ def arxiv_search_recent(
     2) over-fetch a bit
     3) filter by published timestamp locally
     """
+    params = {"query": query, "end_date": end_date.isoformat(), "days": days, "max_results": max_results}
+    return response_cache.cached(
+        "arxiv",
+        "search_recent",
+        params,
+        lambda: _search_recent(query, end_date, days, max_results),
+    )
+
+
+def _search_recent(
+    query: str,
+    end_date: dt.date,
+    days: int,
+    max_results: int,
+) -> List[Dict[str, Any]]:
     require_arxiv()
 
     start_dt = dt.datetime.combine(end_date - dt.timedelta(days=days), dt.time.min)
     end_dt = dt.datetime.combine(end_date, dt.time.max)
 
-    search = arxiv.Search(
-        query=query,
-        max_results=max_results * 3,
-        sort_by=arxiv.SortCriterion.SubmittedDate,
-        sort_order=arxiv.SortOrder.Descending,
-    )
-
     results: List[Dict[str, Any]] = []
-    for r in search.results():
-        if r.published:
-            published = r.published
-            if published.tzinfo is not None:
-                published = published.astimezone(dt.timezone.utc).replace(tzinfo=None)
-            if start_dt <= published <= end_dt:
-                results.append(result_to_metadata(r))
-        if len(results) >= max_results:
-            break
+    point_api_client()
+    with circuit.guard("arxiv", API_FAILURES):
+        ratelimit.get_limiter().acquire("arxiv")
+        search = arxiv.Search(
+            query=query,
+            max_results=max_results * 3,
+            sort_by=arxiv.SortCriterion.SubmittedDate,
+            sort_order=arxiv.SortOrder.Descending,
+        )
+        for r in search.results():
+            if r.published:
+                published = r.published
+                if published.tzinfo is not None:
+                    published = published.astimezone(dt.timezone.utc).replace(tzinfo=None)
+                if start_dt <= published <= end_dt:
+                    results.append(result_to_metadata(r))
+            if len(results) >= max_results:
+                break
     return results
 
 
-def arxiv_download_pdf(pdf_url: str, out_pdf: Path, timeout: int = 120) -> None:
-    out_pdf.parent.mkdir(parents=True, exist_ok=True)
-    with requests.get(pdf_url, stream=True, timeout=timeout, headers=request_headers()) as r:
-        r.raise_for_status()
-        with out_pdf.open("wb") as f:
-            for chunk in r.iter_content(chunk_size=1024 * 512):
-                if chunk:
-                    f.write(chunk)
+def arxiv_download_pdf(pdf_url: str, out_pdf: Path, timeout: int = 120) -> Dict[str, Any]:
+    return downloads.download_file(pdf_url, out_pdf, headers=request_headers(), timeout=timeout)
+
+
+def arxiv_source_url(arxiv_id: str) -> str:
+    return f"{provider_base('arxiv_files', ARXIV_FILES_BASE)}/e-print/{arxiv_id}"
+
+
+def arxiv_download_source(arxiv_id: str, out_tar: Path, timeout: int = 120) -> Dict[str, Any]:
+    return downloads.download_file(
+        arxiv_source_url(arxiv_id),
+        out_tar,
+        headers=request_headers(),
+        timeout=timeout,
+        expect_pdf=False,
+    )
+
+
+def extract_includegraphics(tex_text: str) -> List[str]:
+    return [m.group(1).strip() for m in INCLUDEGRAPHICS_RE.finditer(tex_text)]
+
+
+def _safe_member_target(out_dir: Path, name: str) -> Optional[Path]:
+    if not name or name.startswith("/") or ".." in name:
+        return None
+    root = out_dir.resolve()
+    target = (out_dir / name).resolve()
+    if root not in target.parents:
+        return None
+    return target
 
 
-def arxiv_download_source(arxiv_id: str, out_tar: Path, timeout: int = 120) -> None:
-    out_tar.parent.mkdir(parents=True, exist_ok=True)
-    url = f"https://arxiv.org/e-print/{arxiv_id}"
-    with requests.get(url, stream=True, timeout=timeout, headers=request_headers()) as r:
-        r.raise_for_status()
-        with out_tar.open("wb") as f:
-            for chunk in r.iter_content(chunk_size=1024 * 512):
-                if chunk:
-                    f.write(chunk)
+def _copy_capped(src: IO[bytes], target: Path, limit: int) -> bytes:
+    # Returns the written bytes only for small TeX-side files the caller scans.
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.suffix.lower() not in SOURCE_TEXT_EXTS:
+        with target.open("wb") as out:
+            shutil.copyfileobj(src, out)
+        return b""
+    data = src.read(limit)
+    target.write_bytes(data)
+    return data
 
 
-def extract_arxiv_source(archive_path: Path, out_dir: Path) -> None:
+def _figure_wanted(name: str, refs: List[str]) -> bool:
+    path = Path(name)
+    for ref in refs:
+        ref_path = Path(ref)
+        if name == ref or path.name == ref_path.name or path.stem == ref_path.name:
+            return True
+    return False
+
+
+def extract_arxiv_source(
+    archive_path: Path,
+    out_dir: Path,
+    max_member_bytes: int = SOURCE_MAX_MEMBER_BYTES,
+    max_total_bytes: int = SOURCE_MAX_TOTAL_BYTES,
+) -> Dict[str, Any]:
+    # One streaming pass over the tarball extracts the TeX-side files and collects
+    # \includegraphics references; a second forward pass picks only the referenced
+    # figures. Regular files only; members over the caps are listed, not written.
     out_dir.mkdir(parents=True, exist_ok=True)
-    with tarfile.open(archive_path, "r:*") as tar:
-        members = []
-        for member in tar.getmembers():
-            if not member.name or member.name.startswith("/") or ".." in member.name:
+    report: Dict[str, Any] = {
+        "files": [],
+        "includegraphics": [],
+        "skipped_files": 0,
+        "skipped_bytes": 0,
+        "over_cap": [],
+    }
+    total = 0
+
+    def admit(member: tarfile.TarInfo) -> bool:
+        nonlocal total
+        if member.size > max_member_bytes or total + member.size > max_total_bytes:
+            report["over_cap"].append(member.name)
+            report["skipped_files"] += 1
+            report["skipped_bytes"] += member.size
+            return False
+        total += member.size
+        return True
+
+    try:
+        tar = tarfile.open(archive_path, "r:*")
+    except tarfile.ReadError:
+        # Single-file submissions are served as a gzipped .tex rather than a tarball.
+        with gzip.open(archive_path, "rb") as src:
+            data = src.read(max_member_bytes + 1)
+        if len(data) > max_member_bytes:
+            report["over_cap"].append("main.tex")
+            return report
+        (out_dir / "main.tex").write_bytes(data)
+        report["files"].append("main.tex")
+        report["includegraphics"] = extract_includegraphics(data.decode("utf-8", errors="replace"))
+        return report
+
+    with tar:
+        figures: List[tarfile.TarInfo] = []
+        for member in tar:
+            target = _safe_member_target(out_dir, member.name) if member.isfile() else None
+            suffix = Path(member.name).suffix.lower()
+            if target is None or suffix not in SOURCE_TEXT_EXTS:
+                if target is not None and suffix in FIGURE_EXTS:
+                    figures.append(member)
+                elif member.isfile():
+                    report["skipped_files"] += 1
+                    report["skipped_bytes"] += member.size
+                continue
+            if not admit(member):
+                continue
+            src = tar.extractfile(member)
+            if src is None:
+                continue
+            data = _copy_capped(src, target, max_member_bytes)
+            report["files"].append(member.name)
+            if suffix == ".tex":
+                report["includegraphics"].extend(extract_includegraphics(data.decode("utf-8", errors="replace")))
+        refs = report["includegraphics"]
+        for member in sorted(figures, key=lambda m: m.offset):
+            if not _figure_wanted(member.name, refs):
+                report["skipped_files"] += 1
+                report["skipped_bytes"] += member.size
+                continue
+            if not admit(member):
                 continue
-            target = (out_dir / member.name).resolve()
-            if out_dir.resolve() not in target.parents and target != out_dir.resolve():
+            src = tar.extractfile(member)
+            target = _safe_member_target(out_dir, member.name)
+            if src is None or target is None:
                 continue
-            members.append(member)
-        tar.extractall(out_dir, members=members)
+            _copy_capped(src, target, max_member_bytes)
+            report["files"].append(member.name)
+    return report
 
 
 def pdf_to_text(pdf_path: Path) -> str:
@@ -0,0 +1,519 @@
+import argparse
+import datetime as dt
+import hashlib
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl
+from xml.sax.saxutils import escape
+
+from . import __version__, circuit, jobpool, local_ops, ratelimit
+from .collector import (
+    JobLogger,
+    build_index_md,
+    parse_job,
+    prepare_jobs,
+    run_arxiv_ids,
+    run_local_ingest,
+    run_openalex,
+    run_tavily_extract,
+    run_tavily_search,
+)
+from .models import Job
+from .standin import StandinServer
+from .tavily import TavilyClient
+from .utils import PROVIDER_BASE_ENV, write_text
+
+try:
+    import resource  # type: ignore
+except Exception:
+    resource = None
+
+# Synthetic collector benchmark: generates instruction files and a local document
+# tree, answers every provider call from a feather.standin server, and writes stage
+# timings as JSON (python -m feather.bench --out bench.json).
+RESULTS_VERSION = 1
+WORDS = (
+    "quantum photonic lattice error correction spectral model sensor battery catalyst "
+    "alloy robotics manufacturing inference compiler kernel memory network protocol "
+    "genome protein climate ocean grid turbine solar storage vision language agent "
+    "benchmark dataset pipeline latency throughput cache scheduler runtime"
+).split()
+PROVIDER_STAGES: List[Tuple[str, Callable[..., None], bool]] = [
+    ("local_ingest", run_local_ingest, False),
+    ("tavily_extract", run_tavily_extract, True),
+    ("tavily_search", run_tavily_search, True),
+    ("openalex", run_openalex, False),
+    ("arxiv_ids", run_arxiv_ids, False),
+]
+
+
+def words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def paragraph(rng: random.Random, sentences: int = 6) -> str:
+    return " ".join(words(rng, rng.randint(8, 16)).capitalize() + "." for _ in range(sentences))
+
+
+def minimal_pdf(text: str) -> bytes:
+    # One page with one line of Helvetica text; enough for PyMuPDF to extract.
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def _write_docx(path: Path, text: str) -> None:
+    document = local_ops.docx.Document()
+    for line in text.split(". "):
+        document.add_paragraph(line)
+    document.save(str(path))
+
+
+def _write_pptx(path: Path, text: str) -> None:
+    prs = local_ops.pptx.Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = text.split(".")[0]
+    slide.placeholders[1].text = text
+    prs.save(str(path))
+
+
+def _write_xlsx(path: Path, text: str) -> None:
+    workbook = local_ops.openpyxl.Workbook()
+    sheet = workbook.active
+    for idx, word in enumerate(text.split()):
+        sheet.append([idx, word])
+    workbook.save(str(path))
+
+
+def local_writers() -> Tuple[Dict[str, Callable[[Path, str], None]], List[str]]:
+    # Office formats need their writer packages (the same ones ingestion reads them with).
+    writers: Dict[str, Callable[[Path, str], None]] = {
+        ".txt": lambda path, text: write_text(path, text),
+        ".md": lambda path, text: write_text(path, f"# {text.split('.')[0]}\n\n{text}\n"),
+        ".html": lambda path, text: write_text(path, f"<html><body><h1>Doc</h1><p>{escape(text)}</p></body></html>"),
+        ".pdf": lambda path, text: path.write_bytes(minimal_pdf(text[:200])),
+    }
+    skipped: List[str] = []
+    for ext, available, writer in (
+        (".docx", local_ops.DOCX_AVAILABLE, _write_docx),
+        (".pptx", local_ops.PPTX_AVAILABLE, _write_pptx),
+        (".xlsx", local_ops.XLSX_AVAILABLE, _write_xlsx),
+    ):
+        if available:
+            writers[ext] = writer
+        else:
+            skipped.append(ext)
+    return writers, skipped
+
+
+def make_corpus(
+    root: Path,
+    files: int,
+    queries: int,
+    urls: int,
+    arxiv_ids: int,
+    local_files: int,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    local_dir = root / "local"
+    local_dir.mkdir(parents=True, exist_ok=True)
+    writers, skipped = local_writers()
+    exts = sorted(writers)
+    formats: Dict[str, int] = {}
+    for idx in range(local_files):
+        ext = exts[idx % len(exts)]
+        # Nested folders so the directory walk is part of the measurement.
+        path = local_dir / f"group{idx % 4}" / f"doc{idx:05d}{ext}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        writers[ext](path, paragraph(rng, rng.randint(4, 12)))
+        formats[ext] = formats.get(ext, 0) + 1
+
+    instr_dir = root / "instructions"
+    instr_dir.mkdir(parents=True, exist_ok=True)
+    for num in range(files):
+        lines = [f"{words(rng, 4)} {num}-{idx}" for idx in range(queries)]
+        lines.append("")
+        lines += [f"https://bench.invalid/f{num}/page-{idx}" for idx in range(urls)]
+        lines += [f"arXiv:24{num % 12 + 1:02d}.{idx:05d}" for idx in range(arxiv_ids)]
+        if local_files:
+            lines.append(f"dir: {local_dir.as_posix()}")
+        write_text(instr_dir / f"bench_{num:03d}.txt", "\n".join(lines) + "\n")
+    return {
+        "instruction_dir": instr_dir,
+        "instruction_files": files,
+        "queries": queries,
+        "urls": urls,
+        "arxiv_ids": arxiv_ids,
+        "local_files": local_files,
+        "local_formats": formats,
+        "skipped_formats": skipped,
+    }
+
+
+def _rng_for(*parts: Any) -> random.Random:
+    digest = hashlib.sha256(json.dumps(parts, default=str).encode("utf-8")).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def _json(data: Any) -> Tuple[int, str, bytes]:
+    return 200, "application/json", json.dumps(data).encode("utf-8")
+
+
+def _openalex_work(rng: random.Random, query: str, idx: int) -> Dict[str, Any]:
+    abstract = words(rng, 40).split()
+    inverted: Dict[str, List[int]] = {}
+    for pos, word in enumerate(abstract):
+        inverted.setdefault(word, []).append(pos)
+    work_id = f"W{rng.randrange(10**9, 10**10)}"
+    return {
+        "id": f"https://openalex.org/{work_id}",
+        "doi": f"https://doi.org/10.5555/{work_id.lower()}",
+        "title": f"{query} study {idx}",
+        "publication_date": "2026-01-01",
+        "authorships": [{"author": {"display_name": f"Author {rng.randint(1, 999)}"}}],
+        "abstract_inverted_index": inverted,
+        "cited_by_count": rng.randint(0, 500),
+        "open_access": {"is_oa": True, "oa_status": "gold"},
+        "best_oa_location": {"landing_page_url": f"https://bench.invalid/oa/{work_id}"},
+        "primary_location": {"source": {"display_name": "Journal of Benchmarks"}},
+    }
+
+
+def _arxiv_feed(ids: List[str], rng: random.Random) -> bytes:
+    entries = []
+    for aid in ids:
+        entries.append(
+            "<entry>"
+            f"<id>http://arxiv.org/abs/{aid}v1</id>"
+            "<updated>2026-01-02T00:00:00Z</updated><published>2026-01-01T00:00:00Z</published>"
+            f"<title>{escape(words(rng, 6))}</title><summary>{escape(paragraph(rng, 3))}</summary>"
+            "<author><name>Bench Author</name></author>"
+            f'<link href="http://arxiv.org/abs/{aid}v1" rel="alternate" type="text/html"/>'
+            f'<link title="pdf" href="http://arxiv.org/pdf/{aid}v1" rel="related" type="application/pdf"/>'
+            '<arxiv:primary_category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>'
+            '<category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>'
+            "</entry>"
+        )
+    feed = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/" '
+        'xmlns:arxiv="http://arxiv.org/schemas/atom">'
+        f"<title>bench</title><opensearch:totalResults>{len(ids)}</opensearch:totalResults>"
+        f"<opensearch:startIndex>0</opensearch:startIndex><opensearch:itemsPerPage>{len(ids)}</opensearch:itemsPerPage>"
+        + "".join(entries)
+        + "</feed>"
+    )
+    return feed.encode("utf-8")
+
+
+def synthetic_response(provider: str, method: str, path: str, query: str, body: bytes) -> Optional[Tuple[int, str, bytes]]:
+    # Deterministic answers for every request shape the benchmarked stages send.
+    rng = _rng_for(provider, method, path, query, body.decode("utf-8", "replace"))
+    params = dict(parse_qsl(query))
+    payload = json.loads(body) if body else {}
+    if provider == "tavily" and path == "/search":
+        count = int(payload.get("max_results") or 5)
+        text = str(payload.get("query") or "")
+        return _json(
+            {
+                "query": text,
+                "results": [
+                    {
+                        "url": f"https://bench.invalid/r/{hashlib.sha1(f'{text}{idx}'.encode()).hexdigest()[:12]}",
+                        "title": f"{text} result {idx}",
+                        "content": paragraph(rng, 3),
+                        "score": round(1.0 - idx / (count + 1), 3),
+                    }
+                    for idx in range(count)
+                ],
+            }
+        )
+    if provider == "tavily" and path == "/extract":
+        return _json(
+            {
+                "results": [{"url": url, "raw_content": paragraph(rng, 30)} for url in payload.get("urls") or []],
+                "failed_results": [],
+            }
+        )
+    if provider == "openalex" and path.startswith("/works"):
+        count = int(params.get("per-page") or 1)
+        text = params.get("search") or params.get("filter") or "work"
+        return _json({"results": [_openalex_work(rng, text, idx) for idx in range(count)], "meta": {"next_cursor": None}})
+    if provider == "arxiv" and path == "/query":
+        ids = [aid for aid in (params.get("id_list") or "").split(",") if aid]
+        return 200, "application/atom+xml", _arxiv_feed(ids, rng)
+    return None
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    # Nearest-rank percentile.
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100.0 * len(ordered)) - 1)]
+
+
+def summarize(samples: List[float], items: int = 0) -> Dict[str, Any]:
+    if not samples:
+        return {"runs": 0}
+    total = sum(samples)
+    out: Dict[str, Any] = {
+        "runs": len(samples),
+        "total_s": round(total, 4),
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+    }
+    if items:
+        out["items"] = items
+        out["items_per_sec"] = round(items / total, 2) if total > 0 else None
+    return out
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+@contextmanager
+def pointed_at(url: str, keep_rate_limits: bool = False) -> Iterator[None]:
+    # Sends provider traffic to the stand-in with fresh circuits and, unless asked
+    # otherwise, no client-side rate limits (the stand-in can apply its own).
+    saved_env = os.environ.get(PROVIDER_BASE_ENV)
+    saved_limiter = ratelimit.get_limiter()
+    saved_circuits = circuit.get_registry()
+    os.environ[PROVIDER_BASE_ENV] = url
+    if not keep_rate_limits:
+        ratelimit.install_limiter(ratelimit.RateLimiter({key: (0.0, 1) for key in ratelimit.DEFAULT_RATES}))
+    circuit.configure_circuits()
+    try:
+        yield
+    finally:
+        if saved_env is None:
+            os.environ.pop(PROVIDER_BASE_ENV, None)
+        else:
+            os.environ[PROVIDER_BASE_ENV] = saved_env
+        ratelimit.install_limiter(saved_limiter)
+        circuit.install_registry(saved_circuits)
+
+
+def _job_options(max_results: int) -> Dict[str, Any]:
+    return {
+        "lang_pref": None,
+        "openalex_enabled": True,
+        "openalex_max_results": max_results,
+        "youtube_enabled": False,
+        "youtube_max_results": max_results,
+        "youtube_transcript": False,
+        "youtube_order": "relevance",
+        "days": 30,
+        "max_results": max_results,
+        "download_pdf": False,
+        "arxiv_source": False,
+        "update_run": False,
+        "citations_enabled": False,
+    }
+
+
+def run_benchmark(
+    work_dir: Path,
+    files: int = 4,
+    queries: int = 10,
+    urls: int = 10,
+    arxiv_ids: int = 5,
+    local_files: int = 40,
+    max_results: int = 5,
+    index_repeats: int = 5,
+    parse_repeats: int = 5,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    error_rate: float = 0.0,
+    keep_rate_limits: bool = False,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    corpus = make_corpus(work_dir / "corpus", files, queries, urls, arxiv_ids, local_files, seed=seed)
+    instr_dir: Path = corpus.pop("instruction_dir")
+    output_root = work_dir / "runs"
+    options = _job_options(max_results)
+    timings: Dict[str, List[float]] = {}
+
+    def timed(name: str, fn: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            timings.setdefault(name, []).append(time.perf_counter() - start)
+
+    instruction_files = sorted(instr_dir.glob("*.txt"))
+    for _ in range(parse_repeats):
+        for path in instruction_files:
+            timed("parse_job", lambda: parse_job(path, output_root, path.stem, **options))
+        jobs: List[Job] = timed("prepare_jobs", lambda: prepare_jobs(instr_dir, None, output_root, **options))
+
+    items: Dict[str, int] = {
+        "parse_job": len(instruction_files) * parse_repeats,
+        "prepare_jobs": len(instruction_files) * parse_repeats,
+    }
+    server = StandinServer(
+        work_dir / "cassette",
+        latency_ms=latency_ms,
+        jitter_ms=jitter_ms,
+        error_rate=error_rate,
+        seed=seed,
+        fallback=synthetic_response,
+    )
+    tavily = TavilyClient("bench")
+    wall_start = time.perf_counter()
+    with server, pointed_at(server.url, keep_rate_limits=keep_rate_limits):
+        for job in jobs:
+            job.out_dir.mkdir(parents=True, exist_ok=True)
+            logger = JobLogger(job.out_dir / "_log.txt", also_stdout=False)
+            for name, stage, needs_tavily in PROVIDER_STAGES:
+                args = (job, tavily, logger) if needs_tavily else (job, logger)
+                timed(name, lambda: stage(*args))
+            for _ in range(max(1, index_repeats)):
+                timed("build_index_md", lambda: build_index_md(job))
+            logger.close()
+        wall = time.perf_counter() - wall_start
+        standin_stats = server.stats()
+
+    items["local_ingest"] = local_files * len(jobs)
+    items["tavily_search"] = queries * len(jobs)
+    items["tavily_extract"] = urls * len(jobs)
+    items["openalex"] = queries * len(jobs)
+    items["arxiv_ids"] = arxiv_ids * len(jobs)
+    return {
+        "results_version": RESULTS_VERSION,
+        "feather_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": dt.datetime.now().isoformat(timespec="seconds"),
+        "config": {
+            "max_results": max_results,
+            "index_repeats": index_repeats,
+            "parse_repeats": parse_repeats,
+            "latency_ms": latency_ms,
+            "jitter_ms": jitter_ms,
+            "error_rate": error_rate,
+            "keep_rate_limits": keep_rate_limits,
+            "seed": seed,
+        },
+        "corpus": corpus,
+        "stages": {name: summarize(samples, items.get(name, 0)) for name, samples in timings.items()},
+        "throughput": {
+            "jobs": len(jobs),
+            "wall_s": round(wall, 4),
+            "jobs_per_sec": round(len(jobs) / wall, 3) if wall > 0 else None,
+            "requests": standin_stats["requests"],
+            "requests_per_sec": round(standin_stats["requests"] / wall, 2) if wall > 0 else None,
+        },
+        "peak_rss_mb": peak_rss_mb(),
+        "log_errors": sum(jobpool.count_log_errors(job.out_dir / "_log.txt") for job in jobs),
+        "standin": standin_stats,
+    }
+
+
+def compare_results(old: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+    lines = [f"{'stage':<16}{'old p50 ms':>12}{'new p50 ms':>12}{'change':>10}"]
+    for name, stats in new.get("stages", {}).items():
+        before = (old.get("stages", {}).get(name) or {}).get("p50_ms")
+        after = stats.get("p50_ms")
+        if before is None or after is None:
+            lines.append(f"{name:<16}{'-':>12}{after if after is not None else '-':>12}{'':>10}")
+            continue
+        change = f"{(after - before) / before * 100:+.1f}%" if before else ""
+        lines.append(f"{name:<16}{before:>12.3f}{after:>12.3f}{change:>10}")
+    return lines
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(
+        prog="python -m feather.bench",
+        description="Benchmark the Feather collector on a synthetic corpus against a local provider stand-in.",
+    )
+    ap.add_argument("--out", required=True, help="Write results JSON here.")
+    ap.add_argument("--work-dir", help="Keep the corpus and runs here (default: a temporary folder).")
+    ap.add_argument("--files", type=int, default=4, help="Instruction files (one job each).")
+    ap.add_argument("--queries", type=int, default=10, help="Search queries per instruction file.")
+    ap.add_argument("--urls", type=int, default=10, help="URLs per instruction file.")
+    ap.add_argument("--arxiv-ids", type=int, default=5, help="arXiv IDs per instruction file.")
+    ap.add_argument("--local-files", type=int, default=40, help="Local documents (txt/md/html/pdf plus docx/pptx/xlsx when installed).")
+    ap.add_argument("--max-results", type=int, default=5)
+    ap.add_argument("--index-repeats", type=int, default=5, help="build_index_md calls per job (first is cold).")
+    ap.add_argument("--parse-repeats", type=int, default=5)
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="Stand-in latency per request.")
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--error-rate", type=float, default=0.0, help="Share of stand-in requests answered with HTTP 500.")
+    ap.add_argument("--keep-rate-limits", action="store_true", help="Keep Feather's client-side rate limits.")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--compare", help="Earlier results JSON to print p50 changes against.")
+    return ap
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    for name in ("files", "index_repeats", "parse_repeats", "max_results"):
+        if getattr(args, name) < 1:
+            raise SystemExit(f"--{name.replace('_', '-')} must be >= 1.")
+    for name in ("queries", "urls", "arxiv_ids", "local_files"):
+        if getattr(args, name) < 0:
+            raise SystemExit(f"--{name.replace('_', '-')} must be >= 0.")
+    options = {
+        "files": args.files,
+        "queries": args.queries,
+        "urls": args.urls,
+        "arxiv_ids": args.arxiv_ids,
+        "local_files": args.local_files,
+        "max_results": args.max_results,
+        "index_repeats": args.index_repeats,
+        "parse_repeats": args.parse_repeats,
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "error_rate": args.error_rate,
+        "keep_rate_limits": args.keep_rate_limits,
+        "seed": args.seed,
+    }
+    if args.work_dir:
+        results = run_benchmark(Path(args.work_dir), **options)
+    else:
+        with tempfile.TemporaryDirectory(prefix="feather-bench-") as tmp:
+            results = run_benchmark(Path(tmp), **options)
+    write_text(Path(args.out), json.dumps(results, ensure_ascii=False, indent=2))
+    for name, stats in results["stages"].items():
+        rate = f" {stats['items_per_sec']}/s" if stats.get("items_per_sec") else ""
+        print(f"{name:<16} p50={stats.get('p50_ms')}ms p95={stats.get('p95_ms')}ms{rate}")
+    print(f"peak RSS: {results['peak_rss_mb']} MB, log errors: {results['log_errors']}, results: {args.out}")
+    if args.compare:
+        old = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print("\n".join(compare_results(old, results)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl  # type: ignore
+except Exception:
+    fcntl = None
+
+from .response_cache import default_cache_dir
+
+BLOB_DIR_ENV = "FEDERLICHT_BLOB_DIR"
+INDEX_NAME = "index.sqlite"
+LOCK_NAME = "in-use.lock"
+CHUNK_SIZE = 1024 * 1024
+# Linux FICLONE ioctl (btrfs, xfs, bcachefs): copy-on-write clone of a whole file.
+FICLONE = 0x40049409
+PLACEMENT_ORDER = ("hardlink", "reflink", "symlink", "copy")
+
+
+def default_blob_dir() -> Path:
+    override = os.getenv(BLOB_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+    return default_cache_dir() / "blobs"
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def reflink(src: Path, dst: Path) -> None:
+    if fcntl is None:
+        raise OSError("reflink not supported on this platform")
+    try:
+        with src.open("rb") as s, dst.open("wb") as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+    except OSError:
+        dst.unlink(missing_ok=True)
+        raise
+
+
+class StoreInUse(RuntimeError):
+    pass
+
+
+class BlobStore:
+    def __init__(self, root: Optional[Path] = None):
+        self.root = root or default_blob_dir()
+        self.objects = self.root / "objects"
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._hold_fh = None
+
+    def _lock_file(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        return (self.root / LOCK_NAME).open("a")
+
+    def hold(self) -> None:
+        # Jobs keep a shared lock for as long as the store is configured; gc() needs
+        # it exclusively, so it never drops a blob a running job is about to link.
+        if fcntl is None or self._hold_fh is not None:
+            return
+        fh = self._lock_file()
+        fcntl.flock(fh.fileno(), fcntl.LOCK_SH)
+        self._hold_fh = fh
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.objects.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.root / INDEX_NAME), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
+                "CREATE TABLE IF NOT EXISTS blobs (sha256 TEXT PRIMARY KEY, size INTEGER, created REAL);"
+                "CREATE TABLE IF NOT EXISTS refs (path TEXT PRIMARY KEY, sha256 TEXT, method TEXT);"
+                "CREATE INDEX IF NOT EXISTS refs_sha ON refs(sha256);"
+                "CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY, sha256 TEXT);"
+                "CREATE TABLE IF NOT EXISTS texts (sha256 TEXT PRIMARY KEY, text_sha256 TEXT);"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _execute(self, sql: str, params: tuple = ()) -> list:
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(sql, params).fetchall()
+            conn.commit()
+            return rows
+
+    def blob_path(self, sha: str) -> Path:
+        return self.objects / sha[:2] / sha
+
+    def has(self, sha: Optional[str]) -> bool:
+        return bool(sha) and self.blob_path(sha).exists()
+
+    def ingest(self, src: Path, sha: Optional[str] = None, link_ok: bool = False) -> str:
+        # link_ok lets the store take over a finished file the run created itself (a
+        # download or extracted text), so its bytes are kept once. User files are cloned
+        # or copied: the blob is made read-only, and that must not leak back to them.
+        sha = sha or sha256_file(src)
+        blob = self.blob_path(sha)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            tmp = blob.with_name(f".{sha}.{uuid.uuid4().hex}.tmp")
+            try:
+                linked = False
+                if link_ok:
+                    try:
+                        os.link(src, tmp)
+                        linked = True
+                    except OSError:
+                        linked = False
+                if not linked:
+                    try:
+                        reflink(src, tmp)
+                    except OSError:
+                        shutil.copyfile(src, tmp)
+                os.chmod(tmp, 0o444)
+                os.replace(tmp, blob)
+            finally:
+                tmp.unlink(missing_ok=True)
+        self._execute(
+            "INSERT OR IGNORE INTO blobs (sha256, size, created) VALUES (?, ?, ?)",
+            (sha, blob.stat().st_size, time.time()),
+        )
+        return sha
+
+    def place(self, sha: str, dest: Path) -> str:
+        blob = self.blob_path(sha)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists() and not dest.is_symlink():
+            try:
+                if os.path.samefile(dest, blob):
+                    self._record_ref(dest, sha, "hardlink")
+                    return "hardlink"
+            except OSError:
+                pass
+        tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.tmp")
+        method = ""
+        for candidate in PLACEMENT_ORDER:
+            try:
+                if candidate == "hardlink":
+                    os.link(blob, tmp)
+                elif candidate == "reflink":
+                    reflink(blob, tmp)
+                elif candidate == "symlink":
+                    os.symlink(blob.resolve(), tmp)
+                else:
+                    shutil.copyfile(blob, tmp)
+                method = candidate
+                break
+            except (OSError, NotImplementedError):
+                tmp.unlink(missing_ok=True)
+        if not method:
+            raise OSError(f"could not place blob {sha} at {dest}")
+        os.replace(tmp, dest)
+        self._record_ref(dest, sha, method)
+        return method
+
+    def _record_ref(self, dest: Path, sha: str, method: str) -> None:
+        self._execute(
+            "INSERT OR REPLACE INTO refs (path, sha256, method) VALUES (?, ?, ?)",
+            (str(dest.absolute()), sha, method),
+        )
+
+    def adopt(self, path: Path, sha: Optional[str] = None, url: Optional[str] = None) -> str:
+        # Called once the run has finished writing path: it becomes a placed link like
+        # any other, so the bytes are stored once. Writers replace placed files
+        # (utils.detach_link) instead of editing them in place.
+        sha = self.ingest(path, sha=sha, link_ok=True)
+        self.place(sha, path)
+        if url:
+            self._execute("INSERT OR REPLACE INTO urls (url, sha256) VALUES (?, ?)", (url, sha))
+        return sha
+
+    def sha_for_url(self, url: str) -> Optional[str]:
+        rows = self._execute("SELECT sha256 FROM urls WHERE url = ?", (url,))
+        sha = rows[0][0] if rows else None
+        return sha if self.has(sha) else None
+
+    def sha_for_path(self, path: Path) -> Optional[str]:
+        rows = self._execute("SELECT sha256 FROM refs WHERE path = ?", (str(path.absolute()),))
+        return rows[0][0] if rows else None
+
+    def text_for(self, sha: Optional[str]) -> Optional[str]:
+        if not sha:
+            return None
+        rows = self._execute("SELECT text_sha256 FROM texts WHERE sha256 = ?", (sha,))
+        text_sha = rows[0][0] if rows else None
+        return text_sha if self.has(text_sha) else None
+
+    def place_text(self, source: Path, text_path: Path) -> bool:
+        text_sha = self.text_for(self.sha_for_path(source))
+        if not text_sha:
+            return False
+        self.place(text_sha, text_path)
+        return True
+
+    def record_text(self, source: Path, text_path: Path) -> Optional[str]:
+        sha = self.sha_for_path(source)
+        if not sha or not text_path.exists():
+            return None
+        text_sha = self.adopt(text_path)
+        self._execute("INSERT OR REPLACE INTO texts (sha256, text_sha256) VALUES (?, ?)", (sha, text_sha))
+        return text_sha
+
+    def gc(self) -> Dict[str, int]:
+        fh = self._lock_file()
+        try:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    raise StoreInUse(f"blob store {self.root} is in use by a running job")
+            return self._collect()
+        finally:
+            fh.close()
+
+    def _collect(self) -> Dict[str, int]:
+        # A ref is live while its path still exists with the blob's size; anything
+        # else was deleted or rewritten. Blobs with no live ref are removed.
+        stats = {"refs_dropped": 0, "blobs_removed": 0, "bytes_freed": 0}
+        refs = self._execute("SELECT path, sha256 FROM refs")
+        sizes = dict(self._execute("SELECT sha256, size FROM blobs"))
+        dead = []
+        for path, sha in refs:
+            try:
+                alive = os.path.getsize(path) == sizes.get(sha)
+            except OSError:
+                alive = False
+            if not alive:
+                dead.append((path,))
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("DELETE FROM refs WHERE path = ?", dead)
+            conn.commit()
+            live = {row[0] for row in conn.execute("SELECT DISTINCT sha256 FROM refs")}
+        stats["refs_dropped"] = len(dead)
+        for sha, size in sizes.items():
+            if sha in live:
+                continue
+            self.blob_path(sha).unlink(missing_ok=True)
+            stats["blobs_removed"] += 1
+            stats["bytes_freed"] += size or 0
+        with self._lock:
+            conn = self._connect()
+            removed = [(sha,) for sha in sizes if sha not in live]
+            conn.executemany("DELETE FROM blobs WHERE sha256 = ?", removed)
+            conn.executemany("DELETE FROM urls WHERE sha256 = ?", removed)
+            conn.executemany("DELETE FROM texts WHERE sha256 = ? OR text_sha256 = ?", [(s, s) for (s,) in removed])
+            conn.commit()
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            if self._hold_fh is not None:
+                self._hold_fh.close()
+                self._hold_fh = None
+
+
+_STORE: Optional[BlobStore] = None
+
+
+def get_store() -> Optional[BlobStore]:
+    return _STORE
+
+
+def configure_store(root: Optional[Path]) -> Optional[BlobStore]:
+    global _STORE
+    if _STORE is not None:
+        _STORE.close()
+    _STORE = BlobStore(root) if root is not None else None
+    if _STORE is not None:
+        _STORE.hold()
+    return _STORE
@@ -0,0 +1,210 @@
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple, Type
+
+import requests
+
+from . import metrics
+
+FAILURE_THRESHOLD = 3
+BASE_COOLDOWN_SEC = 15.0
+MAX_COOLDOWN_SEC = 600.0
+JITTER = 0.25
+# Responses that count against a provider or host; other statuses (404, 401, ...)
+# prove the endpoint is answering.
+FAILURE_STATUSES = {429, 500, 502, 503, 504}
+TRANSPORT_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+class CircuitOpen(requests.exceptions.RequestException):
+    def __init__(self, key: str, retry_in: float):
+        super().__init__(f"circuit open for {key} (retry in {retry_in:.0f}s)")
+        self.key = key
+        self.retry_in = retry_in
+
+
+def backoff_delay(attempt: int, base: float, cap: float, rng: Optional[random.Random] = None) -> float:
+    # Exponential backoff with +/- JITTER spread, so parallel lanes and job workers that
+    # failed together do not all come back at the same moment.
+    delay = min(cap, base * 2**attempt)
+    return delay * (1.0 + (rng or random).uniform(-JITTER, JITTER))
+
+
+class CircuitBreaker:
+    # closed: calls pass; FAILURE_THRESHOLD failures in a row open the circuit.
+    # open: calls fail fast with CircuitOpen until the cooldown ends; each reopening
+    # doubles the cooldown. half_open: one probe call is let through and decides.
+    def __init__(
+        self,
+        key: str,
+        threshold: int = FAILURE_THRESHOLD,
+        base: float = BASE_COOLDOWN_SEC,
+        cap: float = MAX_COOLDOWN_SEC,
+        rng: Optional[random.Random] = None,
+    ):
+        self.key = key
+        self.threshold = max(1, threshold)
+        self.base = base
+        self.cap = cap
+        self.rng = rng or random.Random()
+        self.state = "closed"
+        self.consecutive = 0
+        self.reopened = 0
+        self.open_until = 0.0
+        self.probing = False
+        self.failures = 0
+        self.trips = 0
+        self.skipped = 0
+
+    def before(self) -> None:
+        if self.state == "closed":
+            return
+        now = time.monotonic()
+        if self.state == "open" and now >= self.open_until:
+            self.state = "half_open"
+        if self.state == "half_open" and not self.probing:
+            self.probing = True
+            return
+        self.skipped += 1
+        raise CircuitOpen(self.key, max(0.0, self.open_until - now))
+
+    def success(self) -> None:
+        self.state = "closed"
+        self.consecutive = 0
+        self.reopened = 0
+        self.probing = False
+
+    def failure(self) -> None:
+        self.failures += 1
+        self.consecutive += 1
+        if self.state == "half_open" or self.consecutive >= self.threshold:
+            self.trip()
+
+    def trip(self, cooldown: Optional[float] = None) -> None:
+        if cooldown is None:
+            cooldown = backoff_delay(self.reopened, self.base, self.cap, self.rng)
+        self.state = "open"
+        self.open_until = time.monotonic() + cooldown
+        self.probing = False
+        self.reopened += 1
+        self.trips += 1
+
+    def release(self) -> None:
+        # The call ended without saying anything about the endpoint's health.
+        self.probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "skipped": self.skipped,
+        }
+
+
+class CircuitRegistry:
+    # One breaker per limiter key (provider name or host), shared by every lane of a job.
+    def __init__(
+        self,
+        threshold: int = FAILURE_THRESHOLD,
+        base: float = BASE_COOLDOWN_SEC,
+        cap: float = MAX_COOLDOWN_SEC,
+    ):
+        self.threshold = threshold
+        self.base = base
+        self.cap = cap
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def _breaker(self, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(key, self.threshold, self.base, self.cap)
+            self._breakers[key] = breaker
+        return breaker
+
+    def before(self, key: str) -> None:
+        with self._lock:
+            self._breaker(key).before()
+
+    def success(self, key: str) -> None:
+        with self._lock:
+            self._breaker(key).success()
+
+    def failure(self, key: str) -> None:
+        with self._lock:
+            self._breaker(key).failure()
+
+    def trip(self, key: str, cooldown: Optional[float] = None) -> None:
+        with self._lock:
+            self._breaker(key).trip(cooldown)
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._breaker(key).release()
+
+    def record_status(self, key: str, status: int) -> None:
+        if status in FAILURE_STATUSES:
+            self.failure(key)
+        else:
+            self.success(key)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        # Breakers that never failed are left out; they have nothing to report.
+        with self._lock:
+            return {key: b.stats() for key, b in sorted(self._breakers.items()) if b.failures or b.skipped}
+
+    def reset_counts(self) -> None:
+        # Breaker state outlives a job (a dead host stays dead for the next one in this
+        # process); only the per-job counters start over.
+        with self._lock:
+            for breaker in self._breakers.values():
+                breaker.failures = 0
+                breaker.trips = 0
+                breaker.skipped = 0
+
+
+_REGISTRY = CircuitRegistry()
+
+
+def get_registry() -> CircuitRegistry:
+    return _REGISTRY
+
+
+def install_registry(registry: CircuitRegistry) -> None:
+    global _REGISTRY
+    _REGISTRY = registry
+
+
+def configure_circuits(
+    threshold: int = FAILURE_THRESHOLD,
+    base: float = BASE_COOLDOWN_SEC,
+    cap: float = MAX_COOLDOWN_SEC,
+) -> CircuitRegistry:
+    global _REGISTRY
+    _REGISTRY = CircuitRegistry(threshold=threshold, base=base, cap=cap)
+    return _REGISTRY
+
+
+@contextmanager
+def guard(key: str, failures: Tuple[Type[BaseException], ...] = TRANSPORT_ERRORS) -> Iterator[None]:
+    # For clients that do not go through ratelimit.request (the arxiv package).
+    registry = get_registry()
+    try:
+        registry.before(key)
+    except CircuitOpen:
+        metrics.count("skipped")
+        raise
+    metrics.count("requests")
+    try:
+        yield
+    except failures:
+        metrics.count("failures")
+        registry.failure(key)
+        raise
+    except BaseException:
+        registry.release(key)
+        raise
+    registry.success(key)
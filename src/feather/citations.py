@@ -0,0 +1,190 @@
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import openalex_ops
+from .response_cache import default_cache_dir
+
+CITATIONS_DB_NAME = "citations.sqlite"
+DEFAULT_CITATION_TTL_SEC = 7 * 24 * 3600
+# Works OpenAlex does not know yet (fresh preprints) are retried sooner.
+MISS_TTL_SEC = 24 * 3600
+# OpenAlex accepts up to 50 pipe-separated values per filter.
+CITATION_BATCH_SIZE = 50
+ARXIV_ABS_RE = re.compile(r"arxiv\.org/abs/([^?#\s]+)", re.IGNORECASE)
+
+
+def citation_key(doi: Optional[str], arxiv_id: Optional[str]) -> Optional[str]:
+    doi_norm = openalex_ops.normalize_doi(doi)
+    if doi_norm:
+        return f"doi:{doi_norm.lower()}"
+    arxiv_norm = openalex_ops.normalize_arxiv_id(arxiv_id)
+    if arxiv_norm:
+        return f"arxiv:{arxiv_norm}"
+    return None
+
+
+class CitationCache:
+    def __init__(self, path: Optional[Path] = None, ttl: float = DEFAULT_CITATION_TTL_SEC):
+        self.path = path or default_cache_dir() / CITATIONS_DB_NAME
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS citations (key TEXT PRIMARY KEY, count INTEGER, fetched REAL)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, keys: List[str]) -> Dict[str, Optional[int]]:
+        if not self.enabled or not keys:
+            return {}
+        now = time.time()
+        found: Dict[str, Optional[int]] = {}
+        with self._lock:
+            conn = self._connect()
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                marks = ",".join("?" for _ in chunk)
+                rows = conn.execute(f"SELECT key, count, fetched FROM citations WHERE key IN ({marks})", chunk)
+                for key, count, fetched in rows:
+                    ttl = self.ttl if count is not None else min(self.ttl, MISS_TTL_SEC)
+                    if now - fetched <= ttl:
+                        found[key] = count
+        return found
+
+    def put_many(self, counts: Dict[str, Optional[int]]) -> None:
+        if not self.enabled or not counts:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO citations (key, count, fetched) VALUES (?, ?, ?)",
+                [(key, count, now) for key, count in counts.items()],
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_CACHE = CitationCache()
+
+
+def get_citation_cache() -> CitationCache:
+    return _CACHE
+
+
+def configure_citation_cache(path: Optional[Path] = None, ttl: float = DEFAULT_CITATION_TTL_SEC) -> CitationCache:
+    global _CACHE
+    _CACHE.close()
+    _CACHE = CitationCache(path=path, ttl=ttl)
+    return _CACHE
+
+
+def chunks(values: List[str], size: int) -> List[List[str]]:
+    return [values[i : i + size] for i in range(0, len(values), size)]
+
+
+def arxiv_id_from_work(work: Dict[str, Any]) -> Optional[str]:
+    locations = [work.get("primary_location") or {}] + list(work.get("locations") or [])
+    for loc in locations:
+        match = ARXIV_ABS_RE.search(str(loc.get("landing_page_url") or ""))
+        if match:
+            return openalex_ops.normalize_arxiv_id(match.group(1))
+    return None
+
+
+def lookup_citations(
+    records: List[Tuple[Optional[str], Optional[str]]],
+    api_key: Optional[str] = None,
+    mailto: Optional[str] = None,
+    cache: Optional[CitationCache] = None,
+    warn: Optional[Callable[[str], None]] = None,
+) -> Tuple[Dict[str, Optional[int]], Dict[str, int]]:
+    # records are (doi, arxiv_id) pairs; results are keyed by citation_key(). A DOI is
+    # tried first and the arXiv landing page second, like openalex_get_citations.
+    cache = cache or get_citation_cache()
+    stats = {"papers": 0, "cached": 0, "requests": 0, "found": 0}
+    wanted: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+    for doi, arxiv_id in records:
+        key = citation_key(doi, arxiv_id)
+        if key and key not in wanted:
+            wanted[key] = (
+                openalex_ops.normalize_doi(doi),
+                openalex_ops.normalize_arxiv_id(arxiv_id),
+            )
+    stats["papers"] = len(wanted)
+    results = cache.get_many(list(wanted))
+    stats["cached"] = len(results)
+    todo = {key: ids for key, ids in wanted.items() if key not in results}
+    fetched: Dict[str, Optional[int]] = {}
+    failed: set[str] = set()
+
+    def run_batches(
+        field: str,
+        values: Dict[str, List[str]],
+        match: Callable[[Dict[str, Any]], Optional[str]],
+        size: int,
+    ) -> None:
+        # values maps a lookup value (lower-cased DOI or arXiv ID) to the keys waiting on it.
+        for batch in chunks(list(values), size):
+            stats["requests"] += 1
+            try:
+                works = openalex_ops.fetch_citation_batch(field, batch, api_key=api_key, mailto=mailto)
+            except Exception as exc:
+                if warn:
+                    # A rejected filter will not succeed on retry; transient failures might.
+                    status = getattr(getattr(exc, "response", None), "status_code", None)
+                    level = "ERROR" if status == 400 else "WARN"
+                    warn(f"{level} citations batch failed field={field} size={len(batch)} err={repr(exc)}")
+                for value in batch:
+                    failed.update(values[value])
+                continue
+            for work in works:
+                value = match(work)
+                if value in values and work.get("cited_by_count") is not None:
+                    for key in values[value]:
+                        fetched.setdefault(key, work.get("cited_by_count"))
+
+    by_doi: Dict[str, List[str]] = {}
+    for key, (doi, _) in todo.items():
+        # Commas and pipes are filter syntax; those rare DOIs fall back to the arXiv lookup.
+        if doi and "," not in doi and "|" not in doi:
+            by_doi.setdefault(doi.lower(), []).append(key)
+    run_batches(
+        "doi",
+        by_doi,
+        lambda work: (openalex_ops.normalize_doi(work.get("doi")) or "").lower() or None,
+        CITATION_BATCH_SIZE,
+    )
+
+    by_arxiv: Dict[str, List[str]] = {}
+    for key, (_, arxiv_id) in todo.items():
+        if key not in fetched and arxiv_id:
+            by_arxiv.setdefault(arxiv_id, []).append(key)
+    # Each arXiv ID is matched under both http and https landing URLs.
+    run_batches("arxiv", by_arxiv, arxiv_id_from_work, CITATION_BATCH_SIZE // 2)
+
+    for key in todo:
+        if key not in failed or key in fetched:
+            results[key] = fetched.get(key)
+    cache.put_many({key: results[key] for key in todo if key in results})
+    stats["found"] = sum(1 for count in results.values() if count is not None)
+    return results, stats
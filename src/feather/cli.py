@@ -2,9 +2,31 @@ import argparse
 import os
 import shutil
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Dict, Iterable, Optional
 
-from .collector import prepare_jobs, run_job, run_job_agentic
+from . import (
+    blobstore,
+    circuit,
+    citations,
+    downloads,
+    http_pool,
+    jobpool,
+    pdf_text,
+    ratelimit,
+    response_cache,
+    runpack,
+    storage,
+    utils,
+    youtube_ops,
+)
+from .collector import (
+    DEFAULT_EXTRACT_BATCH_SIZE,
+    DEFAULT_LOCAL_WORKERS,
+    DEFAULT_PROVIDER_WORKERS,
+    prepare_jobs,
+    run_job,
+    run_job_agentic,
+)
 from .review import (
     collect_run_summary,
     find_run_dirs,
@@ -15,6 +37,7 @@ from .review import (
     render_review_full,
     render_review_json,
 )
+from .models import Job
 from .tavily import TavilyClient
 
 
@@ -39,6 +62,9 @@ def build_parser() -> argparse.ArgumentParser:
         "  feather --input ./instructions --output ./archive --openalex --download-pdf\n"
         "  feather --list ./runs\n"
         "  feather --review ./runs/20260104\n"
+        "  feather --input ./instructions --output ./archive --download-pdf --blob-store\n"
+        "  feather --blob-gc\n"
+        "  feather --compact ./runs --compress zst\n"
         "  feather --input ./instructions --output ./archive --youtube --yt-transcript\n"
         "  python -m feather --input ./instructions --output ./archive --download-pdf\n"
         "  python run.py --input ./examples/instructions --output ./runs\n"
@@ -76,6 +102,25 @@ def build_parser() -> argparse.ArgumentParser:
         help="List run folders under PATH (default: current directory).",
     )
     group.add_argument("--review", metavar="PATH", help="Show outputs for a single run folder or its archive path.")
+    group.add_argument(
+        "--blob-gc",
+        nargs="?",
+        const="",
+        metavar="DIR",
+        help="Delete blob store objects no longer referenced by any run (default store: ~/.cache/federlicht/blobs).",
+    )
+    group.add_argument(
+        "--compact",
+        metavar="PATH",
+        help="Compress JSONL/text files of finished runs under PATH in place (format from --compress, default gz).",
+    )
+    group.add_argument("--expand", metavar="PATH", help="Decompress runs compacted with --compact/--compress.")
+    group.add_argument(
+        "--pack",
+        metavar="PATH",
+        help=f"Move archive/ and report_notes/ of a run (or every run under PATH) into {runpack.PACK_NAME}.",
+    )
+    group.add_argument("--unpack", metavar="PATH", help=f"Restore the files of runs packed into {runpack.PACK_NAME}.")
     ap.add_argument("--output", help="Output archive root folder")
     ap.add_argument(
         "--filter",
@@ -121,9 +166,171 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Reuse an existing run folder (skip numbered suffix) and update outputs in place.",
     )
+    ap.add_argument(
+        "--parallel-providers",
+        action="store_true",
+        help="Run independent providers (local, extract, search, OpenAlex, arXiv) concurrently.",
+    )
+    ap.add_argument(
+        "--provider-workers",
+        type=int,
+        default=DEFAULT_PROVIDER_WORKERS,
+        help=f"Worker threads for --parallel-providers (default: {DEFAULT_PROVIDER_WORKERS}).",
+    )
+    ap.add_argument(
+        "--extract-batch-size",
+        type=int,
+        default=DEFAULT_EXTRACT_BATCH_SIZE,
+        help=f"URLs per Tavily extract request (1-20, default: {DEFAULT_EXTRACT_BATCH_SIZE}).",
+    )
+    ap.add_argument(
+        "--rate-limit",
+        action="append",
+        default=[],
+        metavar="KEY=RPS[:BURST]",
+        help=(
+            "Override a provider/host token bucket (repeatable), e.g. tavily=2:4 or arxiv.org=1. "
+            "Keys: tavily, openalex, arxiv, youtube, youtube_transcript, linkedin, default, or a host name."
+        ),
+    )
+    ap.add_argument(
+        "--http-per-host",
+        type=int,
+        default=http_pool.DEFAULT_PER_HOST,
+        help=f"Max pooled keep-alive connections per host (default: {http_pool.DEFAULT_PER_HOST}).",
+    )
+    ap.add_argument(
+        "--http-retries",
+        type=int,
+        default=http_pool.DEFAULT_RETRIES,
+        help=(
+            "Transport retries for connection errors and 500/502/504 on idempotent requests "
+            f"(default: {http_pool.DEFAULT_RETRIES})."
+        ),
+    )
+    ap.add_argument(
+        "--circuit-threshold",
+        type=int,
+        default=circuit.FAILURE_THRESHOLD,
+        help=(
+            "Consecutive failures (timeouts, connection errors, 429/5xx) that open a provider/host circuit; "
+            f"later calls are skipped until a probe succeeds (default: {circuit.FAILURE_THRESHOLD})."
+        ),
+    )
+    ap.add_argument(
+        "--circuit-cooldown",
+        type=float,
+        default=circuit.BASE_COOLDOWN_SEC,
+        help=(
+            "Seconds an open circuit waits before a probe call; doubles (with jitter) each time the probe fails, "
+            f"up to {circuit.MAX_COOLDOWN_SEC:.0f}s (default: {circuit.BASE_COOLDOWN_SEC:.0f})."
+        ),
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=jobpool.DEFAULT_JOBS,
+        help=(
+            "Run up to N instruction files concurrently in separate processes, sharing one rate limiter "
+            "(default: 1)."
+        ),
+    )
+    ap.add_argument(
+        "--local-workers",
+        type=int,
+        default=DEFAULT_LOCAL_WORKERS,
+        help=f"Worker threads for local file hashing and text extraction (default: {DEFAULT_LOCAL_WORKERS}).",
+    )
+    ap.add_argument(
+        "--download-workers",
+        type=int,
+        default=downloads.DEFAULT_DOWNLOAD_WORKERS,
+        help=f"Concurrent PDF/source downloads per provider (default: {downloads.DEFAULT_DOWNLOAD_WORKERS}).",
+    )
+    ap.add_argument(
+        "--downloads-per-host",
+        type=int,
+        default=downloads.DEFAULT_DOWNLOADS_PER_HOST,
+        help=f"Max concurrent downloads from one host (default: {downloads.DEFAULT_DOWNLOADS_PER_HOST}).",
+    )
+    ap.add_argument(
+        "--pdf-workers",
+        type=int,
+        default=pdf_text.DEFAULT_PDF_WORKERS,
+        help=(
+            "Processes for PDF->text conversion (default: 0 = one process while --pdf-timeout is set, "
+            "inline on the collector thread with --pdf-timeout 0)."
+        ),
+    )
+    ap.add_argument(
+        "--pdf-timeout",
+        type=int,
+        default=pdf_text.DEFAULT_PDF_TIMEOUT_SEC,
+        help=f"Per-document PDF->text timeout in seconds; 0 disables (default: {pdf_text.DEFAULT_PDF_TIMEOUT_SEC}).",
+    )
+    ap.add_argument(
+        "--blob-store",
+        nargs="?",
+        const="",
+        metavar="DIR",
+        help=(
+            "Keep raw files, PDFs and their extracted text in a shared content-addressed store and link them "
+            f"into each run (hardlink, reflink, symlink, then copy). Default DIR: ${blobstore.BLOB_DIR_ENV} "
+            "or ~/.cache/federlicht/blobs."
+        ),
+    )
+    ap.add_argument(
+        "--cache-mode",
+        choices=response_cache.CACHE_MODES,
+        default="off",
+        help=(
+            "Persistent provider response cache: off (default), read (use cached entries; misses are "
+            "fetched but not stored), readwrite (use and fill), offline (cached entries only, no network: "
+            "a miss, PDF/source download, transcript or LinkedIn fetch fails fast)."
+        ),
+    )
+    ap.add_argument(
+        "--cache-dir",
+        help=f"Response cache directory (default: ${response_cache.CACHE_DIR_ENV} or ~/.cache/federlicht).",
+    )
+    ap.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=response_cache.DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Response cache size cap in MB; least recently used entries are evicted (default: 512).",
+    )
+    ap.add_argument(
+        "--cache-ttl",
+        action="append",
+        default=[],
+        metavar="PROVIDER=SECONDS",
+        help="Override a provider cache TTL (repeatable). Providers: tavily, openalex, arxiv, youtube, default.",
+    )
     ap.add_argument("--lang", help="Preferred language for search results (en/eng or ko/kor). Soft preference only.")
     ap.add_argument("--no-stdout-log", action="store_true", help="Write logs only to _log.txt (no console output).")
     ap.add_argument("--no-citations", action="store_true", help="Disable citation enrichment for papers.")
+    ap.add_argument(
+        "--compress",
+        choices=sorted(storage.COMPRESSION_FORMATS),
+        help="Store archive JSONL/text compressed (.gz or .zst) once each job finishes; readers open them transparently.",
+    )
+    ap.add_argument(
+        "--packed",
+        action="store_true",
+        help=f"Move each finished run's archive into a single {runpack.PACK_NAME} (read directly by Federlicht).",
+    )
+    ap.add_argument(
+        "--no-near-dedup",
+        action="store_true",
+        help="Do not mark near-duplicate web pages and search results (MinHash/LSH).",
+    )
+    ap.add_argument(
+        "--citation-ttl",
+        type=float,
+        default=citations.DEFAULT_CITATION_TTL_SEC / 3600,
+        metavar="HOURS",
+        help="How long citation counts stay in the shared citation cache; 0 disables it (default: 168).",
+    )
     oa_group = ap.add_mutually_exclusive_group()
     oa_group.add_argument(
         "--openalex",
@@ -152,9 +359,80 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Fetch YouTube transcripts (requires youtube-transcript-api).",
     )
+    ap.add_argument(
+        "--yt-transcript-workers",
+        type=int,
+        default=youtube_ops.DEFAULT_TRANSCRIPT_WORKERS,
+        help=(
+            "Concurrent transcript fetches; capped at "
+            f"{youtube_ops.DIRECT_TRANSCRIPT_WORKERS} without a YouTube proxy "
+            f"(default: {youtube_ops.DEFAULT_TRANSCRIPT_WORKERS})."
+        ),
+    )
     return ap
 
 
+def runtime_settings(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        "rate_limit": list(args.rate_limit),
+        "http_per_host": args.http_per_host,
+        "http_retries": args.http_retries,
+        "circuit_threshold": args.circuit_threshold,
+        "circuit_cooldown": args.circuit_cooldown,
+        "cache_mode": args.cache_mode,
+        "cache_dir": args.cache_dir,
+        "cache_max_mb": args.cache_max_mb,
+        "cache_ttl": list(args.cache_ttl),
+        "citation_ttl": args.citation_ttl,
+        "pdf_workers": args.pdf_workers,
+        "pdf_timeout": args.pdf_timeout,
+        "blob_store": args.blob_store,
+        "agentic_search": args.agentic_search,
+        "model": args.model,
+        "max_iter": args.max_iter,
+        "stdout": not args.no_stdout_log,
+    }
+
+
+def configure_runtime(settings: Dict[str, Any]) -> response_cache.ResponseCache:
+    # Process-wide clients (rate limiter, HTTP pool, caches). Called once by the CLI and
+    # once in every --jobs worker process.
+    ratelimit.configure_rate_limits(settings["rate_limit"])
+    http_pool.configure_pool(per_host=settings["http_per_host"], retries=settings["http_retries"])
+    circuit.configure_circuits(threshold=settings["circuit_threshold"], base=settings["circuit_cooldown"])
+    cache_dir = settings["cache_dir"]
+    cache = response_cache.configure_cache(
+        mode=settings["cache_mode"],
+        path=Path(cache_dir) / response_cache.CACHE_DB_NAME if cache_dir else None,
+        max_bytes=settings["cache_max_mb"] * 1024 * 1024,
+        ttl_specs=settings["cache_ttl"],
+    )
+    citations.configure_citation_cache(
+        path=Path(cache_dir) / citations.CITATIONS_DB_NAME if cache_dir else None,
+        ttl=settings["citation_ttl"] * 3600,
+    )
+    pdf_text.configure_stage(workers=settings["pdf_workers"], timeout=settings["pdf_timeout"])
+    blob_store = settings["blob_store"]
+    if blob_store is not None:
+        blobstore.configure_store(Path(blob_store) if blob_store else blobstore.default_blob_dir())
+    return cache
+
+
+def run_one_job(job: Job, settings: Dict[str, Any], tavily: Optional[TavilyClient] = None) -> None:
+    if tavily is None:
+        tavily = TavilyClient(api_key=os.getenv("TAVILY_API_KEY") or "")
+    if settings["agentic_search"]:
+        run_job_agentic(
+            job,
+            tavily,
+            model_name=settings["model"],
+            max_iter=settings["max_iter"],
+            stdout=settings["stdout"],
+        )
+    else:
+        run_job(job, tavily, stdout=settings["stdout"])
+
+
 def main(argv: Optional[Iterable[str]] = None) -> int:
     args = build_parser().parse_args(argv)
 
@@ -168,7 +446,71 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         raise SystemExit("--yt-transcript cannot be combined with --no-youtube.")
     if args.max_iter is not None and args.max_iter < 1:
         raise SystemExit("--max-iter must be >= 1.")
+    if args.provider_workers < 1:
+        raise SystemExit("--provider-workers must be >= 1.")
+    if not 1 <= args.extract_batch_size <= 20:
+        raise SystemExit("--extract-batch-size must be between 1 and 20.")
+    if args.http_per_host < 1:
+        raise SystemExit("--http-per-host must be >= 1.")
+    if args.http_retries < 0:
+        raise SystemExit("--http-retries must be >= 0.")
+    if args.circuit_threshold < 1:
+        raise SystemExit("--circuit-threshold must be >= 1.")
+    if args.circuit_cooldown <= 0:
+        raise SystemExit("--circuit-cooldown must be > 0.")
+    if args.jobs < 1:
+        raise SystemExit("--jobs must be >= 1.")
+    if args.local_workers < 1:
+        raise SystemExit("--local-workers must be >= 1.")
+    if args.download_workers < 1:
+        raise SystemExit("--download-workers must be >= 1.")
+    if args.downloads_per_host < 1:
+        raise SystemExit("--downloads-per-host must be >= 1.")
+    if args.yt_transcript_workers < 1:
+        raise SystemExit("--yt-transcript-workers must be >= 1.")
+    if args.pdf_workers < 0:
+        raise SystemExit("--pdf-workers must be >= 0.")
+    if args.pdf_timeout < 0:
+        raise SystemExit("--pdf-timeout must be >= 0.")
+    if args.cache_max_mb < 1:
+        raise SystemExit("--cache-max-mb must be >= 1.")
+    if args.citation_ttl < 0:
+        raise SystemExit("--citation-ttl must be >= 0.")
+    if args.compress == "zst" and not utils.ZSTD_AVAILABLE:
+        raise SystemExit("--compress zst requires zstandard. Install with: python -m pip install zstandard")
 
+    if args.blob_gc is not None:
+        store = blobstore.BlobStore(Path(args.blob_gc) if args.blob_gc else None)
+        try:
+            stats = store.gc()
+        except blobstore.StoreInUse as exc:
+            raise SystemExit(f"{exc}; retry when it finishes.")
+        finally:
+            store.close()
+        print(
+            f"Blob GC ({store.root}): removed {stats['blobs_removed']} blobs "
+            f"({stats['bytes_freed']} bytes), dropped {stats['refs_dropped']} stale refs"
+        )
+        return 0
+    if args.pack or args.unpack:
+        run_dirs = find_run_dirs(Path(args.pack or args.unpack))
+        if not run_dirs:
+            raise SystemExit("No runs found.")
+        for run_dir in run_dirs:
+            stats = runpack.pack_run(run_dir) if args.pack else runpack.unpack_run(run_dir)
+            print(f"{run_dir.name}: {stats['files']} files, {stats['bytes']} bytes")
+        return 0
+    if args.compact or args.expand:
+        run_dirs = find_run_dirs(Path(args.compact or args.expand))
+        if not run_dirs:
+            raise SystemExit("No runs found.")
+        for run_dir in run_dirs:
+            if args.compact:
+                stats = storage.compact_run(run_dir, args.compress or "gz")
+            else:
+                stats = storage.expand_run(run_dir)
+            print(f"{run_dir.name}: {stats['files']} files, {stats['bytes_before']} -> {stats['bytes_after']} bytes")
+        return 0
     if args.list is not None:
         run_dirs = find_run_dirs(Path(args.list))
         summaries = [collect_run_summary(run_dir) for run_dir in run_dirs]
@@ -210,10 +552,17 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         raise SystemExit("Missing --output. Required with --input/--query.")
 
     api_key = os.getenv("TAVILY_API_KEY")
-    if not api_key:
+    # Offline replays never reach Tavily, and the key is not part of cache keys.
+    if not api_key and args.cache_mode != "offline":
         raise SystemExit("Missing environment variable: TAVILY_API_KEY")
 
-    tavily = TavilyClient(api_key=api_key)
+    settings = runtime_settings(args)
+    try:
+        cache = configure_runtime(settings)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+
+    tavily = TavilyClient(api_key=api_key or "")
     lang_pref = normalize_lang(args.lang)
     openalex_enabled = bool(args.openalex or args.download_pdf)
     if args.no_openalex:
@@ -238,19 +587,38 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         arxiv_source=args.arxiv_src,
         update_run=args.update_run,
         citations_enabled=not args.no_citations,
+        near_dedup=not args.no_near_dedup,
+        compress=args.compress,
+        packed=args.packed,
         agentic_search=args.agentic_search,
         agentic_model=args.model,
         agentic_max_iter=args.max_iter,
+        parallel_providers=args.parallel_providers,
+        provider_workers=args.provider_workers,
+        extract_batch_size=args.extract_batch_size,
+        local_workers=args.local_workers,
+        download_workers=args.download_workers,
+        downloads_per_host=args.downloads_per_host,
+        transcript_workers=args.yt_transcript_workers,
     )
-    for job in jobs:
-        if args.agentic_search:
-            run_job_agentic(
-                job,
-                tavily,
-                model_name=args.model,
-                max_iter=args.max_iter,
-                stdout=not args.no_stdout_log,
-            )
-        else:
-            run_job(job, tavily, stdout=not args.no_stdout_log)
+    if args.jobs > 1 and len(jobs) > 1:
+        # Workers log to their own _log.txt only; the console gets one progress line per job.
+        worker_settings = dict(settings, stdout=False)
+        results = jobpool.run_jobs(
+            jobs,
+            run_one_job,
+            worker_settings,
+            workers=args.jobs,
+            setup=configure_runtime,
+            progress=None if args.no_stdout_log else print,
+        )
+        pdf_text.get_stage().close()
+        return 0 if all(result["ok"] for result in results) else 1
+    try:
+        for job in jobs:
+            run_one_job(job, settings, tavily)
+    finally:
+        pdf_text.get_stage().close()
+    if cache.enabled and not args.no_stdout_log:
+        print(f"Response cache ({cache.mode}): hits={cache.hits} misses={cache.misses} path={cache.path}")
     return 0
@@ -5,26 +5,43 @@ import json
 import os
 import re
 import shutil
-import time
-from collections import Counter
+import threading
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import IO, Any, Callable, ContextManager, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import requests
 
 from . import arxiv_ops
+from . import blobstore
+from . import circuit
+from . import citations
+from . import dedup_index
+from . import index_cache
+from . import downloads
 from . import linkedin_ops
 from . import local_ops
+from . import metrics
+from . import neardup
 from . import openalex_ops
+from . import pdf_text
+from . import runpack
+from . import storage
 from . import youtube_ops
-from .models import Job, LocalPathSpec, QuerySpec
-from .tavily import TavilyClient
+from .downloads import DEFAULT_DOWNLOAD_WORKERS, DEFAULT_DOWNLOADS_PER_HOST
+from .models import DEFAULT_PROVIDER_WORKERS, Job, LocalPathSpec, QuerySpec
+from .tavily import EXTRACT_MAX_URLS, TavilyClient, split_extract_response
 from .utils import (
     append_jsonl,
     normalize_for_json,
     parse_date_from_filename,
     read_text,
     safe_filename,
+    unwatch_jsonl,
+    watch_jsonl,
     write_text,
 )
 
@@ -57,20 +74,22 @@ SITE_HINTS = {"linkedin", "arxiv", "news", "github", "youtube"}
 YOUTUBE_QUERY_SITE_RE = re.compile(r"\bsite:(?:youtube\.com|youtu\.be)\b", re.IGNORECASE)
 DIVIDER_CHARS = set("-_=*#")
 LOCAL_DIRECTIVES = ("file:", "dir:", "glob:")
-REQUEST_SLEEP_SEC = 0.5
 SUMMARY_SENTENCES = 2
 SUMMARY_CHARS = 400
 SUMMARY_MAX_RESULTS = 5
 YOUTUBE_TITLE_MAX_LEN = 80
 ARXIV_TEX_MAX_CHARS = 200000
-ARXIV_FIGURE_EXTS = {".pdf", ".png", ".jpg", ".jpeg", ".eps", ".svg"}
+ARXIV_FIGURE_EXTS = arxiv_ops.FIGURE_EXTS
 INSTRUCTION_EXTS = {".txt", ".md", ".text", ".prompt", ".instruct", ".instruction"}
 AGENTIC_TRACE_JSONL = "agentic_trace.jsonl"
 AGENTIC_TRACE_MD = "agentic_trace.md"
+CIRCUITS_JSON = "_circuits.json"
 AGENTIC_DEFAULT_MODEL = "gpt-4o-mini"
 AGENTIC_DEFAULT_MAX_ITER = 3
 AGENTIC_FALLBACK_MODEL_ENV = "FEATHER_AGENTIC_FALLBACK_MODEL"
 AGENTIC_PLANNER_TOKEN_BUDGET = 900
+DEFAULT_EXTRACT_BATCH_SIZE = 10
+DEFAULT_LOCAL_WORKERS = 4
 
 
 def is_instruction_file(path: Path) -> bool:
@@ -85,17 +104,45 @@ def is_instruction_file(path: Path) -> bool:
 
 
 class JobLogger:
-    def __init__(self, log_path: Path, also_stdout: bool = True):
+    # _log.txt is kept open (line-buffered, so tail -f still works); stage spans go to
+    # _metrics.jsonl next to it, one flushed record per closed span. close() at the end of the job.
+    def __init__(self, log_path: Path, also_stdout: bool = True, metrics_path: Optional[Path] = None):
         self.log_path = log_path
         self.also_stdout = also_stdout
+        self.metrics = metrics.MetricsWriter(metrics_path or log_path.with_name(metrics.METRICS_NAME))
+        self._fh: Optional[IO[str]] = None
+        self._lock = threading.Lock()
 
     def log(self, msg: str) -> None:
         stamp = dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         line = f"[{stamp}] {msg}"
-        with self.log_path.open("a", encoding="utf-8") as f:
-            f.write(line + "\n")
-        if self.also_stdout:
-            print(line, flush=True)
+        if msg.startswith("ERROR"):
+            metrics.count("errors")
+        with self._lock:
+            if self._fh is None:
+                self._fh = self.log_path.open("a", encoding="utf-8", buffering=1)
+            self._fh.write(line + "\n")
+            if self.also_stdout:
+                print(line, flush=True)
+
+    def span(self, stage: str, **attrs: Any) -> ContextManager[metrics.Span]:
+        return metrics.span(self.metrics, stage, **attrs)
+
+    def close(self) -> None:
+        self.metrics.close()
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+def log_call_error(logger: JobLogger, label: str, exc: BaseException) -> None:
+    # Calls refused by an open circuit are skips, not errors; they are totalled per
+    # provider/host at the end of the job.
+    if isinstance(exc, circuit.CircuitOpen):
+        logger.log(f"SKIP {label} circuit={exc.key}")
+    else:
+        logger.log(f"ERROR {label} err={repr(exc)}")
 
 
 def is_divider_line(line: str) -> bool:
@@ -340,6 +387,16 @@ def build_job(
     agentic_search: bool = False,
     agentic_model: Optional[str] = None,
     agentic_max_iter: int = 0,
+    parallel_providers: bool = False,
+    provider_workers: int = DEFAULT_PROVIDER_WORKERS,
+    extract_batch_size: int = DEFAULT_EXTRACT_BATCH_SIZE,
+    download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    downloads_per_host: int = DEFAULT_DOWNLOADS_PER_HOST,
+    local_workers: int = DEFAULT_LOCAL_WORKERS,
+    transcript_workers: int = youtube_ops.DEFAULT_TRANSCRIPT_WORKERS,
+    near_dedup: bool = True,
+    compress: Optional[str] = None,
+    packed: bool = False,
     file_date: Optional[dt.date] = None,
 ) -> Job:
     date_val = file_date or parse_date_from_filename(src_file.stem) or dt.date.today()
@@ -440,6 +497,16 @@ def build_job(
         agentic_search=agentic_search,
         agentic_model=agentic_model,
         agentic_max_iter=agentic_max_iter,
+        parallel_providers=parallel_providers,
+        provider_workers=provider_workers,
+        extract_batch_size=extract_batch_size,
+        download_workers=download_workers,
+        downloads_per_host=downloads_per_host,
+        local_workers=local_workers,
+        transcript_workers=transcript_workers,
+        near_dedup=near_dedup,
+        compress=compress,
+        packed=packed,
     )
 
 
@@ -463,6 +530,16 @@ def parse_job(
     agentic_search: bool = False,
     agentic_model: Optional[str] = None,
     agentic_max_iter: int = 0,
+    parallel_providers: bool = False,
+    provider_workers: int = DEFAULT_PROVIDER_WORKERS,
+    extract_batch_size: int = DEFAULT_EXTRACT_BATCH_SIZE,
+    download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    downloads_per_host: int = DEFAULT_DOWNLOADS_PER_HOST,
+    local_workers: int = DEFAULT_LOCAL_WORKERS,
+    transcript_workers: int = youtube_ops.DEFAULT_TRANSCRIPT_WORKERS,
+    near_dedup: bool = True,
+    compress: Optional[str] = None,
+    packed: bool = False,
     file_date: Optional[dt.date] = None,
 ) -> Job:
     content = read_text(txt_path)
@@ -488,6 +565,16 @@ def parse_job(
         agentic_search=agentic_search,
         agentic_model=agentic_model,
         agentic_max_iter=agentic_max_iter,
+        parallel_providers=parallel_providers,
+        provider_workers=provider_workers,
+        extract_batch_size=extract_batch_size,
+        download_workers=download_workers,
+        downloads_per_host=downloads_per_host,
+        local_workers=local_workers,
+        transcript_workers=transcript_workers,
+        near_dedup=near_dedup,
+        compress=compress,
+        packed=packed,
         file_date=file_date,
     )
 
@@ -569,6 +656,16 @@ def prepare_jobs(
     agentic_search: bool = False,
     agentic_model: Optional[str] = None,
     agentic_max_iter: int = 0,
+    parallel_providers: bool = False,
+    provider_workers: int = DEFAULT_PROVIDER_WORKERS,
+    extract_batch_size: int = DEFAULT_EXTRACT_BATCH_SIZE,
+    download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    downloads_per_host: int = DEFAULT_DOWNLOADS_PER_HOST,
+    local_workers: int = DEFAULT_LOCAL_WORKERS,
+    transcript_workers: int = youtube_ops.DEFAULT_TRANSCRIPT_WORKERS,
+    near_dedup: bool = True,
+    compress: Optional[str] = None,
+    packed: bool = False,
 ) -> List[Job]:
     used_ids: set[str] = set()
     if query:
@@ -601,6 +698,16 @@ def prepare_jobs(
                 agentic_search=agentic_search,
                 agentic_model=agentic_model,
                 agentic_max_iter=agentic_max_iter,
+                parallel_providers=parallel_providers,
+                provider_workers=provider_workers,
+                extract_batch_size=extract_batch_size,
+                download_workers=download_workers,
+                downloads_per_host=downloads_per_host,
+                local_workers=local_workers,
+                transcript_workers=transcript_workers,
+                near_dedup=near_dedup,
+                compress=compress,
+                packed=packed,
                 file_date=date_val,
             )
         ]
@@ -638,6 +745,16 @@ def prepare_jobs(
                 agentic_search=agentic_search,
                 agentic_model=agentic_model,
                 agentic_max_iter=agentic_max_iter,
+                parallel_providers=parallel_providers,
+                provider_workers=provider_workers,
+                extract_batch_size=extract_batch_size,
+                download_workers=download_workers,
+                downloads_per_host=downloads_per_host,
+                local_workers=local_workers,
+                transcript_workers=transcript_workers,
+                near_dedup=near_dedup,
+                compress=compress,
+                packed=packed,
                 file_date=date_val,
             )
         )
@@ -698,17 +815,20 @@ def normalize_arxiv_id(arxiv_id: str) -> str:
     return re.sub(r"v\d+$", "", arxiv_id.strip())
 
 
+def arxiv_entry_ids(entry: dict) -> List[str]:
+    if "arxiv_id" in entry:
+        arxiv_id = entry.get("arxiv_id")
+    elif "paper" in entry and isinstance(entry.get("paper"), dict):
+        arxiv_id = entry["paper"].get("arxiv_id")
+    else:
+        arxiv_id = None
+    return [normalize_arxiv_id(str(arxiv_id))] if arxiv_id else []
+
+
 def load_existing_arxiv_ids(path: Path) -> set[str]:
     ids: set[str] = set()
     for entry in load_jsonl_entries(path):
-        if "arxiv_id" in entry:
-            arxiv_id = entry.get("arxiv_id")
-        elif "paper" in entry and isinstance(entry.get("paper"), dict):
-            arxiv_id = entry["paper"].get("arxiv_id")
-        else:
-            arxiv_id = None
-        if arxiv_id:
-            ids.add(normalize_arxiv_id(str(arxiv_id)))
+        ids.update(arxiv_entry_ids(entry))
     return ids
 
 
@@ -736,33 +856,61 @@ def openalex_work_key(work: dict) -> Optional[str]:
     return None
 
 
+def openalex_entry_keys(entry: dict) -> List[str]:
+    work = entry.get("work") if isinstance(entry.get("work"), dict) else entry
+    key = openalex_work_key(work) if isinstance(work, dict) else None
+    return [key] if key else []
+
+
 def load_existing_openalex_ids(path: Path) -> set[str]:
     ids: set[str] = set()
     for entry in load_jsonl_entries(path):
-        work = entry.get("work") if isinstance(entry.get("work"), dict) else entry
-        if not isinstance(work, dict):
-            continue
-        key = openalex_work_key(work)
-        if key:
-            ids.add(key)
+        ids.update(openalex_entry_keys(entry))
     return ids
 
 
+def youtube_entry_ids(entry: dict) -> List[str]:
+    videos: List[dict] = []
+    if isinstance(entry.get("videos"), list):
+        videos = [v for v in entry.get("videos") if isinstance(v, dict)]
+    elif isinstance(entry.get("video"), dict):
+        videos = [entry.get("video")]
+    return [str(video["video_id"]) for video in videos if video.get("video_id")]
+
+
 def load_existing_youtube_ids(path: Path) -> set[str]:
     ids: set[str] = set()
     for entry in load_jsonl_entries(path):
-        videos: List[dict] = []
-        if isinstance(entry.get("videos"), list):
-            videos = [v for v in entry.get("videos") if isinstance(v, dict)]
-        elif isinstance(entry.get("video"), dict):
-            videos = [entry.get("video")]
-        for video in videos:
-            video_id = video.get("video_id")
-            if video_id:
-                ids.add(str(video_id))
+        ids.update(youtube_entry_ids(entry))
     return ids
 
 
+def query_entry_keys(entry: dict) -> List[str]:
+    query = entry.get("query")
+    return [query] if isinstance(query, str) else []
+
+
+def doc_entry_ids(entry: dict) -> List[str]:
+    doc_id = entry.get("doc_id")
+    return [str(doc_id)] if doc_id else []
+
+
+# Dedup keys per archive JSONL for --update-run. The sidecar index answers
+# membership without re-reading the file; see dedup_index.
+DEDUP_EXTRACTORS: Dict[str, Tuple[str, Callable[[dict], List[str]]]] = {
+    "arxiv/papers.jsonl": ("arxiv_ids", arxiv_entry_ids),
+    "openalex/works.jsonl": ("openalex_keys", openalex_entry_keys),
+    "youtube/videos.jsonl": ("youtube_ids", youtube_entry_ids),
+    "tavily_search.jsonl": ("queries", query_entry_keys),
+    "local/manifest.jsonl": ("doc_ids", doc_entry_ids),
+}
+
+
+def existing_keys(job: Job, name: str) -> dedup_index.KeySet:
+    extractor_id, extract = DEDUP_EXTRACTORS[name]
+    return dedup_index.open_index(job.out_dir).track(name, extractor_id, extract)
+
+
 def is_explicit_youtube_query(query: str) -> bool:
     lower = query.lower()
     if "youtube.com" in lower or "youtu.be" in lower:
@@ -803,6 +951,51 @@ def select_youtube_queries(job: Job) -> List[str]:
     return fallback[:6]
 
 
+def extract_payload_text(payload: Dict[str, Any]) -> str:
+    parts = []
+    for item in payload.get("results") or []:
+        if isinstance(item, dict):
+            parts.append(str(item.get("raw_content") or item.get("content") or ""))
+    return "\n".join(parts)
+
+
+def note_near_duplicate(job: Job, logger: JobLogger, kind: str, url: str, text: str, path: Path) -> None:
+    # Full pages (extracts, LinkedIn embeds) share one group; a match is recorded in
+    # near_duplicates.jsonl so readers can collapse it into the earlier page.
+    if not job.near_dedup:
+        return
+    match = neardup.open_index(job.out_dir).check("page", url, text)
+    if match is None:
+        return
+    canonical, score = match
+    logger.log(f"NEAR DUP: {url} ~ {canonical} ({score:.2f})")
+    append_jsonl(
+        job.out_dir / neardup.RECORDS_NAME,
+        {
+            "kind": kind,
+            "url": url,
+            "path": f"./{path.relative_to(job.out_dir).as_posix()}",
+            "duplicate_of": canonical,
+            "similarity": round(score, 3),
+        },
+    )
+
+
+def mark_search_duplicates(job: Job, results: List[Any]) -> None:
+    # Syndicated copies of one article show up under different URLs across queries;
+    # later copies get duplicate_of pointing at the first URL seen.
+    if not job.near_dedup:
+        return
+    index = neardup.open_index(job.out_dir)
+    for item in results:
+        if not isinstance(item, dict) or not isinstance(item.get("url"), str):
+            continue
+        text = f"{item.get('title') or ''}\n{item.get('content') or ''}"
+        match = index.check("snippet", item["url"], text)
+        if match is not None:
+            item["duplicate_of"] = match[0]
+
+
 def run_tavily_extract(job: Job, tavily: TavilyClient, logger: JobLogger) -> None:
     if not job.urls:
         return
@@ -814,6 +1007,7 @@ def run_tavily_extract(job: Job, tavily: TavilyClient, logger: JobLogger) -> Non
             suffix = name.split("_", 1)[-1] if "_" in name else name
             if suffix:
                 existing_suffixes.add(suffix)
+    pending: List[Tuple[str, Path]] = []
     for idx, url in enumerate(job.urls, start=1):
         safe_name = f"{safe_filename(url)}.txt"
         if job.update_run and safe_name in existing_suffixes:
@@ -833,41 +1027,79 @@ def run_tavily_extract(job: Job, tavily: TavilyClient, logger: JobLogger) -> Non
                         logger.log(f"LINKEDIN EMBED EXTRACT SKIP (exists): {out_txt.name}")
                         continue
                     write_text(out_txt, json.dumps(data, ensure_ascii=False, indent=2))
-                    time.sleep(REQUEST_SLEEP_SEC)
+                    note_near_duplicate(job, logger, "linkedin", url, extract_payload_text(data), out_txt)
                     continue
                 logger.log(f"WARN linkedin embed empty content url={url}")
             except Exception as e:
                 logger.log(f"WARN linkedin embed failed url={url} err={repr(e)}")
+        out_txt = extract_dir / f"{idx:04d}_{safe_filename(url)}.txt"
+        if job.update_run and out_txt.exists():
+            logger.log(f"TAVILY EXTRACT SKIP (exists): {out_txt.name}")
+            continue
+        pending.append((url, out_txt))
+
+    def extract_one(url: str, out_txt: Path) -> None:
         try:
-            logger.log(f"TAVILY EXTRACT: {url}")
             data = tavily.extract(url=url, include_images=False, extract_depth="advanced")
-            out_txt = extract_dir / f"{idx:04d}_{safe_filename(url)}.txt"
-            if job.update_run and out_txt.exists():
-                logger.log(f"TAVILY EXTRACT SKIP (exists): {out_txt.name}")
-                continue
             write_text(out_txt, json.dumps(data, ensure_ascii=False, indent=2))
-            time.sleep(REQUEST_SLEEP_SEC)
+            note_near_duplicate(job, logger, "tavily_extract", url, extract_payload_text(data), out_txt)
+        except Exception as e:
+            log_call_error(logger, f"extract url={url}", e)
+
+    batch_size = min(max(job.extract_batch_size, 1), EXTRACT_MAX_URLS)
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start : start + batch_size]
+        for url, _ in batch:
+            logger.log(f"TAVILY EXTRACT: {url}")
+        if len(batch) == 1:
+            extract_one(*batch[0])
+            continue
+        try:
+            data = tavily.extract_many([url for url, _ in batch], include_images=False, extract_depth="advanced")
+            per_url = split_extract_response([url for url, _ in batch], data)
         except Exception as e:
-            logger.log(f"ERROR extract url={url} err={repr(e)}")
+            logger.log(f"WARN extract batch failed size={len(batch)} err={repr(e)}")
+            per_url = {}
+        failed: List[Tuple[str, Path]] = []
+        for url, out_txt in batch:
+            payload = per_url.get(url)
+            if payload is None:
+                failed.append((url, out_txt))
+                continue
+            write_text(out_txt, json.dumps(payload, ensure_ascii=False, indent=2))
+            note_near_duplicate(job, logger, "tavily_extract", url, extract_payload_text(payload), out_txt)
+        if failed:
+            logger.log(f"TAVILY EXTRACT BATCH: {len(batch) - len(failed)}/{len(batch)} ok, retrying {len(failed)}")
+        for url, out_txt in failed:
+            logger.log(f"TAVILY EXTRACT RETRY: {url}")
+            extract_one(url, out_txt)
 
 
-def expand_local_spec(spec: LocalPathSpec, logger: JobLogger) -> List[Path]:
+def iter_local_spec(spec: LocalPathSpec, logger: JobLogger) -> Iterator[Tuple[Path, Optional[os.stat_result]]]:
     if spec.kind == "file":
-        return [Path(spec.value)]
+        yield Path(spec.value), None
+        return
     if spec.kind == "dir":
         base = Path(spec.value)
         if not base.exists():
             logger.log(f"WARN local dir not found: {spec.value}")
-            return []
+            return
         if not base.is_dir():
             logger.log(f"WARN local dir is not a directory: {spec.value}")
-            return []
-        return [p for p in base.rglob("*") if p.is_file()]
+            return
+        yield from local_ops.iter_dir_files(base)
+        return
     if spec.kind == "glob":
-        matches = [Path(p) for p in glob.glob(spec.value, recursive=True)]
-        return [p for p in matches if p.is_file()]
+        for match in glob.iglob(spec.value, recursive=True):
+            path = Path(match)
+            if path.is_file():
+                yield path, None
+        return
     logger.log(f"WARN unknown local spec kind: {spec.kind}")
-    return []
+
+
+def expand_local_spec(spec: LocalPathSpec, logger: JobLogger) -> List[Path]:
+    return [path for path, _ in iter_local_spec(spec, logger)]
 
 
 def run_local_ingest(job: Job, logger: JobLogger) -> None:
@@ -877,14 +1109,15 @@ def run_local_ingest(job: Job, logger: JobLogger) -> None:
     raw_dir = job.out_dir / "local" / "raw"
     text_dir = job.out_dir / "local" / "text"
     manifest_path = job.out_dir / "local" / "manifest.jsonl"
+    fingerprints_path = job.out_dir / "local" / local_ops.FINGERPRINTS_NAME
     raw_dir.mkdir(parents=True, exist_ok=True)
     text_dir.mkdir(parents=True, exist_ok=True)
-    seen: set[str] = set()
+    seen: Union[set[str], dedup_index.KeySet] = set()
     if job.update_run and manifest_path.exists():
-        for entry in load_jsonl_entries(manifest_path):
-            doc_id = entry.get("doc_id")
-            if doc_id:
-                seen.add(str(doc_id))
+        seen = existing_keys(job, "local/manifest.jsonl")
+    # (path, size, mtime_ns) -> sha1 from earlier runs into this archive. A match
+    # means the file is unchanged, so it is neither re-hashed nor re-extracted.
+    fingerprints = local_ops.load_fingerprints(fingerprints_path)
 
     def rel_path(path: Path) -> str:
         rel = os.path.relpath(path.resolve(), job.out_dir.resolve())
@@ -892,113 +1125,244 @@ def run_local_ingest(job: Job, logger: JobLogger) -> None:
         rel = f"./{rel}" if not rel.startswith(".") else rel
         return rel
 
-    for spec in job.local_paths:
-        matches = expand_local_spec(spec, logger)
-        if not matches:
-            if spec.kind == "glob":
-                logger.log(f"WARN local glob matched no files: {spec.value}")
-            continue
-        for path in matches:
-            key = str(path.resolve())
-            if key in seen:
-                continue
-            seen.add(key)
-            if not path.exists():
-                logger.log(f"WARN local file not found: {path}")
-                continue
-            if not local_ops.is_supported(path):
-                logger.log(f"WARN local unsupported file type: {path.name}")
-                continue
+    def ingest_one(
+        spec: LocalPathSpec,
+        path: Path,
+        stat: os.stat_result,
+        cached: Optional[dict],
+    ) -> Tuple[Optional[dict], dict]:
+        digest = (cached or {}).get("hash") or local_ops.compute_sha1(path)
+        fingerprint = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": digest}
+        doc_id = local_ops.build_doc_id(digest)
+        if job.update_run and doc_id in seen:
+            return None, fingerprint
+        slug = local_ops.slug_from_path(path)
+        ext = path.suffix.lower()
+        raw_name = f"{doc_id}--{slug}{ext}"
+        text_name = f"{doc_id}--{slug}.txt"
+        raw_path = raw_dir / raw_name
+        store = blobstore.get_store()
+        if not raw_path.exists():
+            if store is not None:
+                store.place(store.ingest(path), raw_path)
+            else:
+                shutil.copy2(path, raw_path)
 
+        text_path = text_dir / text_name
+        text_ready = bool(cached and text_path.exists())
+        if not text_ready and store is not None and not text_path.exists():
+            text_ready = store.place_text(raw_path, text_path)
+        if not text_ready:
             try:
-                digest = local_ops.compute_sha1(path)
-                doc_id = local_ops.build_doc_id(digest)
-                if job.update_run and doc_id in seen:
-                    continue
-                slug = local_ops.slug_from_path(path)
-                ext = path.suffix.lower()
-                raw_name = f"{doc_id}--{slug}{ext}"
-                text_name = f"{doc_id}--{slug}.txt"
-                raw_path = raw_dir / raw_name
-                if not raw_path.exists():
-                    shutil.copy2(path, raw_path)
-
-                text_path = text_dir / text_name
-                text_value = None
-                try:
-                    text_value = local_ops.extract_text(path)
-                    if text_value:
-                        write_text(text_path, text_value)
-                except Exception as e:
-                    logger.log(f"ERROR local text extract file={path.name} err={repr(e)}")
-
-                stat = path.stat()
-                title = spec.title or path.stem
-                payload = {
-                    "doc_id": doc_id,
-                    "source": "local",
-                    "title": title,
-                    "tags": spec.tags,
-                    "lang": spec.lang,
-                    "raw_path": rel_path(raw_path),
-                    "content_path": rel_path(text_path) if text_value else None,
-                    "file_ext": ext,
-                    "file_name": path.name,
-                    "source_path": str(path),
-                    "file_size": stat.st_size,
-                    "modified": dt.datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "hash": digest,
-                    "query_id": job.query_id,
-                }
-                append_jsonl(manifest_path, payload)
+                text_value = local_ops.extract_text(path)
+                if text_value:
+                    write_text(text_path, text_value)
+                    text_ready = True
+                    if store is not None:
+                        store.record_text(raw_path, text_path)
+            except Exception as e:
+                logger.log(f"ERROR local text extract file={path.name} err={repr(e)}")
+
+        title = spec.title or path.stem
+        payload = {
+            "doc_id": doc_id,
+            "source": "local",
+            "title": title,
+            "tags": spec.tags,
+            "lang": spec.lang,
+            "raw_path": rel_path(raw_path),
+            "content_path": rel_path(text_path) if text_ready else None,
+            "file_ext": ext,
+            "file_name": path.name,
+            "source_path": str(path),
+            "file_size": stat.st_size,
+            "modified": dt.datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            "hash": digest,
+            "query_id": job.query_id,
+        }
+        return payload, fingerprint
+
+    # Results are consumed in walk order so manifest rows stay deterministic; the
+    # window bounds how far hashing/extraction may run ahead of the walk.
+    workers = max(1, job.local_workers)
+    window = workers * 4
+    in_flight: Deque[Tuple[Path, str, Future]] = deque()
+    unchanged = 0
+
+    def drain(limit: int) -> None:
+        while len(in_flight) > limit:
+            path, key, future = in_flight.popleft()
+            try:
+                payload, fingerprint = future.result()
+                fingerprints[key] = fingerprint
+                if payload:
+                    append_jsonl(manifest_path, payload)
+                    metrics.count("bytes", payload["file_size"])
             except Exception as e:
                 logger.log(f"ERROR local ingest file={path.name} err={repr(e)}")
 
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="feather-local") as pool:
+            for spec in job.local_paths:
+                matched = 0
+                for path, stat in iter_local_spec(spec, logger):
+                    matched += 1
+                    key = str(path.resolve())
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    if stat is None:
+                        if not path.exists():
+                            logger.log(f"WARN local file not found: {path}")
+                            continue
+                        stat = path.stat()
+                    if not local_ops.is_supported(path):
+                        logger.log(f"WARN local unsupported file type: {path.name}")
+                        continue
+                    cached = fingerprints.get(key)
+                    if not local_ops.fingerprint_matches(cached, stat):
+                        cached = None
+                    elif job.update_run and local_ops.build_doc_id(cached["hash"]) in seen:
+                        unchanged += 1
+                        metrics.count("cache_hits")
+                        continue
+                    in_flight.append((path, key, pool.submit(metrics.carry(ingest_one), spec, path, stat, cached)))
+                    drain(window)
+                if not matched and spec.kind == "glob":
+                    logger.log(f"WARN local glob matched no files: {spec.value}")
+            drain(0)
+    finally:
+        try:
+            local_ops.save_fingerprints(fingerprints_path, fingerprints)
+        except Exception as e:
+            logger.log(f"WARN local fingerprints not saved err={repr(e)}")
+    if unchanged:
+        logger.log(f"LOCAL UNCHANGED: {unchanged} files skipped (fingerprint match)")
+
+
+def enrich_citations(job: Job, logger: JobLogger, metas: List[dict]) -> None:
+    # Fills cited_by_count in place with a few batched OpenAlex requests instead of
+    # one lookup per paper; counts are kept in the shared citation cache.
+    if not job.citations_enabled:
+        return
+    missing = [meta for meta in metas if meta.get("cited_by_count") is None]
+    records = [(meta.get("doi"), meta.get("arxiv_id")) for meta in missing]
+    if not any(citations.citation_key(doi, arxiv_id) for doi, arxiv_id in records):
+        return
+    counts, stats = citations.lookup_citations(
+        records,
+        api_key=os.getenv("OPENALEX_API_KEY"),
+        mailto=os.getenv("OPENALEX_MAILTO"),
+        warn=logger.log,
+    )
+    logger.log(
+        f"CITATIONS: {stats['papers']} papers, {stats['cached']} cached, "
+        f"{stats['requests']} OpenAlex requests, {stats['found']} with counts"
+    )
+    for meta, (doi, arxiv_id) in zip(missing, records):
+        count = counts.get(citations.citation_key(doi, arxiv_id) or "")
+        if count is not None:
+            meta["cited_by_count"] = count
+
+
+@contextmanager
+def open_download_manager(
+    job: Job, shared: Optional[downloads.DownloadManager] = None
+) -> Iterator[downloads.DownloadManager]:
+    # One manager per job (see run_providers) so worker and per-host limits hold across
+    # stages and parallel lanes; a stage called on its own gets a private one.
+    if shared is not None:
+        yield shared
+        return
+    with downloads.DownloadManager(
+        job.out_dir / downloads.MANIFEST_NAME,
+        workers=job.download_workers,
+        per_host=job.downloads_per_host,
+    ) as dm:
+        yield dm
+
+
+def submit_pdf_text(pdf_path: Path, txt_path: Path, logger: JobLogger) -> Optional[Future]:
+    if txt_path.exists():
+        return None
+    store = blobstore.get_store()
+    if store is not None and store.place_text(pdf_path, txt_path):
+        logger.log(f"PDF->TEXT SHARED: {pdf_path.name}")
+        return None
+    logger.log(f"PDF->TEXT: {pdf_path.name}")
+    return pdf_text.get_stage().submit(pdf_path, txt_path)
+
+
+def finish_pdf_text(conversions: List[Tuple[str, Optional[Future]]], logger: JobLogger) -> None:
+    if not any(future is not None for _, future in conversions):
+        return
+    stage = pdf_text.get_stage()
+    # Conversions start as soon as each PDF lands; this span covers the remaining wait.
+    with logger.span("pdf_to_text") as span:
+        for label, future in conversions:
+            if future is None:
+                continue
+            try:
+                result = stage.wait(future)
+                span.add("files")
+                span.add("chars", int(result.get("chars") or 0))
+                store = blobstore.get_store()
+                if store is not None:
+                    store.record_text(Path(result["pdf"]), Path(result["text"]))
+            except Exception as e:
+                logger.log(f"ERROR {label} err={repr(e)}")
 
-def run_url_pdf_downloads(job: Job, logger: JobLogger) -> None:
+
+def run_url_pdf_downloads(job: Job, logger: JobLogger, dm: Optional[downloads.DownloadManager] = None) -> None:
     if not job.download_pdf or not job.urls:
         return
     pdf_dir = job.out_dir / "web" / "pdf"
     text_dir = job.out_dir / "web" / "text"
-    for idx, url in enumerate(job.urls, start=1):
-        if not is_pdf_url(url):
-            continue
-        try:
-            filename = url_to_pdf_name(url, f"url_{idx:04d}.pdf")
-            pdf_path = pdf_dir / filename
-            if not pdf_path.exists():
-                logger.log(f"WEB PDF DOWNLOAD: {url} -> {pdf_path.name}")
-                arxiv_ops.arxiv_download_pdf(url, pdf_path)
-            if arxiv_ops.PYMUPDF_AVAILABLE:
-                txt_path = text_dir / f"{pdf_path.stem}.txt"
-                if not txt_path.exists():
-                    logger.log(f"PDF->TEXT: {pdf_path.name}")
-                    txt = arxiv_ops.pdf_to_text(pdf_path)
-                    write_text(txt_path, txt)
-            else:
-                logger.log("ERROR missing dependency: pymupdf (pip install pymupdf)")
-        except Exception as e:
-            logger.log(f"ERROR web pdf url={url} err={repr(e)}")
+    pending: List[Tuple[str, Path, Optional[Future]]] = []
+    with open_download_manager(job, dm) as dm:
+        for idx, url in enumerate(job.urls, start=1):
+            if not is_pdf_url(url):
+                continue
+            try:
+                filename = url_to_pdf_name(url, f"url_{idx:04d}.pdf")
+                pdf_path = pdf_dir / filename
+                future = None
+                if not downloads.is_complete(pdf_path):
+                    logger.log(f"WEB PDF DOWNLOAD: {url} -> {pdf_path.name}")
+                    future = dm.submit(url, pdf_path, download=arxiv_ops.arxiv_download_pdf)
+                pending.append((url, pdf_path, future))
+            except Exception as e:
+                log_call_error(logger, f"web pdf url={url}", e)
+        conversions: List[Tuple[str, Optional[Future]]] = []
+        for url, pdf_path, future in pending:
+            try:
+                if future is not None:
+                    future.result()
+                if arxiv_ops.PYMUPDF_AVAILABLE:
+                    conversions.append(
+                        (f"web pdf url={url}", submit_pdf_text(pdf_path, text_dir / f"{pdf_path.stem}.txt", logger))
+                    )
+                else:
+                    logger.log("ERROR missing dependency: pymupdf (pip install pymupdf)")
+            except Exception as e:
+                log_call_error(logger, f"web pdf url={url}", e)
+    finish_pdf_text(conversions, logger)
 
 
 def run_tavily_search(job: Job, tavily: TavilyClient, logger: JobLogger) -> None:
     if not job.query_specs:
         return
     search_path = job.out_dir / "tavily_search.jsonl"
-    existing_by_query: dict[str, dict] = {}
+    existing_queries: Union[set[str], dedup_index.KeySet] = set()
     if job.update_run and search_path.exists():
-        for entry in load_jsonl_entries(search_path):
-            query = entry.get("query")
-            if isinstance(query, str) and query not in existing_by_query:
-                existing_by_query[query] = entry
-        if existing_by_query:
-            logger.log(f"TAVILY SEARCH UPDATE: {len(existing_by_query)} cached queries")
-    new_entries: list[dict] = []
+        existing_queries = existing_keys(job, "tavily_search.jsonl")
+        if existing_queries:
+            logger.log(f"TAVILY SEARCH UPDATE: {len(existing_queries)} cached queries")
     for spec in job.query_specs:
         try:
             q2 = apply_site_hint(spec.text, spec.hints)
             q2 = apply_language_hint(q2, job.lang_pref)
-            if job.update_run and q2 in existing_by_query:
+            if job.update_run and q2 in existing_queries:
                 logger.log(f"TAVILY SEARCH SKIP (exists): {q2}")
                 continue
             logger.log(f"TAVILY SEARCH: {q2}")
@@ -1011,35 +1375,14 @@ def run_tavily_search(job: Job, tavily: TavilyClient, logger: JobLogger) -> None
             payload = {"query": q2, "result": res}
             if isinstance(res, dict) and isinstance(res.get("results"), list):
                 add_result_summaries(res["results"])
+                mark_search_duplicates(job, res["results"])
                 payload["query_summary"] = summarize_results(res["results"])
                 if job.lang_pref:
                     payload["lang_pref"] = job.lang_pref
                     payload["preferred_results"] = prefer_results(res["results"], job.lang_pref)
-            if job.update_run:
-                new_entries.append(payload)
-            else:
-                append_jsonl(search_path, payload)
-            time.sleep(REQUEST_SLEEP_SEC)
+            append_jsonl(search_path, payload)
         except Exception as e:
-            logger.log(f"ERROR search query={spec.text} err={repr(e)}")
-    if job.update_run and new_entries:
-        merged: list[dict] = []
-        seen: set[str] = set()
-        for entry in list(existing_by_query.values()):
-            query = entry.get("query")
-            if isinstance(query, str) and query not in seen:
-                merged.append(entry)
-                seen.add(query)
-        for entry in new_entries:
-            query = entry.get("query")
-            if isinstance(query, str):
-                seen.add(query)
-            merged.append(entry)
-        search_path.parent.mkdir(parents=True, exist_ok=True)
-        search_path.write_text(
-            "\n".join(json.dumps(item, ensure_ascii=False) for item in merged) + "\n",
-            encoding="utf-8",
-        )
+            log_call_error(logger, f"search query={spec.text}", e)
 
 
 def run_youtube(job: Job, logger: JobLogger) -> None:
@@ -1053,9 +1396,12 @@ def run_youtube(job: Job, logger: JobLogger) -> None:
 
     videos_path = job.out_dir / "youtube" / "videos.jsonl"
     transcript_dir = job.out_dir / "youtube" / "transcripts"
-    existing_ids: set[str] = set()
+    existing_ids: Union[set[str], dedup_index.KeySet] = set()
+    seen_ids: Union[set[str], dedup_index.KeySet] = set()
     if job.update_run and videos_path.exists():
-        existing_ids = load_existing_youtube_ids(videos_path)
+        existing_ids = existing_keys(job, "youtube/videos.jsonl")
+        # A second view over the same index: seen_ids also collects this run's picks.
+        seen_ids = existing_keys(job, "youtube/videos.jsonl")
         if existing_ids:
             logger.log(f"YOUTUBE UPDATE: {len(existing_ids)} cached videos")
 
@@ -1063,7 +1409,6 @@ def run_youtube(job: Job, logger: JobLogger) -> None:
     published_before = dt.datetime.combine(job.date, dt.time.max)
     relevance_language = job.lang_pref
     details_cache: dict[str, dict] = {}
-    seen_ids: set[str] = set(existing_ids)
     quota_exceeded = False
 
     def add_summary(video: dict) -> None:
@@ -1121,48 +1466,84 @@ def run_youtube(job: Job, logger: JobLogger) -> None:
             lines.append(f"Source: {source}")
         return "\n".join(lines).rstrip() + "\n\n"
 
-    def attach_transcript(video: dict) -> None:
-        video_id = video.get("video_id")
-        if not video_id:
-            return
-        title = str(video.get("title") or "")
-        out_txt, rel_path = build_transcript_path(video_id, title)
-        if out_txt.exists():
-            video["transcript_path"] = rel_path
-            return
+    fetcher = youtube_ops.TranscriptFetcher(
+        workers=job.transcript_workers,
+        languages=[job.lang_pref] if job.lang_pref else None,
+    )
+    transcript_warned: set[str] = set()
 
-        legacy_path = transcript_dir / f"{video_id}.txt"
-        legacy_text = read_text(legacy_path) if legacy_path.exists() else None
-        try:
-            if legacy_text is None:
+    def attach_transcripts(videos: List[dict]) -> None:
+        pending: List[Tuple[dict, Path, str, Path, Optional[str]]] = []
+        fetch_ids: List[str] = []
+        for video in videos:
+            video_id = video.get("video_id")
+            if not video_id:
+                continue
+            title = str(video.get("title") or "")
+            out_txt, rel_path = build_transcript_path(video_id, title)
+            if out_txt.exists():
+                video["transcript_path"] = rel_path
+                continue
+            legacy_path = transcript_dir / f"{video_id}.txt"
+            legacy_text = read_text(legacy_path) if legacy_path.exists() else None
+            if legacy_text is None and video_id not in fetch_ids:
                 logger.log(f"YOUTUBE TRANSCRIPT: {video_id}")
-                segments = youtube_ops.fetch_transcript(
-                    video_id,
-                    languages=[job.lang_pref] if job.lang_pref else None,
-                )
-                transcript_text = youtube_ops.format_transcript(segments)
-            else:
-                transcript_text = legacy_text.strip()
-
-            url = video.get("url") or f"https://www.youtube.com/watch?v={video_id}"
-            header = format_transcript_header(video, url)
-            body = transcript_text.strip()
-            payload = header + (body + "\n" if body else "")
-            write_text(out_txt, payload)
-            video["transcript_path"] = rel_path
-            if legacy_path.exists():
-                legacy_path.unlink()
-        except Exception as e:
-            status = youtube_ops.classify_transcript_error(e)
-            if status == "blocked":
-                logger.log(
-                    "WARN youtube transcript blocked by YouTube. "
-                    "Set YOUTUBE_PROXY or disable --yt-transcript."
-                )
-            elif status == "unavailable":
-                logger.log(f"WARN youtube transcript unavailable id={video_id} err={repr(e)}")
-            else:
+                fetch_ids.append(video_id)
+            pending.append((video, out_txt, rel_path, legacy_path, legacy_text))
+
+        fetched = {
+            video_id: (status, segments, exc)
+            for video_id, status, segments, exc in fetcher.fetch_many(fetch_ids)
+        }
+        skipped = 0
+        offline = 0
+        for video, out_txt, rel_path, legacy_path, legacy_text in pending:
+            video_id = video["video_id"]
+            if legacy_text is None:
+                status, segments, exc = fetched[video_id]
+                if status == "skipped":
+                    skipped += 1
+                    continue
+                if status == "offline":
+                    offline += 1
+                    continue
+                if status == "blocked":
+                    if "blocked" not in transcript_warned:
+                        transcript_warned.add("blocked")
+                        logger.log(
+                            "WARN youtube transcript blocked by YouTube. "
+                            "Set YOUTUBE_PROXY or disable --yt-transcript."
+                        )
+                    continue
+                if status == "unavailable":
+                    logger.log(f"WARN youtube transcript unavailable id={video_id} err={repr(exc)}")
+                    continue
+                if status == "timeout":
+                    logger.log(f"WARN youtube transcript timeout id={video_id}")
+                    continue
+                if status != "ok":
+                    logger.log(f"ERROR youtube transcript id={video_id} err={repr(exc)}")
+                    continue
+            try:
+                if legacy_text is None:
+                    transcript_text = youtube_ops.format_transcript(segments or [])
+                else:
+                    transcript_text = legacy_text.strip()
+
+                url = video.get("url") or f"https://www.youtube.com/watch?v={video_id}"
+                header = format_transcript_header(video, url)
+                body = transcript_text.strip()
+                payload = header + (body + "\n" if body else "")
+                write_text(out_txt, payload)
+                video["transcript_path"] = rel_path
+                if legacy_path.exists():
+                    legacy_path.unlink()
+            except Exception as e:
                 logger.log(f"ERROR youtube transcript id={video_id} err={repr(e)}")
+        if skipped:
+            logger.log(f"WARN youtube transcripts skipped after repeated blocks: {skipped} videos")
+        if offline:
+            logger.log(f"YOUTUBE TRANSCRIPT SKIP (offline cache mode): {offline} videos")
 
     youtube_queries = select_youtube_queries(job)
     if not youtube_queries:
@@ -1201,19 +1582,19 @@ def run_youtube(job: Job, logger: JobLogger) -> None:
                 if not youtube_ops.TRANSCRIPT_AVAILABLE:
                     logger.log("ERROR missing dependency: youtube-transcript-api (pip install youtube-transcript-api)")
                 else:
-                    for vid in videos:
-                        attach_transcript(vid)
+                    attach_transcripts(videos)
             append_jsonl(videos_path, {"query": q, "videos": videos})
-            time.sleep(REQUEST_SLEEP_SEC)
         except requests.exceptions.HTTPError as e:
             reason, message = youtube_ops.parse_api_error(e.response)
             if reason == "quotaExceeded":
                 logger.log(f"ERROR youtube quota exceeded: {message or 'quota exceeded'}")
+                # The quota resets daily; keep later YouTube calls (agentic rounds) from trying.
+                circuit.get_registry().trip("youtube", circuit.MAX_COOLDOWN_SEC)
                 quota_exceeded = True
                 break
             logger.log(f"ERROR youtube query={q} err={reason or repr(e)}")
         except Exception as e:
-            logger.log(f"ERROR youtube query={q} err={repr(e)}")
+            log_call_error(logger, f"youtube query={q}", e)
 
     direct_urls = []
     for url in job.urls:
@@ -1247,6 +1628,7 @@ def run_youtube(job: Job, logger: JobLogger) -> None:
         except Exception as e:
             logger.log(f"WARN youtube direct metadata failed: {repr(e)}")
 
+    direct_videos: List[Tuple[str, dict]] = []
     for url, vid in direct_urls:
         if job.update_run and vid in existing_ids:
             logger.log(f"YOUTUBE DIRECT SKIP (exists): {url}")
@@ -1263,18 +1645,21 @@ def run_youtube(job: Job, logger: JobLogger) -> None:
             }
         video["direct_url"] = url
         add_summary(video)
-        if job.youtube_transcript:
-            if not youtube_ops.TRANSCRIPT_AVAILABLE:
-                logger.log("ERROR missing dependency: youtube-transcript-api (pip install youtube-transcript-api)")
-            else:
-                attach_transcript(video)
+        direct_videos.append((url, video))
+    if job.youtube_transcript and direct_videos:
+        if not youtube_ops.TRANSCRIPT_AVAILABLE:
+            logger.log("ERROR missing dependency: youtube-transcript-api (pip install youtube-transcript-api)")
+        else:
+            attach_transcripts([video for _, video in direct_videos])
+    for url, video in direct_videos:
         append_jsonl(videos_path, {"direct_url": url, "video": video})
-        seen_ids.add(vid)
+        seen_ids.add(video["video_id"])
 
     if quota_exceeded:
         tavily_path = job.out_dir / "tavily_search.jsonl"
         if not tavily_path.exists():
             return
+        fallback: List[Tuple[str, dict, Optional[str]]] = []
         for line in tavily_path.read_text(encoding="utf-8", errors="ignore").splitlines():
             line = line.strip()
             if not line:
@@ -1300,16 +1685,18 @@ def run_youtube(job: Job, logger: JobLogger) -> None:
                 }
                 if query:
                     video["query"] = query
-                if job.youtube_transcript:
-                    if not youtube_ops.TRANSCRIPT_AVAILABLE:
-                        logger.log("ERROR missing dependency: youtube-transcript-api (pip install youtube-transcript-api)")
-                    else:
-                        attach_transcript(video)
-                append_jsonl(videos_path, {"tavily_url": url, "video": video, "query": query})
+                fallback.append((url, video, query))
                 seen_ids.add(video_id)
+        if job.youtube_transcript and fallback:
+            if not youtube_ops.TRANSCRIPT_AVAILABLE:
+                logger.log("ERROR missing dependency: youtube-transcript-api (pip install youtube-transcript-api)")
+            else:
+                attach_transcripts([video for _, video, _ in fallback])
+        for url, video, query in fallback:
+            append_jsonl(videos_path, {"tavily_url": url, "video": video, "query": query})
 
 
-def run_openalex(job: Job, logger: JobLogger) -> None:
+def run_openalex(job: Job, logger: JobLogger, dm: Optional[downloads.DownloadManager] = None) -> None:
     if not job.openalex_enabled or not job.queries:
         return
 
@@ -1318,96 +1705,121 @@ def run_openalex(job: Job, logger: JobLogger) -> None:
     text_dir = job.out_dir / "openalex" / "text"
     api_key = os.getenv("OPENALEX_API_KEY")
     mailto = os.getenv("OPENALEX_MAILTO")
-    downloaded_by_url: dict[str, Path] = {}
-    existing_ids: set[str] = set()
+    existing_ids: Union[set[str], dedup_index.KeySet] = set()
     if job.update_run and works_path.exists():
-        existing_ids = load_existing_openalex_ids(works_path)
+        existing_ids = existing_keys(job, "openalex/works.jsonl")
         if existing_ids:
             logger.log(f"OPENALEX UPDATE: {len(existing_ids)} cached works")
 
-    for q in job.queries:
-        try:
-            logger.log(f"OPENALEX SEARCH: {q}")
-            works = openalex_ops.openalex_search_recent(
-                query=q,
-                end_date=job.date,
-                days=job.days,
-                max_results=job.openalex_max_results,
-                api_key=api_key,
-                mailto=mailto,
-            )
-            for w in works:
-                work_key = openalex_work_key(w)
-                oa_id = work_key or "openalex"
-                skip_entry = bool(job.update_run and work_key and work_key in existing_ids)
-                if skip_entry:
-                    logger.log(f"OPENALEX SKIP (exists): {oa_id}")
-                download_url = None
-                if job.download_pdf:
-                    pdf_urls = w.get("pdf_urls") or []
-                    if w.get("pdf_url"):
-                        pdf_urls = [w["pdf_url"]] + [u for u in pdf_urls if u != w["pdf_url"]]
-                    last_err = None
-                    for url in pdf_urls:
-                        try:
-                            if url in downloaded_by_url and downloaded_by_url[url].exists():
-                                download_url = url
-                                pdf_path = downloaded_by_url[url]
-                                logger.log(f"OPENALEX PDF REUSE: {url} -> {pdf_path.name}")
-                                if arxiv_ops.PYMUPDF_AVAILABLE:
-                                    txt_path = text_dir / f"{pdf_path.stem}.txt"
-                                    if not txt_path.exists():
-                                        logger.log(f"PDF->TEXT: {pdf_path.name}")
-                                        txt = arxiv_ops.pdf_to_text(pdf_path)
-                                        write_text(txt_path, txt)
-                                else:
-                                    logger.log("ERROR missing dependency: pymupdf (pip install pymupdf)")
-                                break
-                            pdf_path = pdf_dir / f"{oa_id}.pdf"
-                            if not pdf_path.exists():
-                                logger.log(f"OPENALEX PDF DOWNLOAD: {url} -> {pdf_path.name}")
-                                openalex_ops.openalex_download_pdf(
-                                    url,
-                                    pdf_path,
-                                    referer=w.get("landing_page_url"),
-                                )
-                            download_url = url
-                            downloaded_by_url[url] = pdf_path
+    def download_work_pdf(q: str, w: dict, pdf_urls: List[str], pdf_path: Path) -> Optional[str]:
+        # Candidates are tried in order; the first verified PDF wins.
+        last_err = None
+        for url in pdf_urls:
+            try:
+                if not downloads.is_complete(pdf_path):
+                    logger.log(f"OPENALEX PDF DOWNLOAD: {url} -> {pdf_path.name}")
+                    dm.fetch(
+                        url,
+                        pdf_path,
+                        download=openalex_ops.openalex_download_pdf,
+                        referer=w.get("landing_page_url"),
+                    )
+                return url
+            except Exception as e:
+                last_err = e
+                logger.log(f"WARN openalex pdf download failed url={url} err={repr(e)}")
+        if pdf_urls:
+            logger.log(f"ERROR openalex pdf download failed query={q} err={repr(last_err)} urls={pdf_urls[:3]}")
+        return None
 
+    cursors_path = job.out_dir / "openalex" / openalex_ops.CURSORS_NAME
+    cursors = openalex_ops.load_cursors(cursors_path)
+    claimed: dict[str, Tuple[Path, Future]] = {}
+    conversions: List[Tuple[str, Optional[Future]]] = []
+    converted: set[Path] = set()
+    with open_download_manager(job, dm) as dm:
+        for q in job.queries:
+            try:
+                key = openalex_ops.cursor_key(q, job.date, job.days, job.openalex_max_results)
+                state = cursors.get(key) or {}
+                cursor, fetched = "*", 0
+                resuming = bool(state.get("next_cursor")) and not state.get("done")
+                if resuming:
+                    cursor, fetched = state["next_cursor"], int(state.get("fetched") or 0)
+                    if not job.update_run and works_path.exists():
+                        existing_ids = existing_keys(job, "openalex/works.jsonl")
+                    logger.log(f"OPENALEX RESUME: {q} after {fetched} works")
+                skip_known = job.update_run or resuming
+                logger.log(f"OPENALEX SEARCH: {q}")
+                pages = openalex_ops.iter_search_pages(
+                    query=q,
+                    end_date=job.date,
+                    days=job.days,
+                    max_results=job.openalex_max_results,
+                    api_key=api_key,
+                    mailto=mailto,
+                    cursor=cursor,
+                    fetched=fetched,
+                )
+                # Each page is downloaded and appended before the next one is requested,
+                # then its cursor is saved so an interrupted sweep resumes from there.
+                for works, next_cursor in pages:
+                    pending: List[Tuple[dict, Optional[str], bool, Optional[Path], Optional[Future]]] = []
+                    for w in works:
+                        work_key = openalex_work_key(w)
+                        oa_id = work_key or "openalex"
+                        skip_entry = bool(skip_known and work_key and work_key in existing_ids)
+                        if skip_entry:
+                            logger.log(f"OPENALEX SKIP (exists): {oa_id}")
+                        pdf_path = None
+                        future = None
+                        if job.download_pdf:
+                            pdf_urls = w.get("pdf_urls") or []
+                            if w.get("pdf_url"):
+                                pdf_urls = [w["pdf_url"]] + [u for u in pdf_urls if u != w["pdf_url"]]
+                            shared = next((claimed[u] for u in pdf_urls if u in claimed), None)
+                            if shared is not None:
+                                pdf_path, future = shared
+                                logger.log(f"OPENALEX PDF REUSE: {pdf_urls[0]} -> {pdf_path.name}")
+                            elif pdf_urls:
+                                pdf_path = pdf_dir / f"{oa_id}.pdf"
+                                future = dm.run(download_work_pdf, q, w, pdf_urls, pdf_path)
+                                for url in pdf_urls:
+                                    claimed.setdefault(url, (pdf_path, future))
+                        pending.append((w, work_key, skip_entry, pdf_path, future))
+
+                    for w, work_key, skip_entry, pdf_path, future in pending:
+                        download_url = future.result() if future is not None else None
+                        if download_url and pdf_path is not None:
                             if arxiv_ops.PYMUPDF_AVAILABLE:
-                                txt_path = text_dir / f"{pdf_path.stem}.txt"
-                                if not txt_path.exists():
-                                    logger.log(f"PDF->TEXT: {pdf_path.name}")
-                                    txt = arxiv_ops.pdf_to_text(pdf_path)
-                                    write_text(txt_path, txt)
+                                # Reused PDFs are shared between works; convert each file once.
+                                if pdf_path not in converted:
+                                    converted.add(pdf_path)
+                                    txt_path = text_dir / f"{pdf_path.stem}.txt"
+                                    conversions.append(
+                                        (
+                                            f"pdf_to_text file={pdf_path.name}",
+                                            submit_pdf_text(pdf_path, txt_path, logger),
+                                        )
+                                    )
                             else:
                                 logger.log("ERROR missing dependency: pymupdf (pip install pymupdf)")
-                            break
-                        except Exception as e:
-                            last_err = e
-                            logger.log(f"WARN openalex pdf download failed url={url} err={repr(e)}")
+                            w = dict(w)
+                            w["downloaded_pdf_url"] = download_url
+                        if skip_entry:
                             continue
-
-                    if download_url is None and pdf_urls:
-                        logger.log(
-                            f"ERROR openalex pdf download failed query={q} err={repr(last_err)} urls={pdf_urls[:3]}"
-                        )
-
-                if download_url:
-                    w = dict(w)
-                    w["downloaded_pdf_url"] = download_url
-                if skip_entry:
-                    continue
-                append_jsonl(works_path, {"query": q, "work": w})
-                if work_key:
-                    existing_ids.add(work_key)
-
-            time.sleep(REQUEST_SLEEP_SEC)
-        except Exception as e:
-            logger.log(f"ERROR openalex query={q} err={repr(e)}")
+                        append_jsonl(works_path, {"query": q, "work": w})
+                        if work_key:
+                            existing_ids.add(work_key)
+                    fetched += len(works)
+                    cursors[key] = {"next_cursor": next_cursor, "fetched": fetched, "done": next_cursor is None}
+                    openalex_ops.save_cursors(cursors_path, cursors)
+            except Exception as e:
+                log_call_error(logger, f"openalex query={q}", e)
+        finish_pdf_text(conversions, logger)
 
 
-def run_arxiv_ids(job: Job, logger: JobLogger) -> None:
+def run_arxiv_ids(job: Job, logger: JobLogger, dm: Optional[downloads.DownloadManager] = None) -> None:
     if not job.arxiv_ids:
         return
     if not arxiv_ops.ARXIV_AVAILABLE:
@@ -1417,94 +1829,81 @@ def run_arxiv_ids(job: Job, logger: JobLogger) -> None:
     arxiv_meta_path = job.out_dir / "arxiv" / "papers.jsonl"
     arxiv_pdf_dir = job.out_dir / "arxiv" / "pdf"
     arxiv_text_dir = job.out_dir / "arxiv" / "text"
-    existing_ids: set[str] = set()
+    existing_ids: Union[set[str], dedup_index.KeySet] = set()
     if job.update_run and arxiv_meta_path.exists():
-        existing_ids = load_existing_arxiv_ids(arxiv_meta_path)
+        existing_ids = existing_keys(job, "arxiv/papers.jsonl")
         if existing_ids:
             logger.log(f"ARXIV UPDATE: {len(existing_ids)} cached papers")
 
-    api_key = os.getenv("OPENALEX_API_KEY")
-    mailto = os.getenv("OPENALEX_MAILTO")
-    citations_cache: dict[str, Optional[int]] = {}
-
-    def enrich_citations(meta: dict) -> dict:
-        if not job.citations_enabled:
-            return meta
-        if meta.get("cited_by_count") is not None:
-            return meta
-        doi = meta.get("doi")
-        arxiv_id = meta.get("arxiv_id")
-        key = doi or arxiv_id
-        if not key:
-            return meta
-        if key in citations_cache:
-            count = citations_cache[key]
-        else:
-            try:
-                count = openalex_ops.openalex_get_citations(
-                    doi=doi,
-                    arxiv_id=arxiv_id,
-                    api_key=api_key,
-                    mailto=mailto,
-                )
-            except Exception as e:
-                logger.log(f"WARN citations lookup failed arxiv_id={arxiv_id} err={repr(e)}")
-                count = None
-            citations_cache[key] = count
-        if count is not None:
-            meta["cited_by_count"] = count
-        return meta
-
+    wanted: List[Tuple[str, str, bool]] = []
     for aid in job.arxiv_ids:
         base_id = normalize_arxiv_id(aid)
         skip_meta = job.update_run and base_id in existing_ids
         if skip_meta and not job.download_pdf:
             logger.log(f"ARXIV ID SKIP (exists): {aid}")
             continue
+        wanted.append((aid, base_id, skip_meta))
+
+    metas: Optional[List[Optional[dict]]] = None
+    if wanted:
+        ids = [aid for aid, _, _ in wanted]
+        logger.log(f"ARXIV ID FETCH: {len(ids)} ids (batches of {arxiv_ops.ID_BATCH_SIZE})")
+        try:
+            metas = arxiv_ops.fetch_by_ids(ids)
+        except Exception as e:
+            logger.log(f"WARN arxiv id batch failed err={repr(e)}; fetching ids one by one")
+
+    fetched: List[Tuple[str, str, bool, dict]] = []
+    for i, (aid, base_id, skip_meta) in enumerate(wanted):
         try:
-            logger.log(f"ARXIV ID FETCH: {aid}")
-            got = arxiv_ops.search_by_id(aid)
+            got = metas[i] if metas is not None else arxiv_ops.fetch_by_id(aid)
             if not got:
                 logger.log(f"ARXIV ID NOT FOUND: {aid}")
                 continue
+            fetched.append((aid, base_id, skip_meta, dict(got)))
+        except Exception as e:
+            log_call_error(logger, f"arxiv id={aid}", e)
 
-            meta = arxiv_ops.result_to_metadata(got)
-            meta = enrich_citations(meta)
-            if not skip_meta:
-                append_jsonl(arxiv_meta_path, meta)
-                existing_ids.add(base_id)
-
-            if job.download_pdf and got.pdf_url:
-                pdf_path = arxiv_pdf_dir / f"{got.get_short_id()}.pdf"
-                download_ok = pdf_path.exists()
-                if not download_ok:
-                    logger.log(f"ARXIV PDF DOWNLOAD: {got.pdf_url} -> {pdf_path.name}")
-                    try:
-                        arxiv_ops.arxiv_download_pdf(got.pdf_url, pdf_path)
-                        download_ok = True
-                    except Exception as e:
-                        logger.log(f"WARN arxiv pdf download failed id={aid} url={got.pdf_url} err={repr(e)}")
-                else:
-                    logger.log(f"ARXIV PDF EXISTS: {pdf_path.name}")
+    enrich_citations(job, logger, [got for _, _, skip_meta, got in fetched if not skip_meta])
 
-                if download_ok and arxiv_ops.PYMUPDF_AVAILABLE:
-                    try:
-                        txt_path = arxiv_text_dir / f"{got.get_short_id()}.txt"
-                        if not txt_path.exists():
-                            logger.log(f"PDF->TEXT: {pdf_path.name}")
-                            txt = arxiv_ops.pdf_to_text(pdf_path)
-                            write_text(txt_path, txt)
-                    except Exception as e:
-                        logger.log(f"ERROR pdf_to_text id={aid} err={repr(e)}")
-                elif download_ok:
-                    logger.log("ERROR missing dependency: pymupdf (pip install pymupdf)")
+    pending: List[Tuple[str, str, str, Path, Optional[Future]]] = []
+    with open_download_manager(job, dm) as dm:
+        for aid, base_id, skip_meta, got in fetched:
+            try:
+                if not skip_meta:
+                    append_jsonl(arxiv_meta_path, got)
+                    existing_ids.add(base_id)
 
-            time.sleep(REQUEST_SLEEP_SEC)
-        except Exception as e:
-            logger.log(f"ERROR arxiv id={aid} err={repr(e)}")
+                if job.download_pdf and got["pdf_url"]:
+                    pdf_path = arxiv_pdf_dir / f"{got['arxiv_id']}.pdf"
+                    future = None
+                    if not downloads.is_complete(pdf_path):
+                        logger.log(f"ARXIV PDF DOWNLOAD: {got['pdf_url']} -> {pdf_path.name}")
+                        future = dm.submit(got["pdf_url"], pdf_path, download=arxiv_ops.arxiv_download_pdf)
+                    else:
+                        logger.log(f"ARXIV PDF EXISTS: {pdf_path.name}")
+                    pending.append((aid, got["arxiv_id"], got["pdf_url"], pdf_path, future))
+            except Exception as e:
+                log_call_error(logger, f"arxiv id={aid}", e)
+
+        conversions: List[Tuple[str, Optional[Future]]] = []
+        for aid, arxiv_id, pdf_url, pdf_path, future in pending:
+            if future is not None:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.log(f"WARN arxiv pdf download failed id={aid} url={pdf_url} err={repr(e)}")
+                    continue
+            if arxiv_ops.PYMUPDF_AVAILABLE:
+                conversions.append(
+                    (f"pdf_to_text id={aid}", submit_pdf_text(pdf_path, arxiv_text_dir / f"{arxiv_id}.txt", logger))
+                )
+            else:
+                logger.log("ERROR missing dependency: pymupdf (pip install pymupdf)")
+    finish_pdf_text(conversions, logger)
 
 
-def run_arxiv_recent(job: Job, logger: JobLogger) -> None:
+def run_arxiv_recent(job: Job, logger: JobLogger, dm: Optional[downloads.DownloadManager] = None) -> None:
     run_recent_arxiv = any(("arxiv" in ln.lower() or "논문" in ln) for ln in job.raw_lines)
     if not run_recent_arxiv or not job.queries:
         return
@@ -1516,44 +1915,12 @@ def run_arxiv_recent(job: Job, logger: JobLogger) -> None:
     arxiv_pdf_dir = job.out_dir / "arxiv" / "pdf"
     arxiv_text_dir = job.out_dir / "arxiv" / "text"
     best_q = sorted(job.queries, key=len, reverse=True)[0]
-    existing_ids: set[str] = set()
+    existing_ids: Union[set[str], dedup_index.KeySet] = set()
     if job.update_run and arxiv_meta_path.exists():
-        existing_ids = load_existing_arxiv_ids(arxiv_meta_path)
+        existing_ids = existing_keys(job, "arxiv/papers.jsonl")
         if existing_ids:
             logger.log(f"ARXIV UPDATE: {len(existing_ids)} cached papers")
 
-    api_key = os.getenv("OPENALEX_API_KEY")
-    mailto = os.getenv("OPENALEX_MAILTO")
-    citations_cache: dict[str, Optional[int]] = {}
-
-    def enrich_citations(meta: dict) -> dict:
-        if not job.citations_enabled:
-            return meta
-        if meta.get("cited_by_count") is not None:
-            return meta
-        doi = meta.get("doi")
-        arxiv_id = meta.get("arxiv_id")
-        key = doi or arxiv_id
-        if not key:
-            return meta
-        if key in citations_cache:
-            count = citations_cache[key]
-        else:
-            try:
-                count = openalex_ops.openalex_get_citations(
-                    doi=doi,
-                    arxiv_id=arxiv_id,
-                    api_key=api_key,
-                    mailto=mailto,
-                )
-            except Exception as e:
-                logger.log(f"WARN citations lookup failed arxiv_id={arxiv_id} err={repr(e)}")
-                count = None
-            citations_cache[key] = count
-        if count is not None:
-            meta["cited_by_count"] = count
-        return meta
-
     try:
         logger.log(f"ARXIV RECENT SEARCH: query='{best_q}' days={job.days}")
         papers = arxiv_ops.arxiv_search_recent(
@@ -1575,47 +1942,61 @@ def run_arxiv_recent(job: Job, logger: JobLogger) -> None:
                         existing_src.add(arxiv_id)
             except Exception:
                 pass
-        for p in papers:
-            base_id = normalize_arxiv_id(str(p.get("arxiv_id") or ""))
-            skip_meta = job.update_run and base_id in existing_ids
-            p = enrich_citations(p)
-            if skip_meta:
-                logger.log(f"ARXIV RECENT SKIP (exists): {base_id}")
-            else:
-                append_jsonl(arxiv_meta_path, {"source": "recent_search", "query": best_q, "paper": p})
-                if base_id:
-                    existing_ids.add(base_id)
-
-            if job.download_pdf and p.get("pdf_url") and p.get("arxiv_id"):
-                pdf_path = arxiv_pdf_dir / f"{p['arxiv_id']}.pdf"
-                download_ok = pdf_path.exists()
-                if not download_ok:
-                    logger.log(f"ARXIV PDF DOWNLOAD: {p['pdf_url']} -> {pdf_path.name}")
+        enrich_citations(
+            job,
+            logger,
+            [
+                p
+                for p in papers
+                if not (job.update_run and normalize_arxiv_id(str(p.get("arxiv_id") or "")) in existing_ids)
+            ],
+        )
+        pending: List[Tuple[str, str, Path, Optional[Future]]] = []
+        source_ids: List[str] = []
+        with open_download_manager(job, dm) as dm:
+            for p in papers:
+                base_id = normalize_arxiv_id(str(p.get("arxiv_id") or ""))
+                skip_meta = job.update_run and base_id in existing_ids
+                if skip_meta:
+                    logger.log(f"ARXIV RECENT SKIP (exists): {base_id}")
+                else:
+                    append_jsonl(arxiv_meta_path, {"source": "recent_search", "query": best_q, "paper": p})
+                    if base_id:
+                        existing_ids.add(base_id)
+
+                if job.download_pdf and p.get("pdf_url") and p.get("arxiv_id"):
+                    pdf_path = arxiv_pdf_dir / f"{p['arxiv_id']}.pdf"
+                    future = None
+                    if not downloads.is_complete(pdf_path):
+                        logger.log(f"ARXIV PDF DOWNLOAD: {p['pdf_url']} -> {pdf_path.name}")
+                        future = dm.submit(p["pdf_url"], pdf_path, download=arxiv_ops.arxiv_download_pdf)
+                    pending.append((p["arxiv_id"], p["pdf_url"], pdf_path, future))
+                if job.arxiv_source and p.get("arxiv_id"):
+                    source_ids.append(p["arxiv_id"])
+
+            conversions: List[Tuple[str, Optional[Future]]] = []
+            for arxiv_id, pdf_url, pdf_path, future in pending:
+                if future is not None:
                     try:
-                        arxiv_ops.arxiv_download_pdf(p["pdf_url"], pdf_path)
-                        download_ok = True
+                        future.result()
                     except Exception as e:
-                        logger.log(
-                            f"WARN arxiv pdf download failed arxiv_id={p['arxiv_id']} url={p['pdf_url']} err={repr(e)}"
+                        logger.log(f"WARN arxiv pdf download failed arxiv_id={arxiv_id} url={pdf_url} err={repr(e)}")
+                        continue
+                if arxiv_ops.PYMUPDF_AVAILABLE:
+                    conversions.append(
+                        (
+                            f"pdf_to_text arxiv_id={arxiv_id}",
+                            submit_pdf_text(pdf_path, arxiv_text_dir / f"{arxiv_id}.txt", logger),
                         )
-
-                if download_ok and arxiv_ops.PYMUPDF_AVAILABLE:
-                    try:
-                        txt_path = arxiv_text_dir / f"{p['arxiv_id']}.txt"
-                        if not txt_path.exists():
-                            logger.log(f"PDF->TEXT: {pdf_path.name}")
-                            txt = arxiv_ops.pdf_to_text(pdf_path)
-                            write_text(txt_path, txt)
-                    except Exception as e:
-                        logger.log(f"ERROR pdf_to_text arxiv_id={p['arxiv_id']} err={repr(e)}")
-                elif download_ok:
+                    )
+                else:
                     logger.log("ERROR missing dependency: pymupdf (pip install pymupdf)")
-            if job.arxiv_source and p.get("arxiv_id"):
-                download_arxiv_source_for_id(job, logger, p["arxiv_id"], manifest_path, existing_src)
-
-        time.sleep(REQUEST_SLEEP_SEC)
+            # Source tarballs download while the PDFs are being parsed.
+            if source_ids:
+                download_arxiv_sources(job, logger, dm, source_ids, manifest_path, existing_src)
+            finish_pdf_text(conversions, logger)
     except Exception as e:
-        logger.log(f"ERROR arxiv recent search err={repr(e)}")
+        log_call_error(logger, "arxiv recent search", e)
 
 
 def find_main_tex(tex_files: List[Path]) -> Optional[Path]:
@@ -1629,11 +2010,6 @@ def find_main_tex(tex_files: List[Path]) -> Optional[Path]:
     return tex_files[0] if tex_files else None
 
 
-def extract_includegraphics(tex_text: str) -> List[str]:
-    pattern = re.compile(r"\\includegraphics\\*?(?:\\[[^\\]]*\\])?\\{([^}]+)\\}")
-    return [m.group(1).strip() for m in pattern.finditer(tex_text)]
-
-
 def extract_tex_text(tex_files: List[Path], max_chars: int = ARXIV_TEX_MAX_CHARS) -> str:
     parts: List[str] = []
     total = 0
@@ -1651,18 +2027,28 @@ def extract_tex_text(tex_files: List[Path], max_chars: int = ARXIV_TEX_MAX_CHARS
     return "".join(parts)
 
 
-def collect_arxiv_source_info(src_dir: Path, run_dir: Path) -> dict:
-    tex_files = sorted(src_dir.rglob("*.tex"))
-    fig_files = sorted(
-        [p for p in src_dir.rglob("*") if p.is_file() and p.suffix.lower() in ARXIV_FIGURE_EXTS]
-    )
+def collect_arxiv_source_info(src_dir: Path, run_dir: Path, extracted: Optional[dict] = None) -> dict:
+    # extracted is the report of arxiv_ops.extract_arxiv_source; without it (a source
+    # folder from an earlier run) the folder is walked instead.
+    if extracted is not None:
+        paths = [src_dir / name for name in extracted["files"]]
+        tex_files = sorted(p for p in paths if p.suffix.lower() == ".tex")
+        fig_files = sorted(p for p in paths if p.suffix.lower() in ARXIV_FIGURE_EXTS)
+        includegraphics = list(extracted["includegraphics"])
+    else:
+        tex_files = sorted(src_dir.rglob("*.tex"))
+        fig_files = sorted(
+            [p for p in src_dir.rglob("*") if p.is_file() and p.suffix.lower() in ARXIV_FIGURE_EXTS]
+        )
+        includegraphics = []
+        for tex in tex_files:
+            try:
+                includegraphics.extend(
+                    arxiv_ops.extract_includegraphics(tex.read_text(encoding="utf-8", errors="replace"))
+                )
+            except Exception:
+                continue
     main_tex = find_main_tex(tex_files)
-    includegraphics: List[str] = []
-    for tex in tex_files:
-        try:
-            includegraphics.extend(extract_includegraphics(tex.read_text(encoding="utf-8", errors="replace")))
-        except Exception:
-            continue
     fig_map: List[dict] = []
     if includegraphics and fig_files:
         by_name = {p.name: p for p in fig_files}
@@ -1701,13 +2087,19 @@ def download_arxiv_source_for_id(
     tar_path = src_root / f"{arxiv_id}.tar.gz"
     extract_dir = src_root / arxiv_id
     try:
-        if not tar_path.exists():
+        if not downloads.is_complete(tar_path, expect_pdf=False):
             logger.log(f"ARXIV SRC DOWNLOAD: {arxiv_id}")
             arxiv_ops.arxiv_download_source(arxiv_id, tar_path)
+        extracted = None
         if not extract_dir.exists():
             logger.log(f"ARXIV SRC EXTRACT: {tar_path.name}")
-            arxiv_ops.extract_arxiv_source(tar_path, extract_dir)
-        info = collect_arxiv_source_info(extract_dir, job.out_dir)
+            extracted = arxiv_ops.extract_arxiv_source(tar_path, extract_dir)
+            if extracted["skipped_files"]:
+                logger.log(
+                    f"ARXIV SRC SKIP: {arxiv_id} files={extracted['skipped_files']} "
+                    f"bytes={extracted['skipped_bytes']} over_cap={len(extracted['over_cap'])}"
+                )
+        info = collect_arxiv_source_info(extract_dir, job.out_dir, extracted)
         tex_paths = []
         for rel in info["tex_files"]:
             rel_path = rel.lstrip("./") if isinstance(rel, str) else str(rel)
@@ -1728,17 +2120,55 @@ def download_arxiv_source_for_id(
             "figure_matches": info["figure_matches"],
             "query_id": job.query_id,
         }
+        if extracted is not None:
+            payload["skipped_files"] = extracted["skipped_files"]
+            payload["skipped_bytes"] = extracted["skipped_bytes"]
+            payload["over_cap"] = extracted["over_cap"]
         append_jsonl(manifest_path, payload)
         existing.add(arxiv_id)
     except Exception as e:
-        logger.log(f"ERROR arxiv src download id={arxiv_id} err={repr(e)}")
+        log_call_error(logger, f"arxiv src download id={arxiv_id}", e)
 
 
-def run_arxiv_sources(job: Job, logger: JobLogger) -> None:
-    if not job.arxiv_source or not job.arxiv_ids:
-        return
-    manifest_path = job.out_dir / "arxiv" / "src_manifest.jsonl"
-    existing: set[str] = set()
+def download_arxiv_sources(
+    job: Job,
+    logger: JobLogger,
+    dm: downloads.DownloadManager,
+    arxiv_ids: List[str],
+    manifest_path: Path,
+    existing: set[str],
+) -> None:
+    # Fetch the tarballs concurrently, then extract and append manifest rows in input order.
+    src_root = job.out_dir / "arxiv" / "src"
+    futures: List[Future] = []
+    for aid in dict.fromkeys(arxiv_ids):
+        tar_path = src_root / f"{aid}.tar.gz"
+        if aid in existing or downloads.is_complete(tar_path, expect_pdf=False):
+            continue
+        logger.log(f"ARXIV SRC DOWNLOAD: {aid}")
+        futures.append(
+            dm.submit(
+                arxiv_ops.arxiv_source_url(aid),
+                tar_path,
+                headers=arxiv_ops.request_headers(),
+                expect_pdf=False,
+            )
+        )
+    for future in futures:
+        try:
+            future.result()
+        except Exception:
+            # download_arxiv_source_for_id retries once and logs the error.
+            pass
+    for aid in arxiv_ids:
+        download_arxiv_source_for_id(job, logger, aid, manifest_path, existing)
+
+
+def run_arxiv_sources(job: Job, logger: JobLogger, dm: Optional[downloads.DownloadManager] = None) -> None:
+    if not job.arxiv_source or not job.arxiv_ids:
+        return
+    manifest_path = job.out_dir / "arxiv" / "src_manifest.jsonl"
+    existing: set[str] = set()
     if manifest_path.exists():
         try:
             for line in manifest_path.read_text(encoding="utf-8", errors="replace").splitlines():
@@ -1750,8 +2180,8 @@ def run_arxiv_sources(job: Job, logger: JobLogger) -> None:
                     existing.add(arxiv_id)
         except Exception:
             pass
-    for aid in job.arxiv_ids:
-        download_arxiv_source_for_id(job, logger, aid, manifest_path, existing)
+    with open_download_manager(job, dm) as dm:
+        download_arxiv_sources(job, logger, dm, job.arxiv_ids, manifest_path, existing)
 
 def build_index_md(job: Job) -> str:
     base = job.out_dir
@@ -1807,6 +2237,12 @@ def build_index_md(job: Job) -> str:
             args += ["--yt-order", j.youtube_order]
         if j.update_run:
             args.append("--update-run")
+        if not j.near_dedup:
+            args.append("--no-near-dedup")
+        if j.compress:
+            args += ["--compress", j.compress]
+        if j.packed:
+            args.append("--packed")
         if j.agentic_search:
             args.append("--agentic-search")
             if j.agentic_model:
@@ -1815,89 +2251,60 @@ def build_index_md(job: Job) -> str:
                 args += ["--max-iter", str(j.agentic_max_iter)]
         return " ".join(shell_escape(a) for a in args)
 
-    def load_youtube_transcript_meta(path: Path) -> dict:
-        meta: dict = {}
-        if not path.exists():
-            return meta
-        for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            videos: List[dict] = []
-            if isinstance(data.get("videos"), list):
-                videos = [v for v in data.get("videos") if isinstance(v, dict)]
-            elif isinstance(data.get("video"), dict):
-                videos = [data.get("video")]
-            for video in videos:
-                transcript_path = video.get("transcript_path")
-                if not transcript_path or transcript_path in meta:
-                    continue
-                meta[transcript_path] = {
-                    "title": video.get("title") or "-",
-                    "source": video.get("url") or video.get("direct_url") or "-",
-                }
-        return meta
+    cache = index_cache.IndexCache(base)
 
-    def load_arxiv_meta(path: Path) -> dict:
-        meta: dict = {}
-        if not path.exists():
-            return meta
-        for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if not isinstance(data, dict):
-                continue
-            paper = data.get("paper") if isinstance(data.get("paper"), dict) else data
-            if not isinstance(paper, dict):
-                continue
-            arxiv_id = paper.get("arxiv_id")
-            if not arxiv_id or arxiv_id in meta:
+    def youtube_step(meta: dict, data: dict) -> None:
+        videos: List[dict] = []
+        if isinstance(data.get("videos"), list):
+            videos = [v for v in data.get("videos") if isinstance(v, dict)]
+        elif isinstance(data.get("video"), dict):
+            videos = [data.get("video")]
+        for video in videos:
+            transcript_path = video.get("transcript_path")
+            if not transcript_path or transcript_path in meta:
                 continue
-            meta[arxiv_id] = {
-                "title": paper.get("title") or "-",
-                "source": paper.get("pdf_url") or paper.get("entry_id") or "-",
-                "citations": paper.get("cited_by_count"),
+            meta[transcript_path] = {
+                "title": video.get("title") or "-",
+                "source": video.get("url") or video.get("direct_url") or "-",
             }
-        return meta
 
-    def load_openalex_meta(path: Path) -> dict:
-        meta: dict = {}
-        if not path.exists():
-            return meta
-        for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if not isinstance(data, dict):
-                continue
-            work = data.get("work") if isinstance(data.get("work"), dict) else None
-            if not work:
-                continue
-            oa_id = work.get("openalex_id_short") or safe_filename(work.get("doi") or "", max_len=40) or "openalex"
-            if oa_id in meta:
-                continue
-            pdf_urls = work.get("pdf_urls") or []
-            pdf_url = work.get("downloaded_pdf_url") or work.get("pdf_url") or (pdf_urls[0] if pdf_urls else None)
-            source = pdf_url or work.get("landing_page_url") or "-"
-            meta[oa_id] = {
-                "title": work.get("title") or "-",
-                "source": source,
-                "citations": work.get("cited_by_count"),
-            }
-        return meta
+    def arxiv_step(meta: dict, data: dict) -> None:
+        paper = data.get("paper") if isinstance(data.get("paper"), dict) else data
+        if not isinstance(paper, dict):
+            return
+        arxiv_id = paper.get("arxiv_id")
+        if not arxiv_id or arxiv_id in meta:
+            return
+        meta[arxiv_id] = {
+            "title": paper.get("title") or "-",
+            "source": paper.get("pdf_url") or paper.get("entry_id") or "-",
+            "citations": paper.get("cited_by_count"),
+        }
+
+    def openalex_step(meta: dict, data: dict) -> None:
+        work = data.get("work") if isinstance(data.get("work"), dict) else None
+        if not work:
+            return
+        oa_id = work.get("openalex_id_short") or safe_filename(work.get("doi") or "", max_len=40) or "openalex"
+        if oa_id in meta:
+            return
+        pdf_urls = work.get("pdf_urls") or []
+        pdf_url = work.get("downloaded_pdf_url") or work.get("pdf_url") or (pdf_urls[0] if pdf_urls else None)
+        source = pdf_url or work.get("landing_page_url") or "-"
+        meta[oa_id] = {
+            "title": work.get("title") or "-",
+            "source": source,
+            "citations": work.get("cited_by_count"),
+        }
+
+    def local_step(summary: dict, data: dict) -> None:
+        summary["count"] += 1
+        if data.get("content_path"):
+            summary["text_count"] += 1
+        if len(summary["head"]) < 50:
+            summary["head"].append(
+                {key: data.get(key) for key in ("content_path", "raw_path", "title", "source_path")}
+            )
 
     def load_web_pdf_sources(j: Job) -> dict:
         sources: dict = {}
@@ -1908,22 +2315,6 @@ def build_index_md(job: Job) -> str:
             sources[name] = url
         return sources
 
-    def load_local_manifest(path: Path) -> List[dict]:
-        entries: List[dict] = []
-        if not path.exists():
-            return entries
-        for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(data, dict):
-                entries.append(data)
-        return entries
-
     def one_line(value: Optional[str]) -> str:
         if not value:
             return "-"
@@ -1957,164 +2348,214 @@ def build_index_md(job: Job) -> str:
         idx_md.append("- (instruction folder missing)\n")
     idx_md.append("\n")
 
-    local_manifest = job.out_dir / "local" / "manifest.jsonl"
-    if local_manifest.exists():
-        idx_md.append("## Local Files\n")
-        idx_md.append(f"- {fmt_path(local_manifest, base)}\n")
-        local_entries = load_local_manifest(local_manifest)
-        idx_md.append(f"- Files: {len(local_entries)}\n")
-        text_count = sum(1 for entry in local_entries if entry.get("content_path"))
-        idx_md.append(f"- Texts: {text_count}\n")
-        for entry in local_entries[:50]:
+    file_sig = index_cache.file_signature
+    names = index_cache.listing
+
+    def render_local() -> str:
+        out: List[str] = []
+        out.append("## Local Files\n")
+        out.append(f"- {fmt_path(local_manifest, base)}\n")
+        summary = cache.fold_jsonl(
+            local_manifest,
+            "local",
+            lambda: {"count": 0, "text_count": 0, "head": []},
+            local_step,
+        )
+        out.append(f"- Files: {summary['count']}\n")
+        out.append(f"- Texts: {summary['text_count']}\n")
+        for entry in summary["head"]:
             text_path = entry.get("content_path") or "-"
             raw_path = entry.get("raw_path") or "-"
             title = one_line(entry.get("title"))
             source = one_line(entry.get("source_path"))
-            idx_md.append(f"- Text file: `{text_path}` | Raw: `{raw_path}` | Title: {title} | Source: {source}\n")
-        if len(local_entries) > 50:
-            idx_md.append(f"- ... and {len(local_entries)-50} more\n")
-        idx_md.append("\n")
+            out.append(f"- Text file: `{text_path}` | Raw: `{raw_path}` | Title: {title} | Source: {source}\n")
+        if summary["count"] > 50:
+            out.append(f"- ... and {summary['count']-50} more\n")
+        out.append("\n")
+        return "".join(out)
 
-    if (job.out_dir / "tavily_search.jsonl").exists():
-        idx_md.append("## Tavily Search\n")
-        idx_md.append(f"- {fmt_path(job.out_dir / 'tavily_search.jsonl', base)}\n")
-        idx_md.append("- Includes per-result `summary` and `query_summary`\n\n")
-
-    extract_dir = job.out_dir / "tavily_extract"
-    if extract_dir.exists():
+    def render_extract() -> str:
+        out: List[str] = []
         files = sorted(extract_dir.glob("*.txt"))
-        idx_md.append("## Tavily Extract\n")
+        out.append("## Tavily Extract\n")
         for f in files[:50]:
-            idx_md.append(f"- {fmt_path(f, base)}\n")
+            out.append(f"- {fmt_path(f, base)}\n")
         if len(files) > 50:
-            idx_md.append(f"- ... and {len(files)-50} more\n")
-        idx_md.append("\n")
+            out.append(f"- ... and {len(files)-50} more\n")
+        out.append("\n")
+        return "".join(out)
 
-    youtube_dir = job.out_dir / "youtube"
-    if youtube_dir.exists():
-        idx_md.append("## YouTube\n")
+    def render_youtube() -> str:
+        out: List[str] = []
+        out.append("## YouTube\n")
         videos_path = youtube_dir / "videos.jsonl"
-        youtube_meta = load_youtube_transcript_meta(videos_path) if videos_path.exists() else {}
+        youtube_meta = cache.fold_jsonl(videos_path, "youtube", dict, youtube_step)
         if videos_path.exists():
-            idx_md.append(f"- {fmt_path(videos_path, base)}\n")
+            out.append(f"- {fmt_path(videos_path, base)}\n")
         transcript_dir = youtube_dir / "transcripts"
-        transcripts = list(transcript_dir.glob("*.txt")) if transcript_dir.exists() else []
-        idx_md.append(f"- Transcripts: {len(transcripts)}\n")
+        transcripts = sorted(transcript_dir.glob("*.txt")) if transcript_dir.exists() else []
+        out.append(f"- Transcripts: {len(transcripts)}\n")
         for f in transcripts[:50]:
             rel = rel_path_str(f, base)
             meta = youtube_meta.get(rel) or {}
             title = one_line(meta.get("title"))
             source = one_line(meta.get("source"))
-            idx_md.append(f"- Transcript file: {fmt_path(f, base)} | Title: {title} | Source: {source}\n")
+            out.append(f"- Transcript file: {fmt_path(f, base)} | Title: {title} | Source: {source}\n")
         if len(transcripts) > 50:
-            idx_md.append(f"- ... and {len(transcripts)-50} more\n")
-        idx_md.append("\n")
+            out.append(f"- ... and {len(transcripts)-50} more\n")
+        out.append("\n")
+        return "".join(out)
 
-    web_pdf_dir = job.out_dir / "web" / "pdf"
-    web_text_dir = job.out_dir / "web" / "text"
-    if web_pdf_dir.exists():
-        idx_md.append("## Web PDFs\n")
+    def render_web_pdfs() -> str:
+        out: List[str] = []
+        out.append("## Web PDFs\n")
         pdfs = sorted(web_pdf_dir.glob("*.pdf"))
         txts = sorted(web_text_dir.glob("*.txt")) if web_text_dir.exists() else []
         web_sources = load_web_pdf_sources(job)
-        idx_md.append(f"- PDFs: {len(pdfs)}\n")
+        out.append(f"- PDFs: {len(pdfs)}\n")
         for f in pdfs[:50]:
             source = one_line(web_sources.get(f.name))
-            idx_md.append(f"- PDF file: {fmt_path(f, base)} | Source: {source}\n")
+            out.append(f"- PDF file: {fmt_path(f, base)} | Source: {source}\n")
         if len(pdfs) > 50:
-            idx_md.append(f"- ... and {len(pdfs)-50} more\n")
-        idx_md.append(f"- Extracted texts: {len(txts)}\n")
+            out.append(f"- ... and {len(pdfs)-50} more\n")
+        out.append(f"- Extracted texts: {len(txts)}\n")
         for f in txts[:50]:
             source = one_line(web_sources.get(f.with_suffix(".pdf").name))
-            idx_md.append(f"- Text file: {fmt_path(f, base)} | Source: {source}\n")
+            out.append(f"- Text file: {fmt_path(f, base)} | Source: {source}\n")
         if len(txts) > 50:
-            idx_md.append(f"- ... and {len(txts)-50} more\n")
-        idx_md.append("\n")
+            out.append(f"- ... and {len(txts)-50} more\n")
+        out.append("\n")
+        return "".join(out)
 
-    openalex_dir = job.out_dir / "openalex"
-    if openalex_dir.exists():
-        idx_md.append("## OpenAlex (OA)\n")
-        works_path = openalex_dir / "works.jsonl"
-        openalex_meta = load_openalex_meta(works_path) if works_path.exists() else {}
-        if works_path.exists():
-            idx_md.append(f"- {fmt_path(works_path, base)}\n")
-        pdfs = list((openalex_dir / "pdf").glob("*.pdf")) if (openalex_dir / "pdf").exists() else []
-        txts = list((openalex_dir / "text").glob("*.txt")) if (openalex_dir / "text").exists() else []
-        idx_md.append(f"- PDFs: {len(pdfs)}\n")
-        for f in pdfs[:50]:
-            meta = openalex_meta.get(f.stem) or {}
-            title = one_line(meta.get("title"))
-            source = one_line(meta.get("source"))
-            citations = format_citations(meta.get("citations"))
-            idx_md.append(
-                f"- PDF file: {fmt_path(f, base)} | Title: {title} | Source: {source} | Citations: {citations}\n"
-            )
-        if len(pdfs) > 50:
-            idx_md.append(f"- ... and {len(pdfs)-50} more\n")
-        idx_md.append(f"- Extracted texts: {len(txts)}\n")
-        for f in txts[:50]:
-            meta = openalex_meta.get(f.stem) or {}
+    def paper_lines(out: List[str], files: List[Path], meta_by_stem: dict, label: str) -> None:
+        for f in files[:50]:
+            meta = meta_by_stem.get(f.stem) or {}
             title = one_line(meta.get("title"))
             source = one_line(meta.get("source"))
             citations = format_citations(meta.get("citations"))
-            idx_md.append(
-                f"- Text file: {fmt_path(f, base)} | Title: {title} | Source: {source} | Citations: {citations}\n"
+            out.append(
+                f"- {label}: {fmt_path(f, base)} | Title: {title} | Source: {source} | Citations: {citations}\n"
             )
-        if len(txts) > 50:
-            idx_md.append(f"- ... and {len(txts)-50} more\n")
-        idx_md.append("\n")
+        if len(files) > 50:
+            out.append(f"- ... and {len(files)-50} more\n")
 
-    if (job.out_dir / "arxiv").exists():
-        idx_md.append("## arXiv\n")
-        papers_path = job.out_dir / "arxiv" / "papers.jsonl"
-        arxiv_meta = load_arxiv_meta(papers_path) if papers_path.exists() else {}
+    def render_openalex() -> str:
+        out: List[str] = []
+        out.append("## OpenAlex (OA)\n")
+        works_path = openalex_dir / "works.jsonl"
+        openalex_meta = cache.fold_jsonl(works_path, "openalex", dict, openalex_step)
+        if works_path.exists():
+            out.append(f"- {fmt_path(works_path, base)}\n")
+        pdfs = sorted((openalex_dir / "pdf").glob("*.pdf")) if (openalex_dir / "pdf").exists() else []
+        txts = sorted((openalex_dir / "text").glob("*.txt")) if (openalex_dir / "text").exists() else []
+        out.append(f"- PDFs: {len(pdfs)}\n")
+        paper_lines(out, pdfs, openalex_meta, "PDF file")
+        out.append(f"- Extracted texts: {len(txts)}\n")
+        paper_lines(out, txts, openalex_meta, "Text file")
+        out.append("\n")
+        return "".join(out)
+
+    def render_arxiv() -> str:
+        out: List[str] = []
+        out.append("## arXiv\n")
+        papers_path = arxiv_dir / "papers.jsonl"
+        arxiv_meta = cache.fold_jsonl(papers_path, "arxiv", dict, arxiv_step)
         if papers_path.exists():
-            idx_md.append(f"- {fmt_path(papers_path, base)}\n")
-        pdfs = list((job.out_dir / "arxiv/pdf").glob("*.pdf")) if (job.out_dir / "arxiv/pdf").exists() else []
-        txts = list((job.out_dir / "arxiv/text").glob("*.txt")) if (job.out_dir / "arxiv/text").exists() else []
-        idx_md.append(f"- PDFs: {len(pdfs)}\n")
-        for f in pdfs[:50]:
-            meta = arxiv_meta.get(f.stem) or {}
-            title = one_line(meta.get("title"))
-            source = one_line(meta.get("source"))
-            citations = format_citations(meta.get("citations"))
-            idx_md.append(
-                f"- PDF file: {fmt_path(f, base)} | Title: {title} | Source: {source} | Citations: {citations}\n"
-            )
-        if len(pdfs) > 50:
-            idx_md.append(f"- ... and {len(pdfs)-50} more\n")
-        idx_md.append(f"- Extracted texts: {len(txts)}\n\n")
-        for f in txts[:50]:
-            meta = arxiv_meta.get(f.stem) or {}
-            title = one_line(meta.get("title"))
-            source = one_line(meta.get("source"))
-            citations = format_citations(meta.get("citations"))
-            idx_md.append(
-                f"- Text file: {fmt_path(f, base)} | Title: {title} | Source: {source} | Citations: {citations}\n"
-            )
-        if len(txts) > 50:
-            idx_md.append(f"- ... and {len(txts)-50} more\n")
-        idx_md.append("\n")
+            out.append(f"- {fmt_path(papers_path, base)}\n")
+        pdfs = sorted((arxiv_dir / "pdf").glob("*.pdf")) if (arxiv_dir / "pdf").exists() else []
+        txts = sorted((arxiv_dir / "text").glob("*.txt")) if (arxiv_dir / "text").exists() else []
+        out.append(f"- PDFs: {len(pdfs)}\n")
+        paper_lines(out, pdfs, arxiv_meta, "PDF file")
+        out.append(f"- Extracted texts: {len(txts)}\n\n")
+        paper_lines(out, txts, arxiv_meta, "Text file")
+        out.append("\n")
+        return "".join(out)
+
+    def render_arxiv_source() -> str:
+        out: List[str] = []
+        out.append("## arXiv Source\n")
+        if src_manifest.exists():
+            out.append(f"- {fmt_path(src_manifest, base)}\n")
+        tarballs = sorted(src_dir.glob("*.tar.gz")) if src_dir.exists() else []
+        out.append(f"- Source archives: {len(tarballs)}\n")
+        for f in tarballs[:50]:
+            out.append(f"- Source tar: {fmt_path(f, base)}\n")
+        if len(tarballs) > 50:
+            out.append(f"- ... and {len(tarballs)-50} more\n")
+        texts = sorted(src_text_dir.glob("*.txt")) if src_text_dir.exists() else []
+        out.append(f"- Extracted TeX texts: {len(texts)}\n")
+        for f in texts[:50]:
+            out.append(f"- TeX text: {fmt_path(f, base)}\n")
+        if len(texts) > 50:
+            out.append(f"- ... and {len(texts)-50} more\n")
+        out.append("\n")
+        return "".join(out)
+
+    # Each section is re-rendered only when the JSONL it folds or the file names it
+    # lists change; agentic runs finalize the same archive many times.
+    local_manifest = job.out_dir / "local" / "manifest.jsonl"
+    if local_manifest.exists():
+        idx_md.append(cache.section("local", [file_sig(local_manifest)], render_local))
+
+    if (job.out_dir / "tavily_search.jsonl").exists():
+        idx_md.append("## Tavily Search\n")
+        idx_md.append(f"- {fmt_path(job.out_dir / 'tavily_search.jsonl', base)}\n")
+        idx_md.append("- Includes per-result `summary` and `query_summary`\n\n")
+
+    extract_dir = job.out_dir / "tavily_extract"
+    if extract_dir.exists():
+        idx_md.append(cache.section("tavily_extract", [names(extract_dir, "*.txt")], render_extract))
+
+    youtube_dir = job.out_dir / "youtube"
+    if youtube_dir.exists():
+        key = [file_sig(youtube_dir / "videos.jsonl"), names(youtube_dir / "transcripts", "*.txt")]
+        idx_md.append(cache.section("youtube", key, render_youtube))
+
+    web_pdf_dir = job.out_dir / "web" / "pdf"
+    web_text_dir = job.out_dir / "web" / "text"
+    if web_pdf_dir.exists():
+        key = [names(web_pdf_dir, "*.pdf"), names(web_text_dir, "*.txt"), list(job.urls)]
+        idx_md.append(cache.section("web_pdfs", key, render_web_pdfs))
 
-        src_manifest = job.out_dir / "arxiv" / "src_manifest.jsonl"
-        src_dir = job.out_dir / "arxiv" / "src"
-        src_text_dir = job.out_dir / "arxiv" / "src_text"
+    openalex_dir = job.out_dir / "openalex"
+    if openalex_dir.exists():
+        key = [
+            file_sig(openalex_dir / "works.jsonl"),
+            names(openalex_dir / "pdf", "*.pdf"),
+            names(openalex_dir / "text", "*.txt"),
+        ]
+        idx_md.append(cache.section("openalex", key, render_openalex))
+
+    arxiv_dir = job.out_dir / "arxiv"
+    if arxiv_dir.exists():
+        key = [
+            file_sig(arxiv_dir / "papers.jsonl"),
+            names(arxiv_dir / "pdf", "*.pdf"),
+            names(arxiv_dir / "text", "*.txt"),
+        ]
+        idx_md.append(cache.section("arxiv", key, render_arxiv))
+
+        src_manifest = arxiv_dir / "src_manifest.jsonl"
+        src_dir = arxiv_dir / "src"
+        src_text_dir = arxiv_dir / "src_text"
         if src_manifest.exists() or src_dir.exists() or src_text_dir.exists():
-            idx_md.append("## arXiv Source\n")
-            if src_manifest.exists():
-                idx_md.append(f"- {fmt_path(src_manifest, base)}\n")
-            tarballs = sorted(src_dir.glob("*.tar.gz")) if src_dir.exists() else []
-            idx_md.append(f"- Source archives: {len(tarballs)}\n")
-            for f in tarballs[:50]:
-                idx_md.append(f"- Source tar: {fmt_path(f, base)}\n")
-            if len(tarballs) > 50:
-                idx_md.append(f"- ... and {len(tarballs)-50} more\n")
-            texts = sorted(src_text_dir.glob("*.txt")) if src_text_dir.exists() else []
-            idx_md.append(f"- Extracted TeX texts: {len(texts)}\n")
-            for f in texts[:50]:
-                idx_md.append(f"- TeX text: {fmt_path(f, base)}\n")
-            if len(texts) > 50:
-                idx_md.append(f"- ... and {len(texts)-50} more\n")
+            key = [file_sig(src_manifest), names(src_dir, "*.tar.gz"), names(src_text_dir, "*.txt")]
+            idx_md.append(cache.section("arxiv_source", key, render_arxiv_source))
+
+    circuits_path = job.out_dir / CIRCUITS_JSON
+    if circuits_path.exists():
+        try:
+            circuits = json.loads(read_text(circuits_path))
+        except Exception:
+            circuits = {}
+        if circuits:
+            idx_md.append("## Provider Health\n")
+            idx_md.append(f"- {fmt_path(circuits_path, base)}\n")
+            for key, item in circuits.items():
+                idx_md.append(
+                    f"- {key}: failures={item.get('failures', 0)} circuit_trips={item.get('trips', 0)} "
+                    f"skipped_calls={item.get('skipped', 0)} state={item.get('state', '')}\n"
+                )
             idx_md.append("\n")
 
     trace_json = job.out_dir / AGENTIC_TRACE_JSONL
@@ -2130,6 +2571,82 @@ def build_index_md(job: Job) -> str:
     return "".join(idx_md)
 
 
+def provider_lanes(
+    job: Job,
+    tavily: TavilyClient,
+    logger: JobLogger,
+    dm: Optional[downloads.DownloadManager] = None,
+) -> List[Tuple[str, List[Callable[[], None]]]]:
+    # Stages inside a lane run in order. Stages that share an output file (arxiv/papers.jsonl,
+    # arxiv/src_manifest.jsonl) or read another stage's output (the YouTube quota fallback reads
+    # tavily_search.jsonl) share a lane, so every file is written in the same order as a serial run.
+    return [
+        ("local", [partial(run_local_ingest, job, logger)]),
+        (
+            "extract",
+            [
+                partial(run_tavily_extract, job, tavily, logger),
+                partial(run_url_pdf_downloads, job, logger, dm),
+            ],
+        ),
+        (
+            "search",
+            [
+                partial(run_tavily_search, job, tavily, logger),
+                partial(run_youtube, job, logger),
+            ],
+        ),
+        ("openalex", [partial(run_openalex, job, logger, dm)]),
+        (
+            "arxiv",
+            [
+                partial(run_arxiv_ids, job, logger, dm),
+                partial(run_arxiv_recent, job, logger, dm),
+                partial(run_arxiv_sources, job, logger, dm),
+            ],
+        ),
+    ]
+
+
+def stage_name(stage: Callable[[], None]) -> str:
+    name = getattr(getattr(stage, "func", stage), "__name__", "stage")
+    return name[4:] if name.startswith("run_") else name
+
+
+def run_stage(stage: Callable[[], None], logger: JobLogger) -> None:
+    with logger.span(stage_name(stage)):
+        stage()
+
+
+def run_providers(
+    job: Job,
+    tavily: TavilyClient,
+    logger: JobLogger,
+    dm: Optional[downloads.DownloadManager] = None,
+) -> None:
+    with open_download_manager(job, dm) as dm:
+        lanes = provider_lanes(job, tavily, logger, dm)
+        workers = min(max(job.provider_workers, 1), len(lanes))
+        if not job.parallel_providers or workers <= 1:
+            for _, stages in lanes:
+                for stage in stages:
+                    run_stage(stage, logger)
+            return
+
+        def run_lane(stages: List[Callable[[], None]]) -> None:
+            for stage in stages:
+                run_stage(stage, logger)
+
+        logger.log(f"PROVIDERS PARALLEL: lanes={len(lanes)} workers={workers}")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="feather-provider") as pool:
+            futures = {pool.submit(run_lane, stages): name for name, stages in lanes}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.log(f"ERROR provider lane={futures[future]} err={repr(e)}")
+
+
 def run_job(job: Job, tavily: TavilyClient, stdout: bool = True) -> None:
     job.out_dir.mkdir(parents=True, exist_ok=True)
     log_path = job.out_dir / "_log.txt"
@@ -2139,24 +2656,70 @@ def run_job(job: Job, tavily: TavilyClient, stdout: bool = True) -> None:
     write_job_json(job)
 
     logger.log(f"JOB START: {job.src_file.name} date={job.date.isoformat()} days={job.days} max_results={job.max_results}")
+    circuit.get_registry().reset_counts()
+    restore_stored_outputs(job, logger)
 
-    run_local_ingest(job, logger)
-    run_tavily_extract(job, tavily, logger)
-    run_url_pdf_downloads(job, logger)
-    run_tavily_search(job, tavily, logger)
-    run_youtube(job, logger)
-    run_openalex(job, logger)
-    run_arxiv_ids(job, logger)
-    run_arxiv_recent(job, logger)
-    run_arxiv_sources(job, logger)
+    try:
+        run_providers(job, tavily, logger)
+    finally:
+        close_run_indexes(job)
 
     _finalize_job_outputs(job, log_path, logger)
 
 
+def restore_stored_outputs(job: Job, logger: JobLogger) -> None:
+    # A packed or compacted archive is worked on in plain form and stored again at the end.
+    if not job.update_run:
+        return
+    stats = runpack.unpack_run(job.root_dir)
+    if stats["files"]:
+        logger.log(f"STORAGE UNPACK: files={stats['files']} bytes={stats['bytes']}")
+    stats = storage.expand_run(job.out_dir)
+    if stats["files"]:
+        logger.log(f"STORAGE EXPAND: files={stats['files']} bytes={stats['bytes_before']}->{stats['bytes_after']}")
+
+
+def write_circuit_report(job: Job, logger: JobLogger) -> None:
+    # Per-job failure/skip totals of every provider or host that failed; the index
+    # renders them so a short archive can be told apart from a dead endpoint.
+    report_path = job.out_dir / CIRCUITS_JSON
+    stats = circuit.get_registry().stats()
+    for key, item in stats.items():
+        logger.log(
+            f"CIRCUIT {key}: state={item['state']} failures={item['failures']} "
+            f"trips={item['trips']} skipped={item['skipped']}"
+        )
+    if stats:
+        write_text(report_path, json.dumps(stats, ensure_ascii=False, indent=2))
+    elif report_path.exists():
+        report_path.unlink()
+
+
+def close_run_indexes(job: Job) -> None:
+    # Also runs when a stage raises, so the sidecars are closed and their JSONL
+    # watchers do not outlive the job.
+    dedup_index.close_index(job.out_dir)
+    neardup.close_index(job.out_dir)
+
+
 def _finalize_job_outputs(job: Job, log_path: Path, logger: JobLogger) -> None:
-    write_text(job.out_dir / f"{job.query_id}-index.md", build_index_md(job))
+    write_circuit_report(job, logger)
+    with logger.span("build_index_md"):
+        write_text(job.out_dir / f"{job.query_id}-index.md", build_index_md(job))
+    if job.compress:
+        with logger.span("compact"):
+            stats = storage.compact_run(job.out_dir, job.compress)
+        logger.log(
+            f"STORAGE COMPACT ({job.compress}): files={stats['files']} "
+            f"bytes={stats['bytes_before']}->{stats['bytes_after']}"
+        )
+    if job.packed:
+        with logger.span("pack"):
+            stats = runpack.pack_run(job.root_dir)
+        logger.log(f"STORAGE PACK: {runpack.PACK_NAME} files={stats['files']} bytes={stats['bytes']}")
 
     logger.log("JOB END")
+    logger.close()
     feather_log = job.out_dir / "_feather_log.txt"
     try:
         if log_path.exists():
@@ -2388,21 +2951,24 @@ def _call_agentic_planner(model_name: str, payload: Dict[str, Any], logger: JobL
     user_prompt = json.dumps(payload, ensure_ascii=False, indent=2)
     endpoint_errors: List[str] = []
     parsed: Optional[Dict[str, Any]] = None
-    for kind, endpoint in _agentic_endpoints():
-        try:
-            if kind == "responses":
-                data = _planner_responses_request(endpoint, model_name, system_prompt, user_prompt, headers)
-                content = _planner_content_from_responses_payload(data)
-            else:
-                data = _planner_chat_request(endpoint, model_name, system_prompt, user_prompt, headers, logger)
-                content = _planner_content_from_chat_response(data)
-            parsed = _parse_json_object(content)
-            if parsed:
-                break
-            endpoint_errors.append(f"{kind}@{endpoint}: unparseable output")
-        except Exception as exc:
-            endpoint_errors.append(f"{kind}@{endpoint}: {str(exc)}")
-            continue
+    with logger.span("agentic_planner", model=model_name) as span:
+        for kind, endpoint in _agentic_endpoints():
+            span.add("requests")
+            try:
+                if kind == "responses":
+                    data = _planner_responses_request(endpoint, model_name, system_prompt, user_prompt, headers)
+                    content = _planner_content_from_responses_payload(data)
+                else:
+                    data = _planner_chat_request(endpoint, model_name, system_prompt, user_prompt, headers, logger)
+                    content = _planner_content_from_chat_response(data)
+                parsed = _parse_json_object(content)
+                if parsed:
+                    break
+                endpoint_errors.append(f"{kind}@{endpoint}: unparseable output")
+            except Exception as exc:
+                span.add("failures")
+                endpoint_errors.append(f"{kind}@{endpoint}: {str(exc)}")
+                continue
     if not parsed:
         detail = " | ".join(endpoint_errors[-4:]) if endpoint_errors else "no planner endpoint succeeded"
         raise RuntimeError(f"agentic planner request failed: {detail}")
@@ -2482,24 +3048,102 @@ def _collect_candidate_urls(search_path: Path, limit: int = 20) -> List[str]:
     return out
 
 
-def _collect_agentic_metrics(job: Job) -> Dict[str, Any]:
-    archive = job.out_dir
-    metrics = {
-        "tavily_search_entries": _jsonl_count(archive / "tavily_search.jsonl"),
-        "tavily_extract_files": len(list((archive / "tavily_extract").glob("*.txt")))
-        if (archive / "tavily_extract").exists()
-        else 0,
-        "openalex_works": _jsonl_count(archive / "openalex" / "works.jsonl"),
-        "arxiv_papers": _jsonl_count(archive / "arxiv" / "papers.jsonl"),
-        "youtube_videos": _youtube_video_count(archive / "youtube" / "videos.jsonl"),
-        "youtube_transcripts": len(list((archive / "youtube" / "transcripts").glob("*.txt")))
-        if (archive / "youtube" / "transcripts").exists()
-        else 0,
-        "web_pdf": len(list((archive / "web" / "pdf").glob("*.pdf"))) if (archive / "web" / "pdf").exists() else 0,
-        "web_text": len(list((archive / "web" / "text").glob("*.txt"))) if (archive / "web" / "text").exists() else 0,
-    }
-    metrics["candidate_urls"] = _collect_candidate_urls(archive / "tavily_search.jsonl", limit=20)
-    return metrics
+def _youtube_payload_videos(payload: dict) -> int:
+    videos = payload.get("videos")
+    if isinstance(videos, list):
+        return len(videos)
+    return 1 if isinstance(payload.get("video"), dict) else 0
+
+
+class ArchiveMetrics:
+    # Planner-facing archive counters. JSONL counts are read from disk once and then
+    # advanced by append_jsonl watchers; artifact folders are recounted only when
+    # their mtime moves. Each agentic iteration costs the same however big the
+    # archive gets.
+    def __init__(self, archive: Path, candidate_limit: int = 20):
+        self.archive = archive
+        self.candidate_limit = candidate_limit
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self._candidates: List[str] = []
+        self._candidate_seen: set[str] = set()
+        self._dirs: Dict[str, Tuple[int, int]] = {}
+        self._watchers: List[Tuple[Path, Callable[[Dict[str, Any], int], None]]] = []
+        search_path = archive / "tavily_search.jsonl"
+        self._counts["tavily_search_entries"] = _jsonl_count(search_path)
+        self._counts["openalex_works"] = _jsonl_count(archive / "openalex" / "works.jsonl")
+        self._counts["arxiv_papers"] = _jsonl_count(archive / "arxiv" / "papers.jsonl")
+        self._counts["youtube_videos"] = _youtube_video_count(archive / "youtube" / "videos.jsonl")
+        for url in _collect_candidate_urls(search_path, limit=candidate_limit):
+            self._add_candidate(url)
+        self._watch(search_path, self._on_search)
+        self._watch(archive / "openalex" / "works.jsonl", self._counter("openalex_works"))
+        self._watch(archive / "arxiv" / "papers.jsonl", self._counter("arxiv_papers"))
+        self._watch(archive / "youtube" / "videos.jsonl", self._on_videos)
+
+    def _watch(self, path: Path, callback: Callable[[Dict[str, Any], int], None]) -> None:
+        watch_jsonl(path, callback)
+        self._watchers.append((path, callback))
+
+    def _counter(self, key: str) -> Callable[[Dict[str, Any], int], None]:
+        def bump(obj: Dict[str, Any], size: int) -> None:
+            with self._lock:
+                self._counts[key] += 1
+
+        return bump
+
+    def _add_candidate(self, url: str) -> None:
+        cleaned = url.strip()
+        if cleaned and cleaned not in self._candidate_seen and len(self._candidates) < self.candidate_limit:
+            self._candidate_seen.add(cleaned)
+            self._candidates.append(cleaned)
+
+    def _on_search(self, obj: Dict[str, Any], size: int) -> None:
+        with self._lock:
+            self._counts["tavily_search_entries"] += 1
+            result = obj.get("result")
+            results = result.get("results") if isinstance(result, dict) else None
+            for item in results if isinstance(results, list) else []:
+                if isinstance(item, dict) and isinstance(item.get("url"), str):
+                    self._add_candidate(item["url"])
+
+    def _on_videos(self, obj: Dict[str, Any], size: int) -> None:
+        with self._lock:
+            self._counts["youtube_videos"] += _youtube_payload_videos(obj)
+
+    def _dir_count(self, path: Path, pattern: str) -> int:
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            return 0
+        key = f"{path}/{pattern}"
+        cached = self._dirs.get(key)
+        if cached is None or cached[0] != mtime_ns:
+            cached = (mtime_ns, len(list(path.glob(pattern))))
+            self._dirs[key] = cached
+        return cached[1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        archive = self.archive
+        with self._lock:
+            counts = dict(self._counts)
+            candidates = list(self._candidates)
+        return {
+            "tavily_search_entries": counts["tavily_search_entries"],
+            "tavily_extract_files": self._dir_count(archive / "tavily_extract", "*.txt"),
+            "openalex_works": counts["openalex_works"],
+            "arxiv_papers": counts["arxiv_papers"],
+            "youtube_videos": counts["youtube_videos"],
+            "youtube_transcripts": self._dir_count(archive / "youtube" / "transcripts", "*.txt"),
+            "web_pdf": self._dir_count(archive / "web" / "pdf", "*.pdf"),
+            "web_text": self._dir_count(archive / "web" / "text", "*.txt"),
+            "candidate_urls": candidates,
+        }
+
+    def close(self) -> None:
+        for path, callback in self._watchers:
+            unwatch_jsonl(path, callback)
+        self._watchers = []
 
 
 def _coerce_action_max(value: Any, default_value: int) -> int:
@@ -2678,100 +3322,243 @@ def _render_agentic_trace_md(trace_path: Path, out_path: Path, query_id: str) ->
     write_text(out_path, "\n".join(lines).strip() + "\n")
 
 
+# Agentic actions that touch the same outputs share a lane, mirroring provider_lanes:
+# YouTube search may fall back to reading tavily_search.jsonl.
+AGENTIC_ACTION_LANES = {
+    "tavily_search": "search",
+    "youtube_search": "search",
+    "tavily_extract": "extract",
+    "openalex_search": "openalex",
+    "arxiv_recent": "arxiv",
+}
+
+
+def _run_agentic_action(
+    job: Job,
+    action: Dict[str, Any],
+    tavily: TavilyClient,
+    logger: JobLogger,
+    dm: Optional[downloads.DownloadManager] = None,
+) -> bool:
+    action_type = action.get("type", "")
+    if action_type == "tavily_search":
+        query = action.get("query") or ""
+        if not query:
+            logger.log("AGENTIC action skipped (missing query): tavily_search")
+            return False
+        action_max = _coerce_action_max(action.get("max_results"), job.max_results)
+        temp_job = dataclasses.replace(
+            job,
+            query_specs=[QuerySpec(text=query, hints=[])],
+            queries=[query],
+            max_results=action_max,
+            update_run=True,
+        )
+        logger.log(f"AGENTIC action: tavily_search query={query} max={action_max}")
+        run_tavily_search(temp_job, tavily, logger)
+        return True
+    if action_type == "tavily_extract":
+        url = action.get("url") or ""
+        if not URL_RE.match(url):
+            logger.log("AGENTIC action skipped (invalid url): tavily_extract")
+            return False
+        temp_job = dataclasses.replace(job, urls=[url], update_run=True)
+        logger.log(f"AGENTIC action: tavily_extract url={url}")
+        run_tavily_extract(temp_job, tavily, logger)
+        run_url_pdf_downloads(temp_job, logger, dm)
+        return True
+    if action_type == "openalex_search":
+        query = action.get("query") or ""
+        if not query:
+            logger.log("AGENTIC action skipped (missing query): openalex_search")
+            return False
+        action_max = _coerce_action_max(action.get("max_results"), job.openalex_max_results or job.max_results)
+        temp_job = dataclasses.replace(
+            job,
+            queries=[query],
+            openalex_enabled=True,
+            openalex_max_results=action_max,
+            update_run=True,
+        )
+        logger.log(f"AGENTIC action: openalex_search query={query} max={action_max}")
+        run_openalex(temp_job, logger, dm)
+        return True
+    if action_type == "arxiv_recent":
+        query = action.get("query") or ""
+        if not query:
+            logger.log("AGENTIC action skipped (missing query): arxiv_recent")
+            return False
+        action_max = _coerce_action_max(action.get("max_results"), job.max_results)
+        temp_job = dataclasses.replace(
+            job,
+            queries=[query],
+            raw_lines=[query, "논문"],
+            max_results=action_max,
+            update_run=True,
+        )
+        logger.log(f"AGENTIC action: arxiv_recent query={query} max={action_max}")
+        run_arxiv_recent(temp_job, logger, dm)
+        return True
+    if action_type == "youtube_search":
+        query = action.get("query") or ""
+        if not query:
+            logger.log("AGENTIC action skipped (missing query): youtube_search")
+            return False
+        action_max = _coerce_action_max(action.get("max_results"), job.youtube_max_results or job.max_results)
+        temp_job = dataclasses.replace(
+            job,
+            query_specs=[QuerySpec(text=query, hints=["youtube"])],
+            queries=[query],
+            youtube_enabled=True,
+            youtube_max_results=action_max,
+            update_run=True,
+        )
+        logger.log(f"AGENTIC action: youtube_search query={query} max={action_max}")
+        run_youtube(temp_job, logger)
+        return True
+    logger.log(f"AGENTIC action skipped (unknown type): {action_type}")
+    return False
+
+
 def _execute_agentic_actions(
     job: Job,
     actions: List[Dict[str, Any]],
     tavily: TavilyClient,
     logger: JobLogger,
+    dm: Optional[downloads.DownloadManager] = None,
 ) -> int:
-    executed = 0
+    lanes: Dict[str, List[Dict[str, Any]]] = {}
     for action in actions:
         action_type = action.get("type", "")
         if action_type in {"stop", "done"}:
             logger.log("AGENTIC action: stop")
             continue
-        if action_type == "tavily_search":
-            query = action.get("query") or ""
-            if not query:
-                logger.log("AGENTIC action skipped (missing query): tavily_search")
-                continue
-            action_max = _coerce_action_max(action.get("max_results"), job.max_results)
-            temp_job = dataclasses.replace(
-                job,
-                query_specs=[QuerySpec(text=query, hints=[])],
-                queries=[query],
-                max_results=action_max,
-                update_run=True,
-            )
-            logger.log(f"AGENTIC action: tavily_search query={query} max={action_max}")
-            run_tavily_search(temp_job, tavily, logger)
-            executed += 1
-            continue
-        if action_type == "tavily_extract":
-            url = action.get("url") or ""
-            if not URL_RE.match(url):
-                logger.log("AGENTIC action skipped (invalid url): tavily_extract")
-                continue
-            temp_job = dataclasses.replace(job, urls=[url], update_run=True)
-            logger.log(f"AGENTIC action: tavily_extract url={url}")
-            run_tavily_extract(temp_job, tavily, logger)
-            run_url_pdf_downloads(temp_job, logger)
-            executed += 1
-            continue
-        if action_type == "openalex_search":
-            query = action.get("query") or ""
-            if not query:
-                logger.log("AGENTIC action skipped (missing query): openalex_search")
-                continue
-            action_max = _coerce_action_max(action.get("max_results"), job.openalex_max_results or job.max_results)
-            temp_job = dataclasses.replace(
-                job,
-                queries=[query],
-                openalex_enabled=True,
-                openalex_max_results=action_max,
-                update_run=True,
-            )
-            logger.log(f"AGENTIC action: openalex_search query={query} max={action_max}")
-            run_openalex(temp_job, logger)
-            executed += 1
-            continue
-        if action_type == "arxiv_recent":
-            query = action.get("query") or ""
-            if not query:
-                logger.log("AGENTIC action skipped (missing query): arxiv_recent")
-                continue
-            action_max = _coerce_action_max(action.get("max_results"), job.max_results)
-            temp_job = dataclasses.replace(
-                job,
-                queries=[query],
-                raw_lines=[query, "논문"],
-                max_results=action_max,
-                update_run=True,
-            )
-            logger.log(f"AGENTIC action: arxiv_recent query={query} max={action_max}")
-            run_arxiv_recent(temp_job, logger)
-            executed += 1
-            continue
-        if action_type == "youtube_search":
-            query = action.get("query") or ""
-            if not query:
-                logger.log("AGENTIC action skipped (missing query): youtube_search")
-                continue
-            action_max = _coerce_action_max(action.get("max_results"), job.youtube_max_results or job.max_results)
-            temp_job = dataclasses.replace(
-                job,
-                query_specs=[QuerySpec(text=query, hints=["youtube"])],
-                queries=[query],
-                youtube_enabled=True,
-                youtube_max_results=action_max,
-                update_run=True,
-            )
-            logger.log(f"AGENTIC action: youtube_search query={query} max={action_max}")
-            run_youtube(temp_job, logger)
-            executed += 1
+        lane = AGENTIC_ACTION_LANES.get(action_type)
+        if lane is None:
+            logger.log(f"AGENTIC action skipped (unknown type): {action_type}")
             continue
-        logger.log(f"AGENTIC action skipped (unknown type): {action_type}")
-    return executed
+        lanes.setdefault(lane, []).append(action)
+
+    def run_action(action: Dict[str, Any]) -> bool:
+        with logger.span(f"agentic_{action.get('type', '')}"):
+            return _run_agentic_action(job, action, tavily, logger, dm)
+
+    def run_lane(lane_actions: List[Dict[str, Any]]) -> int:
+        return sum(1 for action in lane_actions if run_action(action))
+
+    workers = min(max(job.provider_workers, 1), len(lanes))
+    if not job.parallel_providers or workers <= 1:
+        return sum(run_lane(lane_actions) for lane_actions in lanes.values())
+    logger.log(f"AGENTIC actions parallel: lanes={len(lanes)} workers={workers}")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_lane, lane_actions) for lane_actions in lanes.values()]
+        return sum(future.result() for future in futures)
+
+
+def _run_agentic_iterations(
+    job: Job,
+    tavily: TavilyClient,
+    logger: JobLogger,
+    dm: downloads.DownloadManager,
+    resolved_model: str,
+    iterations: int,
+    trace_path: Path,
+) -> None:
+    trace_entries: List[dict] = []
+    # Counters advance as actions append to the archive instead of rescanning it every turn.
+    archive_metrics = ArchiveMetrics(job.out_dir)
+    try:
+        for iter_idx in range(1, iterations + 1):
+            metrics_before = archive_metrics.snapshot()
+            plan_payload = {
+                "query_id": job.query_id,
+                "iteration": iter_idx,
+                "max_iterations": iterations,
+                "instruction_lines": job.raw_lines,
+                "goals": {
+                    "days": job.days,
+                    "default_max_results": job.max_results,
+                },
+                "current_archive": metrics_before,
+                "last_trace": trace_entries[-4:],
+                "guidance": (
+                    "Choose next high-value actions only. "
+                    "If evidence coverage is sufficient for the instruction, set done=true."
+                ),
+            }
+            planner_source = f"llm:{resolved_model}"
+            plan: Optional[Dict[str, Any]] = None
+            try:
+                plan = _call_agentic_planner(resolved_model, plan_payload, logger)
+            except Exception as exc:
+                logger.log(f"AGENTIC planner error iter={iter_idx}: {repr(exc)}")
+                fallback_model = _planner_fallback_model(resolved_model)
+                if fallback_model:
+                    try:
+                        logger.log(f"AGENTIC planner fallback: retry with model={fallback_model}")
+                        plan = _call_agentic_planner(fallback_model, plan_payload, logger)
+                        planner_source = f"llm:{fallback_model}"
+                    except Exception as fallback_exc:
+                        logger.log(f"AGENTIC planner fallback error iter={iter_idx}: {repr(fallback_exc)}")
+                if plan is None:
+                    heuristic_actions = _build_heuristic_agentic_actions(job, metrics_before)
+                    if heuristic_actions:
+                        planner_source = "heuristic"
+                        plan = {
+                            "done": False,
+                            "reason": "planner unavailable; heuristic fallback actions selected",
+                            "actions": heuristic_actions,
+                        }
+                        logger.log(
+                            f"AGENTIC planner fallback (heuristic) iter={iter_idx}: actions={len(heuristic_actions)}"
+                        )
+                    else:
+                        logger.log(f"AGENTIC stop iter={iter_idx}: planner failed and no fallback actions")
+                        break
+            if plan is None:
+                logger.log(f"AGENTIC stop iter={iter_idx}: planner failed with empty plan")
+                break
+            actions = _normalize_actions(plan)
+            plan_entry = {
+                "iter": iter_idx,
+                "phase": "plan",
+                "planner_source": planner_source,
+                "done": bool(plan.get("done", False)),
+                "reason": str(plan.get("reason") or ""),
+                "actions": actions,
+                "metrics_before": metrics_before,
+            }
+            append_jsonl(trace_path, plan_entry)
+            trace_entries.append(plan_entry)
+            if plan_entry["done"] and not actions:
+                logger.log(f"AGENTIC stop iter={iter_idx}: {plan_entry['reason'] or 'planner done'}")
+                break
+            executed = _execute_agentic_actions(job, actions, tavily, logger, dm)
+            metrics_after = archive_metrics.snapshot()
+            delta = {}
+            for key, before in metrics_before.items():
+                after = metrics_after.get(key)
+                if isinstance(before, int) and isinstance(after, int):
+                    delta[key] = after - before
+            review_entry = {
+                "iter": iter_idx,
+                "phase": "review",
+                "executed": executed,
+                "done": bool(plan.get("done", False)),
+                "reason": str(plan.get("reason") or ""),
+                "delta": delta,
+                "metrics_after": metrics_after,
+            }
+            append_jsonl(trace_path, review_entry)
+            trace_entries.append(review_entry)
+            if plan_entry["done"]:
+                logger.log(f"AGENTIC stop iter={iter_idx}: {plan_entry['reason'] or 'planner done'}")
+                break
+            if executed == 0:
+                logger.log(f"AGENTIC stop iter={iter_idx}: no executable actions")
+                break
+    finally:
+        archive_metrics.close()
 
 
 def run_job_agentic(
@@ -2798,107 +3585,16 @@ def run_job_agentic(
     logger.log(
         f"JOB START (agentic): {job.src_file.name} date={job.date.isoformat()} max_results={job.max_results} model={resolved_model}"
     )
+    circuit.get_registry().reset_counts()
 
-    # Bootstrap with the deterministic pipeline so agentic turns can build on concrete archive outputs.
-    run_local_ingest(job, logger)
-    run_tavily_extract(job, tavily, logger)
-    run_url_pdf_downloads(job, logger)
-    run_tavily_search(job, tavily, logger)
-    run_youtube(job, logger)
-    run_openalex(job, logger)
-    run_arxiv_ids(job, logger)
-    run_arxiv_recent(job, logger)
-    run_arxiv_sources(job, logger)
+    restore_stored_outputs(job, logger)
 
-    trace_entries: List[dict] = []
-    for iter_idx in range(1, iterations + 1):
-        metrics_before = _collect_agentic_metrics(job)
-        plan_payload = {
-            "query_id": job.query_id,
-            "iteration": iter_idx,
-            "max_iterations": iterations,
-            "instruction_lines": job.raw_lines,
-            "goals": {
-                "days": job.days,
-                "default_max_results": job.max_results,
-            },
-            "current_archive": metrics_before,
-            "last_trace": trace_entries[-4:],
-            "guidance": (
-                "Choose next high-value actions only. "
-                "If evidence coverage is sufficient for the instruction, set done=true."
-            ),
-        }
-        planner_source = f"llm:{resolved_model}"
-        plan: Optional[Dict[str, Any]] = None
-        try:
-            plan = _call_agentic_planner(resolved_model, plan_payload, logger)
-        except Exception as exc:
-            logger.log(f"AGENTIC planner error iter={iter_idx}: {repr(exc)}")
-            fallback_model = _planner_fallback_model(resolved_model)
-            if fallback_model:
-                try:
-                    logger.log(f"AGENTIC planner fallback: retry with model={fallback_model}")
-                    plan = _call_agentic_planner(fallback_model, plan_payload, logger)
-                    planner_source = f"llm:{fallback_model}"
-                except Exception as fallback_exc:
-                    logger.log(f"AGENTIC planner fallback error iter={iter_idx}: {repr(fallback_exc)}")
-            if plan is None:
-                heuristic_actions = _build_heuristic_agentic_actions(job, metrics_before)
-                if heuristic_actions:
-                    planner_source = "heuristic"
-                    plan = {
-                        "done": False,
-                        "reason": "planner unavailable; heuristic fallback actions selected",
-                        "actions": heuristic_actions,
-                    }
-                    logger.log(
-                        f"AGENTIC planner fallback (heuristic) iter={iter_idx}: actions={len(heuristic_actions)}"
-                    )
-                else:
-                    logger.log(f"AGENTIC stop iter={iter_idx}: planner failed and no fallback actions")
-                    break
-        if plan is None:
-            logger.log(f"AGENTIC stop iter={iter_idx}: planner failed with empty plan")
-            break
-        actions = _normalize_actions(plan)
-        plan_entry = {
-            "iter": iter_idx,
-            "phase": "plan",
-            "planner_source": planner_source,
-            "done": bool(plan.get("done", False)),
-            "reason": str(plan.get("reason") or ""),
-            "actions": actions,
-            "metrics_before": metrics_before,
-        }
-        append_jsonl(trace_path, plan_entry)
-        trace_entries.append(plan_entry)
-        if plan_entry["done"] and not actions:
-            logger.log(f"AGENTIC stop iter={iter_idx}: {plan_entry['reason'] or 'planner done'}")
-            break
-        executed = _execute_agentic_actions(job, actions, tavily, logger)
-        metrics_after = _collect_agentic_metrics(job)
-        delta = {}
-        for key, before in metrics_before.items():
-            after = metrics_after.get(key)
-            if isinstance(before, int) and isinstance(after, int):
-                delta[key] = after - before
-        review_entry = {
-            "iter": iter_idx,
-            "phase": "review",
-            "executed": executed,
-            "done": bool(plan.get("done", False)),
-            "reason": str(plan.get("reason") or ""),
-            "delta": delta,
-            "metrics_after": metrics_after,
-        }
-        append_jsonl(trace_path, review_entry)
-        trace_entries.append(review_entry)
-        if plan_entry["done"]:
-            logger.log(f"AGENTIC stop iter={iter_idx}: {plan_entry['reason'] or 'planner done'}")
-            break
-        if executed == 0:
-            logger.log(f"AGENTIC stop iter={iter_idx}: no executable actions")
-            break
+    try:
+        with open_download_manager(job) as dm:
+            # Bootstrap with the deterministic pipeline so agentic turns can build on concrete archive outputs.
+            run_providers(job, tavily, logger, dm)
+            _run_agentic_iterations(job, tavily, logger, dm, resolved_model, iterations, trace_path)
+    finally:
+        close_run_indexes(job)
     _render_agentic_trace_md(trace_path, job.out_dir / AGENTIC_TRACE_MD, job.query_id)
     _finalize_job_outputs(job, log_path, logger)
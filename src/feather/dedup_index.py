@@ -0,0 +1,213 @@
+import functools
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+from . import utils
+
+INDEX_NAME = "_dedup.sqlite"
+# Bump when the table layout changes; older sidecars are then rebuilt from the JSONL.
+SCHEMA_VERSION = 1
+# Bytes before the indexed offset that must still match before a grown file is
+# treated as appended to (rather than rewritten) and only its tail is parsed.
+SIGNATURE_BYTES = 256
+
+Extractor = Callable[[Dict[str, Any]], Iterable[str]]
+
+
+def tail_signature(path: Path, offset: int) -> str:
+    start = max(0, offset - SIGNATURE_BYTES)
+    with path.open("rb") as f:
+        f.seek(start)
+        return hashlib.sha1(f.read(offset - start)).hexdigest()
+
+
+class KeySet:
+    # Set-like view over one tracked JSONL file. Membership is a single indexed
+    # lookup; add() only covers keys that are not appended to the file.
+    def __init__(self, index: "DedupIndex", name: str):
+        self._index = index
+        self._name = name
+        self._extra: Set[str] = set()
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and (key in self._extra or self._index.has(self._name, key))
+
+    def add(self, key: str) -> None:
+        if not self._index.has(self._name, key):
+            self._extra.add(key)
+
+    def __ior__(self, other: Iterable[str]) -> "KeySet":
+        for key in other:
+            self.add(key)
+        return self
+
+    def __len__(self) -> int:
+        return self._index.count(self._name) + len(self._extra)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+
+class DedupIndex:
+    def __init__(self, root: Path):
+        self.root = root
+        self.path = root / INDEX_NAME
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._tracked: Dict[str, Extractor] = {}
+        self._watchers: Dict[str, Callable[[Dict[str, Any], int], None]] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # The sidecar is rebuilt from the JSONL whenever it disagrees, so it
+            # does not need to survive a power loss.
+            conn.execute("PRAGMA synchronous=OFF")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS keys;")
+                conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            conn.executescript(
+                "CREATE TABLE IF NOT EXISTS files ("
+                "name TEXT PRIMARY KEY, extractor TEXT, size INTEGER, mtime_ns INTEGER, signature TEXT);"
+                "CREATE TABLE IF NOT EXISTS keys (name TEXT, key TEXT, PRIMARY KEY (name, key)) WITHOUT ROWID;"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _file(self, name: str) -> Path:
+        return self.root / name
+
+    def track(self, name: str, extractor_id: str, extract: Extractor) -> KeySet:
+        # name is the JSONL path relative to the run folder. The index is brought up
+        # to date now (tail-only when the file was just appended to) and then kept in
+        # sync by append_jsonl.
+        with self._lock:
+            self._tracked[name] = extract
+            self._sync(name, extractor_id, extract)
+            if name not in self._watchers:
+                watcher = functools.partial(self._on_append, name)
+                self._watchers[name] = watcher
+                utils.watch_jsonl(self._file(name), watcher)
+        return KeySet(self, name)
+
+    def _sync(self, name: str, extractor_id: str, extract: Extractor) -> None:
+        conn = self._connect()
+        path = self._file(name)
+        row = conn.execute(
+            "SELECT extractor, size, mtime_ns, signature FROM files WHERE name = ?", (name,)
+        ).fetchone()
+        if not path.exists():
+            conn.execute("DELETE FROM keys WHERE name = ?", (name,))
+            conn.execute(
+                "INSERT OR REPLACE INTO files (name, extractor, size, mtime_ns, signature) VALUES (?, ?, 0, 0, '')",
+                (name, extractor_id),
+            )
+            conn.commit()
+            return
+        stat = path.stat()
+        offset = 0
+        if row is not None and row[0] == extractor_id:
+            _, size, mtime_ns, signature = row
+            if stat.st_size == size and stat.st_mtime_ns == mtime_ns:
+                return
+            if stat.st_size >= size and tail_signature(path, size) == signature:
+                offset = size
+        if offset == 0:
+            conn.execute("DELETE FROM keys WHERE name = ?", (name,))
+        end = self._index_from(conn, name, path, offset, extract)
+        conn.execute(
+            "INSERT OR REPLACE INTO files (name, extractor, size, mtime_ns, signature) VALUES (?, ?, ?, ?, ?)",
+            (name, extractor_id, end, stat.st_mtime_ns, tail_signature(path, end)),
+        )
+        conn.commit()
+
+    def _index_from(self, conn: sqlite3.Connection, name: str, path: Path, offset: int, extract: Extractor) -> int:
+        keys = []
+        with path.open("rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    # A half-written last line is picked up on the next sync.
+                    break
+                offset += len(raw)
+                try:
+                    data = json.loads(raw.decode("utf-8", errors="replace"))
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(data, dict):
+                    keys.extend((name, key) for key in extract(data) if key)
+        conn.executemany("INSERT OR IGNORE INTO keys (name, key) VALUES (?, ?)", keys)
+        return offset
+
+    def _on_append(self, name: str, obj: Dict[str, Any], size: int) -> None:
+        extract = self._tracked.get(name)
+        if extract is None:
+            return
+        path = self._file(name)
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT size FROM files WHERE name = ?", (name,)).fetchone()
+            line_len = len((json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8"))
+            if row is None or row[0] != size - line_len:
+                # Someone else wrote to the file since the last sync; leave the
+                # record stale so the next track() reconciles it.
+                return
+            conn.executemany(
+                "INSERT OR IGNORE INTO keys (name, key) VALUES (?, ?)",
+                [(name, key) for key in extract(obj) if key],
+            )
+            conn.execute(
+                "UPDATE files SET size = ?, mtime_ns = ?, signature = ? WHERE name = ?",
+                (size, path.stat().st_mtime_ns, tail_signature(path, size), name),
+            )
+            conn.commit()
+
+    def has(self, name: str, key: str) -> bool:
+        with self._lock:
+            conn = self._connect()
+            return conn.execute("SELECT 1 FROM keys WHERE name = ? AND key = ?", (name, key)).fetchone() is not None
+
+    def count(self, name: str) -> int:
+        with self._lock:
+            conn = self._connect()
+            return conn.execute("SELECT COUNT(*) FROM keys WHERE name = ?", (name,)).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            for name, watcher in self._watchers.items():
+                utils.unwatch_jsonl(self._file(name), watcher)
+            self._watchers.clear()
+            self._tracked.clear()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_INDEXES: Dict[str, DedupIndex] = {}
+_INDEXES_GUARD = threading.Lock()
+
+
+def open_index(root: Path) -> DedupIndex:
+    key = os.path.abspath(root)
+    with _INDEXES_GUARD:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = DedupIndex(root)
+            _INDEXES[key] = index
+    return index
+
+
+def close_index(root: Path) -> None:
+    with _INDEXES_GUARD:
+        index = _INDEXES.pop(os.path.abspath(root), None)
+    if index is not None:
+        index.close()
@@ -0,0 +1,239 @@
+import datetime as dt
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from . import blobstore, metrics, ratelimit
+from .utils import append_jsonl
+
+PDF_MAGIC = b"%PDF-"
+# The PDF spec allows junk before the header; readers accept it within the first KB.
+PDF_MAGIC_WINDOW = 1024
+PART_SUFFIX = ".part"
+MANIFEST_NAME = "_downloads.jsonl"
+DEFAULT_DOWNLOAD_WORKERS = 4
+DEFAULT_DOWNLOADS_PER_HOST = 2
+CHUNK_SIZE = 1024 * 512
+
+
+class IncompleteDownload(IOError):
+    pass
+
+
+class NotAPdf(ValueError):
+    pass
+
+
+def part_path(out_path: Path) -> Path:
+    return out_path.with_name(out_path.name + PART_SUFFIX)
+
+
+def validator_path(out_path: Path) -> Path:
+    # ETag/Last-Modified of the response a .part file came from; a resume is only sent
+    # (as If-Range) when this is known, so a changed remote file is fetched again.
+    return out_path.with_name(out_path.name + ".etag" + PART_SUFFIX)
+
+
+def response_validator(headers: Any) -> Optional[str]:
+    # Weak ETags are not allowed in If-Range.
+    etag = headers.get("ETag") or ""
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified") or None
+
+
+def has_pdf_magic(path: Path) -> bool:
+    try:
+        with path.open("rb") as f:
+            head = f.read(PDF_MAGIC_WINDOW)
+    except OSError:
+        return False
+    return PDF_MAGIC in head
+
+
+def is_complete(path: Path, expect_pdf: bool = True) -> bool:
+    # Anything at the final path was renamed into place after verification, except
+    # files left by older versions that wrote in place; those fail the magic check.
+    if not path.exists() or path.stat().st_size == 0:
+        return False
+    return has_pdf_magic(path) if expect_pdf else True
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def expected_total(headers: Any, offset: int, status: int) -> Optional[int]:
+    content_range = headers.get("Content-Range") or ""
+    match = re.match(r"bytes\s+\d+-\d+/(\d+)", content_range)
+    if status == 206 and match:
+        return int(match.group(1))
+    length = headers.get("Content-Length")
+    if length and length.isdigit():
+        return int(length) + (offset if status == 206 else 0)
+    return None
+
+
+def download_file(
+    url: str,
+    out_path: Path,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: int = 120,
+    expect_pdf: bool = True,
+    provider: Optional[str] = None,
+) -> Dict[str, Any]:
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    part = part_path(out_path)
+    validator_file = validator_path(out_path)
+    offset = part.stat().st_size if part.exists() else 0
+    validator = validator_file.read_text(encoding="utf-8").strip() if offset and validator_file.exists() else ""
+    if not validator:
+        offset = 0
+    req_headers = dict(headers or {})
+    # Identity encoding keeps Content-Length and Range offsets in raw file bytes.
+    req_headers["Accept-Encoding"] = "identity"
+    if offset:
+        req_headers["Range"] = f"bytes={offset}-"
+        req_headers["If-Range"] = validator
+    with ratelimit.get(url, provider=provider, stream=True, timeout=timeout, headers=req_headers) as r:
+        if r.status_code == 416 and offset:
+            # The partial file is already whole (or stale); verify it below as-is.
+            total = offset
+        else:
+            r.raise_for_status()
+            # A 200 means the file changed (If-Range failed) or ranges are unsupported.
+            resumed = offset > 0 and r.status_code == 206
+            if not resumed:
+                offset = 0
+                validator = response_validator(r.headers) or ""
+                if validator:
+                    validator_file.write_text(validator, encoding="utf-8")
+                else:
+                    validator_file.unlink(missing_ok=True)
+            total = expected_total(r.headers, offset, r.status_code)
+            with part.open("ab" if resumed else "wb") as f:
+                for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        metrics.count("bytes", len(chunk))
+    size = part.stat().st_size
+    if total is not None and size != total:
+        if size > total:
+            part.unlink(missing_ok=True)
+            validator_file.unlink(missing_ok=True)
+        raise IncompleteDownload(f"got {size} of {total} bytes: {url}")
+    if expect_pdf and not has_pdf_magic(part):
+        part.unlink(missing_ok=True)
+        validator_file.unlink(missing_ok=True)
+        raise NotAPdf(f"response is not a PDF: {url}")
+    digest = sha256_file(part)
+    os.replace(part, out_path)
+    validator_file.unlink(missing_ok=True)
+    return {
+        "url": url,
+        "path": out_path.as_posix(),
+        "size": size,
+        "sha256": digest,
+        "resumed_from": offset or None,
+    }
+
+
+def host_key(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class DownloadManager:
+    def __init__(
+        self,
+        manifest_path: Optional[Path] = None,
+        workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        per_host: int = DEFAULT_DOWNLOADS_PER_HOST,
+        root: Optional[Path] = None,
+    ):
+        self.manifest_path = manifest_path
+        self.root = root or (manifest_path.parent if manifest_path else None)
+        self.per_host = max(1, per_host)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="feather-download")
+        self._host_slots: Dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, url: str) -> threading.Semaphore:
+        key = host_key(url)
+        with self._lock:
+            slot = self._host_slots.get(key)
+            if slot is None:
+                slot = threading.Semaphore(self.per_host)
+                self._host_slots[key] = slot
+        return slot
+
+    def _record(self, record: Dict[str, Any]) -> None:
+        if not self.manifest_path:
+            return
+        payload = dict(record)
+        path = Path(payload["path"])
+        if self.root:
+            try:
+                payload["path"] = f"./{path.relative_to(self.root).as_posix()}"
+            except ValueError:
+                pass
+        payload["downloaded_at"] = dt.datetime.now().isoformat(timespec="seconds")
+        append_jsonl(self.manifest_path, payload)
+
+    def fetch(
+        self,
+        url: str,
+        out_path: Path,
+        download: Callable[..., Dict[str, Any]] = download_file,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        store = blobstore.get_store()
+        sha = store.sha_for_url(url) if store is not None else None
+        if store is not None and sha:
+            # Already fetched by an earlier run: link the stored bytes instead of downloading.
+            store.place(sha, out_path)
+            metrics.count("cache_hits")
+            record = {
+                "url": url,
+                "path": out_path.as_posix(),
+                "size": out_path.stat().st_size,
+                "sha256": sha,
+                "from_store": True,
+            }
+        else:
+            with self._slot(url):
+                record = download(url, out_path, **kwargs)
+            if store is not None:
+                store.adopt(out_path, sha=record.get("sha256"), url=url)
+        self._record(record)
+        return record
+
+    def submit(
+        self,
+        url: str,
+        out_path: Path,
+        download: Callable[..., Dict[str, Any]] = download_file,
+        **kwargs: Any,
+    ) -> "Future[Dict[str, Any]]":
+        return self._executor.submit(metrics.carry(self.fetch), url, out_path, download, **kwargs)
+
+    def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> "Future[Any]":
+        return self._executor.submit(metrics.carry(fn), *args, **kwargs)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "DownloadManager":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
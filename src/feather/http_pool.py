@@ -0,0 +1,105 @@
+import threading
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_PER_HOST = 6
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF_SEC = 0.5
+DEFAULT_POOL_HOSTS = 32
+RETRY_STATUS_FORCELIST = (500, 502, 504)
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class SessionPool:
+    # One shared keep-alive session. urllib3 keeps a connection pool per host, capped at
+    # `per_host` connections; pool_block makes extra threads wait for a free connection
+    # instead of opening throwaway ones.
+    def __init__(
+        self,
+        per_host: int = DEFAULT_PER_HOST,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF_SEC,
+        pool_hosts: int = DEFAULT_POOL_HOSTS,
+    ):
+        self.per_host = max(1, per_host)
+        self.retries = max(0, retries)
+        self.backoff = max(0.0, backoff)
+        self.pool_hosts = max(1, pool_hosts)
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    def _build_session(self) -> requests.Session:
+        retry = Retry(
+            total=self.retries,
+            connect=self.retries,
+            read=self.retries,
+            status=self.retries,
+            backoff_factor=self.backoff,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            allowed_methods=RETRY_METHODS,
+            # Throttling (429/503 + Retry-After) is left to ratelimit.request, which caps
+            # the wait, penalizes the bucket and feeds the circuit breaker.
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_hosts,
+            pool_maxsize=self.per_host,
+            max_retries=retry,
+            pool_block=True,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+        return session
+
+    def session(self) -> requests.Session:
+        session = self._session
+        if session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+                session = self._session
+        return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return self.session().request(method, url, **kwargs)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_POOL: Optional[SessionPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool() -> SessionPool:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = SessionPool()
+        return _POOL
+
+
+def configure_pool(
+    per_host: int = DEFAULT_PER_HOST,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = DEFAULT_BACKOFF_SEC,
+) -> SessionPool:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.close()
+        _POOL = SessionPool(per_host=per_host, retries=retries, backoff=backoff)
+        return _POOL
+
+
+def request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    return get_pool().request(method, url, **kwargs)
@@ -0,0 +1,124 @@
+import copy
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from .dedup_index import tail_signature
+from .utils import safe_filename
+
+CACHE_DIR_NAME = "_index_cache"
+
+
+def file_signature(path: Path) -> Optional[list]:
+    # Size and mtime, plus the last bytes so that a same-size rewrite within one
+    # timestamp tick still changes the key (a bounded read, never the whole file).
+    try:
+        stat = path.stat()
+        return [stat.st_size, stat.st_mtime_ns, tail_signature(path, stat.st_size)]
+    except OSError:
+        return None
+
+
+def listing(path: Path, pattern: str) -> Optional[list]:
+    # The sorted names a section lists from a folder; the renderers only show names,
+    # so nothing else about the files (or deeper folders) can change their output.
+    if not path.is_dir():
+        return None
+    return sorted(p.name for p in path.glob(pattern))
+
+
+class IndexCache:
+    # Sidecars for build_index_md under <run>/_index_cache/: folded JSONL metadata
+    # (extended from the last offset when the file only grew) and rendered sections
+    # keyed by the signatures of their inputs.
+    def __init__(self, root: Path):
+        self.root = root
+        self.dir = root / CACHE_DIR_NAME
+        self.rendered = 0
+        self.reused = 0
+
+    def _read(self, name: str) -> Dict[str, Any]:
+        path = self.dir / f"{safe_filename(name)}.json"
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, name: str, data: Dict[str, Any]) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        path = self.dir / f"{safe_filename(name)}.json"
+        tmp = path.with_name(path.name + ".part")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def fold_jsonl(
+        self,
+        path: Path,
+        name: str,
+        init: Callable[[], Any],
+        step: Callable[[Any, dict], None],
+    ) -> Any:
+        # step(state, entry) folds one JSON object into a JSON-serializable state.
+        # Steps must only depend on earlier lines, so appended lines can be folded
+        # into the saved state without re-reading the file.
+        if not path.exists():
+            return init()
+        cached = self._read(f"meta-{name}")
+        size = path.stat().st_size
+        offset = 0
+        state = init()
+        if cached.get("offset") is not None and "state" in cached:
+            prev = int(cached["offset"])
+            if prev == size and cached.get("file") == file_signature(path):
+                return cached["state"]
+            if prev <= size and tail_signature(path, prev) == cached.get("signature"):
+                offset, state = prev, cached["state"]
+        partial: Optional[bytes] = None
+        with path.open("rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    partial = raw
+                    break
+                offset += len(raw)
+                self._step(state, raw, step)
+        self._write(
+            f"meta-{name}",
+            {
+                "offset": offset,
+                "file": file_signature(path),
+                "signature": tail_signature(path, offset),
+                "state": state,
+            },
+        )
+        if partial is not None:
+            # A last line without a newline still counts, but is not saved: it may
+            # still be growing.
+            state = copy.deepcopy(state)
+            self._step(state, partial, step)
+        return state
+
+    @staticmethod
+    def _step(state: Any, raw: bytes, step: Callable[[Any, dict], None]) -> None:
+        line = raw.decode("utf-8", errors="ignore").strip()
+        if not line:
+            return
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return
+        if isinstance(data, dict):
+            step(state, data)
+
+    def section(self, name: str, key: Any, render: Callable[[], str]) -> str:
+        cached = self._read(f"section-{name}")
+        key_json = json.loads(json.dumps(key, default=str))
+        if "md" in cached and cached.get("key") == key_json:
+            self.reused += 1
+            return cached["md"]
+        md = render()
+        self.rendered += 1
+        self._write(f"section-{name}", {"key": key_json, "md": md})
+        return md
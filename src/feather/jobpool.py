@@ -0,0 +1,126 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.managers import BaseManager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from . import ratelimit
+from .models import Job
+
+DEFAULT_JOBS = 1
+
+
+class LimiterManager(BaseManager):
+    pass
+
+
+# One RateLimiter lives in the manager process; every job worker reserves slots
+# from it, so --jobs N shares a single budget per provider instead of N budgets.
+LimiterManager.register("RateLimiter", ratelimit.RateLimiter)
+
+
+class SharedLimiter:
+    def __init__(self, proxy: Any):
+        self._proxy = proxy
+
+    def configure(self, key: str, rate: float, burst: int) -> None:
+        self._proxy.configure(key, rate, burst)
+
+    def rates(self) -> Dict[str, Any]:
+        return self._proxy.rates()
+
+    def reserve(self, key: str) -> float:
+        return self._proxy.reserve(key)
+
+    def acquire(self, key: str) -> float:
+        # Reserve remotely, sleep locally: the manager never blocks on a caller.
+        wait = self.reserve(key)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, key: str, seconds: float) -> None:
+        self._proxy.penalize(key, seconds)
+
+
+def count_log_errors(log_path: Path) -> int:
+    if not log_path.exists():
+        return 0
+    count = 0
+    with log_path.open("r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if "] ERROR " in line:
+                count += 1
+    return count
+
+
+def _init_worker(limiter_proxy: Any, setup: Optional[Callable[[Dict[str, Any]], Any]], settings: Dict[str, Any]) -> None:
+    if setup is not None:
+        setup(settings)
+    ratelimit.install_limiter(SharedLimiter(limiter_proxy))
+
+
+def _run_one(job: Job, run_one: Callable[[Job, Dict[str, Any]], Any], settings: Dict[str, Any]) -> Dict[str, Any]:
+    start = time.monotonic()
+    error = None
+    try:
+        run_one(job, settings)
+    except Exception as exc:
+        error = repr(exc)
+    return {
+        "query_id": job.query_id,
+        "ok": error is None,
+        "error": error,
+        "elapsed": time.monotonic() - start,
+        "log_errors": count_log_errors(job.out_dir / "_log.txt"),
+    }
+
+
+def run_jobs(
+    jobs: List[Job],
+    run_one: Callable[[Job, Dict[str, Any]], Any],
+    settings: Dict[str, Any],
+    workers: int,
+    setup: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    progress: Optional[Callable[[str], None]] = print,
+) -> List[Dict[str, Any]]:
+    # Query IDs were assigned serially by prepare_jobs before any worker starts, so
+    # concurrent jobs never race on build_query_id or on their output folders.
+    start = time.monotonic()
+    total = len(jobs)
+    results: List[Dict[str, Any]] = []
+    with LimiterManager() as manager:
+        limiter = manager.RateLimiter(ratelimit.get_limiter().rates())
+        with ProcessPoolExecutor(
+            max_workers=max(1, min(workers, total)),
+            initializer=_init_worker,
+            initargs=(limiter, setup, settings),
+        ) as pool:
+            futures = {pool.submit(_run_one, job, run_one, settings): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    result = {
+                        "query_id": job.query_id,
+                        "ok": False,
+                        "error": repr(exc),
+                        "elapsed": 0.0,
+                        "log_errors": count_log_errors(job.out_dir / "_log.txt"),
+                    }
+                results.append(result)
+                if progress:
+                    status = "ok" if result["ok"] else f"FAILED {result['error']}"
+                    progress(
+                        f"[{len(results)}/{total}] {result['query_id']}: {status} "
+                        f"({result['elapsed']:.1f}s, log errors={result['log_errors']})"
+                    )
+    if progress:
+        failed = sum(1 for result in results if not result["ok"])
+        log_errors = sum(result["log_errors"] for result in results)
+        progress(
+            f"JOBS DONE: {total - failed}/{total} ok, {failed} failed, "
+            f"{log_errors} logged errors, {time.monotonic() - start:.1f}s"
+        )
+    return results
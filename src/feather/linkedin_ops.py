@@ -4,9 +4,7 @@ import re
 from typing import Dict, List, Optional
 from urllib.parse import parse_qs, unquote, urlparse
 
-import requests
-
-from . import __version__
+from . import __version__, ratelimit
 
 DEFAULT_USER_AGENT = f"Feather/{__version__} (+https://example.invalid)"
 ACTIVITY_PATTERNS = (
@@ -38,7 +36,7 @@ def build_embed_url(activity_id: str) -> str:
 
 
 def fetch_embed_html(embed_url: str, timeout: int = 30) -> str:
-    resp = requests.get(embed_url, timeout=timeout, headers=request_headers())
+    resp = ratelimit.get(embed_url, provider="linkedin", timeout=timeout, headers=request_headers())
     resp.raise_for_status()
     return resp.text
 
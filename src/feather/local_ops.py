@@ -1,9 +1,10 @@
 import hashlib
 import html
+import json
 import os
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from . import arxiv_ops
 from .utils import read_text, safe_filename
@@ -34,6 +35,7 @@ XLSX_AVAILABLE = openpyxl is not None
 BS4_AVAILABLE = BeautifulSoup is not None
 
 SUPPORTED_EXTS = {".txt", ".md", ".pdf", ".docx", ".pptx", ".xlsx", ".html", ".htm"}
+FINGERPRINTS_NAME = "_fingerprints.json"
 
 
 def is_supported(path: Path) -> bool:
@@ -48,6 +50,52 @@ def compute_sha1(path: Path) -> str:
     return digest.hexdigest()
 
 
+def iter_dir_files(base: Path) -> Iterator[Tuple[Path, os.stat_result]]:
+    # Depth-first os.scandir walk. DirEntry.stat() reuses the directory read on most
+    # platforms, so unchanged files cost no extra syscalls before the fingerprint check.
+    stack = [base]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirs: List[Path] = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(Path(entry.path))
+                elif entry.is_file():
+                    yield Path(entry.path), entry.stat()
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
+
+
+def load_fingerprints(path: Path) -> Dict[str, Dict[str, Any]]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_fingerprints(path: Path, data: Dict[str, Dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".part")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def fingerprint_matches(entry: Optional[Dict[str, Any]], stat: os.stat_result) -> bool:
+    if not entry:
+        return False
+    return entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
+
+
 def build_doc_id(digest: str) -> str:
     return f"local-{digest[:8]}"
 
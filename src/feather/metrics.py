@@ -0,0 +1,117 @@
+import contextvars
+import datetime as dt
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, Optional
+
+METRICS_NAME = "_metrics.jsonl"
+# Always present in a span record (0 when nothing was counted).
+COUNTERS = ("requests", "bytes", "cache_hits", "cache_misses", "failures", "skipped", "errors")
+
+_CURRENT: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar("feather_span", default=None)
+
+
+class Span:
+    # Counters for one stage run. HTTP, cache and download code call count() without
+    # knowing which stage they serve; the innermost open span on the thread gets it.
+    def __init__(self, stage: str, parent: Optional["Span"] = None):
+        self.stage = stage
+        self.parent = parent
+        self.counts: Dict[str, int] = {name: 0 for name in COUNTERS}
+        self.started = dt.datetime.now()
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + value
+
+    def record(self, status: str, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - self._t0
+        with self._lock:
+            counts = dict(self.counts)
+        return {
+            "type": "span",
+            "stage": self.stage,
+            "parent": self.parent.stage if self.parent else None,
+            "start": self.started.isoformat(timespec="milliseconds"),
+            "end": (self.started + dt.timedelta(seconds=elapsed)).isoformat(timespec="milliseconds"),
+            "duration_ms": round(elapsed * 1000, 3),
+            "status": status,
+            **counts,
+            **attrs,
+        }
+
+
+def current() -> Optional[Span]:
+    return _CURRENT.get()
+
+
+def count(name: str, value: int = 1) -> None:
+    span = _CURRENT.get()
+    if span is not None:
+        span.add(name, value)
+
+
+def carry(fn: Callable[..., Any]) -> Callable[..., Any]:
+    # Thread pools do not inherit context variables; wrap the task so its counts land
+    # in the submitting stage's span.
+    span = _CURRENT.get()
+    if span is None:
+        return fn
+
+    def run(*args: Any, **kwargs: Any) -> Any:
+        token = _CURRENT.set(span)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _CURRENT.reset(token)
+
+    return run
+
+
+class MetricsWriter:
+    # One append handle per job instead of one open/close per record. Each record is
+    # flushed as its span closes, so a job that crashes still leaves its metrics.
+    def __init__(self, path: Path):
+        self.path = path
+        self._fh: Optional[IO[str]] = None
+        self._lock = threading.Lock()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._fh is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fh = self.path.open("a", encoding="utf-8")
+            self._fh.write(line)
+            self._fh.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+@contextmanager
+def span(writer: MetricsWriter, stage: str, **attrs: Any) -> Iterator[Span]:
+    item = Span(stage, parent=_CURRENT.get())
+    token = _CURRENT.set(item)
+    status = "ok"
+    try:
+        yield item
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        _CURRENT.reset(token)
+        writer.write(item.record(status, attrs))
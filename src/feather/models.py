@@ -3,6 +3,8 @@ from datetime import date
 from pathlib import Path
 from typing import List, Optional
 
+DEFAULT_PROVIDER_WORKERS = 4
+
 
 @dataclass
 class QuerySpec:
@@ -49,3 +51,13 @@ class Job:
     agentic_search: bool = False
     agentic_model: Optional[str] = None
     agentic_max_iter: int = 0
+    parallel_providers: bool = False
+    provider_workers: int = DEFAULT_PROVIDER_WORKERS
+    extract_batch_size: int = 10
+    download_workers: int = 4
+    downloads_per_host: int = 2
+    local_workers: int = 4
+    transcript_workers: int = 4
+    near_dedup: bool = True
+    compress: Optional[str] = None
+    packed: bool = False
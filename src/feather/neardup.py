@@ -0,0 +1,144 @@
+import hashlib
+import os
+import random
+import re
+import sqlite3
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+INDEX_NAME = "_neardup.sqlite"
+RECORDS_NAME = "near_duplicates.jsonl"
+SHINGLE_WORDS = 5
+NUM_PERM = 64
+# 16 bands of 4 rows: pairs around 0.5 Jaccard already share a bucket, so the
+# signature comparison below decides; candidates stay a handful per document.
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+THRESHOLD = 0.8
+# Texts shorter than this many shingles are too small to compare reliably.
+MIN_SHINGLES = 8
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def text_shingles(text: str) -> Set[int]:
+    words = WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_WORDS:
+        return set()
+    out: Set[int] = set()
+    for idx in range(len(words) - SHINGLE_WORDS + 1):
+        shingle = " ".join(words[idx : idx + SHINGLE_WORDS]).encode("utf-8")
+        out.add(int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), "big"))
+    return out
+
+
+def minhash(shingles: Set[int]) -> List[int]:
+    return [min((a * h + b) % _PRIME for h in shingles) for a, b in _PERMS]
+
+
+def similarity(sig_a: List[int], sig_b: List[int]) -> float:
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+def band_buckets(sig: List[int]) -> List[str]:
+    out = []
+    for band in range(BANDS):
+        rows = sig[band * ROWS : (band + 1) * ROWS]
+        out.append(hashlib.blake2b(struct.pack(f">{ROWS}Q", *rows), digest_size=8).hexdigest())
+    return out
+
+
+class NearDupIndex:
+    # MinHash signatures with LSH buckets in <run>/_neardup.sqlite. A lookup touches
+    # only documents sharing a band bucket, so the cost does not grow with the archive.
+    # Groups keep unlike texts apart (search snippets are never compared to pages).
+    def __init__(self, root: Path):
+        self.root = root
+        self.path = root / INDEX_NAME
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(
+                "CREATE TABLE IF NOT EXISTS docs ("
+                "grp TEXT, key TEXT, sig BLOB, dup_of TEXT, score REAL, PRIMARY KEY (grp, key));"
+                "CREATE TABLE IF NOT EXISTS buckets (grp TEXT, band INTEGER, bucket TEXT, key TEXT);"
+                "CREATE INDEX IF NOT EXISTS buckets_lookup ON buckets (grp, band, bucket);"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def check(self, group: str, key: str, text: str) -> Optional[Tuple[str, float]]:
+        # Returns (canonical_key, similarity) when text near-duplicates an earlier
+        # document of the group; otherwise registers it as a canonical document.
+        shingles = text_shingles(text)
+        if len(shingles) < MIN_SHINGLES:
+            return None
+        sig = minhash(shingles)
+        buckets = band_buckets(sig)
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT dup_of, score FROM docs WHERE grp = ? AND key = ?", (group, key)).fetchone()
+            if row is not None:
+                return (row[0], row[1]) if row[0] else None
+            candidates: Dict[str, None] = {}
+            for band, bucket in enumerate(buckets):
+                for (other,) in conn.execute(
+                    "SELECT key FROM buckets WHERE grp = ? AND band = ? AND bucket = ?", (group, band, bucket)
+                ):
+                    candidates.setdefault(other, None)
+            best: Optional[Tuple[str, float]] = None
+            for other in candidates:
+                (blob,) = conn.execute("SELECT sig FROM docs WHERE grp = ? AND key = ?", (group, other)).fetchone()
+                score = similarity(sig, list(struct.unpack(f">{NUM_PERM}Q", blob)))
+                if score >= THRESHOLD and (best is None or score > best[1]):
+                    best = (other, score)
+            conn.execute(
+                "INSERT INTO docs (grp, key, sig, dup_of, score) VALUES (?, ?, ?, ?, ?)",
+                (group, key, struct.pack(f">{NUM_PERM}Q", *sig), best[0] if best else None, best[1] if best else None),
+            )
+            if best is None:
+                # Only canonical documents are bucketed, so every match points at one.
+                conn.executemany(
+                    "INSERT INTO buckets (grp, band, bucket, key) VALUES (?, ?, ?, ?)",
+                    [(group, band, bucket, key) for band, bucket in enumerate(buckets)],
+                )
+            conn.commit()
+        return best
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_INDEXES: Dict[str, NearDupIndex] = {}
+_INDEXES_GUARD = threading.Lock()
+
+
+def open_index(root: Path) -> NearDupIndex:
+    key = os.path.abspath(root)
+    with _INDEXES_GUARD:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = NearDupIndex(root)
+            _INDEXES[key] = index
+    return index
+
+
+def close_index(root: Path) -> None:
+    with _INDEXES_GUARD:
+        index = _INDEXES.pop(os.path.abspath(root), None)
+    if index is not None:
+        index.close()
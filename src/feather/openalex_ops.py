@@ -1,15 +1,17 @@
 import datetime as dt
+import json
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-import requests
-
-from . import __version__
+from . import __version__, downloads, ratelimit, response_cache
+from .utils import provider_base
 
 OPENALEX_BASE = "https://api.openalex.org"
 DEFAULT_USER_AGENT = f"Feather/{__version__} (+https://example.invalid)"
+MAX_PER_PAGE = 200
+CURSORS_NAME = "_cursors.json"
 
 
 def request_headers() -> Dict[str, str]:
@@ -102,37 +104,107 @@ def work_to_metadata(work: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def openalex_search_recent(
+class _SkippedStatus(Exception):
+    pass
+
+
+def fetch_works(params: Dict[str, Any], skip_statuses: tuple = ()) -> Optional[Dict[str, Any]]:
+    # A status in skip_statuses returns None; it is raised through the cache so that
+    # "nothing found" is never stored as an answer for the TTL.
+    params = dict(params)
+
+    def fetch() -> Optional[Dict[str, Any]]:
+        r = ratelimit.get(f"{provider_base('openalex', OPENALEX_BASE)}/works", provider="openalex", params=params, timeout=60, headers=request_headers())
+        if r.status_code in skip_statuses:
+            raise _SkippedStatus(r.status_code)
+        r.raise_for_status()
+        return r.json()
+
+    try:
+        return response_cache.cached("openalex", "works", params, fetch)
+    except _SkippedStatus:
+        return None
+
+
+def iter_search_pages(
     query: str,
     end_date: dt.date,
     days: int,
     max_results: int,
     api_key: Optional[str] = None,
     mailto: Optional[str] = None,
-) -> List[Dict[str, Any]]:
+    cursor: str = "*",
+    fetched: int = 0,
+) -> Iterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+    # Cursor pagination: yields (records, next_cursor) one page at a time. Pass a saved
+    # next_cursor (and the number of records already taken) to resume a sweep.
     start_date = (end_date - dt.timedelta(days=days)).isoformat()
     end_date_str = end_date.isoformat()
-    per_page = min(max_results, 200)
-    params = {
+    params: Dict[str, Any] = {
         "search": query,
         "filter": f"from_publication_date:{start_date},to_publication_date:{end_date_str},is_oa:true",
-        "per-page": per_page,
+        "per-page": min(max_results, MAX_PER_PAGE),
     }
     if api_key:
         params["api_key"] = api_key
     if mailto:
         params["mailto"] = mailto
 
-    r = requests.get(f"{OPENALEX_BASE}/works", params=params, timeout=60, headers=request_headers())
-    r.raise_for_status()
-    data = r.json()
+    next_cursor: Optional[str] = cursor
+    while next_cursor and fetched < max_results:
+        params["cursor"] = next_cursor
+        data = fetch_works(params) or {}
+        works = data.get("results", []) or []
+        next_cursor = (data.get("meta") or {}).get("next_cursor") if works else None
+        records = [work_to_metadata(work) for work in works[: max_results - fetched]]
+        fetched += len(records)
+        if fetched >= max_results:
+            next_cursor = None
+        yield records, next_cursor
+
 
-    results: List[Dict[str, Any]] = []
-    for work in data.get("results", []) or []:
-        results.append(work_to_metadata(work))
-        if len(results) >= max_results:
-            break
-    return results
+def openalex_search_stream(
+    query: str,
+    end_date: dt.date,
+    days: int,
+    max_results: int,
+    api_key: Optional[str] = None,
+    mailto: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    for records, _ in iter_search_pages(query, end_date, days, max_results, api_key=api_key, mailto=mailto):
+        yield from records
+
+
+def openalex_search_recent(
+    query: str,
+    end_date: dt.date,
+    days: int,
+    max_results: int,
+    api_key: Optional[str] = None,
+    mailto: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    return list(openalex_search_stream(query, end_date, days, max_results, api_key=api_key, mailto=mailto))
+
+
+def cursor_key(query: str, end_date: dt.date, days: int, max_results: int) -> str:
+    return f"{query}|{end_date.isoformat()}|{days}|{max_results}"
+
+
+def load_cursors(path: Path) -> Dict[str, Dict[str, Any]]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_cursors(path: Path, data: Dict[str, Dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".part")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def openalex_download_pdf(
@@ -140,17 +212,11 @@ def openalex_download_pdf(
     out_pdf: Path,
     timeout: int = 120,
     referer: Optional[str] = None,
-) -> None:
-    out_pdf.parent.mkdir(parents=True, exist_ok=True)
+) -> Dict[str, Any]:
     headers = request_headers()
     if referer:
         headers["Referer"] = referer
-    with requests.get(pdf_url, stream=True, timeout=timeout, headers=headers) as r:
-        r.raise_for_status()
-        with out_pdf.open("wb") as f:
-            for chunk in r.iter_content(chunk_size=1024 * 512):
-                if chunk:
-                    f.write(chunk)
+    return downloads.download_file(pdf_url, out_pdf, headers=headers, timeout=timeout)
 
 
 def normalize_doi(value: Optional[str]) -> Optional[str]:
@@ -182,12 +248,19 @@ def build_params(api_key: Optional[str], mailto: Optional[str]) -> dict:
 
 def openalex_fetch_by_doi(doi: str, api_key: Optional[str], mailto: Optional[str]) -> Optional[Dict[str, Any]]:
     params = build_params(api_key, mailto)
-    url = f"{OPENALEX_BASE}/works/https://doi.org/{doi}"
-    r = requests.get(url, params=params, timeout=60, headers=request_headers())
-    if r.status_code == 404:
+    url = f"{provider_base('openalex', OPENALEX_BASE)}/works/https://doi.org/{doi}"
+
+    def fetch() -> Optional[Dict[str, Any]]:
+        r = ratelimit.get(url, provider="openalex", params=params, timeout=60, headers=request_headers())
+        if r.status_code == 404:
+            raise _SkippedStatus(r.status_code)
+        r.raise_for_status()
+        return r.json()
+
+    try:
+        return response_cache.cached("openalex", "work", {"url": url, **params}, fetch)
+    except _SkippedStatus:
         return None
-    r.raise_for_status()
-    return r.json()
 
 
 def openalex_fetch_by_arxiv(arxiv_id: str, api_key: Optional[str], mailto: Optional[str]) -> Optional[Dict[str, Any]]:
@@ -198,19 +271,40 @@ def openalex_fetch_by_arxiv(arxiv_id: str, api_key: Optional[str], mailto: Optio
     )
     for url in landing_urls:
         params["filter"] = f"primary_location.landing_page_url:{url}"
-        r = requests.get(f"{OPENALEX_BASE}/works", params=params, timeout=60, headers=request_headers())
-        if r.status_code == 404:
-            continue
-        if r.status_code == 400:
-            continue
-        r.raise_for_status()
-        data = r.json()
-        results = data.get("results") or []
+        data = fetch_works(params, skip_statuses=(400, 404))
+        results = (data or {}).get("results") or []
         if results:
             return results[0]
     return None
 
 
+def citation_filter(field: str, values: List[str]) -> str:
+    if field == "doi":
+        return "doi:" + "|".join(values)
+    if field == "arxiv":
+        urls = []
+        for arxiv_id in values:
+            urls += [f"http://arxiv.org/abs/{arxiv_id}", f"https://arxiv.org/abs/{arxiv_id}"]
+        return "primary_location.landing_page_url:" + "|".join(urls)
+    raise ValueError(f"Unsupported citation filter field: {field}")
+
+
+def fetch_citation_batch(
+    field: str,
+    values: List[str],
+    api_key: Optional[str] = None,
+    mailto: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    # One OpenAlex request for many works via an OR-filter (pipe-separated values).
+    params = build_params(api_key, mailto)
+    params["filter"] = citation_filter(field, values)
+    params["select"] = "id,doi,cited_by_count,primary_location,locations"
+    params["per-page"] = 200
+    # A 400 (malformed filter) raises so the caller logs it as an error.
+    data = fetch_works(params, skip_statuses=(404,))
+    return list((data or {}).get("results") or [])
+
+
 def openalex_get_citations(
     doi: Optional[str],
     arxiv_id: Optional[str],
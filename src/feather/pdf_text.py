@@ -0,0 +1,151 @@
+import multiprocessing
+import os
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from . import arxiv_ops
+
+DEFAULT_PDF_WORKERS = 0
+DEFAULT_PDF_TIMEOUT_SEC = 120
+# The collector is multithreaded by the time PDFs arrive; forking it can copy a held
+# lock into the child. Workers are started fresh instead.
+POOL_START_METHOD = "spawn"
+# Extra time the parent waits beyond the per-document timeout before giving up on a worker.
+PARENT_GRACE_SEC = 15
+
+
+class PdfTimeout(TimeoutError):
+    pass
+
+
+def _on_alarm(signum: int, frame: Any) -> None:
+    raise PdfTimeout("pdf_to_text timed out")
+
+
+def convert_pdf(pdf_path: str, txt_path: str, timeout: int = DEFAULT_PDF_TIMEOUT_SEC) -> Dict[str, Any]:
+    # Timed conversions run in a pool worker, whose tasks execute on the main thread
+    # where SIGALRM works (POSIX); the parent's wait() is the backstop elsewhere.
+    use_alarm = timeout > 0 and hasattr(signal, "SIGALRM") and threading.current_thread() is threading.main_thread()
+    previous = None
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.alarm(int(timeout))
+    try:
+        text = arxiv_ops.pdf_to_text(Path(pdf_path))
+    finally:
+        if use_alarm:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, previous)
+    out = Path(txt_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_name(out.name + ".part")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, out)
+    return {"pdf": pdf_path, "text": txt_path, "chars": len(text), "pages": text.count("===== PAGE ")}
+
+
+class PdfTextStage:
+    def __init__(self, workers: int = DEFAULT_PDF_WORKERS, timeout: int = DEFAULT_PDF_TIMEOUT_SEC):
+        self.workers = max(0, workers)
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Pooled submissions by future, so a killed pool's queued work can be resubmitted;
+        # _moved maps a future from a killed pool to its replacement.
+        self._pending: Dict["Future[Dict[str, Any]]", Tuple[str, str]] = {}
+        self._moved: Dict["Future[Dict[str, Any]]", "Future[Dict[str, Any]]"] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pooled(self) -> bool:
+        # A timeout can only be enforced in a worker process: inline, SIGALRM is not
+        # available off the main thread (provider lanes, download workers).
+        return self.workers > 0 or self.timeout > 0
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=max(1, self.workers),
+                    mp_context=multiprocessing.get_context(POOL_START_METHOD),
+                )
+            return self._executor
+
+    def _submit_pooled(self, pdf_path: str, txt_path: str) -> "Future[Dict[str, Any]]":
+        try:
+            future = self._pool().submit(convert_pdf, pdf_path, txt_path, self.timeout)
+        except BrokenProcessPool:
+            # A worker died (e.g. a crashing PDF); start a fresh pool for the rest.
+            with self._lock:
+                self._executor = None
+            future = self._pool().submit(convert_pdf, pdf_path, txt_path, self.timeout)
+        with self._lock:
+            self._pending[future] = (pdf_path, txt_path)
+        return future
+
+    def submit(self, pdf_path: Path, txt_path: Path) -> "Future[Dict[str, Any]]":
+        if self.pooled:
+            return self._submit_pooled(str(pdf_path), str(txt_path))
+        future: "Future[Dict[str, Any]]" = Future()
+        try:
+            future.set_result(convert_pdf(str(pdf_path), str(txt_path), self.timeout))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def wait(self, future: "Future[Dict[str, Any]]") -> Dict[str, Any]:
+        # Backstop for hangs SIGALRM cannot interrupt (stuck in C code) and platforms
+        # without it: stop waiting, kill the pool and resubmit the queued work.
+        with self._lock:
+            while future in self._moved:
+                future = self._moved.pop(future)
+        limit = self.timeout + PARENT_GRACE_SEC if self.timeout > 0 else None
+        try:
+            return future.result(timeout=limit)
+        except FutureTimeout as exc:
+            self._restart_pool(stuck=future)
+            raise PdfTimeout(f"pdf_to_text exceeded {limit}s") from exc
+        finally:
+            with self._lock:
+                self._pending.pop(future, None)
+
+    def _restart_pool(self, stuck: "Future[Dict[str, Any]]") -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            queued = [(f, args) for f, args in self._pending.items() if f is not stuck and not f.done()]
+            for f, _ in queued:
+                del self._pending[f]
+        if executor is not None:
+            for proc in list((getattr(executor, "_processes", None) or {}).values()):
+                proc.terminate()
+            executor.shutdown(wait=False, cancel_futures=True)
+        for old, (pdf_path, txt_path) in queued:
+            replacement = self._submit_pooled(pdf_path, txt_path)
+            with self._lock:
+                self._moved[old] = replacement
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+            self._pending.clear()
+            self._moved.clear()
+
+
+_STAGE = PdfTextStage()
+
+
+def get_stage() -> PdfTextStage:
+    return _STAGE
+
+
+def configure_stage(workers: int = DEFAULT_PDF_WORKERS, timeout: int = DEFAULT_PDF_TIMEOUT_SEC) -> PdfTextStage:
+    global _STAGE
+    _STAGE.close()
+    _STAGE = PdfTextStage(workers=workers, timeout=timeout)
+    return _STAGE
@@ -0,0 +1,210 @@
+import datetime as dt
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from . import circuit, http_pool, metrics, response_cache
+
+# (requests per second, burst). A rate <= 0 disables limiting for that key.
+DEFAULT_RATES: Dict[str, Tuple[float, int]] = {
+    "tavily": (4.0, 4),
+    "openalex": (8.0, 8),
+    "arxiv": (1.0 / 3.0, 1),
+    "youtube": (5.0, 5),
+    "linkedin": (1.0, 1),
+    "youtube_transcript": (1.0, 2),
+    "default": (2.0, 4),
+}
+RATE_LIMITS_ENV = "FEATHER_RATE_LIMITS"
+RETRY_STATUSES = {429, 503}
+MAX_RETRY_AFTER_SEC = 120.0
+DEFAULT_MAX_RETRIES = 3
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, int(burst))
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        wait = max(0.0, self.blocked_until - now)
+        if self.rate <= 0:
+            return wait
+        self.tokens = min(float(self.burst), self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1.0
+        if self.tokens < 0:
+            wait = max(wait, -self.tokens / self.rate)
+        return wait
+
+    def block(self, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, time.monotonic() + max(0.0, seconds))
+
+
+class RateLimiter:
+    def __init__(self, rates: Optional[Dict[str, Tuple[float, int]]] = None):
+        self._rates: Dict[str, Tuple[float, int]] = dict(DEFAULT_RATES)
+        if rates:
+            self._rates.update(rates)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, key: str, rate: float, burst: int) -> None:
+        with self._lock:
+            self._rates[key] = (rate, burst)
+            self._buckets.pop(key, None)
+
+    def rates(self) -> Dict[str, Tuple[float, int]]:
+        with self._lock:
+            return dict(self._rates)
+
+    def _bucket(self, key: str) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate, burst = self._rates.get(key) or self._rates["default"]
+            bucket = TokenBucket(rate, burst)
+            self._buckets[key] = bucket
+        return bucket
+
+    def reserve(self, key: str) -> float:
+        with self._lock:
+            return self._bucket(key).reserve()
+
+    def acquire(self, key: str) -> float:
+        wait = self.reserve(key)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, key: str, seconds: float) -> None:
+        with self._lock:
+            self._bucket(key).block(seconds)
+
+
+_LIMITER = RateLimiter()
+
+
+def get_limiter() -> RateLimiter:
+    return _LIMITER
+
+
+def install_limiter(limiter: Any) -> None:
+    global _LIMITER
+    _LIMITER = limiter
+
+
+def parse_rate_spec(spec: str) -> Tuple[str, float, int]:
+    if "=" not in spec:
+        raise ValueError(f"Invalid rate limit '{spec}'. Use PROVIDER=RPS[:BURST].")
+    key, value = spec.split("=", 1)
+    key = key.strip().lower()
+    rate_text, _, burst_text = value.strip().partition(":")
+    if not key:
+        raise ValueError(f"Invalid rate limit '{spec}': missing provider or host.")
+    try:
+        rate = float(rate_text)
+        burst = int(burst_text) if burst_text else max(1, int(rate) or 1)
+    except ValueError as exc:
+        raise ValueError(f"Invalid rate limit '{spec}': {exc}") from exc
+    return key, rate, burst
+
+
+def configure_rate_limits(specs: Optional[Iterable[str]] = None) -> RateLimiter:
+    limiter = get_limiter()
+    env_specs = [part.strip() for part in os.getenv(RATE_LIMITS_ENV, "").split(",") if part.strip()]
+    for spec in [*env_specs, *(specs or [])]:
+        key, rate, burst = parse_rate_spec(spec)
+        limiter.configure(key, rate, burst)
+    return limiter
+
+
+def limiter_key(url: str, provider: Optional[str] = None) -> str:
+    if provider:
+        return provider
+    host = (urlparse(url).hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return host or "default"
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=dt.timezone.utc)
+    return max(0.0, (when - dt.datetime.now(dt.timezone.utc)).total_seconds())
+
+
+def request(
+    method: str,
+    url: str,
+    provider: Optional[str] = None,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    **kwargs: Any,
+) -> requests.Response:
+    key = limiter_key(url, provider)
+    response_cache.require_network(key)
+    limiter = get_limiter()
+    breakers = circuit.get_registry()
+    attempt = 0
+    while True:
+        # An open circuit fails fast instead of spending another timeout on a dead
+        # provider or host; CircuitOpen is a RequestException, so callers log and move on.
+        try:
+            breakers.before(key)
+        except circuit.CircuitOpen:
+            metrics.count("skipped")
+            raise
+        limiter.acquire(key)
+        metrics.count("requests")
+        try:
+            response = http_pool.request(method, url, **kwargs)
+        except circuit.TRANSPORT_ERRORS:
+            metrics.count("failures")
+            breakers.failure(key)
+            raise
+        except Exception:
+            breakers.release(key)
+            raise
+        if response.status_code not in RETRY_STATUSES or attempt >= max_retries:
+            # Retried attempts show up in "requests"; "failures" counts outcomes only.
+            if response.status_code in circuit.FAILURE_STATUSES:
+                metrics.count("failures")
+            breakers.record_status(key, response.status_code)
+            # Streamed bodies are counted by whoever reads them (downloads).
+            if not kwargs.get("stream") and metrics.current() is not None:
+                metrics.count("bytes", len(response.content))
+            return response
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = circuit.backoff_delay(attempt, 1.0, MAX_RETRY_AFTER_SEC)
+        breakers.release(key)
+        limiter.penalize(key, min(delay, MAX_RETRY_AFTER_SEC))
+        response.close()
+        attempt += 1
+
+
+def get(url: str, provider: Optional[str] = None, **kwargs: Any) -> requests.Response:
+    return request("GET", url, provider=provider, **kwargs)
+
+
+def post(url: str, provider: Optional[str] = None, **kwargs: Any) -> requests.Response:
+    return request("POST", url, provider=provider, **kwargs)
@@ -0,0 +1,257 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from . import metrics
+
+CACHE_MODES = ("off", "read", "readwrite", "offline")
+CACHE_DIR_ENV = "FEDERLICHT_CACHE_DIR"
+CACHE_DB_NAME = "responses.sqlite"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_TTLS: Dict[str, float] = {
+    "tavily": 6 * 3600,
+    "openalex": 24 * 3600,
+    "arxiv": 24 * 3600,
+    "youtube": 12 * 3600,
+    "default": 24 * 3600,
+}
+# Never part of a cache key: credentials and contact details do not change the response.
+SECRET_PARAMS = {"api_key", "key", "mailto"}
+
+
+class CacheMiss(RuntimeError):
+    pass
+
+
+def default_cache_dir() -> Path:
+    override = os.getenv(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+    xdg = os.getenv("XDG_CACHE_HOME")
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return base / "federlicht"
+
+
+def normalize_params(params: Any) -> Any:
+    if isinstance(params, dict):
+        return {str(k): normalize_params(v) for k, v in sorted(params.items()) if str(k) not in SECRET_PARAMS}
+    if isinstance(params, (list, tuple)):
+        return [normalize_params(v) for v in params]
+    if isinstance(params, str):
+        return params.strip()
+    return params
+
+
+def make_key(provider: str, endpoint: str, params: Any) -> str:
+    payload = json.dumps(
+        [provider, endpoint, normalize_params(params)],
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        mode: str = "off",
+        ttls: Optional[Dict[str, float]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Invalid cache mode: {mode}. Use one of {', '.join(CACHE_MODES)}.")
+        self.path = path or default_cache_dir() / CACHE_DB_NAME
+        self.mode = mode
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, provider TEXT, endpoint TEXT, payload TEXT, "
+                "size INTEGER, created REAL, accessed REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def ttl(self, provider: str) -> float:
+        return self.ttls.get(provider, self.ttls["default"])
+
+    def lookup(self, provider: str, endpoint: str, params: Any) -> Tuple[bool, Any]:
+        key = make_key(provider, endpoint, params)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT payload, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return False, None
+            payload, created = row
+            # Offline replays serve whatever was recorded, however old.
+            if self.mode != "offline" and now - created > self.ttl(provider):
+                return False, None
+            conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            conn.commit()
+        return True, json.loads(payload)
+
+    def store(self, provider: str, endpoint: str, params: Any, value: Any) -> None:
+        key = make_key(provider, endpoint, params)
+        payload = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, provider, endpoint, payload, size, created, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, provider, endpoint, payload, len(payload.encode("utf-8")), now, now),
+            )
+            conn.commit()
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * 0.9)
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed ASC").fetchall()
+        doomed = []
+        for key, size in rows:
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size or 0
+        conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        conn.commit()
+
+    def _count(self, hit: bool) -> None:
+        # Lanes and download workers share the cache.
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        metrics.count("cache_hits" if hit else "cache_misses")
+
+    def fetch(self, provider: str, endpoint: str, params: Any, fetch_fn: Callable[[], Any]) -> Any:
+        if not self.enabled:
+            return fetch_fn()
+        hit, value = self.lookup(provider, endpoint, params)
+        self._count(hit)
+        if hit:
+            return value
+        if self.mode == "offline":
+            raise CacheMiss(f"offline cache miss: {provider} {endpoint}")
+        value = fetch_fn()
+        if self.mode == "readwrite":
+            self.store(provider, endpoint, params, value)
+        return value
+
+    def fetch_many(
+        self,
+        provider: str,
+        endpoint: str,
+        params_list: List[Any],
+        fetch_fn: Callable[[List[Any]], List[Any]],
+    ) -> List[Any]:
+        # Like fetch() for many keys: hits come from the cache and all misses go to
+        # fetch_fn in one call, which must return values in the order it was given.
+        if not self.enabled:
+            return list(fetch_fn(list(params_list)))
+        values: List[Any] = [None] * len(params_list)
+        missing: List[int] = []
+        for i, params in enumerate(params_list):
+            hit, value = self.lookup(provider, endpoint, params)
+            self._count(hit)
+            if hit:
+                values[i] = value
+            else:
+                missing.append(i)
+        if not missing:
+            return values
+        if self.mode == "offline":
+            raise CacheMiss(f"offline cache miss: {provider} {endpoint} ({len(missing)} keys)")
+        fetched = list(fetch_fn([params_list[i] for i in missing]))
+        for i, value in zip(missing, fetched):
+            values[i] = value
+            if self.mode == "readwrite":
+                self.store(provider, endpoint, params_list[i], value)
+        return values
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_CACHE = ResponseCache()
+
+
+def get_cache() -> ResponseCache:
+    return _CACHE
+
+
+def parse_ttl_spec(spec: str) -> Tuple[str, float]:
+    key, sep, value = spec.partition("=")
+    key = key.strip().lower()
+    if not sep or not key:
+        raise ValueError(f"Invalid cache TTL '{spec}'. Use PROVIDER=SECONDS.")
+    try:
+        return key, float(value)
+    except ValueError as exc:
+        raise ValueError(f"Invalid cache TTL '{spec}': {exc}") from exc
+
+
+def configure_cache(
+    mode: str = "off",
+    path: Optional[Path] = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    ttl_specs: Optional[Iterable[str]] = None,
+) -> ResponseCache:
+    global _CACHE
+    ttls = dict(parse_ttl_spec(spec) for spec in (ttl_specs or []))
+    _CACHE.close()
+    _CACHE = ResponseCache(path=path, mode=mode, ttls=ttls, max_bytes=max_bytes)
+    return _CACHE
+
+
+def require_network(what: str) -> None:
+    # In offline mode every call that would reach the network fails fast, not only
+    # the cached provider calls (PDF/source downloads, transcripts, LinkedIn embeds).
+    if get_cache().mode == "offline":
+        raise CacheMiss(f"offline: {what} needs the network")
+
+
+def cached(provider: str, endpoint: str, params: Any, fetch_fn: Callable[[], Any]) -> Any:
+    return get_cache().fetch(provider, endpoint, params, fetch_fn)
+
+
+def cached_many(
+    provider: str,
+    endpoint: str,
+    params_list: List[Any],
+    fetch_fn: Callable[[List[Any]], List[Any]],
+) -> List[Any]:
+    return get_cache().fetch_many(provider, endpoint, params_list, fetch_fn)
@@ -3,6 +3,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .metrics import COUNTERS, METRICS_NAME
+from .utils import iter_stored_files, open_text, read_text, stored_exists, stored_path
+
 
 @dataclass
 class RunSummary:
@@ -78,10 +81,12 @@ def pick_index_path(run_dir: Path, query_id: str) -> Optional[Path]:
 
 
 def count_youtube_videos(path: Path) -> int:
-    if not path.exists():
+    if not stored_exists(path):
         return 0
+    with open_text(stored_path(path), errors="ignore") as f:
+        lines = f.read().splitlines()
     total = 0
-    for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
+    for line in lines:
         line = line.strip()
         if not line:
             continue
@@ -105,31 +110,29 @@ def collect_run_summary(run_dir: Path) -> RunSummary:
     date, queries, urls, arxiv_ids = load_job_counts(run_dir)
     index_path = pick_index_path(run_dir, query_id)
 
-    tavily_search = (archive / "tavily_search.jsonl").exists()
-    tavily_extract_count = len(list((archive / "tavily_extract").glob("*.txt"))) if (archive / "tavily_extract").exists() else 0
+    # Compacted (--compress/--compact) and packed runs are counted like plain ones.
+    def count(folder: str, suffix: str = "") -> int:
+        return sum(1 for _ in iter_stored_files(archive / folder, suffix))
 
-    arxiv_papers = (archive / "arxiv" / "papers.jsonl").exists()
-    arxiv_pdf_count = len(list((archive / "arxiv" / "pdf").glob("*.pdf"))) if (archive / "arxiv" / "pdf").exists() else 0
-    arxiv_text_count = len(list((archive / "arxiv" / "text").glob("*.txt"))) if (archive / "arxiv" / "text").exists() else 0
+    tavily_search = stored_exists(archive / "tavily_search.jsonl")
+    tavily_extract_count = count("tavily_extract", ".txt")
 
-    openalex_works = (archive / "openalex" / "works.jsonl").exists()
-    openalex_pdf_count = len(list((archive / "openalex" / "pdf").glob("*.pdf"))) if (archive / "openalex" / "pdf").exists() else 0
-    openalex_text_count = (
-        len(list((archive / "openalex" / "text").glob("*.txt"))) if (archive / "openalex" / "text").exists() else 0
-    )
+    arxiv_papers = stored_exists(archive / "arxiv" / "papers.jsonl")
+    arxiv_pdf_count = count("arxiv/pdf", ".pdf")
+    arxiv_text_count = count("arxiv/text", ".txt")
+
+    openalex_works = stored_exists(archive / "openalex" / "works.jsonl")
+    openalex_pdf_count = count("openalex/pdf", ".pdf")
+    openalex_text_count = count("openalex/text", ".txt")
 
-    youtube_videos = (archive / "youtube" / "videos.jsonl").exists()
+    youtube_videos = stored_exists(archive / "youtube" / "videos.jsonl")
     youtube_video_count = count_youtube_videos(archive / "youtube" / "videos.jsonl") if youtube_videos else 0
-    youtube_transcript_count = (
-        len(list((archive / "youtube" / "transcripts").glob("*.txt")))
-        if (archive / "youtube" / "transcripts").exists()
-        else 0
-    )
+    youtube_transcript_count = count("youtube/transcripts", ".txt")
 
-    web_pdf_count = len(list((archive / "web" / "pdf").glob("*.pdf"))) if (archive / "web" / "pdf").exists() else 0
-    web_text_count = len(list((archive / "web" / "text").glob("*.txt"))) if (archive / "web" / "text").exists() else 0
-    local_raw_count = len(list((archive / "local" / "raw").glob("*"))) if (archive / "local" / "raw").exists() else 0
-    local_text_count = len(list((archive / "local" / "text").glob("*.txt"))) if (archive / "local" / "text").exists() else 0
+    web_pdf_count = count("web/pdf", ".pdf")
+    web_text_count = count("web/text", ".txt")
+    local_raw_count = count("local/raw")
+    local_text_count = count("local/text", ".txt")
 
     return RunSummary(
         run_dir=run_dir,
@@ -231,9 +234,14 @@ def render_review(run_dir: Path) -> str:
         f"- web/pdf: {summary.web_pdf_count} (txt={summary.web_text_count})",
         "",
     ]
+    metrics_path = run_dir / "archive" / METRICS_NAME
+    if metrics_path.exists():
+        lines.append("Metrics:")
+        lines.append(render_metrics_table(summarize_metrics(metrics_path)))
+        lines.append("")
     if summary.index_path and summary.index_path.exists():
         lines.append("Index:")
-        lines.append(summary.index_path.read_text(encoding="utf-8", errors="ignore").strip())
+        lines.append(read_text(summary.index_path).strip())
     return "\n".join(lines)
 
 
@@ -241,9 +249,11 @@ def render_review_json(run_dir: Path) -> str:
     summary = collect_run_summary(run_dir)
     payload = summary_to_dict(summary)
     if summary.index_path and summary.index_path.exists():
-        payload["index_text"] = summary.index_path.read_text(encoding="utf-8", errors="ignore").strip()
+        payload["index_text"] = read_text(summary.index_path).strip()
     else:
         payload["index_text"] = None
+    metrics_path = run_dir / "archive" / METRICS_NAME
+    payload["metrics"] = summarize_metrics(metrics_path) if metrics_path.exists() else None
     return json.dumps(payload, indent=2)
 
 
@@ -260,15 +270,15 @@ def render_review_full(run_dir: Path) -> str:
 
     if summary.index_path and summary.index_path.exists():
         lines.append("===== INDEX =====")
-        lines.append(summary.index_path.read_text(encoding="utf-8", errors="ignore").strip())
+        lines.append(read_text(summary.index_path).strip())
         lines.append("")
 
     def append_text_file(label: str, path: Path) -> None:
-        if not path.exists():
+        if not stored_exists(path):
             return
         lines.append(f"===== {label} =====")
         lines.append(f"-- {path} --")
-        lines.append(path.read_text(encoding="utf-8", errors="ignore").strip())
+        lines.append(read_text(path).strip())
         lines.append("")
 
     def append_text_files(label: str, paths: List[Path]) -> None:
@@ -277,28 +287,28 @@ def render_review_full(run_dir: Path) -> str:
         lines.append(f"===== {label} =====")
         for path in paths:
             lines.append(f"-- {path} --")
-            lines.append(path.read_text(encoding="utf-8", errors="ignore").strip())
+            lines.append(read_text(path).strip())
             lines.append("")
 
     def append_jsonl_full(label: str, path: Path) -> None:
-        if not path.exists():
+        if not stored_exists(path):
             return
         lines.append(f"===== {label} =====")
         lines.append(render_jsonl_review_full(path))
         lines.append("")
 
     append_jsonl_full("Tavily Search (full)", archive / "tavily_search.jsonl")
-    append_text_files("Tavily Extract (full)", sorted((archive / "tavily_extract").glob("*.txt")))
+    append_text_files("Tavily Extract (full)", sorted(iter_stored_files(archive / "tavily_extract", ".txt")))
     append_jsonl_full("OpenAlex Works (full)", archive / "openalex" / "works.jsonl")
     append_jsonl_full("arXiv Papers (full)", archive / "arxiv" / "papers.jsonl")
     append_jsonl_full("YouTube Videos (full)", archive / "youtube" / "videos.jsonl")
 
-    append_text_files("OpenAlex Texts (full)", sorted((archive / "openalex" / "text").glob("*.txt")))
-    append_text_files("arXiv Texts (full)", sorted((archive / "arxiv" / "text").glob("*.txt")))
-    append_text_files("Web Texts (full)", sorted((archive / "web" / "text").glob("*.txt")))
-    append_text_files("YouTube Transcripts (full)", sorted((archive / "youtube" / "transcripts").glob("*.txt")))
+    append_text_files("OpenAlex Texts (full)", sorted(iter_stored_files(archive / "openalex" / "text", ".txt")))
+    append_text_files("arXiv Texts (full)", sorted(iter_stored_files(archive / "arxiv" / "text", ".txt")))
+    append_text_files("Web Texts (full)", sorted(iter_stored_files(archive / "web" / "text", ".txt")))
+    append_text_files("YouTube Transcripts (full)", sorted(iter_stored_files(archive / "youtube" / "transcripts", ".txt")))
     append_jsonl_full("Local Manifest (full)", archive / "local" / "manifest.jsonl")
-    append_text_files("Local Texts (full)", sorted((archive / "local" / "text").glob("*.txt")))
+    append_text_files("Local Texts (full)", sorted(iter_stored_files(archive / "local" / "text", ".txt")))
 
     return "\n".join(lines).rstrip()
 
@@ -330,7 +340,7 @@ def classify_result_types(results: List[dict]) -> Dict[str, int]:
 def render_tavily_search_review(path: Path) -> str:
     rows: List[dict] = []
     total_entries = 0
-    for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
+    for line in read_text(path).splitlines():
         line = line.strip()
         if not line:
             continue
@@ -406,7 +416,7 @@ def render_tavily_search_review(path: Path) -> str:
 def render_generic_jsonl_review(path: Path, preview_lines: int = 5) -> str:
     rows = []
     total_entries = 0
-    for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
+    for line in read_text(path).splitlines():
         line = line.strip()
         if not line:
             continue
@@ -436,9 +446,81 @@ def render_generic_jsonl_review(path: Path, preview_lines: int = 5) -> str:
     return "\n".join(lines)
 
 
+def summarize_metrics(path: Path) -> Dict[str, dict]:
+    # Span records of _metrics.jsonl totalled per stage, slowest first. share is the
+    # stage's part of all top-level span time; nested spans (pdf_to_text inside a
+    # provider stage) overlap their parent and are not part of the total.
+    stages: Dict[str, dict] = {}
+    top_total = 0.0
+    for line in read_text(path).splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if not isinstance(record, dict) or record.get("type") != "span":
+            continue
+        duration = float(record.get("duration_ms") or 0.0)
+        row = stages.setdefault(
+            str(record.get("stage")),
+            {"runs": 0, "total_ms": 0.0, "max_ms": 0.0, "nested": record.get("parent") is not None, **{name: 0 for name in COUNTERS}},
+        )
+        row["runs"] += 1
+        row["total_ms"] += duration
+        row["max_ms"] = max(row["max_ms"], duration)
+        for name in COUNTERS:
+            row[name] += int(record.get(name) or 0)
+        if record.get("parent") is None:
+            top_total += duration
+    for row in stages.values():
+        row["total_ms"] = round(row["total_ms"], 3)
+        row["max_ms"] = round(row["max_ms"], 3)
+        row["share"] = round(row["total_ms"] / top_total, 4) if top_total and not row["nested"] else None
+    return dict(sorted(stages.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+
+def format_bytes(value: int) -> str:
+    size = float(value)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+def render_metrics_table(stages: Dict[str, dict]) -> str:
+    if not stages:
+        return "(no spans recorded)"
+    stage_w = max(5, min(max(len(name) for name in stages) + 2, 30))
+    header = (
+        f"{'Stage':<{stage_w}}  {'Runs':>4}  {'Total s':>8}  {'Share':>5}  {'Max ms':>9}  "
+        f"{'Reqs':>5}  {'Bytes':>8}  {'Cache h/m':>9}  {'Fail':>4}  {'Skip':>4}  {'Err':>4}"
+    )
+    lines = [header, "-" * len(header)]
+    for name, row in stages.items():
+        share = f"{row['share'] * 100:.0f}%" if row["share"] is not None else "-"
+        indent = "  " if row["nested"] else ""
+        label = indent + truncate_text(name, stage_w - len(indent))
+        lines.append(
+            f"{label.ljust(stage_w)}  {row['runs']:>4}  {row['total_ms'] / 1000:>8.2f}  "
+            f"{share:>5}  {row['max_ms']:>9.1f}  {row['requests']:>5}  {format_bytes(row['bytes']):>8}  "
+            f"{str(row['cache_hits']) + '/' + str(row['cache_misses']):>9}  {row['failures']:>4}  "
+            f"{row['skipped']:>4}  {row['errors']:>4}"
+        )
+    return "\n".join(lines)
+
+
+def render_metrics_review(path: Path) -> str:
+    return "\n".join([f"Metrics review: {path}", render_metrics_table(summarize_metrics(path))])
+
+
 def render_jsonl_review(path: Path) -> str:
     if path.name == "tavily_search.jsonl":
         return render_tavily_search_review(path)
+    if path.name == METRICS_NAME:
+        return render_metrics_review(path)
     return render_generic_jsonl_review(path)
 
 
@@ -493,7 +575,7 @@ def format_pretty(value: object, indent: int = 0) -> List[str]:
 def render_jsonl_review_full(path: Path) -> str:
     lines = [f"Full JSONL: {path}"]
     entries = 0
-    for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
+    for line in read_text(path).splitlines():
         line = line.strip()
         if not line:
             continue
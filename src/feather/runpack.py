@@ -0,0 +1,189 @@
+import os
+import shutil
+import threading
+import zipfile
+from pathlib import Path, PurePosixPath
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+PACK_NAME = "run-pack.zip"
+PACK_DIRS = ("archive", "report_notes")
+# Left on disk so --list/--review and Federlicht can find and describe the run.
+UNPACKED_NAMES = {"_job.json", "_log.txt", "_feather_log.txt", "_metrics.jsonl"}
+# Already compressed; deflating them again only costs time.
+STORED_SUFFIXES = {".pdf", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".gz", ".zst", ".zip", ".mp4", ".tar"}
+
+
+def stays_unpacked(rel: PurePosixPath) -> bool:
+    return len(rel.parts) == 2 and rel.parts[0] == "archive" and (
+        rel.name in UNPACKED_NAMES or rel.name.endswith("-index.md")
+    )
+
+
+class RunPack:
+    # Read-only view of <run>/run-pack.zip. Member names are paths relative to the
+    # run folder ("archive/tavily_search.jsonl"), so a packed file keeps the path
+    # recorded for it in manifests and the index.
+    def __init__(self, path: Path):
+        self.path = path
+        self.run_dir = path.parent
+        stat = path.stat()
+        self.signature = (stat.st_size, stat.st_mtime_ns)
+        self._zip = zipfile.ZipFile(path)
+        self._infos: Dict[str, zipfile.ZipInfo] = {info.filename: info for info in self._zip.infolist()}
+        self._dirs = {str(parent) for name in self._infos for parent in PurePosixPath(name).parents}
+
+    def names(self) -> List[str]:
+        return sorted(self._infos)
+
+    def has(self, name: str) -> bool:
+        return name in self._infos
+
+    def has_dir(self, name: str) -> bool:
+        return name in self._dirs
+
+    def info(self, name: str) -> zipfile.ZipInfo:
+        return self._infos[name]
+
+    def size(self, name: str) -> int:
+        return self._infos[name].file_size
+
+    def open(self, name: str) -> IO[bytes]:
+        return self._zip.open(name)
+
+    def children(self, name: str) -> List[str]:
+        prefix = f"{name}/" if name else ""
+        return [n for n in self.names() if n.startswith(prefix) and "/" not in n[len(prefix) :]]
+
+    def extract(self, name: str, dest: Path) -> Path:
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        with self._zip.open(name) as src, dest.open("wb") as out:
+            shutil.copyfileobj(src, out)
+        return dest
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+_PACKS: Dict[str, RunPack] = {}
+_PACKS_GUARD = threading.Lock()
+
+
+def has_pack(folder: Path) -> bool:
+    # Not cached: another process (feather --pack, a --jobs worker) may pack a run at
+    # any time, and a long-lived reader has to see it.
+    return (folder / PACK_NAME).is_file()
+
+
+def open_pack(run_dir: Path) -> Optional[RunPack]:
+    # Cached per run folder and reopened when the pack file changes.
+    path = run_dir / PACK_NAME
+    key = os.path.abspath(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        with _PACKS_GUARD:
+            stale = _PACKS.pop(key, None)
+        if stale is not None:
+            stale.close()
+        return None
+    with _PACKS_GUARD:
+        pack = _PACKS.get(key)
+        if pack is None or pack.signature != (stat.st_size, stat.st_mtime_ns):
+            if pack is not None:
+                pack.close()
+            pack = RunPack(path)
+            _PACKS[key] = pack
+    return pack
+
+
+def forget_pack(run_dir: Path) -> None:
+    with _PACKS_GUARD:
+        pack = _PACKS.pop(os.path.abspath(run_dir / PACK_NAME), None)
+    if pack is not None:
+        pack.close()
+
+
+def locate(path: Path) -> Optional[Tuple[RunPack, str]]:
+    # Finds the pack holding path (file or folder) by checking each parent folder.
+    path = Path(os.path.abspath(path))
+    for parent in path.parents:
+        if not has_pack(parent):
+            continue
+        pack = open_pack(parent)
+        if pack is None:
+            return None
+        name = path.relative_to(parent).as_posix()
+        if pack.has(name) or pack.has_dir(name):
+            return pack, name
+        return None
+    return None
+
+
+def _iter_packable(run_dir: Path) -> Iterator[Tuple[Path, str]]:
+    for folder in PACK_DIRS:
+        root = run_dir / folder
+        if not root.is_dir():
+            continue
+        for path in sorted(root.rglob("*")):
+            if not path.is_file() or path.name.endswith(".part"):
+                continue
+            rel = PurePosixPath(path.relative_to(run_dir).as_posix())
+            if not stays_unpacked(rel):
+                yield path, str(rel)
+
+
+def pack_run(run_dir: Path) -> Dict[str, int]:
+    # Moves archive/ and report_notes/ into one zip. Files already in an earlier pack
+    # are carried over unless a newer copy is on disk.
+    target = run_dir / PACK_NAME
+    tmp = target.with_name(target.name + ".part")
+    files = list(_iter_packable(run_dir))
+    on_disk = {name for _, name in files}
+    previous = open_pack(run_dir)
+    stats = {"files": 0, "bytes": 0, "carried": 0}
+    if not files:
+        return stats
+    with zipfile.ZipFile(tmp, "w", allowZip64=True) as out:
+        if previous is not None:
+            for name in previous.names():
+                if name not in on_disk:
+                    with previous.open(name) as src, out.open(previous.info(name), "w") as dst:
+                        shutil.copyfileobj(src, dst)
+                    stats["carried"] += 1
+        for path, name in files:
+            compress = zipfile.ZIP_STORED if path.suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+            out.write(path, name, compress_type=compress)
+            stats["files"] += 1
+            stats["bytes"] += path.stat().st_size
+    forget_pack(run_dir)
+    os.replace(tmp, target)
+    for path, _ in files:
+        path.unlink()
+    for folder in PACK_DIRS:
+        root = run_dir / folder
+        if root.is_dir():
+            for sub in sorted((p for p in root.rglob("*") if p.is_dir()), key=lambda p: len(p.parts), reverse=True):
+                if not any(sub.iterdir()):
+                    sub.rmdir()
+            if not any(root.iterdir()):
+                root.rmdir()
+    return stats
+
+
+def unpack_run(run_dir: Path) -> Dict[str, int]:
+    # Restores the packed files; files that are newer on disk are kept.
+    pack = open_pack(run_dir)
+    stats = {"files": 0, "bytes": 0, "carried": 0}
+    if pack is None:
+        return stats
+    for name in pack.names():
+        rel = PurePosixPath(name)
+        dest = run_dir / name
+        if rel.is_absolute() or ".." in rel.parts or dest.exists():
+            continue
+        pack.extract(name, dest)
+        stats["files"] += 1
+        stats["bytes"] += pack.size(name)
+    forget_pack(run_dir)
+    (run_dir / PACK_NAME).unlink()
+    return stats
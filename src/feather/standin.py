@@ -0,0 +1,382 @@
+import argparse
+import base64
+import hashlib
+import json
+import random
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+from .arxiv_ops import ARXIV_API_BASE, ARXIV_FILES_BASE
+from .openalex_ops import OPENALEX_BASE
+from .tavily import TAVILY_BASE
+from .utils import PROVIDER_BASE_ENV, append_jsonl
+from .youtube_ops import YOUTUBE_BASE
+
+# Local stand-in for the collector's providers. In record mode it forwards
+# /<provider>/<path> to the real API and stores each answer in <dir>/cassette.jsonl;
+# in replay mode it serves those answers with optional latency, errors and rate limits.
+# Point Feather at it with FEATHER_PROVIDER_BASE=<url>.
+CASSETTE_NAME = "cassette.jsonl"
+UPSTREAMS: Dict[str, str] = {
+    "tavily": TAVILY_BASE,
+    "openalex": OPENALEX_BASE,
+    "youtube": YOUTUBE_BASE,
+    "arxiv": ARXIV_API_BASE,
+    "arxiv_files": ARXIV_FILES_BASE,
+}
+# Credentials and contact details never reach the cassette or its keys.
+SECRET_PARAMS = {"api_key", "key", "mailto"}
+STATS_PATH = "/_standin/stats"
+FORWARD_HEADERS = {"accept", "content-type", "user-agent", "range"}
+# (provider, method, path, query, body) -> (status, content_type, body) or None.
+Fallback = Callable[[str, str, str, str, bytes], Optional[Tuple[int, str, bytes]]]
+
+
+def request_key(provider: str, method: str, path: str, query: str, body: bytes) -> str:
+    params = sorted((k, v) for k, v in parse_qsl(query, keep_blank_values=True) if k not in SECRET_PARAMS)
+    try:
+        payload: Any = json.loads(body) if body else None
+    except ValueError:
+        payload = hashlib.sha256(body).hexdigest()
+    if isinstance(payload, dict):
+        payload = {k: v for k, v in payload.items() if k not in SECRET_PARAMS}
+    raw = json.dumps([provider, method.upper(), path, params, payload], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    # Recorded answers keyed by request_key. The first recording of a key wins, so a
+    # cassette replays the same bytes however often it is re-recorded into.
+    def __init__(self, root: Path):
+        self.root = root
+        self.path = root / CASSETTE_NAME
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if self.path.exists():
+            with self.path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        entry = json.loads(line)
+                        self._entries.setdefault(entry["key"], entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(key)
+
+    def add(
+        self,
+        key: str,
+        provider: str,
+        method: str,
+        path: str,
+        status: int,
+        content_type: str,
+        body: bytes,
+    ) -> bool:
+        entry: Dict[str, Any] = {
+            "key": key,
+            "provider": provider,
+            "method": method.upper(),
+            "path": path,
+            "status": status,
+            "content_type": content_type,
+        }
+        try:
+            entry["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["body_b64"] = base64.b64encode(body).decode("ascii")
+        with self._lock:
+            if key in self._entries:
+                return False
+            self._entries[key] = entry
+            append_jsonl(self.path, entry)
+        return True
+
+
+def entry_body(entry: Dict[str, Any]) -> bytes:
+    if "body_b64" in entry:
+        return base64.b64decode(entry["body_b64"])
+    return str(entry.get("body") or "").encode("utf-8")
+
+
+class _Bucket:
+    # Like ratelimit.TokenBucket, but a refused request keeps its token: the stand-in
+    # answers 429 instead of queueing.
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.burst = max(1.0, rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+
+class StandinServer:
+    def __init__(
+        self,
+        cassette_dir: Path,
+        mode: str = "replay",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        rate_limits: Optional[Dict[str, float]] = None,
+        seed: int = 0,
+        upstreams: Optional[Dict[str, str]] = None,
+        fallback: Optional[Fallback] = None,
+    ):
+        if mode not in {"record", "replay"}:
+            raise ValueError(f"Unknown stand-in mode: {mode}")
+        self.mode = mode
+        self.cassette = Cassette(cassette_dir)
+        self.latency_ms = max(0.0, latency_ms)
+        self.jitter_ms = max(0.0, jitter_ms)
+        self.error_rate = min(max(error_rate, 0.0), 1.0)
+        self.error_status = error_status
+        self.upstreams = dict(UPSTREAMS)
+        if upstreams:
+            self.upstreams.update(upstreams)
+        # Answers requests the cassette lacks (replay only), e.g. synthetic benchmark data.
+        self.fallback = fallback
+        self._buckets = {name: _Bucket(rate) for name, rate in (rate_limits or {}).items() if rate > 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts: Dict[str, int] = {
+            "requests": 0,
+            "hits": 0,
+            "misses": 0,
+            "synthesized": 0,
+            "recorded": 0,
+            "errors": 0,
+            "throttled": 0,
+        }
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counts[name] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+    def _fault(self, provider: str) -> Tuple[Optional[int], float]:
+        # (status to fail with or None, Retry-After) for one replayed request.
+        with self._lock:
+            delay = (self.latency_ms + self._rng.uniform(0.0, self.jitter_ms)) / 1000.0
+            bucket = self._buckets.get(provider)
+            wait = bucket.take() if bucket is not None else 0.0
+            failed = self._rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if wait:
+            self._count("throttled")
+            return 429, wait
+        if failed:
+            self._count("errors")
+            return self.error_status, 0.0
+        return None, 0.0
+
+    def handle(self, method: str, target: str, headers: Dict[str, str], body: bytes) -> Tuple[int, Dict[str, str], bytes]:
+        parts = urlsplit(target)
+        if parts.path == STATS_PATH:
+            return 200, {"Content-Type": "application/json"}, json.dumps(self.stats()).encode("utf-8")
+        self._count("requests")
+        provider, _, rest = parts.path.lstrip("/").partition("/")
+        path = f"/{rest}"
+        if provider not in self.upstreams:
+            return 404, {"Content-Type": "application/json"}, b'{"error": "unknown provider"}'
+        key = request_key(provider, method, path, parts.query, body)
+        if self.mode == "record":
+            entry = self.cassette.get(key)
+            if entry is None:
+                entry = self._record(key, provider, method, path, parts.query, headers, body)
+        else:
+            status, retry_after = self._fault(provider)
+            if status is not None:
+                out_headers = {"Content-Type": "application/json"}
+                if status == 429:
+                    out_headers["Retry-After"] = f"{max(1, round(retry_after))}"
+                return status, out_headers, json.dumps({"error": "injected", "status": status}).encode("utf-8")
+            entry = self.cassette.get(key)
+            made = self.fallback(provider, method, path, parts.query, body) if entry is None and self.fallback else None
+            if made is not None:
+                self._count("synthesized")
+                return made[0], {"Content-Type": made[1]}, made[2]
+            if entry is None:
+                self._count("misses")
+                return 404, {"Content-Type": "application/json"}, json.dumps({"error": "not recorded", "key": key}).encode("utf-8")
+            self._count("hits")
+        return int(entry["status"]), {"Content-Type": entry.get("content_type") or "application/octet-stream"}, entry_body(entry)
+
+    def _record(
+        self,
+        key: str,
+        provider: str,
+        method: str,
+        path: str,
+        query: str,
+        headers: Dict[str, str],
+        body: bytes,
+    ) -> Dict[str, Any]:
+        url = f"{self.upstreams[provider]}{path}" + (f"?{query}" if query else "")
+        forward = {k: v for k, v in headers.items() if k.lower() in FORWARD_HEADERS}
+        resp = requests.request(method, url, headers=forward, data=body or None, timeout=120)
+        content_type = resp.headers.get("Content-Type", "application/octet-stream")
+        # Errors and throttling are served but not kept; replay injects its own.
+        if resp.status_code < 500 and resp.status_code != 429:
+            if self.cassette.add(key, provider, method, path, resp.status_code, content_type, resp.content):
+                self._count("recorded")
+        return {"status": resp.status_code, "content_type": content_type, "body_b64": base64.b64encode(resp.content).decode("ascii")}
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                # Headers and body go out in separate writes; without this, Nagle plus
+                # delayed ACKs add ~40ms to every keep-alive response.
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def _serve(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                try:
+                    status, headers, payload = server.handle(self.command, self.path, dict(self.headers), body)
+                except Exception as exc:
+                    status, headers = 502, {"Content-Type": "application/json"}
+                    payload = json.dumps({"error": repr(exc)}).encode("utf-8")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(payload)
+
+            do_GET = do_POST = do_HEAD = _serve
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def start(self) -> "StandinServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, name="feather-standin", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StandinServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+def parse_rate_limits(specs: List[str]) -> Dict[str, float]:
+    out: Dict[str, float] = {}
+    for spec in specs:
+        name, sep, value = spec.partition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"Invalid rate limit '{spec}'. Use PROVIDER=RPS.")
+        out[name.strip().lower()] = float(value)
+    return out
+
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(
+        prog="python -m feather.standin",
+        description="Record provider responses once, then replay them locally for offline collector runs.",
+    )
+    ap.add_argument("cassette", help="Cassette folder (cassette.jsonl is created inside).")
+    ap.add_argument("--mode", choices=["record", "replay"], default="replay")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="Added to every replayed response.")
+    ap.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform random extra latency on top of --latency-ms.")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="Share of replayed requests answered with --error-status.")
+    ap.add_argument("--error-status", type=int, default=500)
+    ap.add_argument(
+        "--rate-limit",
+        action="append",
+        default=[],
+        metavar="PROVIDER=RPS",
+        help="Answer 429 with Retry-After above this rate (repeatable), e.g. tavily=2.",
+    )
+    ap.add_argument("--seed", type=int, default=0, help="Seed for jitter and injected errors.")
+    return ap
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    if not 0.0 <= args.error_rate <= 1.0:
+        raise SystemExit("--error-rate must be between 0 and 1.")
+    try:
+        rate_limits = parse_rate_limits(args.rate_limit)
+    except ValueError as exc:
+        raise SystemExit(str(exc))
+    server = StandinServer(
+        Path(args.cassette),
+        mode=args.mode,
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        rate_limits=rate_limits,
+        seed=args.seed,
+    )
+    print(f"Stand-in ({args.mode}) on {server.url} with {len(server.cassette)} recorded responses.")
+    print(f"Run Feather with {PROVIDER_BASE_ENV}={server.url}")
+    try:
+        server.start()
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        print(f"Stand-in stats: {json.dumps(server.stats())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import gzip
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterator
+
+from .utils import COMPRESSED_SUFFIXES, is_compressed, require_zstandard, zstandard
+
+COMPRESSION_FORMATS = {"gz": ".gz", "zst": ".zst"}
+COMPACT_SUFFIXES = (".jsonl", ".txt")
+# Logs are still appended to while a job runs and are read by humans; they stay plain.
+PLAIN_NAMES = {"_log.txt", "_feather_log.txt", "_metrics.jsonl"}
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 10
+
+
+def archive_root(run_dir: Path) -> Path:
+    archive = run_dir / "archive"
+    return archive if archive.is_dir() else run_dir
+
+
+def iter_compactable(root: Path) -> Iterator[Path]:
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and path.suffix.lower() in COMPACT_SUFFIXES and path.name not in PLAIN_NAMES:
+            yield path
+
+
+def iter_compressed(root: Path) -> Iterator[Path]:
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and is_compressed(path) and path.with_suffix("").suffix.lower() in COMPACT_SUFFIXES:
+            yield path
+
+
+def compress_file(path: Path, fmt: str = "gz") -> Path:
+    target = path.with_name(path.name + COMPRESSION_FORMATS[fmt])
+    tmp = target.with_name(target.name + ".part")
+    with path.open("rb") as src:
+        if fmt == "zst":
+            require_zstandard()
+            with tmp.open("wb") as raw:
+                zstandard.ZstdCompressor(level=ZSTD_LEVEL).copy_stream(src, raw)
+        else:
+            with gzip.open(tmp, "wb", compresslevel=GZIP_LEVEL) as out:
+                shutil.copyfileobj(src, out)
+    # Keep the timestamps but not the mode: a blob-store link is read-only.
+    st = path.stat()
+    os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(tmp, target)
+    path.unlink()
+    return target
+
+
+def expand_file(path: Path) -> Path:
+    target = path.with_suffix("")
+    tmp = target.with_name(target.name + ".part")
+    if path.suffix.lower() == ".zst":
+        require_zstandard()
+        with path.open("rb") as raw, tmp.open("wb") as out:
+            reader = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+            shutil.copyfileobj(reader, out)
+    else:
+        with gzip.open(path, "rb") as src, tmp.open("wb") as out:
+            shutil.copyfileobj(src, out)
+    os.replace(tmp, target)
+    path.unlink()
+    return target
+
+
+def compact_run(run_dir: Path, fmt: str = "gz") -> Dict[str, int]:
+    # Compress a run's JSONL and text files in place. Readers resolve <name> to
+    # <name>.gz/.zst, so paths recorded in manifests and the index stay valid.
+    stats = {"files": 0, "bytes_before": 0, "bytes_after": 0}
+    for path in iter_compactable(archive_root(run_dir)):
+        if any(path.with_name(path.name + suffix).exists() for suffix in COMPRESSED_SUFFIXES):
+            continue
+        size = path.stat().st_size
+        target = compress_file(path, fmt)
+        stats["files"] += 1
+        stats["bytes_before"] += size
+        stats["bytes_after"] += target.stat().st_size
+    return stats
+
+
+def expand_run(run_dir: Path) -> Dict[str, int]:
+    # The inverse of compact_run. --update-run expands first so that appends and the
+    # sidecar indexes work on plain files.
+    stats = {"files": 0, "bytes_before": 0, "bytes_after": 0}
+    for path in iter_compressed(archive_root(run_dir)):
+        if path.with_suffix("").exists():
+            continue
+        size = path.stat().st_size
+        target = expand_file(path)
+        stats["files"] += 1
+        stats["bytes_before"] += size
+        stats["bytes_after"] += target.stat().st_size
+    return stats
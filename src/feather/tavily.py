@@ -1,13 +1,54 @@
 from typing import Any, Dict, List, Optional
 
-import requests
+from . import ratelimit, response_cache
+from .utils import provider_base
+
+TAVILY_BASE = "https://api.tavily.com"
+EXTRACT_MAX_URLS = 20
+
+
+def normalize_extract_url(url: str) -> str:
+    return str(url or "").strip().rstrip("/")
+
+
+def split_extract_response(urls: List[str], data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    # Rebuild one single-URL response per requested URL so the per-URL files keep the
+    # exact shape of a one-URL extract call. Failed or missing URLs are left out.
+    wanted = {normalize_extract_url(url): url for url in urls}
+    shared = {key: value for key, value in data.items() if key not in {"results", "failed_results"}}
+    out: Dict[str, Dict[str, Any]] = {}
+    for item in data.get("results") or []:
+        if not isinstance(item, dict):
+            continue
+        url = wanted.get(normalize_extract_url(item.get("url") or ""))
+        if url and url not in out:
+            out[url] = {"results": [item], "failed_results": [], **shared}
+    return out
 
 
 class TavilyClient:
     def __init__(self, api_key: str, timeout: int = 60):
         self.api_key = api_key
         self.timeout = timeout
-        self.base = "https://api.tavily.com"
+        self._base: Optional[str] = None
+
+    @property
+    def base(self) -> str:
+        # Resolved per request unless set explicitly, so FEATHER_TAVILY_BASE /
+        # FEATHER_PROVIDER_BASE apply to clients created earlier.
+        return self._base or provider_base("tavily", TAVILY_BASE)
+
+    @base.setter
+    def base(self, value: str) -> None:
+        self._base = value
+
+    def _post(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        def fetch() -> Dict[str, Any]:
+            r = ratelimit.post(f"{self.base}/{endpoint}", provider="tavily", json=payload, timeout=self.timeout)
+            r.raise_for_status()
+            return r.json()
+
+        return response_cache.cached("tavily", endpoint, payload, fetch)
 
     def search(
         self,
@@ -30,9 +71,7 @@ class TavilyClient:
         if exclude_domains:
             payload["exclude_domains"] = exclude_domains
 
-        r = requests.post(f"{self.base}/search", json=payload, timeout=self.timeout)
-        r.raise_for_status()
-        return r.json()
+        return self._post("search", payload)
 
     def extract(
         self,
@@ -46,6 +85,18 @@ class TavilyClient:
             "include_images": include_images,
             "extract_depth": extract_depth,
         }
-        r = requests.post(f"{self.base}/extract", json=payload, timeout=self.timeout)
-        r.raise_for_status()
-        return r.json()
+        return self._post("extract", payload)
+
+    def extract_many(
+        self,
+        urls: List[str],
+        include_images: bool = False,
+        extract_depth: str = "advanced",
+    ) -> Dict[str, Any]:
+        payload = {
+            "api_key": self.api_key,
+            "urls": list(urls)[:EXTRACT_MAX_URLS],
+            "include_images": include_images,
+            "extract_depth": extract_depth,
+        }
+        return self._post("extract", payload)
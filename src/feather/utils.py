@@ -1,8 +1,35 @@
 import datetime as dt
+import gzip
+import io
 import json
+import os
 import re
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from . import runpack
+
+try:
+    import zstandard  # type: ignore
+except Exception:
+    zstandard = None
+
+ZSTD_AVAILABLE = zstandard is not None
+PROVIDER_BASE_ENV = "FEATHER_PROVIDER_BASE"
+# A file stored as <name>.gz or <name>.zst is read and written through its plain <name>.
+COMPRESSED_SUFFIXES = (".zst", ".gz")
+
+
+def provider_base(name: str, default: str) -> str:
+    # FEATHER_<NAME>_BASE points one provider elsewhere; FEATHER_PROVIDER_BASE points all
+    # of them at <url>/<name> (the layout served by feather.standin). Read on every call,
+    # so --jobs workers and long-lived clients follow the environment.
+    value = os.getenv(f"FEATHER_{name.upper()}_BASE")
+    if not value:
+        shared = os.getenv(PROVIDER_BASE_ENV)
+        value = f"{shared.rstrip('/')}/{name}" if shared else default
+    return value.rstrip("/")
 
 
 def safe_filename(s: str, max_len: int = 120) -> str:
@@ -10,19 +37,159 @@ def safe_filename(s: str, max_len: int = 120) -> str:
     return s[:max_len] if len(s) > max_len else s
 
 
+def is_compressed(path: Path) -> bool:
+    return path.suffix.lower() in COMPRESSED_SUFFIXES
+
+
+def stored_path(path: Path) -> Path:
+    # The plain file wins; otherwise a compressed copy of it, if one exists.
+    if path.exists() or is_compressed(path):
+        return path
+    for suffix in COMPRESSED_SUFFIXES:
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            return candidate
+    return path
+
+
+def packed_member(path: Path) -> Optional[Tuple[runpack.RunPack, str]]:
+    # A file (or its compressed copy) moved into the run's pack by feather --pack.
+    for candidate in (path, *(path.with_name(path.name + suffix) for suffix in COMPRESSED_SUFFIXES)):
+        found = runpack.locate(candidate)
+        if found is not None and found[0].has(found[1]):
+            return found
+    return None
+
+
+def stored_exists(path: Path) -> bool:
+    if stored_path(path).exists():
+        return True
+    return runpack.locate(path) is not None or packed_member(path) is not None
+
+
+def iter_stored_files(folder: Path, suffix: str = "") -> Iterator[Path]:
+    # Plain path of every file in folder whose name ends in suffix, whether it is stored
+    # as is, compressed, or in the run pack.
+    names = [path.name for path in folder.glob(f"*{suffix}*" if suffix else "*") if path.is_file()]
+    found = runpack.locate(folder)
+    if found is not None:
+        names += [Path(member).name for member in found[0].children(found[1])]
+    seen = set()
+    for name in names:
+        path = folder / name
+        if path.suffix.lower() in COMPRESSED_SUFFIXES:
+            path = path.with_suffix("")
+        if path.name.lower().endswith(suffix) and path.name not in seen:
+            seen.add(path.name)
+            yield path
+
+
+def require_zstandard() -> None:
+    if zstandard is None:
+        raise RuntimeError("zstandard is not installed. Install with: python -m pip install zstandard")
+
+
+def _text_reader(raw: IO[bytes], suffix: str, errors: str) -> IO[str]:
+    if suffix == ".gz":
+        raw = gzip.GzipFile(fileobj=raw)
+    elif suffix == ".zst":
+        require_zstandard()
+        raw = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+    return io.TextIOWrapper(raw, encoding="utf-8", errors=errors)
+
+
+def open_text(path: Path, mode: str = "r", errors: str = "replace") -> IO[str]:
+    # mode is "r", "w" or "a"; appends to a compressed file add a new gzip member /
+    # zstd frame, which readers see as one continuous stream. Reads fall back to the
+    # run pack when the file is not on disk.
+    suffix = path.suffix.lower()
+    if mode == "r" and not path.exists():
+        member = packed_member(path)
+        if member is not None:
+            pack, name = member
+            return _text_reader(pack.open(name), Path(name).suffix.lower(), errors)
+    if suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8", errors=errors)
+    if suffix == ".zst":
+        require_zstandard()
+        if mode == "r":
+            raw = zstandard.ZstdDecompressor().stream_reader(path.open("rb"), read_across_frames=True, closefd=True)
+        else:
+            raw = zstandard.ZstdCompressor().stream_writer(path.open(mode + "b"), closefd=True)
+        return io.TextIOWrapper(raw, encoding="utf-8", errors=errors)
+    return path.open(mode, encoding="utf-8", errors=errors)
+
+
 def read_text(path: Path) -> str:
-    return path.read_text(encoding="utf-8", errors="ignore")
+    with open_text(stored_path(path), errors="ignore") as f:
+        return f.read()
+
+
+def detach_link(path: Path) -> None:
+    # Blob-store placements are read-only hardlinks or symlinks shared with the store
+    # and other runs; a rewrite must replace the link, never write through it.
+    try:
+        if path.is_symlink() or path.stat().st_nlink > 1:
+            path.unlink()
+    except FileNotFoundError:
+        pass
 
 
 def write_text(path: Path, text: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
+    target = stored_path(path)
+    if not is_compressed(target):
+        detach_link(path)
+        path.write_text(text, encoding="utf-8")
+        return
+    with open_text(target, "w") as f:
+        f.write(text)
+
+
+_JSONL_LOCKS: Dict[str, threading.Lock] = {}
+_JSONL_LOCKS_GUARD = threading.Lock()
+
+
+def jsonl_lock(path: Path) -> threading.Lock:
+    key = os.path.abspath(path)
+    with _JSONL_LOCKS_GUARD:
+        lock = _JSONL_LOCKS.get(key)
+        if lock is None:
+            lock = threading.Lock()
+            _JSONL_LOCKS[key] = lock
+    return lock
+
+
+# Per-file callbacks run after each append_jsonl with (obj, file size after the write);
+# used to keep sidecar indexes in step with the JSONL they describe.
+_JSONL_WATCHERS: Dict[str, List[Callable[[Dict[str, Any], int], None]]] = {}
+
+
+def watch_jsonl(path: Path, callback: Callable[[Dict[str, Any], int], None]) -> None:
+    with _JSONL_LOCKS_GUARD:
+        _JSONL_WATCHERS.setdefault(os.path.abspath(path), []).append(callback)
+
+
+def unwatch_jsonl(path: Path, callback: Callable[[Dict[str, Any], int], None]) -> None:
+    key = os.path.abspath(path)
+    with _JSONL_LOCKS_GUARD:
+        callbacks = [cb for cb in _JSONL_WATCHERS.get(key, []) if cb is not callback]
+        if callbacks:
+            _JSONL_WATCHERS[key] = callbacks
+        else:
+            _JSONL_WATCHERS.pop(key, None)
 
 
 def append_jsonl(path: Path, obj: Dict[str, Any]) -> None:
+    line = json.dumps(obj, ensure_ascii=False) + "\n"
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+    with jsonl_lock(path):
+        target = stored_path(path)
+        with open_text(target, "a", errors="strict") as f:
+            f.write(line)
+        size = target.stat().st_size
+        for watcher in _JSONL_WATCHERS.get(os.path.abspath(path), ()):
+            watcher(obj, size)
 
 
 def parse_date_from_filename(name: str) -> Optional[dt.date]:
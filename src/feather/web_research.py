@@ -9,9 +9,7 @@ import re
 import time
 import urllib.parse
 
-import requests
-
-from . import __version__
+from . import __version__, neardup, ratelimit
 from .tavily import TavilyClient
 from .local_ops import html_to_text
 
@@ -63,6 +61,18 @@ def select_top_urls(search_entries: list[dict], max_fetch: int) -> list[dict]:
     return selected
 
 
+def run_near_dedup(supporting_dir: Path) -> bool:
+    # Supporting research lives inside a run; follow the run's --no-near-dedup choice.
+    for parent in supporting_dir.resolve().parents:
+        job_path = parent / "archive" / "_job.json"
+        if job_path.exists():
+            try:
+                return bool(json.loads(job_path.read_text(encoding="utf-8")).get("near_dedup", True))
+            except (OSError, ValueError):
+                return True
+    return True
+
+
 def run_supporting_web_research(
     supporting_dir: Path,
     queries: list[str],
@@ -73,6 +83,7 @@ def run_supporting_web_research(
     *,
     api_key: Optional[str] = None,
     pdf_text_reader: Optional[Callable[[Path, int, int, int], str]] = None,
+    near_dedup: Optional[bool] = None,
 ) -> tuple[str, list[dict]]:
     api_key = api_key or os.getenv("TAVILY_API_KEY")
     if not api_key:
@@ -108,6 +119,11 @@ def run_supporting_web_research(
             append_jsonl(search_path, {"query": query, "error": str(exc), "timestamp": time.time()})
 
     selected = select_top_urls(search_entries, max_fetch)
+    # Syndicated copies of one article are still fetched, but marked duplicate_of the
+    # first page so build_source_index can collapse them.
+    if near_dedup is None:
+        near_dedup = run_near_dedup(supporting_dir)
+    dup_index = neardup.NearDupIndex(supporting_dir) if near_dedup else None
     for idx, item in enumerate(selected, start=1):
         url = item.get("url")
         if not url:
@@ -123,7 +139,7 @@ def run_supporting_web_research(
             is_pdf = url.lower().endswith(".pdf")
             if not is_pdf:
                 try:
-                    head = requests.head(url, timeout=20, headers=request_headers(), allow_redirects=True)
+                    head = ratelimit.request("HEAD", url, timeout=20, headers=request_headers(), allow_redirects=True)
                     ctype = head.headers.get("content-type", "").lower()
                     if "pdf" in ctype:
                         is_pdf = True
@@ -132,7 +148,7 @@ def run_supporting_web_research(
             if is_pdf:
                 pdf_path = pdf_dir / f"{idx:03d}_{slug}.pdf"
                 text_path = text_dir / f"{idx:03d}_{slug}.txt"
-                with requests.get(url, stream=True, timeout=60, headers=request_headers()) as resp:
+                with ratelimit.get(url, stream=True, timeout=60, headers=request_headers()) as resp:
                     resp.raise_for_status()
                     with pdf_path.open("wb") as handle:
                         for chunk in resp.iter_content(chunk_size=8192):
@@ -154,7 +170,7 @@ def run_supporting_web_research(
                     if not content:
                         content = json.dumps(extract_res, ensure_ascii=False)
                 except Exception:
-                    resp = requests.get(url, timeout=60, headers=request_headers())
+                    resp = ratelimit.get(url, timeout=60, headers=request_headers())
                     resp.raise_for_status()
                     content = html_to_text(resp.text)
                 content, truncated = truncate_for_view(content, max_chars)
@@ -162,9 +178,15 @@ def run_supporting_web_research(
                     content = f"[truncated]\n{content}"
                 extract_path.write_text(content, encoding="utf-8")
                 record["extract_path"] = extract_path.as_posix()
+                match = dup_index.check("page", url, content) if dup_index else None
+                if match is not None:
+                    record["duplicate_of"] = match[0]
+                    record["similarity"] = round(match[1], 3)
         except Exception as exc:
             record["error"] = str(exc)
         append_jsonl(fetch_path, record)
+    if dup_index:
+        dup_index.close()
 
     summary_lines = [
         f"Web research queries: {len(queries)}",
@@ -1,11 +1,15 @@
 import datetime as dt
 import os
-from typing import Any, Dict, Iterable, List, Optional
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
 import requests
 
-from . import __version__
+from . import __version__, metrics, ratelimit, response_cache
+from .utils import provider_base
 
 YOUTUBE_BASE = "https://www.googleapis.com/youtube/v3"
 DEFAULT_USER_AGENT = f"Feather/{__version__} (+https://example.invalid)"
@@ -20,6 +24,13 @@ except Exception:
     GenericProxyConfig = None
 
 TRANSCRIPT_AVAILABLE = YouTubeTranscriptApi is not None
+PROXY_ENV_VARS = ("YOUTUBE_PROXY", "YOUTUBE_PROXY_HTTP", "YOUTUBE_PROXY_HTTPS")
+DEFAULT_TRANSCRIPT_WORKERS = 4
+# Without a proxy every request comes from one IP, which YouTube blocks quickly.
+DIRECT_TRANSCRIPT_WORKERS = 2
+TRANSCRIPT_TIMEOUT_SEC = 45
+BLOCK_BACKOFF_SEC = 30.0
+MAX_BLOCKED = 3
 
 
 def request_headers() -> Dict[str, str]:
@@ -119,6 +130,15 @@ def parse_api_error(response: Optional[requests.Response]) -> tuple[Optional[str
     return reason, message
 
 
+def fetch_api(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    def fetch() -> Dict[str, Any]:
+        r = ratelimit.get(f"{provider_base('youtube', YOUTUBE_BASE)}/{endpoint}", provider="youtube", params=params, timeout=60, headers=request_headers())
+        r.raise_for_status()
+        return r.json()
+
+    return response_cache.cached("youtube", endpoint, params, fetch)
+
+
 def youtube_search(
     query: str,
     api_key: str,
@@ -152,9 +172,7 @@ def youtube_search(
         if relevance_language:
             params["relevanceLanguage"] = relevance_language
 
-        r = requests.get(f"{YOUTUBE_BASE}/search", params=params, timeout=60, headers=request_headers())
-        r.raise_for_status()
-        data = r.json()
+        data = fetch_api("search", params)
         batch = data.get("items", []) or []
         items.extend(batch)
         remaining = max_results - len(items)
@@ -204,9 +222,7 @@ def fetch_video_details(video_ids: List[str], api_key: str) -> Dict[str, Dict[st
             "key": api_key,
             "maxResults": len(chunk),
         }
-        r = requests.get(f"{YOUTUBE_BASE}/videos", params=params, timeout=60, headers=request_headers())
-        r.raise_for_status()
-        data = r.json()
+        data = fetch_api("videos", params)
         for item in data.get("items", []) or []:
             vid = item.get("id")
             if vid:
@@ -220,6 +236,8 @@ def fetch_transcript(video_id: str, languages: Optional[List[str]] = None) -> Li
     lang_list = [lang for lang in (languages or []) if lang]
     if not lang_list:
         lang_list = ["en"]
+    response_cache.require_network("youtube_transcript")
+    ratelimit.get_limiter().acquire("youtube_transcript")
     if hasattr(YouTubeTranscriptApi, "get_transcript"):
         return YouTubeTranscriptApi.get_transcript(video_id, languages=lang_list)
     api = build_transcript_api()
@@ -249,6 +267,8 @@ def build_transcript_api() -> Any:
 
 
 def classify_transcript_error(exc: Exception) -> str:
+    if isinstance(exc, response_cache.CacheMiss):
+        return "offline"
     if yt_errors is None:
         return "error"
     blocked = (yt_errors.IpBlocked, yt_errors.RequestBlocked, yt_errors.YouTubeRequestFailed)
@@ -268,6 +288,109 @@ def classify_transcript_error(exc: Exception) -> str:
     return "error"
 
 
+def proxy_configured() -> bool:
+    return any(os.getenv(name) for name in PROXY_ENV_VARS)
+
+
+def transcript_workers(requested: int) -> int:
+    requested = max(1, requested)
+    return requested if proxy_configured() else min(requested, DIRECT_TRANSCRIPT_WORKERS)
+
+
+class TranscriptFetcher:
+    # Fetches transcripts on a bounded set of worker threads and yields results in input order.
+    # Each "blocked" answer pauses the youtube_transcript bucket with exponential
+    # backoff; after MAX_BLOCKED blocks the remaining videos are skipped.
+    def __init__(
+        self,
+        workers: int = DEFAULT_TRANSCRIPT_WORKERS,
+        timeout: float = TRANSCRIPT_TIMEOUT_SEC,
+        languages: Optional[List[str]] = None,
+    ):
+        self.workers = transcript_workers(workers)
+        self.timeout = timeout
+        self.languages = languages
+        self.blocked = 0
+        self.backoff_total = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def gave_up(self) -> bool:
+        return self.blocked >= MAX_BLOCKED
+
+    def _fetch(self, video_id: str) -> Tuple[str, Optional[List[Dict[str, Any]]], Optional[Exception]]:
+        if self.gave_up:
+            return "skipped", None, None
+        metrics.count("requests")
+        try:
+            return "ok", fetch_transcript(video_id, languages=self.languages), None
+        except Exception as exc:
+            status = classify_transcript_error(exc)
+            if status == "blocked":
+                metrics.count("failures")
+                with self._lock:
+                    self.blocked += 1
+                    delay = BLOCK_BACKOFF_SEC * 2 ** (self.blocked - 1)
+                    self.backoff_total += delay
+                ratelimit.get_limiter().penalize("youtube_transcript", delay)
+            return status, None, exc
+
+    def fetch_many(
+        self, video_ids: List[str]
+    ) -> Iterator[Tuple[str, str, Optional[List[Dict[str, Any]]], Optional[Exception]]]:
+        # Each video's timeout runs from the moment its fetch starts, not from when the
+        # caller gets to it. A hung fetch keeps its thread, so a replacement worker is
+        # started and the videos queued behind it still run.
+        if not video_ids:
+            return
+        pending: "queue.Queue[int]" = queue.Queue()
+        for idx in range(len(video_ids)):
+            pending.put(idx)
+        started: Dict[int, float] = {}
+        results: Dict[int, Tuple[str, Optional[List[Dict[str, Any]]], Optional[Exception]]] = {}
+        cond = threading.Condition()
+        stop = threading.Event()
+
+        def work() -> None:
+            while not stop.is_set():
+                try:
+                    idx = pending.get_nowait()
+                except queue.Empty:
+                    return
+                with cond:
+                    started[idx] = time.monotonic()
+                    cond.notify_all()
+                result = self._fetch(video_ids[idx])
+                with cond:
+                    results[idx] = result
+                    cond.notify_all()
+
+        def spawn() -> None:
+            threading.Thread(target=metrics.carry(work), name="feather-transcript", daemon=True).start()
+
+        for _ in range(min(self.workers, len(video_ids))):
+            spawn()
+        try:
+            for idx, video_id in enumerate(video_ids):
+                with cond:
+                    while idx not in results:
+                        if idx not in started:
+                            cond.wait()
+                            continue
+                        # Block backoff sleeps happen inside the fetch; don't count them as a hang.
+                        remaining = started[idx] + self.timeout + self.backoff_total - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        cond.wait(remaining)
+                    result = results.get(idx)
+                if result is None:
+                    result = ("timeout", None, TimeoutError(f"transcript fetch exceeded {self.timeout}s"))
+                    spawn()
+                yield (video_id, *result)
+        finally:
+            stop.set()
+
+
 def format_transcript(segments: Iterable[Any]) -> str:
     lines: List[str] = []
     for seg in segments:
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Callable, Optional
 import datetime as dt
 import difflib
@@ -11,6 +11,8 @@ import json
 import re
 import sys
 
+from feather import runpack
+from feather.utils import open_text, packed_member, stored_exists, stored_path
 from federlicht import tools as feder_tools
 
 from . import artwork as feder_artwork
@@ -394,10 +396,10 @@ class ReportOrchestrator:
             candidate = Path(rel_path)
             if not candidate.is_absolute():
                 candidate = run_dir / candidate
-            resolved = candidate.resolve()
+            resolved = stored_path(candidate.resolve())
             if run_dir != resolved and run_dir not in resolved.parents:
                 raise ValueError(f"Path is outside run folder: {rel_path}")
-            if not resolved.exists():
+            if not stored_exists(resolved):
                 raise FileNotFoundError(f"Path does not exist: {rel_path}")
             return resolved
 
@@ -410,6 +412,20 @@ class ReportOrchestrator:
                 return "*"
             return cleaned.replace("/", "\\")
 
+        def list_packed_files(pattern: str) -> list[dict]:
+            # Files moved into run-pack.zip (feather --pack) are listed under their run paths.
+            found = runpack.locate(archive_dir)
+            if found is None:
+                return []
+            pack, name = found
+            glob = pattern.replace("\\", "/")
+            files = []
+            for member in pack.names():
+                if member.startswith(f"{name}/") and PurePosixPath(member[len(name) + 1 :]).match(glob):
+                    rel = (pack.run_dir / member).relative_to(run_dir).as_posix()
+                    files.append({"path": rel, "bytes": pack.size(member)})
+            return files
+
         def list_archive_files(pattern: Optional[str] = None, max_files: Optional[int] = None) -> str:
             """List archive files (relative paths + size) as JSON."""
             files = []
@@ -424,12 +440,14 @@ class ReportOrchestrator:
                 if path.is_file():
                     rel = path.relative_to(run_dir).as_posix()
                     files.append({"path": rel, "bytes": path.stat().st_size})
+            files.extend(list_packed_files(normalized))
             if pattern and not files:
                 warning = f"No matches for pattern '{pattern}'. Falling back to '*'"
                 for path in sorted(archive_dir.rglob("*")):
                     if path.is_file():
                         rel = path.relative_to(run_dir).as_posix()
                         files.append({"path": rel, "bytes": path.stat().st_size})
+                files.extend(list_packed_files("*"))
             limit = args.max_files if max_files is None else max_files
             payload = {"total_files": len(files), "files": files[:limit]}
             if warning:
@@ -462,10 +480,12 @@ class ReportOrchestrator:
 
         def read_text_file(path: Path, start: int, max_chars: int) -> str:
             start = max(0, start)
-            if start == 0 and max_chars > 0:
-                with path.open("r", encoding="utf-8", errors="replace") as handle:
+            # Compressed (feather --compress) and packed (feather --pack) files are read
+            # through open_text.
+            with open_text(stored_path(path)) as handle:
+                if start == 0 and max_chars > 0:
                     return handle.read(max_chars)
-            text = path.read_text(encoding="utf-8", errors="replace")
+                text = handle.read()
             if max_chars <= 0:
                 return text[start:]
             return text[start : start + max_chars]
@@ -491,10 +511,20 @@ class ReportOrchestrator:
             if pdf_path.parent.name == "pdf":
                 text_dir = pdf_path.parent.parent / "text"
                 candidate = text_dir / f"{pdf_path.stem}.txt"
-                if candidate.exists():
+                if stored_exists(candidate):
                     return candidate
             candidate = pdf_path.with_suffix(".txt")
-            return candidate if candidate.exists() else None
+            return candidate if stored_exists(candidate) else None
+
+        def materialize_packed(path: Path) -> Path:
+            # Binary readers (PyMuPDF, python-pptx, ...) need a real file; packed ones are
+            # extracted once into the tool cache.
+            member = None if path.exists() else packed_member(path)
+            if member is None:
+                return path
+            pack, name = member
+            dest = tool_cache_dir / "packed" / name
+            return dest if dest.exists() else pack.extract(name, dest)
 
         tool_chars_used = 0
         reducer_chunk_chars = 3000
@@ -635,7 +665,7 @@ class ReportOrchestrator:
                 try:
                     artifact_path = resolve_run_path(artifact_dir)
                     chunk_path = artifact_path / chunk_name
-                    if not chunk_path.exists():
+                    if not stored_exists(chunk_path):
                         continue
                     content = read_text_file(chunk_path, 0, max(2000, budget))
                 except Exception:
@@ -675,7 +705,7 @@ class ReportOrchestrator:
                         payload = f"[from text] {rel_label}\n\n{text}"
                         return apply_tool_budget(payload, text, rel_label)
                     pdf_text = helpers.read_pdf_with_fitz(
-                        path,
+                        materialize_packed(path),
                         page_limit,
                         limit,
                         start_page=page_start,
@@ -689,7 +719,7 @@ class ReportOrchestrator:
                     slide_limit = getattr(args, "max_pptx_slides", 0)
                     slide_start = 0 if start_page is None else max(0, start_page)
                     pptx_text = helpers.read_pptx_text(
-                        path,
+                        materialize_packed(path),
                         slide_limit,
                         limit,
                         start_slide=slide_start,
@@ -699,7 +729,7 @@ class ReportOrchestrator:
                     payload = f"[from pptx] {rel_label}\n\n{pptx_text}"
                     return apply_tool_budget(payload, pptx_text, rel_label)
                 if path.suffix.lower() in {".docx", ".doc"}:
-                    docx_text = helpers.read_docx_text(path, limit, start=start)
+                    docx_text = helpers.read_docx_text(materialize_packed(path), limit, start=start)
                     rel_label = path.relative_to(run_dir).as_posix()
                     payload = f"[from docx] {rel_label}\n\n{docx_text}"
                     return apply_tool_budget(payload, docx_text, rel_label)
@@ -707,7 +737,7 @@ class ReportOrchestrator:
                     sheet_limit = 0 if max_pages is None else max_pages
                     sheet_start = 0 if start_page is None else max(0, start_page)
                     xlsx_text = helpers.read_xlsx_text(
-                        path,
+                        materialize_packed(path),
                         limit,
                         max_sheets=sheet_limit,
                         start_sheet=sheet_start,
@@ -48,6 +48,7 @@ from .orchestrator import (
     STAGE_INFO,
     STAGE_ORDER,
 )
+from feather.utils import iter_stored_files, open_text, stored_exists, stored_path
 from feather.web_research import run_supporting_web_research
 from .render.html import (
     html_to_text,
@@ -4038,13 +4039,13 @@ def build_text_meta_index(
                 meta_map[variant] = payload
 
     arxiv = archive_dir / "arxiv" / "papers.jsonl"
-    if arxiv.exists():
+    if stored_exists(arxiv):
         for entry in iter_jsonl(arxiv):
             arxiv_id = entry.get("arxiv_id")
             if not arxiv_id:
                 continue
             text_path = archive_dir / "arxiv" / "text" / f"{arxiv_id}.txt"
-            if not text_path.exists():
+            if not stored_exists(text_path):
                 continue
             rel_text = f"./{text_path.relative_to(run_dir).as_posix()}"
             pdf_path = archive_dir / "arxiv" / "pdf" / f"{arxiv_id}.pdf"
@@ -4052,7 +4053,7 @@ def build_text_meta_index(
                 "title": entry.get("title"),
                 "summary": entry.get("summary"),
                 "source_url": entry.get("entry_id") or entry.get("pdf_url"),
-                "pdf_path": f"./{pdf_path.relative_to(run_dir).as_posix()}" if pdf_path.exists() else None,
+                "pdf_path": f"./{pdf_path.relative_to(run_dir).as_posix()}" if stored_exists(pdf_path) else None,
                 "authors": normalize_author_list(entry.get("authors")),
                 "published": entry.get("published") or entry.get("updated"),
                 "source": "arxiv",
@@ -4060,14 +4061,14 @@ def build_text_meta_index(
             add_meta(rel_text, payload)
 
     openalex = archive_dir / "openalex" / "works.jsonl"
-    if openalex.exists():
+    if stored_exists(openalex):
         for entry in iter_jsonl(openalex):
             work = entry.get("work") or entry
             short_id = work.get("openalex_id_short")
             if not short_id:
                 continue
             text_path = archive_dir / "openalex" / "text" / f"{short_id}.txt"
-            if not text_path.exists():
+            if not stored_exists(text_path):
                 continue
             rel_text = f"./{text_path.relative_to(run_dir).as_posix()}"
             pdf_path = archive_dir / "openalex" / "pdf" / f"{short_id}.pdf"
@@ -4075,7 +4076,7 @@ def build_text_meta_index(
                 "title": work.get("title"),
                 "summary": work.get("abstract"),
                 "source_url": work.get("landing_page_url") or work.get("doi") or work.get("pdf_url"),
-                "pdf_path": f"./{pdf_path.relative_to(run_dir).as_posix()}" if pdf_path.exists() else None,
+                "pdf_path": f"./{pdf_path.relative_to(run_dir).as_posix()}" if stored_exists(pdf_path) else None,
                 "authors": extract_openalex_authors(work),
                 "published": resolve_openalex_published(work),
                 "journal": resolve_openalex_journal(work),
@@ -4085,7 +4086,7 @@ def build_text_meta_index(
             add_meta(rel_text, payload)
 
     youtube = archive_dir / "youtube" / "videos.jsonl"
-    if youtube.exists():
+    if stored_exists(youtube):
         for entry in iter_jsonl(youtube):
             video = entry.get("video") or entry
             rel_text = coerce_rel_path(video.get("transcript_path") or entry.get("transcript_path"), run_dir)
@@ -4103,7 +4104,8 @@ def build_text_meta_index(
 
     tavily_search = archive_dir / "tavily_search.jsonl"
     tavily_extract_dir = archive_dir / "tavily_extract"
-    if tavily_search.exists() and tavily_extract_dir.exists():
+    if stored_exists(tavily_search) and stored_exists(tavily_extract_dir):
+        tavily_extract_texts = list(iter_stored_files(tavily_extract_dir, ".txt"))
         for entry in iter_jsonl(tavily_search):
             results = entry.get("result", {}).get("results") or entry.get("results") or []
             for item in results:
@@ -4111,7 +4113,9 @@ def build_text_meta_index(
                 if not url:
                     continue
                 safe = feder_tools.safe_filename(url)
-                for text_path in tavily_extract_dir.glob(f"*_{safe}.txt"):
+                for text_path in tavily_extract_texts:
+                    if not text_path.name.endswith(f"_{safe}.txt"):
+                        continue
                     rel_text = f"./{text_path.relative_to(run_dir).as_posix()}"
                     payload = {
                         "title": item.get("title"),
@@ -4121,19 +4125,19 @@ def build_text_meta_index(
                     add_meta(rel_text, payload)
 
     web_text_dir = archive_dir / "web" / "text"
-    if web_text_dir.exists():
-        for text_path in web_text_dir.glob("*.txt"):
+    if stored_exists(web_text_dir):
+        for text_path in iter_stored_files(web_text_dir, ".txt"):
             rel_text = f"./{text_path.relative_to(run_dir).as_posix()}"
             pdf_path = archive_dir / "web" / "pdf" / f"{text_path.stem}.pdf"
             payload = {
-                "pdf_path": f"./{pdf_path.relative_to(run_dir).as_posix()}" if pdf_path.exists() else None,
+                "pdf_path": f"./{pdf_path.relative_to(run_dir).as_posix()}" if stored_exists(pdf_path) else None,
                 "source": "web",
             }
             add_meta(rel_text, payload)
 
-    if supporting_dir and supporting_dir.exists():
+    if supporting_dir and stored_exists(supporting_dir):
         fetch = supporting_dir / "web_fetch.jsonl"
-        if fetch.exists():
+        if stored_exists(fetch):
             for entry in iter_jsonl(fetch):
                 rel_text = coerce_rel_path(entry.get("text_path") or entry.get("extract_path"), run_dir)
                 if not rel_text:
@@ -4146,18 +4150,18 @@ def build_text_meta_index(
                 }
                 add_meta(rel_text, payload)
         support_text_dir = supporting_dir / "web_text"
-        if support_text_dir.exists():
-            for text_path in support_text_dir.glob("*.txt"):
+        if stored_exists(support_text_dir):
+            for text_path in iter_stored_files(support_text_dir, ".txt"):
                 rel_text = f"./{text_path.relative_to(run_dir).as_posix()}"
                 pdf_path = supporting_dir / "web_pdf" / f"{text_path.stem}.pdf"
                 payload = {
-                    "pdf_path": f"./{pdf_path.relative_to(run_dir).as_posix()}" if pdf_path.exists() else None,
+                    "pdf_path": f"./{pdf_path.relative_to(run_dir).as_posix()}" if stored_exists(pdf_path) else None,
                     "source": "supporting_web",
                 }
                 add_meta(rel_text, payload)
 
     local_manifest = archive_dir / "local" / "manifest.jsonl"
-    if local_manifest.exists():
+    if stored_exists(local_manifest):
         for entry in iter_jsonl(local_manifest):
             rel_text = coerce_rel_path(entry.get("content_path"), run_dir)
             if not rel_text:
@@ -4198,7 +4202,7 @@ def build_viewer_map(
     for rel in rel_paths:
         rel_clean = rel.lstrip("./")
         path = (run_dir / rel_clean).resolve()
-        if not path.exists() or run_dir not in path.parents and path != run_dir:
+        if not stored_exists(path) or run_dir not in path.parents and path != run_dir:
             continue
         if path.is_dir():
             continue
@@ -4210,18 +4214,18 @@ def build_viewer_map(
         if suffix in {".pptx", ".ppt", ".docx", ".doc", ".xlsx", ".xls"}:
             continue
         if suffix in {".md", ".markdown"}:
-            text = path.read_text(encoding="utf-8", errors="replace")
+            text = read_stored_text(path)
             text, truncated = truncate_for_view(text, max_chars)
             body_html = linkify_html(markdown_to_html(text))
         elif suffix in {".json", ".jsonl"}:
             if suffix == ".json":
                 try:
-                    data = json.loads(path.read_text(encoding="utf-8", errors="replace"))
+                    data = json.loads(read_stored_text(path))
                 except Exception:
-                    data = path.read_text(encoding="utf-8", errors="replace")
+                    data = read_stored_text(path)
                 payload = json.dumps(data, ensure_ascii=False, indent=2) if isinstance(data, (dict, list)) else str(data)
             else:
-                lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+                lines = read_stored_text(path).splitlines()
                 items = []
                 truncated_items = False
                 for line in lines:
@@ -4243,7 +4247,7 @@ def build_viewer_map(
             rel_pdf = os.path.relpath(path, viewer_dir).replace("\\", "/")
             body_html = f'<iframe src="{html_lib.escape(rel_pdf)}" style="width:100%; height:80vh; border:0;"></iframe>'
         else:
-            text = path.read_text(encoding="utf-8", errors="replace")
+            text = read_stored_text(path)
             text, truncated = truncate_for_view(text, max_chars)
             body_html = f"<pre>{linkify_plain_text(text)}</pre>"
             meta = meta_index.get(rel) or meta_index.get(rel_clean) or meta_index.get(f"./{rel_clean}")
@@ -4486,8 +4490,13 @@ class SafeFilesystemBackend:
         }
 
 
+def read_stored_text(path: Path) -> str:
+    with open_text(stored_path(path)) as handle:
+        return handle.read()
+
+
 def iter_jsonl(path: Path):
-    with path.open("r", encoding="utf-8", errors="replace") as handle:
+    with open_text(stored_path(path)) as handle:
         for line in handle:
             line = line.strip()
             if not line:
@@ -7,6 +7,8 @@ import urllib.parse
 from pathlib import Path
 from typing import Iterable, Optional
 
+from feather.utils import iter_stored_files, open_text, stored_exists, stored_path
+
 WORD_RE = re.compile(r"[A-Za-z]{2,}|[\uac00-\ud7a3]{2,}")
 YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
 PLAN_STEP_RE = re.compile(r"^\s*-\s*\[[ xX]\]\s+")
@@ -36,8 +38,9 @@ _CLAIM_STRENGTH_WEIGHT = {
 
 
 def iter_jsonl(path: Path) -> Iterable[dict]:
+    # <name>.jsonl may be stored as <name>.jsonl.gz/.zst by feather --compress.
     try:
-        with path.open("r", encoding="utf-8", errors="replace") as handle:
+        with open_text(stored_path(path)) as handle:
             for line in handle:
                 line = line.strip()
                 if not line:
@@ -98,9 +101,9 @@ def domain_from_url(url: Optional[str]) -> Optional[str]:
 
 def _collect_tavily_extract_map(extract_dir: Path, run_dir: Path) -> dict[str, str]:
     mapping: dict[str, str] = {}
-    if not extract_dir.exists():
+    if not stored_exists(extract_dir):
         return mapping
-    for path in extract_dir.glob("*.txt"):
+    for path in iter_stored_files(extract_dir, ".txt"):
         name = path.stem
         parts = name.split("_", 1)
         if len(parts) == 2:
@@ -110,9 +113,9 @@ def _collect_tavily_extract_map(extract_dir: Path, run_dir: Path) -> dict[str, s
 
 def _collect_youtube_transcripts(transcript_dir: Path, run_dir: Path) -> dict[str, str]:
     mapping: dict[str, str] = {}
-    if not transcript_dir.exists():
+    if not stored_exists(transcript_dir):
         return mapping
-    for path in transcript_dir.glob("*.txt"):
+    for path in iter_stored_files(transcript_dir, ".txt"):
         name = path.name
         match = re.search(r"youtu\.be-([A-Za-z0-9_-]{6,})-", name)
         if not match:
@@ -121,6 +124,22 @@ def _collect_youtube_transcripts(transcript_dir: Path, run_dir: Path) -> dict[st
     return mapping
 
 
+def _collapse_near_duplicates(entries: list[dict], duplicates: dict[str, str]) -> list[dict]:
+    # Feather marks later copies of a syndicated page with duplicate_of; fold them into
+    # the first copy when it is indexed, keeping their URLs on it.
+    if not duplicates:
+        return entries
+    by_url = {entry["url"]: entry for entry in entries if entry.get("url") and entry["url"] not in duplicates}
+    collapsed: list[dict] = []
+    for entry in entries:
+        canonical = by_url.get(duplicates.get(entry.get("url") or "", ""))
+        if canonical is not None and canonical is not entry:
+            canonical.setdefault("duplicates", []).append(entry["url"])
+            continue
+        collapsed.append(entry)
+    return collapsed
+
+
 def build_source_index(
     archive_dir: Path,
     run_dir: Path,
@@ -129,6 +148,13 @@ def build_source_index(
 ) -> list[dict]:
     entries: list[dict] = []
     seen: set[str] = set()
+    duplicates: dict[str, str] = {}
+
+    def mark_duplicate(url: Optional[str], canonical: Optional[str]) -> None:
+        url = normalize_url(url)
+        canonical = normalize_url(canonical)
+        if url and canonical and url != canonical:
+            duplicates[url] = canonical
 
     def add_entry(entry: dict) -> None:
         key = entry.get("url") or entry.get("local_path") or entry.get("text_path") or entry.get("pdf_path")
@@ -146,7 +172,7 @@ def build_source_index(
             return path.as_posix()
 
     openalex = archive_dir / "openalex" / "works.jsonl"
-    if openalex.exists():
+    if stored_exists(openalex):
         for entry in iter_jsonl(openalex):
             work = entry.get("work") or entry
             short_id = work.get("openalex_id_short")
@@ -158,10 +184,10 @@ def build_source_index(
             pdf_path = None
             if short_id:
                 cand_text = archive_dir / "openalex" / "text" / f"{short_id}.txt"
-                if cand_text.exists():
+                if stored_exists(cand_text):
                     text_path = rel(cand_text)
                 cand_pdf = archive_dir / "openalex" / "pdf" / f"{short_id}.pdf"
-                if cand_pdf.exists():
+                if stored_exists(cand_pdf):
                     pdf_path = rel(cand_pdf)
             add_entry(
                 {
@@ -178,7 +204,7 @@ def build_source_index(
             )
 
     arxiv = archive_dir / "arxiv" / "papers.jsonl"
-    if arxiv.exists():
+    if stored_exists(arxiv):
         for entry in iter_jsonl(arxiv):
             paper = entry.get("paper") or entry
             arxiv_id = paper.get("arxiv_id")
@@ -189,10 +215,10 @@ def build_source_index(
             pdf_path = None
             if arxiv_id:
                 cand_text = archive_dir / "arxiv" / "text" / f"{arxiv_id}.txt"
-                if cand_text.exists():
+                if stored_exists(cand_text):
                     text_path = rel(cand_text)
                 cand_pdf = archive_dir / "arxiv" / "pdf" / f"{arxiv_id}.pdf"
-                if cand_pdf.exists():
+                if stored_exists(cand_pdf):
                     pdf_path = rel(cand_pdf)
             add_entry(
                 {
@@ -210,7 +236,7 @@ def build_source_index(
     tavily_search = archive_dir / "tavily_search.jsonl"
     tavily_extract_dir = archive_dir / "tavily_extract"
     tavily_map = _collect_tavily_extract_map(tavily_extract_dir, run_dir)
-    if tavily_search.exists():
+    if stored_exists(tavily_search):
         for entry in iter_jsonl(tavily_search):
             results = entry.get("result", {}).get("results") or entry.get("results") or []
             for item in results:
@@ -219,6 +245,7 @@ def build_source_index(
                     continue
                 title = item.get("title")
                 score = item.get("score")
+                mark_duplicate(url, item.get("duplicate_of"))
                 extract_path = None
                 safe = safe_filename(url)
                 if safe in tavily_map:
@@ -235,10 +262,13 @@ def build_source_index(
                     }
                 )
 
+    for entry in iter_jsonl(archive_dir / "near_duplicates.jsonl"):
+        mark_duplicate(entry.get("url"), entry.get("duplicate_of"))
+
     youtube = archive_dir / "youtube" / "videos.jsonl"
     transcript_dir = archive_dir / "youtube" / "transcripts"
     transcript_map = _collect_youtube_transcripts(transcript_dir, run_dir)
-    if youtube.exists():
+    if stored_exists(youtube):
         for entry in iter_jsonl(youtube):
             videos = []
             if isinstance(entry.get("videos"), list):
@@ -264,7 +294,7 @@ def build_source_index(
                 )
 
     local_manifest = archive_dir / "local" / "manifest.jsonl"
-    if local_manifest.exists():
+    if stored_exists(local_manifest):
         for entry in iter_jsonl(local_manifest):
             title = entry.get("title") or entry.get("path")
             text_path = entry.get("text_path")
@@ -307,6 +337,7 @@ def build_source_index(
             for entry in iter_jsonl(web_fetch):
                 url = normalize_url(entry.get("url"))
                 title = entry.get("title")
+                mark_duplicate(url, entry.get("duplicate_of"))
                 pdf_path = entry.get("pdf_path")
                 text_path = entry.get("text_path") or entry.get("extract_path")
                 add_entry(
@@ -321,7 +352,7 @@ def build_source_index(
                     }
                 )
 
-    return entries[:max_items]
+    return _collapse_near_duplicates(entries, duplicates)[:max_items]
 
 
 def write_jsonl(path: Path, items: Iterable[dict]) -> None:
@@ -0,0 +1,91 @@
+import gzip
+import io
+import tarfile
+from types import SimpleNamespace
+
+from feather import arxiv_ops
+
+
+class FakeResult:
+    def __init__(self, short_id: str):
+        self.short_id = short_id
+
+    def get_short_id(self) -> str:
+        return self.short_id
+
+
+def test_search_by_ids_matches_results_to_input_order(monkeypatch) -> None:
+    searches = []
+
+    class FakeSearch:
+        def __init__(self, id_list, max_results):
+            searches.append(list(id_list))
+
+        def results(self):
+            # arXiv returns its own order, always with a version suffix.
+            return iter([FakeResult("2401.00003v1"), FakeResult("2401.00001v2")])
+
+    monkeypatch.setattr(arxiv_ops, "arxiv", SimpleNamespace(Search=FakeSearch))
+    results = arxiv_ops.search_by_ids(["2401.00001", "2401.00002", "2401.00003v1"])
+    assert searches == [["2401.00001", "2401.00002", "2401.00003v1"]]
+    assert [r.get_short_id() if r else None for r in results] == ["2401.00001v2", None, "2401.00003v1"]
+
+
+def test_fetch_by_ids_batches_requests(monkeypatch) -> None:
+    batches = []
+
+    def fake_search(ids):
+        batches.append(list(ids))
+        return [FakeResult(f"{aid}v1") for aid in ids]
+
+    monkeypatch.setattr(arxiv_ops, "search_by_ids", fake_search)
+    monkeypatch.setattr(arxiv_ops, "result_to_metadata", lambda r: {"arxiv_id": r.get_short_id()})
+    ids = [f"2401.{i:05d}" for i in range(5)]
+    metas = arxiv_ops.fetch_by_ids(ids, batch_size=2)
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert [m["arxiv_id"] for m in metas] == [f"{aid}v1" for aid in ids]
+
+
+def _write_tar(path, files) -> None:
+    with tarfile.open(path, "w:gz") as tar:
+        for name, data in files.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+
+def test_extract_arxiv_source_keeps_tex_and_referenced_figures(tmp_path) -> None:
+    tex = b"\\documentclass{article}\\includegraphics[width=2in]{figs/plot}\\includegraphics{big.png}"
+    archive = tmp_path / "src.tar.gz"
+    _write_tar(
+        archive,
+        {
+            "figs/plot.pdf": b"%PDF",
+            "figs/unused.png": b"png",
+            "big.png": b"x" * 128,
+            "data/weights.bin": b"w" * 32,
+            "main.tex": tex,
+            "refs.bbl": b"\\bibitem{a}",
+            "../escape.tex": b"no",
+        },
+    )
+    out = tmp_path / "out"
+    report = arxiv_ops.extract_arxiv_source(archive, out, max_member_bytes=100)
+    assert report["files"] == ["main.tex", "refs.bbl", "figs/plot.pdf"]
+    assert report["includegraphics"] == ["figs/plot", "big.png"]
+    assert report["over_cap"] == ["big.png"]
+    assert report["skipped_files"] == 4
+    assert sorted(p.relative_to(out).as_posix() for p in out.rglob("*") if p.is_file()) == [
+        "figs/plot.pdf",
+        "main.tex",
+        "refs.bbl",
+    ]
+
+
+def test_extract_arxiv_source_handles_single_gzipped_tex(tmp_path) -> None:
+    archive = tmp_path / "src.tar.gz"
+    archive.write_bytes(gzip.compress(b"\\documentclass{article}\\includegraphics{f.png}"))
+    report = arxiv_ops.extract_arxiv_source(archive, tmp_path / "out")
+    assert report["files"] == ["main.tex"]
+    assert report["includegraphics"] == ["f.png"]
+    assert (tmp_path / "out" / "main.tex").exists()
@@ -0,0 +1,36 @@
+import json
+
+from feather import bench
+
+
+def test_run_benchmark_reports_stages_against_standin(tmp_path) -> None:
+    results = bench.run_benchmark(
+        tmp_path, files=2, queries=2, urls=2, arxiv_ids=1, local_files=6, index_repeats=2, parse_repeats=1
+    )
+    json.dumps(results)
+    stages = results["stages"]
+    assert set(stages) == {
+        "parse_job",
+        "prepare_jobs",
+        "local_ingest",
+        "tavily_extract",
+        "tavily_search",
+        "openalex",
+        "arxiv_ids",
+        "build_index_md",
+    }
+    assert stages["tavily_search"]["runs"] == 2 and stages["build_index_md"]["runs"] == 4
+    assert stages["local_ingest"]["items"] == 12 and stages["local_ingest"]["items_per_sec"] > 0
+    assert {".txt", ".md", ".html", ".pdf"} <= set(results["corpus"]["local_formats"])
+    # Search, extract and OpenAlex are answered by the stand-in, never a real provider.
+    assert results["standin"]["synthesized"] == results["standin"]["requests"] >= 6
+    search_lines = (tmp_path / "runs" / "bench_000" / "archive" / "tavily_search.jsonl").read_text(encoding="utf-8")
+    assert len(search_lines.splitlines()) == 2
+
+
+def test_compare_results_reports_p50_change() -> None:
+    old = {"stages": {"tavily_search": {"p50_ms": 10.0}}}
+    new = {"stages": {"tavily_search": {"p50_ms": 12.5}, "openalex": {"p50_ms": 3.0}}}
+    lines = bench.compare_results(old, new)
+    assert lines[1].split() == ["tavily_search", "10.000", "12.500", "+25.0%"]
+    assert lines[2].split()[0] == "openalex"
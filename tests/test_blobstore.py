@@ -0,0 +1,90 @@
+import os
+
+import pytest
+
+from feather.blobstore import BlobStore, StoreInUse
+from feather.utils import write_text
+
+
+def test_ingest_dedupes_and_places_hardlinks(tmp_path) -> None:
+    store = BlobStore(tmp_path / "blobs")
+    src = tmp_path / "src" / "a.pdf"
+    src.parent.mkdir()
+    src.write_bytes(b"%PDF-1.4 same bytes")
+    sha = store.ingest(src)
+    assert store.ingest(src) == sha
+    assert os.access(src, os.W_OK)
+
+    run_a = tmp_path / "run_a" / "raw" / "a.pdf"
+    run_b = tmp_path / "run_b" / "raw" / "a.pdf"
+    assert store.place(sha, run_a) == "hardlink"
+    store.place(sha, run_b)
+    assert os.path.samefile(run_a, run_b)
+    assert run_b.read_bytes() == b"%PDF-1.4 same bytes"
+    assert store.sha_for_path(run_a) == sha
+
+
+def test_adopt_records_url_and_shared_text(tmp_path) -> None:
+    store = BlobStore(tmp_path / "blobs")
+    pdf = tmp_path / "run_a" / "pdf" / "x.pdf"
+    pdf.parent.mkdir(parents=True)
+    pdf.write_bytes(b"%PDF-1.7 downloaded")
+    sha = store.adopt(pdf, url="https://example.com/x.pdf")
+    assert store.sha_for_url("https://example.com/x.pdf") == sha
+    # The finished download is linked into the store, not kept twice.
+    assert os.path.samefile(pdf, store.blob_path(sha))
+
+    txt = tmp_path / "run_a" / "text" / "x.txt"
+    txt.parent.mkdir(parents=True)
+    txt.write_text("===== PAGE 1 =====\nhello", encoding="utf-8")
+    store.record_text(pdf, txt)
+
+    other_pdf = tmp_path / "run_b" / "pdf" / "x.pdf"
+    store.place(sha, other_pdf)
+    assert other_pdf.read_bytes() == b"%PDF-1.7 downloaded"
+    other_txt = tmp_path / "run_b" / "text" / "x.txt"
+    assert store.place_text(other_pdf, other_txt)
+    assert other_txt.read_text(encoding="utf-8") == "===== PAGE 1 =====\nhello"
+
+
+def test_gc_removes_unreferenced_blobs(tmp_path) -> None:
+    store = BlobStore(tmp_path / "blobs")
+    keep = tmp_path / "run" / "keep.txt"
+    drop = tmp_path / "run" / "drop.txt"
+    keep.parent.mkdir()
+    keep.write_text("keep", encoding="utf-8")
+    drop.write_text("drop me", encoding="utf-8")
+    keep_sha = store.adopt(keep)
+    drop_sha = store.adopt(drop)
+    drop.unlink()
+
+    stats = store.gc()
+    assert stats["refs_dropped"] == 1
+    assert stats["blobs_removed"] == 1
+    assert store.blob_path(keep_sha).exists()
+    assert not store.blob_path(drop_sha).exists()
+    assert keep.read_text(encoding="utf-8") == "keep"
+
+
+def test_gc_refuses_while_a_job_holds_the_store(tmp_path) -> None:
+    job_store = BlobStore(tmp_path / "blobs")
+    job_store.hold()
+    with pytest.raises(StoreInUse):
+        BlobStore(tmp_path / "blobs").gc()
+    job_store.close()
+    assert BlobStore(tmp_path / "blobs").gc()["blobs_removed"] == 0
+
+
+def test_rewriting_a_placed_file_leaves_the_blob_alone(tmp_path) -> None:
+    store = BlobStore(tmp_path / "blobs")
+    txt = tmp_path / "run_a" / "text" / "x.txt"
+    write_text(txt, "original")
+    sha = store.adopt(txt)
+    other = tmp_path / "run_b" / "text" / "x.txt"
+    store.place(sha, other)
+
+    write_text(txt, "rewritten by an update run")
+    assert txt.read_text(encoding="utf-8") == "rewritten by an update run"
+    assert os.access(txt, os.W_OK)
+    assert store.blob_path(sha).read_text(encoding="utf-8") == "original"
+    assert other.read_text(encoding="utf-8") == "original"
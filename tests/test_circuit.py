@@ -0,0 +1,57 @@
+import random
+
+import pytest
+import requests
+
+from feather import circuit, ratelimit
+from feather.circuit import CircuitBreaker, CircuitOpen, CircuitRegistry
+from feather.ratelimit import RateLimiter
+
+
+def test_breaker_opens_probes_and_backs_off(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(circuit.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker("host", threshold=2, base=10.0, cap=1000.0, rng=random.Random(1))
+    breaker.before()
+    breaker.failure()
+    breaker.before()
+    breaker.failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpen):
+        breaker.before()
+    first = breaker.open_until - now[0]
+    assert 7.5 <= first <= 12.5
+
+    # After the cooldown one probe goes through; a second caller is still refused.
+    now[0] = breaker.open_until
+    breaker.before()
+    with pytest.raises(CircuitOpen):
+        breaker.before()
+    breaker.failure()
+    assert breaker.state == "open"
+    assert 15.0 <= breaker.open_until - now[0] <= 25.0
+
+    now[0] = breaker.open_until
+    breaker.before()
+    breaker.success()
+    breaker.before()
+    assert breaker.stats() == {"state": "closed", "failures": 3, "trips": 2, "skipped": 2}
+
+
+def test_request_fails_fast_once_circuit_opens(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def fake_request(method: str, url: str, **kwargs):
+        calls.append(url)
+        raise requests.exceptions.ConnectTimeout("timed out")
+
+    registry = CircuitRegistry(threshold=2, base=60.0)
+    monkeypatch.setattr(circuit, "_REGISTRY", registry)
+    monkeypatch.setattr(ratelimit, "_LIMITER", RateLimiter({"default": (0, 1)}))
+    monkeypatch.setattr(ratelimit.http_pool, "request", fake_request)
+    for idx in range(5):
+        with pytest.raises(requests.exceptions.RequestException):
+            ratelimit.get(f"https://dead.example.com/{idx}")
+    assert len(calls) == 2
+    stats = registry.stats()["dead.example.com"]
+    assert stats["failures"] == 2 and stats["trips"] == 1 and stats["skipped"] == 3
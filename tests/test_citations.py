@@ -0,0 +1,102 @@
+import requests
+
+from feather import citations, openalex_ops, response_cache
+
+
+def test_lookup_citations_batches_and_caches(tmp_path, monkeypatch) -> None:
+    calls = []
+
+    def fake_batch(field, values, api_key=None, mailto=None):
+        calls.append((field, list(values)))
+        if field == "doi":
+            return [
+                {"doi": f"https://doi.org/{v.upper()}", "cited_by_count": int(v.split("/")[-1])}
+                for v in values
+                if v != "10.1/7"
+            ]
+        return [
+            {"primary_location": {"landing_page_url": f"https://arxiv.org/abs/{v}v2"}, "cited_by_count": 99}
+            for v in values
+        ]
+
+    monkeypatch.setattr(openalex_ops, "fetch_citation_batch", fake_batch)
+    cache = citations.CitationCache(tmp_path / "citations.sqlite")
+    records = [(f"10.1/{i}", None) for i in range(120)]
+    records[7] = ("10.1/7", "2401.00007v1")
+    counts, stats = citations.lookup_citations(records, cache=cache)
+
+    assert [field for field, _ in calls] == ["doi", "doi", "doi", "arxiv"]
+    assert calls[-1][1] == ["2401.00007"]
+    assert counts["doi:10.1/3"] == 3
+    assert counts["doi:10.1/7"] == 99
+    assert stats == {"papers": 120, "cached": 0, "requests": 4, "found": 120}
+
+    calls.clear()
+    counts, stats = citations.lookup_citations(records, cache=cache)
+    assert calls == []
+    assert stats["cached"] == 120
+    assert counts["doi:10.1/119"] == 119
+
+
+def test_lookup_citations_does_not_cache_failed_batches(tmp_path, monkeypatch) -> None:
+    def failing_batch(field, values, api_key=None, mailto=None):
+        raise RuntimeError("503")
+
+    warnings = []
+    monkeypatch.setattr(openalex_ops, "fetch_citation_batch", failing_batch)
+    cache = citations.CitationCache(tmp_path / "citations.sqlite")
+    counts, stats = citations.lookup_citations([("10.1/1", None)], cache=cache, warn=warnings.append)
+    assert counts == {}
+    assert stats["requests"] == 1
+    assert warnings and warnings[0].startswith("WARN citations batch failed")
+    assert cache.get_many(["doi:10.1/1"]) == {}
+
+
+def test_citation_filter_uses_pipe_separated_values() -> None:
+    assert openalex_ops.citation_filter("doi", ["10.1/a", "10.1/b"]) == "doi:10.1/a|10.1/b"
+    arxiv = openalex_ops.citation_filter("arxiv", ["2401.00001"])
+    assert arxiv == (
+        "primary_location.landing_page_url:http://arxiv.org/abs/2401.00001|https://arxiv.org/abs/2401.00001"
+    )
+
+
+def test_openalex_skipped_and_rejected_statuses_are_not_cached(tmp_path, monkeypatch) -> None:
+    class Reply:
+        def __init__(self, status_code):
+            self.status_code = status_code
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+    statuses = [404, 400]
+    monkeypatch.setattr(response_cache, "_CACHE", response_cache.ResponseCache(tmp_path / "c.sqlite", mode="readwrite"))
+    monkeypatch.setattr(openalex_ops.ratelimit, "get", lambda url, **kwargs: Reply(statuses.pop(0)))
+    assert openalex_ops.fetch_works({"filter": "doi:x"}, skip_statuses=(404,)) is None
+    assert not response_cache.get_cache().lookup("openalex", "works", {"filter": "doi:x"})[0]
+
+    warnings = []
+    cache = citations.CitationCache(tmp_path / "citations.sqlite")
+    citations.lookup_citations([("10.1/1", None)], cache=cache, warn=warnings.append)
+    assert statuses == []
+    assert warnings[0].startswith("ERROR citations batch failed")
+    assert cache.get_many(["doi:10.1/1"]) == {}
+
+
+def test_arxiv_lookup_moves_on_after_a_rejected_landing_url(monkeypatch) -> None:
+    class Reply:
+        def __init__(self, status_code, payload=None):
+            self.status_code = status_code
+            self.payload = payload
+
+        def raise_for_status(self):
+            if self.status_code >= 400:
+                raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+        def json(self):
+            return self.payload
+
+    replies = [Reply(400), Reply(200, {"results": [{"id": "W1"}]})]
+    monkeypatch.setattr(openalex_ops.ratelimit, "get", lambda url, **kwargs: replies.pop(0))
+    assert openalex_ops.openalex_fetch_by_arxiv("2401.00001", None, None) == {"id": "W1"}
+    assert replies == []
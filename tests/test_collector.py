@@ -1,8 +1,16 @@
 import datetime as dt
 import json
+import os
+import shutil
+import threading
+import time
 from pathlib import Path
 
+import pytest
+
 import feather.collector as collector
+import feather.metrics as metrics
+import feather.utils as feather_utils
 from feather.collector import (
     _agentic_endpoints,
     _build_heuristic_agentic_actions,
@@ -16,7 +24,8 @@ from feather.collector import (
     prepare_jobs,
     select_youtube_queries,
 )
-from feather.models import Job, QuerySpec
+from feather.models import Job, LocalPathSpec, QuerySpec
+from feather.utils import append_jsonl, write_text
 
 
 def test_collect_instruction_files_with_file(tmp_path) -> None:
@@ -364,3 +373,387 @@ def test_parse_instruction_sections_dividers() -> None:
         ["linkedin", "news", "agentic ai"],
         ["youtube", "demo videos"],
     ]
+
+
+def _make_job(tmp_path: Path, **overrides) -> Job:
+    values = dict(
+        date=dt.date(2026, 1, 4),
+        src_file=tmp_path / "x.txt",
+        root_dir=tmp_path / "run",
+        out_dir=tmp_path / "run" / "archive",
+        query_id="run",
+        lang_pref=None,
+        openalex_enabled=False,
+        openalex_max_results=5,
+        youtube_enabled=False,
+        youtube_max_results=5,
+        youtube_transcript=False,
+        youtube_order="relevance",
+        days=30,
+        max_results=5,
+        download_pdf=False,
+        arxiv_source=False,
+        update_run=False,
+        citations_enabled=True,
+        queries=["quantum"],
+        query_specs=[QuerySpec(text="quantum", hints=[])],
+        local_paths=[],
+        urls=[],
+        arxiv_ids=[],
+        site_hints=[],
+        raw_lines=["quantum"],
+    )
+    values.update(overrides)
+    return Job(**values)
+
+
+def _stub_providers(monkeypatch) -> None:
+    def writer(rel: str, count: int, delay: float):
+        def stage(job, *args) -> None:
+            for idx in range(count):
+                time.sleep(delay)
+                append_jsonl(job.out_dir / rel, {"arxiv_id": f"2401.{idx:05d}", "title": rel})
+                write_text(job.out_dir / Path(rel).parent / "text" / f"{Path(rel).stem}-{idx}.txt", "x")
+
+        return stage
+
+    monkeypatch.setattr(collector, "run_local_ingest", writer("local/manifest.jsonl", 3, 0.003))
+    monkeypatch.setattr(collector, "run_tavily_extract", writer("tavily_extract/extract.jsonl", 3, 0.001))
+    monkeypatch.setattr(collector, "run_url_pdf_downloads", writer("web/pdf.jsonl", 2, 0.002))
+    monkeypatch.setattr(collector, "run_tavily_search", writer("tavily_search.jsonl", 4, 0.001))
+    monkeypatch.setattr(collector, "run_youtube", writer("youtube/videos.jsonl", 2, 0.002))
+    monkeypatch.setattr(collector, "run_openalex", writer("openalex/works.jsonl", 3, 0.002))
+    monkeypatch.setattr(collector, "run_arxiv_ids", writer("arxiv/papers.jsonl", 3, 0.003))
+    monkeypatch.setattr(collector, "run_arxiv_recent", writer("arxiv/papers.jsonl", 2, 0.001))
+    monkeypatch.setattr(collector, "run_arxiv_sources", writer("arxiv/src_manifest.jsonl", 1, 0.001))
+
+
+def test_parallel_providers_match_serial_outputs(tmp_path, monkeypatch) -> None:
+    _stub_providers(monkeypatch)
+    outputs = []
+    for parallel in (False, True):
+        job = _make_job(tmp_path, parallel_providers=parallel)
+        collector.run_job(job, tavily=None, stdout=False)  # type: ignore[arg-type]
+        papers = (job.out_dir / "arxiv" / "papers.jsonl").read_text(encoding="utf-8")
+        index = (job.out_dir / f"{job.query_id}-index.md").read_text(encoding="utf-8")
+        assert "--parallel-providers" not in index
+        outputs.append((papers, index))
+        log_text = (job.out_dir / "_log.txt").read_text(encoding="utf-8")
+        assert ("PROVIDERS PARALLEL" in log_text) is parallel
+        shutil.rmtree(job.root_dir)
+    assert outputs[0] == outputs[1]
+
+
+def test_execute_agentic_actions_runs_lanes_concurrently(tmp_path, monkeypatch) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    calls: list[str] = []
+
+    def stage(name: str, wait: bool):
+        def run(job, *args) -> None:
+            if wait:
+                barrier.wait()
+            calls.append(f"{name}:{job.queries[0]}")
+
+        return run
+
+    monkeypatch.setattr(collector, "run_tavily_search", stage("search", True))
+    monkeypatch.setattr(collector, "run_youtube", stage("youtube", False))
+    monkeypatch.setattr(collector, "run_openalex", stage("openalex", True))
+    job = _make_job(tmp_path, parallel_providers=True)
+    job.out_dir.mkdir(parents=True)
+    logger = collector.JobLogger(job.out_dir / "_log.txt", also_stdout=False)
+    actions = [
+        {"type": "tavily_search", "query": "a"},
+        {"type": "openalex_search", "query": "b"},
+        {"type": "youtube_search", "query": "c"},
+        {"type": "youtube_search", "query": ""},
+        {"type": "bogus"},
+    ]
+    executed = collector._execute_agentic_actions(job, actions, None, logger)  # type: ignore[arg-type]
+    assert executed == 3
+    assert sorted(calls) == ["openalex:b", "search:a", "youtube:c"]
+    assert calls.index("search:a") < calls.index("youtube:c")
+
+
+def test_archive_metrics_follow_appends_without_rescanning(tmp_path, monkeypatch) -> None:
+    archive = tmp_path / "archive"
+    search_path = archive / "tavily_search.jsonl"
+    append_jsonl(search_path, {"query": "q", "result": {"results": [{"url": "https://a"}]}})
+    append_jsonl(archive / "youtube" / "videos.jsonl", {"videos": [{}, {}]})
+    metrics = collector.ArchiveMetrics(archive, candidate_limit=2)
+    assert metrics.snapshot()["youtube_videos"] == 2
+
+    def no_scan(*args, **kwargs):
+        raise AssertionError("archive rescanned")
+
+    monkeypatch.setattr(collector, "_jsonl_count", no_scan)
+    monkeypatch.setattr(collector, "_youtube_video_count", no_scan)
+    monkeypatch.setattr(collector, "_collect_candidate_urls", no_scan)
+    results = [{"url": "https://a"}, {"url": "https://b"}, {"url": "https://c"}]
+    append_jsonl(search_path, {"query": "r", "result": {"results": results}})
+    append_jsonl(archive / "openalex" / "works.jsonl", {"work": {}})
+    append_jsonl(archive / "youtube" / "videos.jsonl", {"video": {}})
+    write_text(archive / "web" / "text" / "a.txt", "x")
+    snap = metrics.snapshot()
+    assert snap["tavily_search_entries"] == 2
+    assert snap["openalex_works"] == 1
+    assert snap["youtube_videos"] == 3
+    assert snap["web_text"] == 1
+    assert snap["candidate_urls"] == ["https://a", "https://b"]
+    metrics.close()
+    append_jsonl(archive / "openalex" / "works.jsonl", {"work": {}})
+    assert metrics.snapshot()["openalex_works"] == 1
+
+
+def test_run_tavily_extract_batches_and_retries_failed_urls(tmp_path) -> None:
+    urls = [f"https://example.com/{name}" for name in ("a", "b", "c")]
+
+    class StubTavily:
+        def __init__(self):
+            self.batches: list[list[str]] = []
+            self.singles: list[str] = []
+
+        def extract_many(self, urls, include_images=False, extract_depth="advanced"):
+            self.batches.append(list(urls))
+            return {
+                "results": [{"url": f"{url}/", "raw_content": url} for url in urls if not url.endswith("b")],
+                "failed_results": [{"url": urls[1], "error": "timeout"}],
+                "response_time": 1.5,
+            }
+
+        def extract(self, url, include_images=False, extract_depth="advanced"):
+            self.singles.append(url)
+            return {"results": [{"url": url, "raw_content": "retried"}], "failed_results": []}
+
+    class StubLogger:
+        def log(self, msg: str) -> None:
+            pass
+
+    (tmp_path / "run" / "archive" / "tavily_extract").mkdir(parents=True)
+    existing = tmp_path / "run" / "archive" / "tavily_extract" / "0003_https_example.com_c.txt"
+    existing.write_text("{}", encoding="utf-8")
+    job = _make_job(tmp_path, urls=urls + ["https://example.com/d"], update_run=True, extract_batch_size=3)
+    tavily = StubTavily()
+    collector.run_tavily_extract(job, tavily, StubLogger())  # type: ignore[arg-type]
+
+    assert tavily.batches == [["https://example.com/a", "https://example.com/b", "https://example.com/d"]]
+    assert tavily.singles == ["https://example.com/b"]
+    extract_dir = job.out_dir / "tavily_extract"
+    first = json.loads((extract_dir / "0001_https_example.com_a.txt").read_text(encoding="utf-8"))
+    assert first == {
+        "results": [{"url": "https://example.com/a/", "raw_content": "https://example.com/a"}],
+        "failed_results": [],
+        "response_time": 1.5,
+    }
+    retried = json.loads((extract_dir / "0002_https_example.com_b.txt").read_text(encoding="utf-8"))
+    assert retried["results"][0]["raw_content"] == "retried"
+    assert (extract_dir / "0004_https_example.com_d.txt").exists()
+    assert existing.read_text(encoding="utf-8") == "{}"
+
+
+def test_local_ingest_skips_unchanged_files_by_fingerprint(tmp_path: Path, monkeypatch) -> None:
+    docs = tmp_path / "docs"
+    for idx in range(6):
+        write_text(docs / f"sub{idx % 2}" / f"note{idx}.md", f"note {idx}")
+    (docs / "skip.bin").write_bytes(b"\x00")
+    spec = LocalPathSpec(kind="dir", value=str(docs), title=None, tags=[], lang=None)
+    job = _make_job(tmp_path, local_paths=[spec], update_run=True, local_workers=3)
+    logger = collector.JobLogger(job.out_dir / "_log.txt", also_stdout=False)
+    manifest = job.out_dir / "local" / "manifest.jsonl"
+
+    collector.run_local_ingest(job, logger)
+    first = [json.loads(line) for line in manifest.read_text(encoding="utf-8").splitlines()]
+    assert [row["file_name"] for row in first] == [f"note{idx}.md" for idx in (0, 2, 4, 1, 3, 5)]
+    assert all(row["content_path"] for row in first)
+
+    def no_hash(path):
+        raise AssertionError(f"re-hashed unchanged file {path}")
+
+    monkeypatch.setattr(collector.local_ops, "compute_sha1", no_hash)
+    collector.run_local_ingest(job, logger)
+    assert len(manifest.read_text(encoding="utf-8").splitlines()) == 6
+    assert "LOCAL UNCHANGED: 6 files skipped" in (job.out_dir / "_log.txt").read_text(encoding="utf-8")
+
+    monkeypatch.undo()
+    write_text(docs / "sub0" / "note0.md", "note 0, edited")
+    collector.run_local_ingest(job, logger)
+    rows = [json.loads(line) for line in manifest.read_text(encoding="utf-8").splitlines()]
+    assert len(rows) == 7
+    assert rows[-1]["file_name"] == "note0.md"
+    assert rows[-1]["hash"] != first[0]["hash"]
+
+
+def test_run_openalex_appends_pages_and_resumes_from_cursor(tmp_path: Path, monkeypatch) -> None:
+    pages = {
+        "*": ([1, 2], "c2"),
+        "c2": ([3, 4], "c3"),
+        "c3": ([5], None),
+    }
+    requested = []
+    fail_on = {"c3"}
+
+    def fake_fetch_works(params, skip_statuses=()):
+        cursor = params["cursor"]
+        requested.append(cursor)
+        if cursor in fail_on:
+            raise RuntimeError("connection reset")
+        ids, next_cursor = pages[cursor]
+        results = [{"id": f"https://openalex.org/W{i}", "title": f"w{i}"} for i in ids]
+        return {"results": results, "meta": {"next_cursor": next_cursor}}
+
+    monkeypatch.setattr(collector.openalex_ops, "fetch_works", fake_fetch_works)
+    job = _make_job(tmp_path, openalex_enabled=True, openalex_max_results=500, update_run=True)
+    job.out_dir.mkdir(parents=True)
+    logger = collector.JobLogger(job.out_dir / "_log.txt", also_stdout=False)
+    works_path = job.out_dir / "openalex" / "works.jsonl"
+
+    collector.run_openalex(job, logger)
+    rows = [json.loads(line) for line in works_path.read_text(encoding="utf-8").splitlines()]
+    assert [row["work"]["title"] for row in rows] == ["w1", "w2", "w3", "w4"]
+    assert requested == ["*", "c2", "c3"]
+
+    fail_on.clear()
+    requested.clear()
+    collector.run_openalex(job, logger)
+    rows = [json.loads(line) for line in works_path.read_text(encoding="utf-8").splitlines()]
+    assert [row["work"]["title"] for row in rows] == ["w1", "w2", "w3", "w4", "w5"]
+    assert requested == ["c3"]
+    cursors = json.loads((job.out_dir / "openalex" / "_cursors.json").read_text(encoding="utf-8"))
+    assert list(cursors.values())[0]["done"] is True
+
+
+def test_build_index_md_rerenders_only_changed_sections(tmp_path: Path, monkeypatch) -> None:
+    job = _make_job(tmp_path)
+    out = job.out_dir
+    for idx in range(3):
+        append_jsonl(out / "arxiv" / "papers.jsonl", {"arxiv_id": f"2401.0000{idx}", "title": f"paper {idx}"})
+        write_text(out / "arxiv" / "text" / f"2401.0000{idx}.txt", "x")
+        append_jsonl(out / "openalex" / "works.jsonl", {"query": "q", "work": {"openalex_id_short": f"W{idx}"}})
+    first = collector.build_index_md(job)
+    assert "Title: paper 1" in first
+
+    folded = []
+    original_fold = collector.index_cache.IndexCache.fold_jsonl
+
+    def tracking_fold(self, path, name, init, step):
+        folded.append(name)
+        return original_fold(self, path, name, init, step)
+
+    monkeypatch.setattr(collector.index_cache.IndexCache, "fold_jsonl", tracking_fold)
+    assert collector.build_index_md(job) == first
+    assert folded == []
+
+    append_jsonl(out / "openalex" / "works.jsonl", {"query": "q", "work": {"openalex_id_short": "W9", "title": "new"}})
+    write_text(out / "openalex" / "text" / "W9.txt", "x")
+    updated = collector.build_index_md(job)
+    assert folded == ["openalex"]
+    assert "Title: new" in updated
+    assert updated.split("## arXiv")[1] == first.split("## arXiv")[1]
+
+
+def test_index_cache_keys_on_listed_names_and_jsonl_rewrites(tmp_path: Path) -> None:
+    cache = collector.index_cache.IndexCache(tmp_path)
+    works = tmp_path / "works.jsonl"
+    append_jsonl(works, {"title": "aaaa"})
+    names = collector.index_cache.listing
+    write_text(tmp_path / "text" / "a.txt", "one")
+    before = names(tmp_path / "text", "*.txt")
+    write_text(tmp_path / "text" / "a.txt", "rewritten")
+    write_text(tmp_path / "text" / "nested" / "b.txt", "not listed")
+    assert names(tmp_path / "text", "*.txt") == before == ["a.txt"]
+    write_text(tmp_path / "text" / "c.txt", "new")
+    assert names(tmp_path / "text", "*.txt") == ["a.txt", "c.txt"]
+
+    def fold(state, entry):
+        state.append(entry["title"])
+
+    assert cache.fold_jsonl(works, "works", list, fold) == ["aaaa"]
+    stamp = works.stat().st_mtime_ns
+    works.write_text(json.dumps({"title": "bbbb"}) + "\n", encoding="utf-8")
+    os.utime(works, ns=(stamp, stamp))
+    assert cache.fold_jsonl(works, "works", list, fold) == ["bbbb"]
+
+
+def test_run_job_closes_sidecar_indexes_when_a_stage_fails(tmp_path: Path, monkeypatch) -> None:
+    job = _make_job(tmp_path)
+
+    def failing_providers(job, tavily, logger, dm=None):
+        collector.dedup_index.open_index(job.out_dir).track("arxiv/papers.jsonl", "ids", lambda obj: [])
+        raise RuntimeError("stage failed")
+
+    monkeypatch.setattr(collector, "run_providers", failing_providers)
+    with pytest.raises(RuntimeError):
+        collector.run_job(job, tavily=None, stdout=False)  # type: ignore[arg-type]
+    papers = job.out_dir / "arxiv" / "papers.jsonl"
+    assert os.path.abspath(job.out_dir) not in collector.dedup_index._INDEXES
+    assert os.path.abspath(papers) not in feather_utils._JSONL_WATCHERS
+
+
+def test_open_circuit_is_logged_as_skip_and_reported(tmp_path: Path, monkeypatch) -> None:
+    job = _make_job(tmp_path, queries=["a", "b", "c"], query_specs=[QuerySpec(text=q, hints=[]) for q in "abc"])
+    job.out_dir.mkdir(parents=True)
+    logger = collector.JobLogger(job.out_dir / "_log.txt", also_stdout=False)
+    registry = collector.circuit.CircuitRegistry(threshold=1, base=60.0)
+    monkeypatch.setattr(collector.circuit, "_REGISTRY", registry)
+
+    class DeadTavily:
+        calls = 0
+
+        def search(self, **kwargs):
+            registry.before("tavily")
+            self.calls += 1
+            registry.failure("tavily")
+            raise collector.requests.exceptions.ReadTimeout("timed out")
+
+    tavily = DeadTavily()
+    collector.run_tavily_search(job, tavily, logger)
+    assert tavily.calls == 1
+    log = (job.out_dir / "_log.txt").read_text(encoding="utf-8")
+    assert log.count("] ERROR search query=a") == 1
+    assert "SKIP search query=b circuit=tavily" in log and "SKIP search query=c circuit=tavily" in log
+
+    collector.write_circuit_report(job, logger)
+    assert "CIRCUIT tavily: state=open failures=1 trips=1 skipped=2" in (job.out_dir / "_log.txt").read_text(encoding="utf-8")
+    index_md = collector.build_index_md(job)
+    assert "## Provider Health" in index_md
+    assert "- tavily: failures=1 circuit_trips=1 skipped_calls=2 state=open" in index_md
+
+
+def test_provider_stages_write_metric_spans(tmp_path, monkeypatch) -> None:
+    def openalex(job, logger, dm=None) -> None:
+        metrics.count("requests", 2)
+        metrics.count("cache_hits")
+        logger.log("ERROR openalex query=q err=boom")
+
+    monkeypatch.setattr(collector, "run_openalex", openalex)
+    job = _make_job(tmp_path)
+    job.out_dir.mkdir(parents=True)
+    logger = collector.JobLogger(job.out_dir / "_log.txt", also_stdout=False)
+    collector.run_providers(job, None, logger)  # type: ignore[arg-type]
+    logger.close()
+
+    lines = (job.out_dir / "_metrics.jsonl").read_text(encoding="utf-8").splitlines()
+    spans = {record["stage"]: record for record in map(json.loads, lines)}
+    assert {"local_ingest", "tavily_search", "openalex", "arxiv_sources"} <= set(spans)
+    assert spans["openalex"]["requests"] == 2
+    assert spans["openalex"]["cache_hits"] == 1
+    assert spans["openalex"]["errors"] == 1
+    assert spans["openalex"]["parent"] is None
+    assert spans["tavily_search"]["requests"] == 0
+    assert "ERROR openalex" in (job.out_dir / "_log.txt").read_text(encoding="utf-8")
+
+
+def test_provider_stages_share_one_download_manager(tmp_path, monkeypatch) -> None:
+    seen = []
+
+    def stage(job, logger, dm=None) -> None:
+        seen.append(dm)
+
+    for name in ("run_url_pdf_downloads", "run_openalex", "run_arxiv_ids", "run_arxiv_recent", "run_arxiv_sources"):
+        monkeypatch.setattr(collector, name, stage)
+    job = _make_job(tmp_path, parallel_providers=True)
+    job.out_dir.mkdir(parents=True)
+    logger = collector.JobLogger(job.out_dir / "_log.txt", also_stdout=False)
+    collector.run_providers(job, None, logger)  # type: ignore[arg-type]
+    assert len(seen) == 5
+    assert seen[0] is not None and all(dm is seen[0] for dm in seen)
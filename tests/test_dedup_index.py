@@ -0,0 +1,57 @@
+import json
+
+from feather import dedup_index
+from feather.utils import append_jsonl
+
+
+def _ids(entry):
+    return [entry["id"]] if entry.get("id") else []
+
+
+def test_track_builds_then_follows_appends(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "papers.jsonl"
+    for idx in range(3):
+        append_jsonl(path, {"id": f"p{idx}"})
+    index = dedup_index.DedupIndex(tmp_path)
+    keys = index.track("papers.jsonl", "ids", _ids)
+    assert "p1" in keys and "p9" not in keys
+    assert len(keys) == 3
+
+    def no_rescan(*args):
+        raise AssertionError("file was re-read")
+
+    monkeypatch.setattr(index, "_index_from", no_rescan)
+    append_jsonl(path, {"id": "p3"})
+    assert "p3" in keys
+    assert len(index.track("papers.jsonl", "ids", _ids)) == 4
+    index.close()
+
+
+def test_external_append_syncs_tail_and_rewrite_rebuilds(tmp_path) -> None:
+    path = tmp_path / "papers.jsonl"
+    append_jsonl(path, {"id": "a"})
+    index = dedup_index.DedupIndex(tmp_path)
+    index.track("papers.jsonl", "ids", _ids)
+    index.close()
+
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"id": "b"}) + "\n")
+    index = dedup_index.DedupIndex(tmp_path)
+    keys = index.track("papers.jsonl", "ids", _ids)
+    assert "a" in keys and "b" in keys
+
+    path.write_text("\n".join(json.dumps({"id": k}) for k in ("x", "y", "z")) + "\n", encoding="utf-8")
+    keys = index.track("papers.jsonl", "ids", _ids)
+    assert "a" not in keys and "z" in keys
+    assert len(keys) == 3
+    index.close()
+
+
+def test_keyset_add_is_local_to_the_view(tmp_path) -> None:
+    append_jsonl(tmp_path / "v.jsonl", {"id": "a"})
+    index = dedup_index.DedupIndex(tmp_path)
+    first = index.track("v.jsonl", "ids", _ids)
+    second = index.track("v.jsonl", "ids", _ids)
+    first.add("new")
+    assert "new" in first and "new" not in second
+    index.close()
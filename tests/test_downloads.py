@@ -0,0 +1,119 @@
+import hashlib
+import json
+
+import pytest
+
+from feather import downloads
+from feather.downloads import DownloadManager, IncompleteDownload, NotAPdf, download_file, part_path
+
+PDF_BYTES = b"%PDF-1.7\n" + b"x" * 200 + b"\n%%EOF\n"
+
+
+class StubResponse:
+    def __init__(self, status_code: int, body: bytes, headers: dict):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def iter_content(self, chunk_size: int = 1):
+        for idx in range(0, len(self.body), 16):
+            yield self.body[idx : idx + 16]
+
+
+def serve(monkeypatch, body: bytes, truncate_at: int | None = None, etag: str = '"v1"'):
+    seen: list[dict] = []
+
+    def fake_get(url, provider=None, **kwargs):
+        headers = kwargs.get("headers") or {}
+        seen.append(headers)
+        start = 0
+        if "Range" in headers and headers.get("If-Range") == etag:
+            start = int(headers["Range"].split("=")[1].rstrip("-"))
+            chunk = body[start:]
+            resp_headers = {
+                "Content-Length": str(len(chunk)),
+                "Content-Range": f"bytes {start}-{len(body) - 1}/{len(body)}",
+                "ETag": etag,
+            }
+            return StubResponse(206, chunk, resp_headers)
+        chunk = body if truncate_at is None else body[:truncate_at]
+        return StubResponse(200, chunk, {"Content-Length": str(len(body)), "ETag": etag})
+
+    monkeypatch.setattr(downloads.ratelimit, "get", fake_get)
+    return seen
+
+
+def test_interrupted_download_resumes_with_range(monkeypatch, tmp_path) -> None:
+    out = tmp_path / "paper.pdf"
+    serve(monkeypatch, PDF_BYTES, truncate_at=50)
+    with pytest.raises(IncompleteDownload):
+        download_file("https://example.com/paper.pdf", out)
+    assert not out.exists()
+    assert part_path(out).stat().st_size == 50
+
+    seen = serve(monkeypatch, PDF_BYTES)
+    record = download_file("https://example.com/paper.pdf", out)
+    assert seen[0]["Range"] == "bytes=50-"
+    assert seen[0]["If-Range"] == '"v1"'
+    assert out.read_bytes() == PDF_BYTES
+    assert not part_path(out).exists()
+    assert record["size"] == len(PDF_BYTES)
+    assert record["sha256"] == hashlib.sha256(PDF_BYTES).hexdigest()
+    assert record["resumed_from"] == 50
+
+
+def test_resume_restarts_when_remote_file_changed(monkeypatch, tmp_path) -> None:
+    out = tmp_path / "paper.pdf"
+    serve(monkeypatch, b"%PDF-1.4 old" + b"y" * 100, truncate_at=50)
+    with pytest.raises(IncompleteDownload):
+        download_file("https://example.com/paper.pdf", out)
+
+    seen = serve(monkeypatch, PDF_BYTES, etag='"v2"')
+    record = download_file("https://example.com/paper.pdf", out)
+    assert seen[0]["If-Range"] == '"v1"'
+    assert out.read_bytes() == PDF_BYTES
+    assert record["resumed_from"] is None
+    assert not downloads.validator_path(out).exists()
+
+
+def test_non_pdf_response_is_rejected(monkeypatch, tmp_path) -> None:
+    out = tmp_path / "paper.pdf"
+    serve(monkeypatch, b"<html>paywall</html>")
+    with pytest.raises(NotAPdf):
+        download_file("https://example.com/paper.pdf", out)
+    assert not out.exists()
+    assert not part_path(out).exists()
+
+
+def test_is_complete_rejects_truncated_legacy_files(tmp_path) -> None:
+    legacy = tmp_path / "old.pdf"
+    legacy.write_bytes(b"")
+    assert not downloads.is_complete(legacy)
+    legacy.write_bytes(b"<html>")
+    assert not downloads.is_complete(legacy)
+    assert downloads.is_complete(legacy, expect_pdf=False)
+    legacy.write_bytes(PDF_BYTES)
+    assert downloads.is_complete(legacy)
+
+
+def test_manager_downloads_concurrently_and_writes_manifest(monkeypatch, tmp_path) -> None:
+    serve(monkeypatch, PDF_BYTES)
+    manifest = tmp_path / "_downloads.jsonl"
+    with DownloadManager(manifest, workers=3, per_host=2) as dm:
+        futures = [dm.submit(f"https://example.com/{idx}.pdf", tmp_path / "pdf" / f"{idx}.pdf") for idx in range(5)]
+        records = [future.result() for future in futures]
+    assert all((tmp_path / "pdf" / f"{idx}.pdf").read_bytes() == PDF_BYTES for idx in range(5))
+    assert len(records) == 5
+    rows = [json.loads(line) for line in manifest.read_text(encoding="utf-8").splitlines()]
+    assert sorted(row["path"] for row in rows) == [f"./pdf/{idx}.pdf" for idx in range(5)]
+    assert {row["sha256"] for row in rows} == {hashlib.sha256(PDF_BYTES).hexdigest()}
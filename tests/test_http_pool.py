@@ -0,0 +1,58 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from feather import circuit, http_pool, ratelimit
+from feather.http_pool import SessionPool
+
+
+def test_session_pool_shares_one_session_across_threads() -> None:
+    pool = SessionPool(per_host=3, retries=1)
+    seen: list[int] = []
+
+    def grab() -> None:
+        seen.append(id(pool.session()))
+
+    threads = [threading.Thread(target=grab) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(seen)) == 1
+    adapter = pool.session().get_adapter("https://api.openalex.org/works")
+    assert adapter._pool_maxsize == 3
+    assert adapter._pool_block is True
+    assert adapter.max_retries.total == 1
+    assert 502 in adapter.max_retries.status_forcelist
+    assert "POST" not in adapter.max_retries.allowed_methods
+    pool.close()
+
+
+def test_throttled_get_reaches_ratelimit_once_per_attempt(monkeypatch) -> None:
+    hits: list[str] = []
+
+    class Throttled(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            hits.append(self.path)
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Throttled)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    pool = SessionPool(retries=3)
+    monkeypatch.setattr(http_pool, "_POOL", pool)
+    monkeypatch.setattr(ratelimit, "_LIMITER", ratelimit.RateLimiter({"stub": (0, 1)}))
+    monkeypatch.setattr(circuit, "_REGISTRY", circuit.CircuitRegistry())
+    try:
+        response = ratelimit.get(f"http://127.0.0.1:{server.server_port}/x", provider="stub", max_retries=1)
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+    assert response.status_code == 429
+    assert len(hits) == 2
@@ -0,0 +1,71 @@
+import datetime as dt
+from pathlib import Path
+
+from feather import jobpool, ratelimit
+from feather.collector import build_query_id
+from feather.models import Job, QuerySpec
+
+
+def _job(tmp_path: Path, query_id: str) -> Job:
+    return Job(
+        date=dt.date(2026, 1, 4),
+        src_file=tmp_path / f"{query_id}.txt",
+        root_dir=tmp_path / query_id,
+        out_dir=tmp_path / query_id / "archive",
+        query_id=query_id,
+        lang_pref=None,
+        openalex_enabled=False,
+        openalex_max_results=5,
+        youtube_enabled=False,
+        youtube_max_results=5,
+        youtube_transcript=False,
+        youtube_order="relevance",
+        days=30,
+        max_results=5,
+        download_pdf=False,
+        arxiv_source=False,
+        update_run=False,
+        citations_enabled=False,
+        queries=["q"],
+        query_specs=[QuerySpec(text="q", hints=[])],
+        local_paths=[],
+        urls=[],
+        arxiv_ids=[],
+        site_hints=[],
+        raw_lines=["q"],
+    )
+
+
+def record_shared_wait(job: Job, settings: dict) -> None:
+    wait = ratelimit.get_limiter().reserve("shared-test")
+    job.out_dir.mkdir(parents=True, exist_ok=True)
+    (job.out_dir / "_log.txt").write_text(f"[t] ERROR wait={wait:.2f}\n", encoding="utf-8")
+    if job.query_id == "boom":
+        raise RuntimeError("boom")
+
+
+def test_run_jobs_shares_one_limiter_across_processes(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(ratelimit, "_LIMITER", ratelimit.RateLimiter({"shared-test": (1.0, 1)}))
+    jobs = [_job(tmp_path, name) for name in ("a", "b", "c", "boom")]
+    lines: list[str] = []
+    results = jobpool.run_jobs(jobs, record_shared_wait, {}, workers=4, progress=lines.append)
+
+    waits = sorted(
+        float((tmp_path / job.query_id / "archive" / "_log.txt").read_text(encoding="utf-8").split("wait=")[1])
+        for job in jobs
+    )
+    # One bucket for all workers: the reservations queue up one second apart.
+    assert waits[0] == 0.0
+    assert waits[-1] > 2.5
+    by_id = {result["query_id"]: result for result in results}
+    assert not by_id["boom"]["ok"]
+    assert all(by_id[name]["ok"] for name in ("a", "b", "c"))
+    assert all(result["log_errors"] == 1 for result in results)
+    assert lines[-1].startswith("JOBS DONE: 3/4 ok, 1 failed, 4 logged errors")
+
+
+def test_build_query_id_is_unique_per_batch(tmp_path: Path) -> None:
+    (tmp_path / "topic").mkdir()
+    used: set[str] = set()
+    ids = [build_query_id("topic", tmp_path, used) for _ in range(3)]
+    assert ids == ["topic_01", "topic_02", "topic_03"]
@@ -0,0 +1,61 @@
+import json
+
+from feather import neardup
+
+ARTICLE = (
+    "The new lithium sulfur cell keeps ninety percent of its capacity after one thousand cycles "
+    "according to researchers who tested the prototype in a pilot line this spring and plan to "
+    "scale the process to automotive formats within two years"
+)
+
+
+def test_near_duplicate_points_at_first_copy(tmp_path) -> None:
+    index = neardup.NearDupIndex(tmp_path)
+    assert index.check("page", "https://a.example/story", ARTICLE) is None
+    copy = ARTICLE.replace("this spring", "this spring.") + " Copyright Wire Service."
+    match = index.check("page", "https://b.example/syndicated", copy)
+    assert match is not None and match[0] == "https://a.example/story" and match[1] >= neardup.THRESHOLD
+    other = "A completely different report about quantum error correction codes on superconducting chips"
+    assert index.check("page", "https://c.example/qec", other) is None
+    # Groups are independent, and known keys keep their verdict after a reopen.
+    assert index.check("snippet", "https://b.example/syndicated", copy) is None
+    index.close()
+    reopened = neardup.NearDupIndex(tmp_path)
+    match = reopened.check("page", "https://b.example/syndicated", copy)
+    assert match is not None and match[0] == "https://a.example/story"
+    reopened.close()
+
+
+def test_short_texts_are_not_compared(tmp_path) -> None:
+    index = neardup.NearDupIndex(tmp_path)
+    assert index.check("page", "https://a", "breaking news today") is None
+    assert index.check("page", "https://b", "breaking news today") is None
+
+
+def test_supporting_web_research_follows_run_near_dedup(tmp_path, monkeypatch) -> None:
+    from feather import web_research
+
+    class FakeTavily:
+        def __init__(self, api_key):
+            pass
+
+        def search(self, query, **kwargs):
+            return {"results": [{"url": "https://a.example/story"}, {"url": "https://b.example/copy"}]}
+
+        def extract(self, url, **kwargs):
+            return {"results": [{"content": ARTICLE}]}
+
+    def head(*args, **kwargs):
+        raise OSError("offline")
+
+    monkeypatch.setattr(web_research, "TavilyClient", FakeTavily)
+    monkeypatch.setattr(web_research.ratelimit, "request", head)
+    for near_dedup in (True, False):
+        run_dir = tmp_path / f"run_{near_dedup}"
+        (run_dir / "archive").mkdir(parents=True)
+        (run_dir / "archive" / "_job.json").write_text(json.dumps({"near_dedup": near_dedup}), encoding="utf-8")
+        supporting_dir = run_dir / "supporting" / "s1"
+        web_research.run_supporting_web_research(supporting_dir, ["q"], 5, 5, 10000, 1, api_key="k")
+        records = [json.loads(line) for line in (supporting_dir / "web_fetch.jsonl").read_text(encoding="utf-8").splitlines()]
+        assert ("duplicate_of" in records[1]) is near_dedup
+        assert (supporting_dir / neardup.INDEX_NAME).exists() is near_dedup
@@ -0,0 +1,94 @@
+import threading
+import time
+
+import pytest
+
+from feather import pdf_text
+from feather.pdf_text import PdfTextStage, PdfTimeout
+
+
+def fake_pdf_to_text(path):
+    return "\n\n===== PAGE 1 =====\nhello\n\n===== PAGE 2 =====\nworld"
+
+
+def test_inline_stage_writes_text_atomically(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(pdf_text.arxiv_ops, "pdf_to_text", fake_pdf_to_text)
+    stage = PdfTextStage(workers=0, timeout=0)
+    assert not stage.pooled
+    out = tmp_path / "text" / "paper.txt"
+    result = stage.wait(stage.submit(tmp_path / "paper.pdf", out))
+    assert out.read_text(encoding="utf-8") == fake_pdf_to_text(None)
+    assert result["pages"] == 2
+    assert not (tmp_path / "text" / "paper.txt.part").exists()
+
+
+def test_slow_pdf_times_out_without_writing(monkeypatch, tmp_path) -> None:
+    if not hasattr(pdf_text.signal, "SIGALRM"):
+        pytest.skip("SIGALRM not available")
+
+    def slow(path):
+        time.sleep(5)
+        return "never"
+
+    monkeypatch.setattr(pdf_text.arxiv_ops, "pdf_to_text", slow)
+    with pytest.raises(PdfTimeout):
+        pdf_text.convert_pdf(str(tmp_path / "slow.pdf"), str(tmp_path / "slow.txt"), timeout=1)
+    assert not (tmp_path / "slow.txt").exists()
+
+
+def test_pool_stage_surfaces_worker_errors(tmp_path) -> None:
+    stage = PdfTextStage(workers=1, timeout=30)
+    try:
+        future = stage.submit(tmp_path / "missing.pdf", tmp_path / "missing.txt")
+        with pytest.raises(Exception):
+            stage.wait(future)
+    finally:
+        stage.close()
+    assert not (tmp_path / "missing.txt").exists()
+
+
+def test_timed_conversion_off_main_thread_uses_spawned_pool(tmp_path) -> None:
+    stage = PdfTextStage(workers=0, timeout=30)
+    futures = []
+    try:
+        worker = threading.Thread(target=lambda: futures.append(stage.submit(tmp_path / "missing.pdf", tmp_path / "m.txt")))
+        worker.start()
+        worker.join()
+        assert stage._executor is not None
+        assert stage._executor._mp_context.get_start_method() == pdf_text.POOL_START_METHOD
+        with pytest.raises(Exception):
+            stage.wait(futures[0])
+    finally:
+        stage.close()
+
+
+def hung_or_quick_convert(pdf_path, txt_path, timeout):
+    # Runs in the spawned worker; "hung" stands in for a conversion stuck in C code.
+    if pdf_path.endswith("hung.pdf"):
+        time.sleep(120)
+    with open(txt_path, "w", encoding="utf-8") as handle:
+        handle.write("ok")
+    return {"pdf": pdf_path, "text": txt_path, "chars": 2, "pages": 0}
+
+
+def test_hung_conversion_kills_pool_and_queued_pdf_still_converts(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(pdf_text, "convert_pdf", hung_or_quick_convert)
+    monkeypatch.setattr(pdf_text, "PARENT_GRACE_SEC", 0)
+    stage = PdfTextStage(workers=0, timeout=3)
+    try:
+        hung = stage.submit(tmp_path / "hung.pdf", tmp_path / "hung.txt")
+        queued = stage.submit(tmp_path / "next.pdf", tmp_path / "next.txt")
+        first_pool = stage._executor
+        processes = list(first_pool._processes.values())
+        with pytest.raises(PdfTimeout):
+            stage.wait(hung)
+        assert stage._executor is not first_pool
+        started = time.monotonic()
+        assert stage.wait(queued)["chars"] == 2
+        assert time.monotonic() - started < 3
+        assert (tmp_path / "next.txt").read_text(encoding="utf-8") == "ok"
+        for proc in processes:
+            proc.join(timeout=5)
+            assert not proc.is_alive()
+    finally:
+        stage.close()
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from feather import metrics, ratelimit
+from feather.ratelimit import RateLimiter, TokenBucket, limiter_key, parse_rate_spec, parse_retry_after
+
+
+def test_token_bucket_allows_burst_then_spaces_requests() -> None:
+    bucket = TokenBucket(rate=2.0, burst=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    wait = bucket.reserve()
+    assert 0.4 < wait <= 0.5
+
+
+def test_token_bucket_block_defers_next_reservation() -> None:
+    bucket = TokenBucket(rate=0, burst=1)
+    assert bucket.reserve() == 0.0
+    bucket.block(5.0)
+    assert 4.5 < bucket.reserve() <= 5.0
+
+
+def test_parse_rate_spec() -> None:
+    assert parse_rate_spec("tavily=2:4") == ("tavily", 2.0, 4)
+    assert parse_rate_spec("ArXiv.org=0.5") == ("arxiv.org", 0.5, 1)
+    with pytest.raises(ValueError):
+        parse_rate_spec("tavily")
+    with pytest.raises(ValueError):
+        parse_rate_spec("tavily=fast")
+
+
+def test_limiter_key_prefers_provider_then_host() -> None:
+    assert limiter_key("https://api.tavily.com/search", "tavily") == "tavily"
+    assert limiter_key("https://www.arxiv.org/pdf/2401.01234") == "arxiv.org"
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_request_retries_after_429(tmp_path, monkeypatch) -> None:
+    class StubResponse:
+        def __init__(self, status_code: int, headers: dict):
+            self.status_code = status_code
+            self.headers = headers
+            self.content = b""
+
+        def close(self) -> None:
+            pass
+
+    responses = [StubResponse(429, {"Retry-After": "0"}), StubResponse(200, {})]
+    calls: list[str] = []
+
+    def fake_request(method: str, url: str, **kwargs):
+        calls.append(method)
+        return responses.pop(0)
+
+    limiter = RateLimiter({"stub": (0, 1)})
+    monkeypatch.setattr(ratelimit, "_LIMITER", limiter)
+    monkeypatch.setattr(ratelimit.http_pool, "request", fake_request)
+    writer = metrics.MetricsWriter(tmp_path / metrics.METRICS_NAME)
+    with metrics.span(writer, "stub"):
+        response = ratelimit.get("https://example.com/x", provider="stub")
+    assert response.status_code == 200
+    assert calls == ["GET", "GET"]
+    # The record is on disk as soon as the span closes, and the retried 429 is not a failure.
+    record = json.loads((tmp_path / metrics.METRICS_NAME).read_text(encoding="utf-8"))
+    assert record["requests"] == 2 and record["failures"] == 0
+    writer.close()
+
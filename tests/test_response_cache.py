@@ -0,0 +1,104 @@
+import pytest
+
+from feather import ratelimit, response_cache
+from feather.downloads import download_file
+from feather.response_cache import CacheMiss, ResponseCache, make_key, parse_ttl_spec
+
+
+def test_make_key_ignores_secrets_and_key_order() -> None:
+    a = make_key("tavily", "search", {"query": "q ", "api_key": "one", "max_results": 5})
+    b = make_key("tavily", "search", {"max_results": 5, "query": "q", "api_key": "two"})
+    assert a == b
+    assert a != make_key("tavily", "extract", {"query": "q", "max_results": 5})
+
+
+def test_readwrite_then_offline_replay(tmp_path) -> None:
+    path = tmp_path / "cache.sqlite"
+    calls: list[int] = []
+
+    def fetch():
+        calls.append(1)
+        return {"results": [1, 2]}
+
+    cache = ResponseCache(path=path, mode="readwrite")
+    assert cache.fetch("tavily", "search", {"query": "q"}, fetch) == {"results": [1, 2]}
+    assert cache.fetch("tavily", "search", {"query": "q"}, fetch) == {"results": [1, 2]}
+    assert len(calls) == 1
+    cache.close()
+
+    offline = ResponseCache(path=path, mode="offline", ttls={"tavily": 0})
+    assert offline.fetch("tavily", "search", {"query": "q"}, fetch) == {"results": [1, 2]}
+    with pytest.raises(CacheMiss):
+        offline.fetch("tavily", "search", {"query": "other"}, fetch)
+    assert len(calls) == 1
+
+
+def test_read_mode_does_not_store_and_expired_entries_refetch(tmp_path) -> None:
+    path = tmp_path / "cache.sqlite"
+    read_only = ResponseCache(path=path, mode="read")
+    read_only.fetch("openalex", "works", {"search": "x"}, lambda: {"n": 1})
+    assert read_only.lookup("openalex", "works", {"search": "x"}) == (False, None)
+
+    cache = ResponseCache(path=path, mode="readwrite", ttls={"openalex": -1})
+    cache.fetch("openalex", "works", {"search": "x"}, lambda: None)
+    assert cache.fetch("openalex", "works", {"search": "x"}, lambda: {"n": 2}) == {"n": 2}
+
+
+def test_cached_none_is_a_hit(tmp_path) -> None:
+    cache = ResponseCache(path=tmp_path / "cache.sqlite", mode="readwrite")
+    cache.fetch("openalex", "work", {"url": "doi"}, lambda: None)
+    assert cache.lookup("openalex", "work", {"url": "doi"}) == (True, None)
+
+
+def test_lru_eviction_keeps_recent_entries(tmp_path) -> None:
+    cache = ResponseCache(path=tmp_path / "cache.sqlite", mode="readwrite", max_bytes=200)
+    blob = "x" * 80
+    cache.fetch("youtube", "videos", {"id": "a"}, lambda: blob)
+    cache.fetch("youtube", "videos", {"id": "b"}, lambda: blob)
+    cache.lookup("youtube", "videos", {"id": "a"})
+    cache.fetch("youtube", "videos", {"id": "c"}, lambda: blob)
+    assert cache.lookup("youtube", "videos", {"id": "a"})[0]
+    assert not cache.lookup("youtube", "videos", {"id": "b"})[0]
+    assert cache.lookup("youtube", "videos", {"id": "c"})[0]
+
+
+def test_configure_cache_and_ttl_specs(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(response_cache, "_CACHE", ResponseCache())
+    cache = response_cache.configure_cache("readwrite", path=tmp_path / "c.sqlite", ttl_specs=["arxiv=60"])
+    assert response_cache.get_cache() is cache
+    assert cache.ttl("arxiv") == 60
+    assert parse_ttl_spec("Tavily=5") == ("tavily", 5.0)
+    with pytest.raises(ValueError):
+        parse_ttl_spec("tavily")
+    cache.close()
+
+
+def test_fetch_many_sends_only_misses(tmp_path) -> None:
+    cache = ResponseCache(tmp_path / "c.sqlite", mode="readwrite")
+    cache.store("arxiv", "id", {"id": "b"}, {"arxiv_id": "b"})
+    calls = []
+
+    def fetch(params_list):
+        calls.append([p["id"] for p in params_list])
+        return [{"arxiv_id": p["id"]} if p["id"] != "c" else None for p in params_list]
+
+    values = cache.fetch_many("arxiv", "id", [{"id": "a"}, {"id": "b"}, {"id": "c"}], fetch)
+    assert values == [{"arxiv_id": "a"}, {"arxiv_id": "b"}, None]
+    assert calls == [["a", "c"]]
+    assert cache.fetch_many("arxiv", "id", [{"id": "c"}, {"id": "a"}], fetch) == [None, {"arxiv_id": "a"}]
+    assert len(calls) == 1
+
+    cache.mode = "offline"
+    with pytest.raises(CacheMiss):
+        cache.fetch_many("arxiv", "id", [{"id": "d"}], fetch)
+
+
+def test_offline_mode_refuses_uncached_network_calls(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(response_cache, "_CACHE", ResponseCache(tmp_path / "c.sqlite", mode="offline"))
+    sent = []
+    monkeypatch.setattr(ratelimit.http_pool, "request", lambda *args, **kwargs: sent.append(args))
+    with pytest.raises(CacheMiss):
+        download_file("https://example.com/paper.pdf", tmp_path / "paper.pdf")
+    with pytest.raises(CacheMiss):
+        ratelimit.get("https://www.linkedin.com/embed/feed/update/urn:li:share:1", provider="linkedin")
+    assert sent == []
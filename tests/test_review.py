@@ -1,11 +1,15 @@
 import json
 
+from feather import runpack, storage
 from feather.review import (
     collect_run_summary,
     find_run_dirs,
     format_run_list,
     render_jsonl_review,
+    render_review,
     render_review_json,
+    summarize_metrics,
+    summary_to_dict,
 )
 
 
@@ -135,3 +139,45 @@ def test_render_jsonl_review_tavily(tmp_path) -> None:
     assert "Results" in output
     assert "pdf=1" in output
     assert "arxiv=1" in output
+
+
+def test_review_summarizes_metrics(tmp_path) -> None:
+    run_dir = create_run(tmp_path, "20260104_demo")
+    path = run_dir / "archive" / "_metrics.jsonl"
+    spans = [
+        {"type": "span", "stage": "tavily_search", "parent": None, "duration_ms": 300.0, "requests": 3, "bytes": 2048},
+        {"type": "span", "stage": "pdf_to_text", "parent": "tavily_search", "duration_ms": 100.0},
+        {"type": "span", "stage": "openalex", "parent": None, "duration_ms": 100.0, "cache_hits": 2, "errors": 1},
+        {"type": "span", "stage": "openalex", "parent": None, "duration_ms": 200.0, "requests": 1, "failures": 1},
+    ]
+    path.write_text("".join(json.dumps(span) + "\n" for span in spans), encoding="utf-8")
+
+    stages = summarize_metrics(path)
+    assert list(stages) == ["tavily_search", "openalex", "pdf_to_text"]
+    assert stages["openalex"]["runs"] == 2
+    assert stages["openalex"]["max_ms"] == 200.0
+    assert stages["openalex"]["requests"] == 1
+    assert stages["openalex"]["failures"] == 1
+    assert stages["openalex"]["share"] == 0.5
+    assert stages["pdf_to_text"]["share"] is None
+
+    assert "Metrics:" in render_review(run_dir)
+    assert "Metrics review" in render_jsonl_review(path)
+    assert json.loads(render_review_json(run_dir))["metrics"]["tavily_search"]["bytes"] == 2048
+
+
+def test_review_counts_survive_compaction(tmp_path) -> None:
+    run_dir = create_run(tmp_path, "20260104_demo")
+    before = summary_to_dict(collect_run_summary(run_dir))
+    stats = storage.compact_run(run_dir, "gz")
+    assert stats["files"] > 0
+    assert not (run_dir / "archive" / "youtube" / "videos.jsonl").exists()
+    assert summary_to_dict(collect_run_summary(run_dir)) == before
+
+
+def test_review_counts_packed_run(tmp_path) -> None:
+    run_dir = create_run(tmp_path, "20260104_demo")
+    before = summary_to_dict(collect_run_summary(run_dir))
+    assert runpack.pack_run(run_dir)["files"] > 0
+    assert not (run_dir / "archive" / "arxiv").exists()
+    assert summary_to_dict(collect_run_summary(run_dir)) == before
@@ -0,0 +1,45 @@
+import json
+import zipfile
+
+from feather import runpack
+from feather.utils import append_jsonl, read_text, stored_exists, write_text
+from federlicht import tools
+
+
+def test_pack_run_is_read_in_place_and_unpacks(tmp_path) -> None:
+    run = tmp_path / "run"
+    archive = run / "archive"
+    url = "https://example.com/a"
+    append_jsonl(archive / "tavily_search.jsonl", {"query": "q", "result": {"results": [{"url": url, "title": "A"}]}})
+    write_text(archive / "tavily_extract" / f"0001_{tools.safe_filename(url)}.txt", json.dumps({"results": []}))
+    write_text(archive / "_job.json", "{}")
+    write_text(archive / "run-index.md", "# index")
+    write_text(run / "report_notes" / "cache" / "x.json", "{}")
+
+    stats = runpack.pack_run(run)
+    assert stats["files"] == 3
+    assert (run / runpack.PACK_NAME).exists()
+    assert not (archive / "tavily_search.jsonl").exists() and not (run / "report_notes").exists()
+    assert (archive / "_job.json").exists() and (archive / "run-index.md").exists()
+
+    assert stored_exists(archive / "tavily_extract")
+    assert read_text(run / "report_notes" / "cache" / "x.json") == "{}"
+    entries = tools.build_source_index(archive, run)
+    assert entries[0]["url"] == url
+    assert entries[0]["extract_path"] == f"./archive/tavily_extract/0001_{tools.safe_filename(url)}.txt"
+
+    stats = runpack.unpack_run(run)
+    assert stats["files"] == 3
+    assert not (run / runpack.PACK_NAME).exists()
+    assert (archive / "tavily_search.jsonl").exists()
+
+
+def test_pack_written_by_another_process_is_found(tmp_path) -> None:
+    run = tmp_path / "run"
+    path = run / "archive" / "notes.txt"
+    run.mkdir()
+    assert not stored_exists(path)
+    with zipfile.ZipFile(run / runpack.PACK_NAME, "w") as pack:
+        pack.writestr("archive/notes.txt", "packed elsewhere")
+    assert stored_exists(path)
+    assert read_text(path) == "packed elsewhere"
@@ -0,0 +1,46 @@
+import requests
+
+from feather import standin
+from feather.standin import Cassette, StandinServer, request_key
+from feather.tavily import TavilyClient
+
+
+def test_request_key_ignores_credentials() -> None:
+    a = request_key("tavily", "POST", "/search", "", b'{"api_key": "one", "query": "q"}')
+    b = request_key("tavily", "post", "/search", "", b'{"query": "q", "api_key": "two"}')
+    assert a == b
+    assert request_key("youtube", "GET", "/search", "q=x&key=1", b"") == request_key("youtube", "GET", "/search", "key=2&q=x", b"")
+    assert a != request_key("tavily", "POST", "/search", "", b'{"query": "other"}')
+
+
+def test_record_then_replay_tavily(tmp_path, monkeypatch) -> None:
+    upstream_dir = tmp_path / "upstream"
+    body = b'{"query": "q", "max_results": 8, "search_depth": "advanced", "include_raw_content": false}'
+    key = request_key("tavily", "POST", "/search", "", body)
+    Cassette(upstream_dir).add(key, "tavily", "POST", "/search", 200, "application/json", b'{"results": [{"url": "u"}]}')
+
+    cassette_dir = tmp_path / "cassette"
+    with StandinServer(upstream_dir) as upstream:
+        with StandinServer(cassette_dir, mode="record", upstreams={"tavily": f"{upstream.url}/tavily"}) as recorder:
+            monkeypatch.setenv(standin.PROVIDER_BASE_ENV, recorder.url)
+            assert TavilyClient("secret").search("q") == {"results": [{"url": "u"}]}
+            assert recorder.stats()["recorded"] == 1
+    assert "secret" not in (cassette_dir / standin.CASSETTE_NAME).read_text(encoding="utf-8")
+
+    with StandinServer(cassette_dir) as replay:
+        monkeypatch.setenv(standin.PROVIDER_BASE_ENV, replay.url)
+        assert TavilyClient("other-key").search("q") == {"results": [{"url": "u"}]}
+        assert requests.get(f"{replay.url}/tavily/missing", timeout=5).status_code == 404
+        stats = requests.get(f"{replay.url}{standin.STATS_PATH}", timeout=5).json()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+
+
+def test_replay_injects_errors_and_throttling(tmp_path) -> None:
+    with StandinServer(tmp_path, error_rate=1.0, error_status=503) as server:
+        assert requests.get(f"{server.url}/openalex/works", timeout=5).status_code == 503
+    with StandinServer(tmp_path, rate_limits={"openalex": 1.0}) as server:
+        assert requests.get(f"{server.url}/openalex/works", timeout=5).status_code == 404
+        throttled = requests.get(f"{server.url}/openalex/works", timeout=5)
+        assert throttled.status_code == 429
+        assert throttled.headers["Retry-After"] == "1"
+        assert server.stats()["throttled"] == 1
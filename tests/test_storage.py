@@ -0,0 +1,39 @@
+import gzip
+
+from feather import storage
+from feather.utils import append_jsonl, read_text, stored_path, write_text
+from federlicht import tools
+
+
+def test_compact_run_keeps_paths_readable(tmp_path) -> None:
+    archive = tmp_path / "run" / "archive"
+    works = archive / "openalex" / "works.jsonl"
+    append_jsonl(works, {"work": {"title": "A"}})
+    write_text(archive / "youtube" / "transcripts" / "t.txt", "transcript " * 100)
+    write_text(archive / "_log.txt", "log")
+
+    stats = storage.compact_run(tmp_path / "run", "gz")
+    assert stats["files"] == 2 and stats["bytes_after"] < stats["bytes_before"]
+    assert not works.exists() and stored_path(works).name == "works.jsonl.gz"
+    assert (archive / "_log.txt").exists()
+    assert read_text(archive / "youtube" / "transcripts" / "t.txt").startswith("transcript")
+
+    # Appends land in the compressed copy as a new gzip member.
+    append_jsonl(works, {"work": {"title": "B"}})
+    assert [entry["work"]["title"] for entry in tools.iter_jsonl(works)] == ["A", "B"]
+    with gzip.open(stored_path(works), "rt", encoding="utf-8") as handle:
+        assert len(handle.read().splitlines()) == 2
+
+    stats = storage.expand_run(tmp_path / "run")
+    assert stats["files"] == 2
+    assert works.read_text(encoding="utf-8").count("\n") == 2
+
+
+def test_compress_file_does_not_copy_read_only_mode(tmp_path) -> None:
+    path = tmp_path / "linked.jsonl"
+    append_jsonl(path, {"a": 1})
+    path.chmod(0o444)
+    target = storage.compress_file(path, "gz")
+    append_jsonl(path, {"a": 2})
+    assert [entry["a"] for entry in tools.iter_jsonl(path)] == [1, 2]
+    assert target.exists()
@@ -1,3 +1,5 @@
+import json
+
 from federlicht import tools
 
 
@@ -51,3 +53,25 @@ def test_format_claim_evidence_packet_contains_claim_and_evidence_ids() -> None:
     assert "Claim-Evidence Packet" in text
     assert "C001" in text
     assert "E001" in text
+
+
+def test_build_source_index_collapses_near_duplicates(tmp_path) -> None:
+    archive = tmp_path / "archive"
+    archive.mkdir()
+    results = [
+        {"url": "https://a.example/story", "title": "Story"},
+        {"url": "https://b.example/copy", "title": "Story", "duplicate_of": "https://a.example/story"},
+        {"url": "https://c.example/other", "title": "Other"},
+        {"url": "https://d.example/page", "title": "Page copy"},
+    ]
+    (archive / "tavily_search.jsonl").write_text(
+        json.dumps({"query": "q", "result": {"results": results}}) + "\n", encoding="utf-8"
+    )
+    (archive / "near_duplicates.jsonl").write_text(
+        json.dumps({"url": "https://d.example/page", "duplicate_of": "https://c.example/other"}) + "\n",
+        encoding="utf-8",
+    )
+    entries = tools.build_source_index(archive, tmp_path)
+    assert [entry["url"] for entry in entries] == ["https://a.example/story", "https://c.example/other"]
+    assert entries[0]["duplicates"] == ["https://b.example/copy"]
+    assert entries[1]["duplicates"] == ["https://d.example/page"]
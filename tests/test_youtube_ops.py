@@ -1,3 +1,7 @@
+import threading
+import time
+
+from feather import youtube_ops
 from feather.youtube_ops import detail_to_metadata, extract_video_id
 
 
@@ -39,3 +43,68 @@ def test_detail_to_metadata() -> None:
     assert meta["comment_count"] == "1"
     assert meta["search_rank"] == 3
     assert meta["source"] == "direct_url"
+
+
+def test_transcript_workers_capped_without_proxy(monkeypatch) -> None:
+    for name in youtube_ops.PROXY_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    assert youtube_ops.transcript_workers(8) == youtube_ops.DIRECT_TRANSCRIPT_WORKERS
+    monkeypatch.setenv("YOUTUBE_PROXY", "http://proxy:8080")
+    assert youtube_ops.transcript_workers(8) == 8
+
+
+def test_transcript_fetcher_keeps_input_order(monkeypatch) -> None:
+    def fake_fetch(video_id, languages=None):
+        time.sleep(0.05 if video_id == "a" else 0)
+        if video_id == "c":
+            raise ValueError("boom")
+        return [{"start": 0, "text": video_id}]
+
+    monkeypatch.setattr(youtube_ops, "fetch_transcript", fake_fetch)
+    monkeypatch.setattr(youtube_ops, "classify_transcript_error", lambda exc: "unavailable")
+    fetcher = youtube_ops.TranscriptFetcher(workers=2)
+    results = list(fetcher.fetch_many(["a", "b", "c"]))
+    assert [r[0] for r in results] == ["a", "b", "c"]
+    assert [r[1] for r in results] == ["ok", "ok", "unavailable"]
+    assert results[0][2] == [{"start": 0, "text": "a"}]
+
+
+def test_transcript_fetcher_backs_off_and_gives_up(monkeypatch) -> None:
+    penalties = []
+
+    class FakeLimiter:
+        def penalize(self, key, seconds):
+            penalties.append((key, seconds))
+
+    def blocked(video_id, languages=None):
+        raise RuntimeError("blocked")
+
+    monkeypatch.setattr(youtube_ops, "fetch_transcript", blocked)
+    monkeypatch.setattr(youtube_ops, "classify_transcript_error", lambda exc: "blocked")
+    monkeypatch.setattr(youtube_ops.ratelimit, "get_limiter", lambda: FakeLimiter())
+    fetcher = youtube_ops.TranscriptFetcher(workers=1)
+    statuses = [r[1] for r in fetcher.fetch_many(["a", "b", "c", "d", "e"])]
+    assert statuses == ["blocked", "blocked", "blocked", "skipped", "skipped"]
+    base = youtube_ops.BLOCK_BACKOFF_SEC
+    assert penalties == [("youtube_transcript", base), ("youtube_transcript", base * 2), ("youtube_transcript", base * 4)]
+    assert fetcher.gave_up
+
+
+def test_transcript_timeout_starts_when_fetch_starts(monkeypatch) -> None:
+    release = threading.Event()
+    called: list[str] = []
+
+    def fake_fetch(video_id, languages=None):
+        called.append(video_id)
+        if video_id in ("a", "b"):
+            release.wait(10)
+        return [{"start": 0, "text": video_id}]
+
+    monkeypatch.setattr(youtube_ops, "fetch_transcript", fake_fetch)
+    fetcher = youtube_ops.TranscriptFetcher(workers=2, timeout=0.2)
+    try:
+        results = list(fetcher.fetch_many(["a", "b", "c", "d", "e"]))
+    finally:
+        release.set()
+    assert [r[1] for r in results] == ["timeout", "timeout", "ok", "ok", "ok"]
+    assert sorted(called) == ["a", "b", "c", "d", "e"]